@@ -1,5 +1,5 @@
+import importlib
 import logging
-import pkg_resources
 import re
 from gym import error
 import warnings
@@ -13,8 +13,11 @@ logger = logging.getLogger(__name__)
 agent_id_re = re.compile(r'^(?:[\w:-]+\/)?([\w:.-]+)-v(\d+)$')
 
 def load(name):
-    entry_point = pkg_resources.EntryPoint.parse('x={}'.format(name))
-    result = entry_point.load(False)
+    # module.name:Class, resolved without pkg_resources, which is slow to import
+    mod_name, attr_name = name.split(':')
+    result = importlib.import_module(mod_name)
+    for attr in attr_name.split('.'):
+        result = getattr(result, attr)
     return result
 
 class AgentSpec(object):
@@ -128,6 +128,18 @@ register(
   order_enforce=False,
 	)
 
+## locomotors sharing one physics server, one robot per running lane, see VectorStadiumEnv
+## no max_episode_steps: every lane is truncated on its own, at the max_episode_steps of its single env
+## no 'Bullet' in the ids: the scripts that run every '*Bullet*' id step and render single envs
+for walker in ['Walker2D', 'HalfCheetah', 'Ant', 'Hopper', 'Humanoid']:
+	register(
+		id=f'{walker}VectorStadiumEnv-v0',
+		entry_point='pybulletgym.envs.roboschool.envs.locomotion.vector_stadium_env:VectorStadiumEnv',
+		kwargs={'env_fn': f'{walker}PyBulletEnv-v0', 'num_envs': 8},
+		order_enforce=False,
+		disable_env_checker=True,
+		)
+
 # mujoco envs
 register(
 	id='InvertedPendulumMuJoCoEnv-v0',
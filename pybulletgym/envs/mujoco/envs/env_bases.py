@@ -3,7 +3,9 @@ import numpy as np
 import pybullet
 from pybullet_utils import bullet_client
 
-from pkg_resources import parse_version
+from pybulletgym.utils.version import parse_version
+from pybulletgym.utils.profiling import StepProfiler
+from pybulletgym.utils.rendering import FrameRenderer
 
 
 class BaseBulletEnv(gym.Env):
@@ -18,7 +20,11 @@ class BaseBulletEnv(gym.Env):
     'render_fps': 60,
     }
 
-  def __init__(self, robot, render=False):
+  def __init__(self, robot, render=False, profile=False, profile_in_info=False, renderer=None):
+    '''
+    :param profile, profile_in_info: see enable_profiler.
+    :param renderer: renderer of the rgb_array frames, see configure_rendering.
+    '''
     self.scene = None
     self.physicsClientId = -1
     self.ownsPhysicsClient = 0
@@ -29,8 +35,10 @@ class BaseBulletEnv(gym.Env):
     self._cam_dist = 3
     self._cam_yaw = 0
     self._cam_pitch = -30
-    self._render_width = 320
-    self._render_height = 240
+    self.frame_renderer = FrameRenderer(width=320, height=240, renderer=renderer)
+    self.profiler = None
+    if profile:
+      self.enable_profiler(in_info=profile_in_info)
 
     self.action_space = robot.action_space
     self.observation_space = robot.observation_space
@@ -38,6 +46,24 @@ class BaseBulletEnv(gym.Env):
   def configure(self, args):
     self.robot.args = args
 
+  def enable_profiler(self, in_info=False):
+    '''
+    Time the phases of reset and step and count the physics-server API calls made in each of them, see
+    pybulletgym.utils.profiling.StepProfiler. API calls are only counted if this is called before the first reset.
+    :param in_info: add the phase times of every step to info['profile']
+    '''
+    if self.profiler is None:
+      self.profiler = StepProfiler()
+    self.profile_in_info = in_info
+    if self.physicsClientId >= 0:
+      self.profiler.instrument(self)
+
+  def profile_report(self):
+    '''
+    :return: phase name -> count, total/mean/min/max wall time in seconds, histogram and API call counts
+    '''
+    return self.profiler.report() if self.profiler is not None else {}
+
   def _seed(self, seed=None):
     self.np_random, seed = gym.utils.seeding.np_random(seed)
     self.robot.np_random = self.np_random # use the same np_randomizer for robot as for env
@@ -60,6 +86,8 @@ class BaseBulletEnv(gym.Env):
         self._p = bullet_client.BulletClient()
 
       self.physicsClientId = self._p._client
+      if self.profiler is not None:
+        self._p = self.profiler.wrap_client(self._p)
       self._p.configureDebugVisualizer(pybullet.COV_ENABLE_GUI,0)
 
     if self.scene is None:
@@ -75,9 +103,22 @@ class BaseBulletEnv(gym.Env):
     dump = 0
     s = self.robot.reset(self._p)
     self.potential = self.robot.calc_potential()
+    if self.profiler is not None:
+      self.profiler.instrument(self)
     return s
 
+  def configure_rendering(self, **options):
+    '''
+    :param options: width, height, fov, near, far, renderer ('tiny', 'opengl' or a pybullet ER_* constant,
+    TinyRenderer in DIRECT mode by default), grayscale, downsample, see pybulletgym.utils.rendering.FrameRenderer
+    '''
+    self.frame_renderer.configure(**options)
+
   def _render(self, mode, close=False):
+    '''
+    :return: in 'rgb_array' mode, the (height, width, 3) uint8 frame, or (height, width) if grayscale. It is a
+    preallocated buffer overwritten by the next render, copy it to keep it.
+    '''
     if mode == "human":
       self.isRender = True
     if mode != "rgb_array":
@@ -88,24 +129,7 @@ class BaseBulletEnv(gym.Env):
       if hasattr(self.robot,'body_xyz'):
         base_pos = self.robot.body_xyz
 
-    view_matrix = self._p.computeViewMatrixFromYawPitchRoll(
-      cameraTargetPosition=base_pos,
-      distance=self._cam_dist,
-      yaw=self._cam_yaw,
-      pitch=self._cam_pitch,
-      roll=0,
-      upAxisIndex=2)
-    proj_matrix = self._p.computeProjectionMatrixFOV(
-      fov=60, aspect=float(self._render_width)/self._render_height,
-      nearVal=0.1, farVal=100.0)
-    (_, _, px, _, _) = self._p.getCameraImage(
-    width = self._render_width, height=self._render_height, viewMatrix=view_matrix,
-      projectionMatrix=proj_matrix,
-      renderer=pybullet.ER_BULLET_HARDWARE_OPENGL
-      )
-    rgb_array = np.array(px)
-    rgb_array = rgb_array[:, :, :3]
-    return rgb_array
+    return self.frame_renderer.render(self._p, base_pos, self._cam_dist, self._cam_yaw, self._cam_pitch)
 
   def _close(self):
     if self.ownsPhysicsClient:
@@ -119,9 +143,17 @@ class BaseBulletEnv(gym.Env):
   # backwards compatibility for gym >= v0.9.x
   # for extension of this class.
   def step(self, *args, **kwargs):
-    step_output = self._step(*args, **kwargs)
+    if self.profiler is None:
+      step_output = self._step(*args, **kwargs)
+    else:
+      self.profiler.last_step = {}
+      # what _step spends outside of the robot and scene phases is reward and contact processing
+      with self.profiler.phase('rewards_and_contacts'):
+        step_output = self._step(*args, **kwargs)
     if len(step_output) == 4:
       info = step_output[-1]
+      if self.profiler is not None and self.profile_in_info:
+        info['profile'] = self.profiler.last_step
       step_output = list(step_output[:-1])+[False]
       step_output.append(info)
     return tuple(step_output)
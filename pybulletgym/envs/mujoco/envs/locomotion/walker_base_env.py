@@ -1,5 +1,6 @@
 from pybulletgym.envs.mujoco.envs.env_bases import BaseBulletEnv
 from pybulletgym.envs.roboschool.scenes import StadiumScene
+from pybulletgym.envs.roboschool.scenes.scene_bases import ContactCache
 import pybullet as p
 import numpy as np
 
@@ -36,6 +37,10 @@ class WalkerBaseMuJoCoEnv(BaseBulletEnv):
                                                                                              self.stadium_scene.ground_plane_mjcf)
         self.ground_ids = set([(self.parts[f].bodies[self.parts[f].bodyIndex], self.parts[f].bodyPartIndex) for f in
                                self.foot_ground_object_names])
+        # keys of the feet and of the ground parts in the scene's contact cache
+        self.ground_keys = ContactCache.keys(self.ground_ids)
+        self.foot_keys = ContactCache.keys([(f.bodies[f.bodyIndex], f.bodyPartIndex) for f in self.robot.feet])
+        self.scene.contacts.invalidate()  # the reset moved the bodies without a global_step
         self._p.configureDebugVisualizer(p.COV_ENABLE_RENDERING, 1)
         if self.stateId < 0:
             self.stateId=self._p.saveState()
@@ -74,15 +79,9 @@ class WalkerBaseMuJoCoEnv(BaseBulletEnv):
         progress = float(self.potential - potential_old)
 
         feet_collision_cost = 0.0
-        for i,f in enumerate(self.robot.feet):  # TODO: Maybe calculating feet contacts could be done within the robot code
-            contact_ids = set((x[2], x[4]) for x in f.contact_list())
-            # print("CONTACT OF '%d' WITH %d" % (contact_ids, ",".join(contact_names)) )
-            if self.ground_ids & contact_ids:
-                # see Issue 63: https://github.com/openai/roboschool/issues/63
-                # feet_collision_cost += self.foot_collision_cost
-                self.robot.feet_contact[i] = 1.0
-            else:
-                self.robot.feet_contact[i] = 0.0
+        # see Issue 63: https://github.com/openai/roboschool/issues/63
+        # feet_collision_cost += self.foot_collision_cost for feet touching anything but the ground
+        self.robot.feet_contact[:] = self.scene.contacts.touching(self.foot_keys, self.ground_keys)
 
         #electricity_cost  = self.electricity_cost  * float(np.abs(a*self.robot.joint_speeds).mean())  # let's assume we have DC motor with controller, and reverse current braking
         #electricity_cost += self.stall_torque_cost * float(np.square(a).mean())
@@ -10,8 +10,8 @@ class Ant(WalkerBase, MJCFBasedRobot):
         WalkerBase.__init__(self, power=2.5)
         MJCFBasedRobot.__init__(self, "ant.xml", "torso", action_dim=8, obs_dim=111)
 
-    def calc_state(self):
-        WalkerBase.calc_state(self)
+    def calc_state(self, out=None):
+        self.update_walker_state()
         pose = self.parts['torso'].get_pose()
         qpos = np.hstack((pose, [j.get_position() for j in self.ordered_joints])).flatten()  # shape (15,)
 
@@ -19,11 +19,12 @@ class Ant(WalkerBase, MJCFBasedRobot):
         qvel = np.hstack((velocity[0], velocity[1], [j.get_velocity() for j in self.ordered_joints])).flatten()  # shape (14,)
 
         cfrc_ext = np.zeros((14, 6))  # shape (14, 6)  # TODO: FIND cfrc_ext
-        return np.concatenate([
-            qpos.flat[2:],                   # self.sim.data.qpos.flat[2:],
-            qvel.flat,						 # self.sim.data.qvel.flat,
-            np.clip(cfrc_ext, -1, 1).flat    # np.clip(self.sim.data.cfrc_ext, -1, 1).flat,
-        ])
+        obs = self._pack(self._observation_buffer(out),
+            qpos[2:],                   # self.sim.data.qpos.flat[2:],
+            qvel,						 # self.sim.data.qvel.flat,
+            np.clip(cfrc_ext, -1, 1)    # np.clip(self.sim.data.cfrc_ext, -1, 1).flat,
+        )
+        return self._observation(obs, out)
 
     def alive_bonus(self, z, pitch):
         return +1 if z > 0.26 else -1  # 0.25 is central sphere rad, die if it scrapes the ground
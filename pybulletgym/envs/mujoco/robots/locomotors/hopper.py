@@ -15,14 +15,15 @@ class Hopper(WalkerBase, MJCFBasedRobot):
 
         self.pos_after = 0
 
-    def calc_state(self):
+    def calc_state(self, out=None):
         qpos = np.array([j.get_position() for j in self.ordered_joints], dtype=np.float32).flatten()  # shape (6,)
         qvel = np.array([j.get_velocity() for j in self.ordered_joints], dtype=np.float32).flatten()  # shape (6,)
 
-        return np.concatenate([
-            qpos.flat[1:],                   # self.sim.data.qpos.flat[1:],
-            np.clip(qvel, -10, 10).flat		# self.sim.data.qvel.flat,
-        ])
+        obs = self._pack(self._observation_buffer(out),
+            qpos[1:],                   # self.sim.data.qpos.flat[1:],
+            np.clip(qvel, -10, 10)		# self.sim.data.qvel.flat,
+        )
+        return self._observation(obs, out)
 
     def calc_potential(self):
         # progress in potential field is speed*dt, typical speed is about 2-3 meter per second, this potential will change 2-3 per frame (not per second),
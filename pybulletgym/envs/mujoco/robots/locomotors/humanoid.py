@@ -47,8 +47,8 @@ class Humanoid(WalkerBase, MJCFBasedRobot):
             self.robot_body.reset_orientation(p.getQuaternionFromEuler(orientation))
         self.initial_z = 0.8
 
-    def calc_state(self):
-        WalkerBase.calc_state(self)
+    def calc_state(self, out=None):
+        self.update_walker_state()
 
         pose = self.parts['torso'].get_pose()
         qpos = np.hstack((pose, [j.get_position() for j in self.ordered_joints])).flatten()  # shape (24,)
@@ -60,14 +60,15 @@ class Humanoid(WalkerBase, MJCFBasedRobot):
         cvel = np.zeros((14, 6))  		# shape (14, 6)  # TODO: FIND
         qfrc_actuator = np.zeros(23)  	# shape (23,)  # TODO: FIND
         cfrc_ext = np.zeros((14, 6))  	# shape (14, 6)  # TODO: FIND cfrc_ext
-        return np.concatenate([
-            qpos.flat[2:],                   # self.sim.data.qpos.flat[2:],
-            qvel.flat,						 # self.sim.data.qvel.flat,
-            cinert.flat,    			     # data.cinert.flat,
-            cvel.flat,						 # data.cvel.flat,
-            qfrc_actuator.flat,    	         # data.qfrc_actuator.flat,
-            cfrc_ext.flat					 # data.cfrc_ext.flat
-        ])
+        obs = self._pack(self._observation_buffer(out),
+            qpos[2:],                   # self.sim.data.qpos.flat[2:],
+            qvel,						 # self.sim.data.qvel.flat,
+            cinert,    			     # data.cinert.flat,
+            cvel,						 # data.cvel.flat,
+            qfrc_actuator,    	         # data.qfrc_actuator.flat,
+            cfrc_ext					 # data.cfrc_ext.flat
+        )
+        return self._observation(obs, out)
 
     def apply_action(self, a):
         assert(np.isfinite(a).all())
@@ -30,7 +30,17 @@ class WalkerBase(XmlBasedRobot):
             else:
                 i += 1
 
-    def calc_state(self):
+    def calc_state(self, out=None):
+        j, more = self.update_walker_state()
+        obs = self._pack(self._observation_buffer(out), more, j, self.feet_contact)
+        np.clip(obs, -5, +5, out=obs)
+        return self._observation(obs, out)
+
+    def update_walker_state(self):
+        '''
+        Update joint_speeds, joints_at_limit, body_xyz, body_rpy and the walk target the rewards read.
+        :return: the joints' relative positions and speeds, and the eight body values of the walker observation
+        '''
         j = np.array([j.current_relative_position() for j in self.ordered_joints], dtype=np.float32).flatten()
         # even elements [0::2] position, scaled to -1..+1 between limits
         # odd elements  [1::2] angular speed, scaled to show -1..+1
@@ -63,7 +73,7 @@ class WalkerBase(XmlBasedRobot):
                           np.sin(angle_to_target), np.cos(angle_to_target),
                           0.3 * vx, 0.3 * vy, 0.3 * vz,  # 0.3 is just scaling typical speed into -1..+1, no physical sense here
                           r, p], dtype=np.float32)
-        return np.clip( np.concatenate([more] + [j] + [self.feet_contact]), -5, +5)
+        return j, more
 
     def calc_potential(self):
         # progress in potential field is speed*dt, typical speed is about 2-3 meter per second, this potential will change 2-3 per frame (not per second),
@@ -22,7 +22,7 @@ class InvertedDoublePendulum(MJCFBasedRobot):
         assert( np.isfinite(a).all() )
         self.slider.set_motor_torque( 200*float(np.clip(a[0], -1, +1)) )
 
-    def calc_state(self):
+    def calc_state(self, out=None):
         x, vx = self.slider.current_position()
         theta, theta_dot = self.j1.current_position()
         gamma, gamma_dot = self.j2.current_position()
@@ -32,10 +32,11 @@ class InvertedDoublePendulum(MJCFBasedRobot):
         qpos = np.array([x, theta, gamma])           # shape (3,)
         qvel = np.array([vx, theta_dot, gamma_dot])  # shape (3,)
         qfrc_constraint = np.zeros(3)  # shape (3,)  # TODO: FIND qfrc_constraint in pybullet
-        return np.concatenate([
+        obs = self._pack(self._observation_buffer(out),
             qpos[:1],                           # self.sim.data.qpos[:1],  # cart x pos
             np.sin(qpos[1:]),                   # np.sin(self.sim.data.qpos[1:]),  # link angles
             np.cos(qpos[1:]),                   # np.cos(self.sim.data.qpos[1:]),
             np.clip(qvel, -10, 10),  			# np.clip(self.sim.data.qvel, -10, 10),
             np.clip(qfrc_constraint, -10, 10)   # np.clip(self.sim.data.qfrc_constraint, -10, 10)
-        ]).ravel()
+        )
+        return self._observation(obs, out)
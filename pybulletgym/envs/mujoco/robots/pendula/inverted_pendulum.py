@@ -23,7 +23,7 @@ class InvertedPendulum(MJCFBasedRobot):
             a[0] = 0
         self.slider.set_motor_torque(100*float(np.clip(a[0], -1, +1)))
 
-    def calc_state(self):
+    def calc_state(self, out=None):
         x, vx = self.slider.current_position()
         self.theta, theta_dot = self.j1.current_position()
         assert(np.isfinite(x))
@@ -44,9 +44,8 @@ class InvertedPendulum(MJCFBasedRobot):
             print("theta_dot is inf")
             theta_dot = 0
 
-        qpos = np.array([x, self.theta])  # shape (2,)
-        qvel = np.array([vx, theta_dot])  # shape (2,)
-
-        return np.concatenate([
-            qpos,   # self.sim.data.qpos
-            qvel]).ravel() # self.sim.data.qvel
+        obs = self._observation_buffer(out)
+        obs[:] = (
+            x, self.theta,      # self.sim.data.qpos
+            vx, theta_dot)      # self.sim.data.qvel
+        return self._observation(obs, out)
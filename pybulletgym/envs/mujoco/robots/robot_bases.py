@@ -13,6 +13,9 @@ class XmlBasedRobot:
 	"""
 
 	self_collision = True
+	# calc_state returns its preallocated observation buffer instead of a copy: the observation is then
+	# overwritten by the next calc_state
+	zero_copy_observations = False
 
 	def __init__(self, robot_name, action_dim, obs_dim, self_collision, add_ignored_joints=False):
 		self.parts = None
@@ -24,8 +27,9 @@ class XmlBasedRobot:
 
 		high = np.ones([action_dim])
 		self.action_space = gym.spaces.Box(-high, high)
-		high = np.inf * np.ones([obs_dim])
-		self.observation_space = gym.spaces.Box(-high, high)
+		high = np.inf * np.ones([obs_dim], dtype=np.float32)
+		self.observation_space = gym.spaces.Box(-high, high, dtype=np.float32)
+		self.observation = np.zeros(obs_dim, dtype=np.float32)  # written by calc_state, see _observation
 
 		self.robot_name = robot_name
 		self.self_collision = self_collision
@@ -99,6 +103,35 @@ class XmlBasedRobot:
 	def reset_pose(self, position, orientation):
 		self.parts[self.robot_name].reset_pose(position, orientation)
 
+	def _observation_buffer(self, out):
+		'''
+		:return: the float32 array calc_state(out) writes the observation into: out, or the robot's preallocated buffer
+		'''
+		return self.observation if out is None else out
+
+	def _observation(self, obs, out):
+		'''
+		:return: what calc_state(out) returns once obs is written: out itself, the buffer in zero-copy mode, or a copy of it
+		'''
+		if out is not None or self.zero_copy_observations:
+			return obs
+		return obs.copy()
+
+	@staticmethod
+	def _pack(obs, *arrays):
+		'''
+		Copy arrays one after the other into obs, without the temporary of np.concatenate.
+		Raises a ValueError if they do not fill obs exactly, i.e. the obs_dim of the robot is wrong.
+		'''
+		offset = 0
+		for a in arrays:
+			a = np.ravel(a)
+			obs[offset:offset + a.size] = a
+			offset += a.size
+		if offset != obs.size:
+			raise ValueError(f"observation of {offset} values, obs_dim is {obs.size}")
+		return obs
+
 
 class MJCFBasedRobot(XmlBasedRobot):
 	"""
@@ -1,10 +1,23 @@
+import copy
+
 import gym, gym.spaces, gym.utils, gym.utils.seeding
 import numpy as np
 import pybullet
 from pybullet_utils import bullet_client
 
-from pkg_resources import parse_version
-from pybulletgym.utils.logging import log_contacts, log_kinematics, log_joint_states
+from pybulletgym.utils.version import parse_version
+from pybulletgym.utils.profiling import StepProfiler
+from pybulletgym.utils.rendering import FrameRenderer
+from pybulletgym.envs.roboschool.envs.reset_pool import ResetPool
+from pybulletgym.envs.roboschool.envs.env_state import EnvState, deterministic_pairs
+from pybulletgym.utils.logging import (
+  LazyLogs,
+  kinematics_records, joint_state_records,
+  NameIndex, joint_table,
+  format_contacts, format_kinematics, format_joint_states,
+)
+
+LOG_MODES = ('off', 'lazy', 'eager')
 
 
 class BaseBulletEnv(gym.Env):
@@ -19,17 +32,36 @@ class BaseBulletEnv(gym.Env):
     'render_fps': 60,
     }
 
+  # Python state of an episode that the physics server does not hold, see _episode_state
+  episode_state_attributes = ('potential', 'frame', 'done', 'reward')
+
   def __init__(
     self, 
     robot, 
     render=False, 
     logs_with_joints=False, 
-    timestep=0.0166,
-    frame_skip=1,
+    timestep=None,
+    frame_skip=None,
     obfuscate_logs=False, 
     minimal_logs=False,
+    log_mode='eager',
+    profile=False,
+    profile_in_info=False,
+    reset_pool_size=0,
+    renderer=None,
+    sorted_pairs=False,
     **kwargs,
   ):
+    '''
+    :param timestep, frame_skip: physics timestep and number of them per env step, passed to
+    create_single_player_scene if given, the scene of the env has its own defaults otherwise.
+    :param log_mode: 'off' leaves info['logs'] out, 'eager' renders the text logs on every step/reset,
+    'lazy' captures the raw numeric state and only renders the text when info['logs'] is read.
+    :param profile, profile_in_info: see enable_profiler.
+    :param reset_pool_size: if > 0, see enable_reset_pool.
+    :param renderer: renderer of the rgb_array frames, see configure_rendering.
+    :param sorted_pairs: see enable_sorted_pairs.
+    '''
     self.scene = None
     self.physicsClientId = -1
     self.ownsPhysicsClient = 0
@@ -40,22 +72,191 @@ class BaseBulletEnv(gym.Env):
     self._cam_dist = 3
     self._cam_yaw = 0
     self._cam_pitch = -30
-    self._render_width = 320
-    self._render_height = 240
+    self.frame_renderer = FrameRenderer(width=320, height=240, renderer=renderer)
     
     self.logs_with_joints = logs_with_joints
     self.obfuscate_logs = obfuscate_logs
     self.minimal_logs = minimal_logs 
+    self.set_log_mode(log_mode)
     self.timestep = timestep
     self.frame_skip = frame_skip
     self.nbr_time_steps = 0
+    self.profiler = None
+    if profile:
+      self.enable_profiler(in_info=profile_in_info)
+    self._frame_ring = None  # see enable_pixel_observations
+    self.recorders = []
+    self.reset_pool = None
+    if reset_pool_size > 0:
+      self.enable_reset_pool(reset_pool_size)
+    self.sorted_pairs = False
+    if sorted_pairs:
+      self.enable_sorted_pairs()
 
     self.action_space = robot.action_space
     self.observation_space = robot.observation_space
 
+  def scene_options(self):
+    '''
+    :return: the timestep and frame_skip the env was given, as keyword arguments of create_single_player_scene
+    '''
+    options = {'timestep': self.timestep, 'frame_skip': self.frame_skip}
+    return {name: value for name, value in options.items() if value is not None}
+
   def configure(self, args):
     self.robot.args = args
 
+  def enable_profiler(self, in_info=False):
+    '''
+    Time the phases of reset and step and count the physics-server API calls made in each of them, see
+    pybulletgym.utils.profiling.StepProfiler. API calls are only counted if this is called before the first reset.
+    :param in_info: add the phase times of every step to info['profile']
+    '''
+    if self.profiler is None:
+      self.profiler = StepProfiler()
+    self.profile_in_info = in_info
+    if self.physicsClientId >= 0:
+      self.profiler.instrument(self)
+
+  def profile_report(self):
+    '''
+    :return: phase name -> count, total/mean/min/max wall time in seconds, histogram and API call counts
+    '''
+    return self.profiler.report() if self.profiler is not None else {}
+
+  def enable_sorted_pairs(self):
+    '''
+    Sort the overlapping pairs of the broadphase on every step of this env, see env_state.deterministic_pairs.
+    Without it, the same seed and actions can give different episodes in two envs of the same process, and
+    an episode replayed with set_state from a get_state snapshot drifts from the one that went on from it.
+    '''
+    self.sorted_pairs = True
+    if self.physicsClientId >= 0:
+      deterministic_pairs(self._p)
+
+  def enable_reset_pool(self, size, refresh_every=0):
+    '''
+    Sample size initial states with full resets, on the next reset, and make every later reset restore
+    one of them with restoreState instead of resetting the robot, see ResetPool.
+    Reseeding through reset(seed=...) resamples the pool from the new seed.
+    :param refresh_every: if > 0, resample one pooled state every refresh_every resets
+    '''
+    if self.reset_pool is not None:
+      self.reset_pool.clear(self)
+    self.reset_pool = ResetPool(size, refresh_every)
+
+  def disable_reset_pool(self):
+    if self.reset_pool is not None:
+      self.reset_pool.clear(self)
+    self.reset_pool = None
+
+  def enable_pixel_observations(self, stack=1, proprioceptive=False, **render_options):
+    '''
+    Make reset and step return the frames of the robot-tracking camera of render('rgb_array') as observations.
+    The last stack frames are kept in a ring buffer: each step renders and stores one frame, and the observation
+    is a view into the buffer, overwritten by the next steps, copy it to keep it.
+    :param stack: number of frames in the observation, stacked along a new first axis, oldest first
+    :param proprioceptive: observe {'pixels': frames, 'state': the robot's calc_state vector} instead of the frames
+    :param render_options: see configure_rendering, e.g. width=84, height=84, grayscale=True
+    '''
+    self.frame_renderer.configure(**render_options)
+    frame_shape = self.frame_renderer.output_shape
+    # every frame is stored twice, stack slots apart, so that the last stack frames are always contiguous
+    self._frame_ring = np.zeros((2 * stack,) + frame_shape, dtype=np.uint8)
+    self._frame_stack = stack
+    self._frame_index = 0
+    self.proprioceptive = proprioceptive
+    pixels = gym.spaces.Box(0, 255, (stack,) + frame_shape, dtype=np.uint8)
+    if proprioceptive:
+      self.observation_space = gym.spaces.Dict({'pixels': pixels, 'state': self.robot.observation_space})
+    else:
+      self.observation_space = pixels
+
+  def disable_pixel_observations(self):
+    self._frame_ring = None
+    self.observation_space = self.robot.observation_space
+
+  def _pixel_observation(self, state, new_episode):
+    frame = self.frame_renderer.render(self._p, self._camera_target(), self._cam_dist, self._cam_yaw, self._cam_pitch)
+    stack = self._frame_stack
+    if new_episode:
+      self._frame_ring[:] = frame
+      self._frame_index = 0
+    else:
+      self._frame_index = (self._frame_index + 1) % stack
+      self._frame_ring[self._frame_index] = frame
+      self._frame_ring[self._frame_index + stack] = frame
+    pixels = self._frame_ring[self._frame_index + 1:self._frame_index + 1 + stack]
+    if self.proprioceptive:
+      return {'pixels': pixels, 'state': state}
+    return pixels
+
+  def attach_recorder(self, recorder):
+    '''
+    :param recorder: a pybulletgym.utils.recording.EpisodeRecorder or pybulletgym.utils.dataset.DatasetWriter,
+    told about every reset and step from then on. Closing the env does not close the recorders.
+    Only the roboschool envs have recorders: the MuJoCo BaseBulletEnv has no attach_recorder.
+    '''
+    self.recorders.append(recorder)
+
+  def detach_recorder(self, recorder=None):
+    '''
+    :param recorder: the recorder to detach, all of them if None
+    '''
+    self.recorders = [] if recorder is None else [r for r in self.recorders if r is not recorder]
+
+  def _episode_state(self):
+    '''
+    :return: copy of the Python state of the episode that a restoreState does not bring back:
+    the episode_state_attributes of the env and of the robot.
+    '''
+    return copy.deepcopy((
+      {name: getattr(self, name) for name in self.episode_state_attributes if hasattr(self, name)},
+      self.robot.episode_state(),
+    ))
+
+  def _set_episode_state(self, episode_state):
+    env_state, robot_state = copy.deepcopy(episode_state)
+    for name, value in env_state.items():
+      setattr(self, name, value)
+    self.robot.set_episode_state(robot_state)
+
+  def get_state(self, serializable=False):
+    '''
+    Snapshot the env at the current step, to come back to it with set_state, in this env or in another
+    instance of the same env (e.g. in a worker process). With enable_sorted_pairs, taking the snapshot does not
+    change the episode and the episode replayed from it is the one that went on from it. Without it, neither
+    holds: saveState and saveBullet can change the default order of the broadphase pairs, which already differs
+    between two runs of the same episode.
+    :param serializable: whether the state is going to be serialized, e.g. sent to workers. The snapshot is
+    then also saved with saveBullet right away, instead of when EnvState.to_bytes() is called.
+    :return: an EnvState, EnvState.to_bytes() serializes it
+    '''
+    return EnvState.capture(
+      self._p, self._episode_state(), self.nbr_time_steps, copy.deepcopy(self.np_random), serializable=serializable)
+
+  def set_state(self, state):
+    '''
+    :param state: an EnvState returned by get_state, or its bytes
+    '''
+    if isinstance(state, (bytes, bytearray, memoryview)):
+      state = EnvState.from_bytes(state)
+    state.restore_physics(self._p)
+    self._set_episode_state(state.episode_state)
+    self.nbr_time_steps = state.nbr_time_steps
+    self.np_random = copy.deepcopy(state.np_random)
+    self.robot.np_random = self.np_random
+    self.robot.invalidate_link_snapshots()
+    self.scene.contacts.invalidate()
+    if state.nbr_time_steps == 0 and self.robot.initial_velocities:
+      # the initial impulses of the reset are applied on the first step, they are not part of the body states
+      self.robot.robot_specific_dynamic_reset(self._p)
+
+  def set_log_mode(self, log_mode):
+    if log_mode not in LOG_MODES:
+      raise ValueError(f"log_mode should be one of {LOG_MODES}, got {log_mode!r}")
+    self.log_mode = log_mode
+
   def _seed(self, seed=None):
     self.np_random, seed = gym.utils.seeding.np_random(seed)
     self.robot.np_random = self.np_random  # use the same np_randomizer for robot as for env
@@ -68,12 +269,12 @@ class BaseBulletEnv(gym.Env):
     if self.obfuscate_logs: 
       for partIdx, part_name in enumerate(self.nameSwap.keys()):
         self.nameSwap[part_name] = f'RB{partIdx}'
+    # bodies may have been (re)loaded by the reset: the names of the logged parts are indexed
+    # once per reset, by the first capture
+    self._log_names = None
+    self._log_joint_tables = {}
      
-  def _generate_logs(self):
-    printoptions = np.get_printoptions()
-    np.set_printoptions(formatter={'float_kind': lambda x: "%.2f" % x})
-    loglist = [[f"Time: {self.nbr_time_steps * self._p.getPhysicsEngineParameters()['fixedTimeStep']:.3f}"]]
-    # Function to log contact events
+  def _logged_parts(self):
     # Ignore parts that have been added by the system for bookkeeping around joint configuration:
     parts = {k:v for k,v in self.robot.parts.items() if 'link' not in k}
     #parts = self.robot.parts
@@ -82,25 +283,81 @@ class BaseBulletEnv(gym.Env):
       # TODO: update to be more general, only for cartpole now:
       parts = {'pole': parts['pole']}
       list_infos = ['angular_velocity']
-    loglist.append(log_contacts(self._p, parts=parts, NS=self.nameSwap))
-    loglist.append(log_kinematics(self._p, parts=parts, NS=self.nameSwap, list_infos=list_infos))
-    if not self.logs_with_joints: return loglist 
-    bodyIndices = []
-    for part in self.robot.parts.values(): 
-      if part.bodyIndex in bodyIndices: continue 
-      bodyIndices.append(part.bodyIndex) 
-      loglist.append(log_joint_states(self._p, robot_id=part.bodyIndex))
-    np.set_printoptions(**printoptions) 
+    return parts, list_infos
+
+  def _capture_log_state(self):
+    '''
+    Cheaply copy the raw numeric state the logs are rendered from into structured records
+    (see pybulletgym.utils.logging): the contacts of the scene's cache, the kinematics of the logged parts
+    and, if requested, one getJointStates call per body.
+    '''
+    parts, list_infos = self._logged_parts()
+    if self._log_names is None:
+      self._log_names = NameIndex(self._p, parts, self.nameSwap)
+    state = {
+      'time': self.nbr_time_steps * self.scene.dt,
+      'parts': parts,
+      'list_infos': list_infos,
+      'names': self._log_names,
+      'contacts': self.scene.contacts.get(),
+      'kinematics': kinematics_records(parts),
+      'joint_states': [],
+    }
+    if self.logs_with_joints:
+      bodyIndices = []
+      for part in self.robot.parts.values():
+        if part.bodyIndex in bodyIndices: continue
+        bodyIndices.append(part.bodyIndex)
+        num_joints = self._p.getNumJoints(part.bodyIndex)
+        joint_states = self._p.getJointStates(part.bodyIndex, list(range(num_joints))) if num_joints > 0 else []
+        state['joint_states'].append(joint_state_records(part.bodyIndex, joint_states))
+    return state
+
+  def _render_logs(self, state):
+    '''
+    Format a state captured by _capture_log_state into the text logs. This is a pure formatting pass:
+    names come from the NameIndex built at reset, joint tables are looked up once per body.
+    '''
+    with np.printoptions(formatter={'float_kind': lambda x: "%.2f" % x}):
+      loglist = [[f"Time: {state['time']:.3f}"]]
+      # Function to log contact events
+      loglist.append(format_contacts(state['contacts'], state['names']))
+      loglist.append(format_kinematics(state['kinematics'], list(state['parts'].keys()), state['names'], state['list_infos']))
+      for records in state['joint_states']:
+        robot_id = int(records['body'][0]) if len(records) else None
+        if robot_id not in self._log_joint_tables:
+          self._log_joint_tables[robot_id] = joint_table(self._p, robot_id) if robot_id is not None else ([], [])
+        loglist.append(format_joint_states(records, *self._log_joint_tables[robot_id]))
     return loglist
 
+  def _generate_logs(self):
+    if self.log_mode == 'lazy':
+      return LazyLogs(self._render_logs, self._capture_log_state())
+    return self._render_logs(self._capture_log_state())
+
   def reset(self, **kwargs):
-    if 'seed' in kwargs.keys(): self.seed(kwargs['seed']) 
+    if 'seed' in kwargs.keys():
+      self.seed(kwargs['seed'])
+      if self.reset_pool is not None:
+        self.reset_pool.clear(self)  # the pooled states were drawn from the previous seed
     self.nbr_time_steps = 0
-    reset_output = self._reset(**kwargs)
+    reset = self._reset if self.reset_pool is None else self._pooled_reset
+    if self.profiler is None:
+      reset_output = reset(**kwargs)
+    else:
+      with self.profiler.phase('reset'):
+        reset_output = reset(**kwargs)
+      self.profiler.instrument(self)
     self._generate_name_swap()
     if not isinstance(reset_output, tuple):
-      info = {'logs': self._generate_logs()}
+      info = {}
+      if self.log_mode != 'off':
+        info['logs'] = self._generate_logs()
       reset_output = tuple([reset_output, info])
+    if self._frame_ring is not None:
+      reset_output = (self._pixel_observation(reset_output[0], new_episode=True),) + tuple(reset_output[1:])
+    for recorder in self.recorders:
+      recorder.on_reset(self, reset_output[0])
     return reset_output 
     
   def _reset(self, **kwargs):
@@ -113,14 +370,14 @@ class BaseBulletEnv(gym.Env):
         self._p = bullet_client.BulletClient()
 
       self.physicsClientId = self._p._client
+      if self.sorted_pairs:
+        deterministic_pairs(self._p)
+      if self.profiler is not None:
+        self._p = self.profiler.wrap_client(self._p)
       self._p.configureDebugVisualizer(pybullet.COV_ENABLE_GUI,0)
 
     if self.scene is None:
-      self.scene = self.create_single_player_scene(
-        self._p,
-        timestep=self.timestep,
-        frame_skip=self.frame_skip,
-    )
+      self.scene = self.create_single_player_scene(self._p, **self.scene_options())
     if not self.scene.multiplayer and self.ownsPhysicsClient:
       self.scene.episode_restart(self._p)
 
@@ -131,40 +388,45 @@ class BaseBulletEnv(gym.Env):
     self.reward = 0
     dump = 0
     s = self.robot.reset(self._p)
+    self.scene.contacts.invalidate()  # the reset moved the bodies without a global_step
     self.potential = self.robot.calc_potential()
     return s
 
+  def _pooled_reset(self, **kwargs):
+    return self.reset_pool.reset(self)
+
+  def configure_rendering(self, **options):
+    '''
+    :param options: width, height, fov, near, far, renderer ('tiny', 'opengl' or a pybullet ER_* constant,
+    TinyRenderer in DIRECT mode by default), grayscale, downsample, see pybulletgym.utils.rendering.FrameRenderer
+    '''
+    self.frame_renderer.configure(**options)
+    if self._frame_ring is not None:
+      self.enable_pixel_observations(self._frame_stack, self.proprioceptive)  # the frames changed shape
+
   def _render(self, mode, close=False):
+    '''
+    :return: in 'rgb_array' mode, the (height, width, 3) uint8 frame, or (height, width) if grayscale. It is a
+    preallocated buffer overwritten by the next render, copy it to keep it.
+    '''
     if mode == "human":
       self.isRender = True
     if mode != "rgb_array":
       return np.array([])
 
+    return self.frame_renderer.render(self._p, self._camera_target(), self._cam_dist, self._cam_yaw, self._cam_pitch)
+
+  def _camera_target(self):
+    "The camera of the rgb_array frames and of the pixel observations tracks the robot, if it knows where it is."
     base_pos = [0,0,0]
     if hasattr(self,'robot'):
       if hasattr(self.robot,'body_xyz'):
         base_pos = self.robot.body_xyz
-
-    view_matrix = self._p.computeViewMatrixFromYawPitchRoll(
-      cameraTargetPosition=base_pos,
-      distance=self._cam_dist,
-      yaw=self._cam_yaw,
-      pitch=self._cam_pitch,
-      roll=0,
-      upAxisIndex=2)
-    proj_matrix = self._p.computeProjectionMatrixFOV(
-      fov=60, aspect=float(self._render_width)/self._render_height,
-      nearVal=0.1, farVal=100.0)
-    (_, _, px, _, _) = self._p.getCameraImage(
-    width=self._render_width, height=self._render_height, viewMatrix=view_matrix,
-      projectionMatrix=proj_matrix,
-      renderer=pybullet.ER_BULLET_HARDWARE_OPENGL
-      )
-    rgb_array = np.array(px)
-    rgb_array = rgb_array[:, :, :3]
-    return rgb_array
+    return base_pos
 
   def _close(self):
+    if self.reset_pool is not None:
+      self.reset_pool.clear(self)
     if self.ownsPhysicsClient:
       if self.physicsClientId >= 0:
         self._p.disconnect()
@@ -177,12 +439,25 @@ class BaseBulletEnv(gym.Env):
   # for extension of this class.
   def step(self, *args, **kwargs):
     self.nbr_time_steps += 1
-    step_output = self._step(*args, **kwargs)
+    if self.profiler is None:
+      step_output = self._step(*args, **kwargs)
+    else:
+      self.profiler.last_step = {}
+      # what _step spends outside of the robot and scene phases is reward and contact processing
+      with self.profiler.phase('rewards_and_contacts'):
+        step_output = self._step(*args, **kwargs)
     if len(step_output) == 4:
       info = step_output[-1]
-      info['logs'] = self._generate_logs()
+      if self.log_mode != 'off':
+        info['logs'] = self._generate_logs()
+      if self.profiler is not None and self.profile_in_info:
+        info['profile'] = self.profiler.last_step
       step_output = list(step_output[:-1])+[False]
       step_output.append(info)
+    if self._frame_ring is not None:
+      step_output = [self._pixel_observation(step_output[0], new_episode=False)] + list(step_output[1:])
+    for recorder in self.recorders:
+      recorder.on_step(self, args[0] if args else kwargs.get('a'), *step_output[:4])
     return tuple(step_output)
 
   if parse_version(gym.__version__)>=parse_version('0.9.6'):
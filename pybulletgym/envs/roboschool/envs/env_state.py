@@ -0,0 +1,133 @@
+import os
+import pickle
+import tempfile
+
+import pybullet
+
+
+def save_bullet(bullet_client):
+    '''
+    :return: the bytes of a saveBullet snapshot of the current state of the world
+    '''
+    fd, path = tempfile.mkstemp(suffix='.bullet')
+    os.close(fd)
+    try:
+        bullet_client.saveBullet(path)
+        with open(path, 'rb') as f:
+            return f.read()
+    finally:
+        os.remove(path)
+
+
+def restore_bullet(bullet_client, data):
+    '''
+    Restore the world to a snapshot returned by save_bullet. The world must hold the same bodies,
+    e.g. the snapshot comes from this env or from another instance of the same env.
+    '''
+    fd, path = tempfile.mkstemp(suffix='.bullet')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        bullet_client.restoreState(fileName=path)
+    finally:
+        os.remove(path)
+
+
+def deterministic_pairs(bullet_client):
+    '''
+    Sort the overlapping pairs of the broadphase. Their default order depends on the history of the world,
+    which a snapshot does not hold, and the solver visits the constraints in that order: without this,
+    two runs from the same snapshot drift apart as soon as the contacts or joint limits of several pairs are active.
+    '''
+    bullet_client.setPhysicsEngineParameter(deterministicOverlappingPairs=1)
+
+
+class EnvState:
+    """
+    Snapshot of an env at any step, see BaseBulletEnv.get_state: a saveState snapshot of the physics server,
+    which unlike resetting the body states also keeps the contact points the solver is warm started from,
+    the Python episode state of the env and robot, the step count and the random generator.
+    The saveState id only lives in the physics client it was taken in: to_bytes() serializes the snapshot
+    with saveBullet, to restore it in another instance of the same env, e.g. in a worker process.
+    """
+
+    def __init__(self, episode_state, nbr_time_steps, np_random, bullet_client=None, state_id=None, bullet=None):
+        '''
+        :param bullet_client, state_id: the saveState snapshot, if the state was taken in this process
+        :param bullet: the save_bullet bytes of the snapshot, if it was serialized
+        '''
+        self.episode_state = episode_state
+        self.nbr_time_steps = nbr_time_steps
+        self.np_random = np_random
+        self.bullet_client = bullet_client
+        self.state_id = state_id
+        self.bullet = bullet
+
+    @classmethod
+    def capture(cls, bullet_client, episode_state, nbr_time_steps, np_random, serializable=False):
+        '''
+        :param serializable: also take the saveBullet snapshot now, see _bullet
+        '''
+        state = cls(episode_state, nbr_time_steps, np_random, bullet_client=bullet_client, state_id=bullet_client.saveState())
+        if serializable:
+            state.bullet = save_bullet(bullet_client)
+        return state
+
+    def _in(self, bullet_client):
+        return self.state_id is not None and self.bullet_client._client == bullet_client._client
+
+    def restore_physics(self, bullet_client):
+        '''
+        Restore the physics server of bullet_client to the snapshot, with restoreState from the saveState id
+        if it was taken in this client and from the saveBullet bytes otherwise. The broadphase pairs of the client
+        are sorted from then on, so that every run from the same snapshot goes the same way.
+        '''
+        deterministic_pairs(bullet_client)
+        if self._in(bullet_client):
+            bullet_client.restoreState(self.state_id)
+        else:
+            restore_bullet(bullet_client, self._bullet())
+
+    def _bullet(self):
+        if self.bullet is None:
+            if self.state_id is None:
+                raise ValueError("the state was released before it was serialized")
+            # saveBullet writes the current world: visit the snapshot and come back to the current state.
+            # Like any snapshot, the round trip only leaves the episode unchanged if the pairs are sorted,
+            # see deterministic_pairs; capturing the state serializable saves the round trip.
+            p = self.bullet_client
+            current = p.saveState()
+            try:
+                p.restoreState(self.state_id)
+                self.bullet = save_bullet(p)
+            finally:
+                p.restoreState(current)
+                p.removeState(current)
+        return self.bullet
+
+    def to_bytes(self):
+        return pickle.dumps(
+            (self.episode_state, self.nbr_time_steps, self.np_random, self._bullet()), protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data):
+        episode_state, nbr_time_steps, np_random, bullet = pickle.loads(data)
+        return cls(episode_state, nbr_time_steps, np_random, bullet=bullet)
+
+    def __reduce__(self):
+        return EnvState.from_bytes, (self.to_bytes(),)
+
+    def release(self):
+        '''
+        Free the saveState snapshot in the physics server, the state can still be restored if it was serialized.
+        '''
+        if self.state_id is not None:
+            try:
+                self.bullet_client.removeState(self.state_id)
+            except pybullet.error:
+                pass  # the client was disconnected, its states are gone with it
+            self.state_id = None
+            self.bullet_client = None
+
+    def __del__(self):
+        self.release()
@@ -1,5 +1,5 @@
 from pybulletgym.envs.roboschool.envs.locomotion.walker_base_env import WalkerBaseBulletEnv
-from pybulletgym.envs.roboschool.robots.locomotors import Ant
+from pybulletgym.envs.roboschool.robots.locomotors.ant import Ant
 
 
 class AntBulletEnv(WalkerBaseBulletEnv):
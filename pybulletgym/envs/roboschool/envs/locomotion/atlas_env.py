@@ -1,15 +1,15 @@
 from pybulletgym.envs.roboschool.envs.locomotion.walker_base_env import WalkerBaseBulletEnv
-from pybulletgym.envs.roboschool.robots.locomotors import Atlas
+from pybulletgym.envs.roboschool.robots.locomotors.atlas import Atlas
 from pybulletgym.envs.roboschool.scenes import StadiumScene
 
 
 class AtlasBulletEnv(WalkerBaseBulletEnv):
     def __init__(self):
         self.robot = Atlas()
-        WalkerBaseBulletEnv.__init__(self, self.robot)
+        WalkerBaseBulletEnv.__init__(self, self.robot, timestep=None, frame_skip=None)  # the 8 substeps of its scene
 
-    def create_single_player_scene(self, bullet_client):
-        self.stadium_scene = StadiumScene(bullet_client, gravity=9.8, timestep=0.0165/8, frame_skip=8)   # 8 instead of 4 here
+    def create_single_player_scene(self, bullet_client, gravity=9.8, timestep=0.0165/8, frame_skip=8):   # 8 instead of 4 here
+        self.stadium_scene = StadiumScene(bullet_client, gravity=gravity, timestep=timestep, frame_skip=frame_skip)
         return self.stadium_scene
 
     def robot_specific_reset(self):
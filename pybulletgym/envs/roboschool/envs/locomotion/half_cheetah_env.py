@@ -1,5 +1,5 @@
 from pybulletgym.envs.roboschool.envs.locomotion.walker_base_env import WalkerBaseBulletEnv
-from pybulletgym.envs.roboschool.robots.locomotors import HalfCheetah
+from pybulletgym.envs.roboschool.robots.locomotors.half_cheetah import HalfCheetah
 
 
 class HalfCheetahBulletEnv(WalkerBaseBulletEnv):
@@ -1,5 +1,5 @@
 from pybulletgym.envs.roboschool.envs.locomotion.walker_base_env import WalkerBaseBulletEnv
-from pybulletgym.envs.roboschool.robots.locomotors import Humanoid
+from pybulletgym.envs.roboschool.robots.locomotors.humanoid import Humanoid
 
 
 class HumanoidBulletEnv(WalkerBaseBulletEnv):
@@ -1,5 +1,5 @@
 from pybulletgym.envs.roboschool.envs.locomotion.humanoid_env import HumanoidBulletEnv
-from pybulletgym.envs.roboschool.robots.locomotors import HumanoidFlagrun, HumanoidFlagrunHarder
+from pybulletgym.envs.roboschool.robots.locomotors.humanoid_flagrun import HumanoidFlagrun, HumanoidFlagrunHarder
 
 
 class HumanoidFlagrunBulletEnv(HumanoidBulletEnv):
@@ -9,8 +9,8 @@ class HumanoidFlagrunBulletEnv(HumanoidBulletEnv):
         self.robot = HumanoidFlagrun()
         HumanoidBulletEnv.__init__(self, self.robot)
 
-    def create_single_player_scene(self, bullet_client):
-        s = HumanoidBulletEnv.create_single_player_scene(self, bullet_client)
+    def create_single_player_scene(self, bullet_client, **kwargs):
+        s = HumanoidBulletEnv.create_single_player_scene(self, bullet_client, **kwargs)
         s.zero_at_running_strip_start_line = False
         return s
 
@@ -23,7 +23,7 @@ class HumanoidFlagrunHarderBulletEnv(HumanoidBulletEnv):
         self.electricity_cost /= 4   # don't care that much about electricity, just stand up!
         HumanoidBulletEnv.__init__(self, self.robot)
 
-    def create_single_player_scene(self, bullet_client):
-        s = HumanoidBulletEnv.create_single_player_scene(self, bullet_client)
+    def create_single_player_scene(self, bullet_client, **kwargs):
+        s = HumanoidBulletEnv.create_single_player_scene(self, bullet_client, **kwargs)
         s.zero_at_running_strip_start_line = False
         return s
@@ -0,0 +1,206 @@
+import functools
+
+from pybulletgym.envs.roboschool.envs.env_bases import BaseBulletEnv
+from pybulletgym.envs.roboschool.envs.env_state import deterministic_pairs
+from pybulletgym.envs.roboschool.robots.utils import extract_collision_filters_MJCF
+import gym, gym.spaces
+import pybullet
+from pybullet_utils import bullet_client
+import numpy as np
+
+
+# collision filter groups of the world before the lanes are added: Bullet's default and static filters
+WORLD_GROUPS = 0b11
+# one more group bit per lane, up to the 31st bit of the signed 32-bit group masks
+LANE_GROUPS = 29
+
+
+def _make_unwrapped(env_id):
+    return gym.make(env_id).unwrapped
+
+
+class VectorStadiumEnv(gym.Env):
+    """
+    N copies of a walker sharing one physics server and one stadium, each on its own running lane.
+    It relies on the multiplayer hooks of the scene: the N actions are applied, the simulation is stepped
+    once, then every copy computes its observation and reward from the shared world in its own _step.
+    Collisions between robots are filtered out, so that the lanes are independent.
+
+    Observations, rewards and flags are returned as (N, ...) arrays that are overwritten by the next
+    call to step() or reset(): copy them if they need to outlive it.
+    """
+
+    metadata = BaseBulletEnv.metadata
+
+    def __init__(self, env_fn, num_envs, lane_width=2.0, auto_reset=True, render=False, log_mode='off',
+                 lane_max_episode_steps=None):
+        '''
+        :param env_fn: gym id or callable returning a new WalkerBaseBulletEnv, e.g. HopperBulletEnv. Its robot
+        is expected to be loaded once and reset in place, like the MJCF walkers.
+        :param lane_width: distance between the lanes along y, lanes are centered on y=0.
+        :param auto_reset: reset a lane as soon as its robot is done, the last observation of the
+        episode is then stored in info['final_observation'].
+        :param log_mode: log mode of every copy, see BaseBulletEnv.
+        :param lane_max_episode_steps: number of steps after which the episode of a lane is truncated, by default
+        the max_episode_steps of the gym spec of env_fn if it is a gym id. The copies are unwrapped, this is their
+        TimeLimit: without it, the lanes whose robot does not fall would never be reset.
+        '''
+        if isinstance(env_fn, str):
+            if lane_max_episode_steps is None:
+                lane_max_episode_steps = gym.spec(env_fn).max_episode_steps
+            env_fn = functools.partial(_make_unwrapped, env_fn)
+        self.lane_max_episode_steps = lane_max_episode_steps
+        self.num_envs = num_envs
+        self.envs = [env_fn() for _ in range(num_envs)]
+        for env in self.envs:
+            env.set_log_mode(log_mode)
+            env.robot.zero_copy_observations = True  # the observations are copied into self._obs right away
+        self.lane_y = (np.arange(num_envs) - (num_envs - 1) / 2.0) * lane_width
+        self.auto_reset = auto_reset
+        self.isRender = render
+        self.physicsClientId = -1
+        self.scene = None
+
+        self.single_action_space = self.envs[0].action_space
+        self.single_observation_space = self.envs[0].observation_space
+        obs_dim = self.single_observation_space.shape[0]
+        act_dim = self.single_action_space.shape[0]
+        self.action_space = gym.spaces.Box(-1.0, 1.0, (num_envs, act_dim), dtype=np.float32)
+        self.observation_space = gym.spaces.Box(-np.inf, np.inf, (num_envs, obs_dim), dtype=np.float32)
+
+        self._obs = np.zeros((num_envs, obs_dim), dtype=np.float32)
+        self._rewards = np.zeros(num_envs, dtype=np.float32)
+        self._terminated = np.zeros(num_envs, dtype=bool)
+        self._truncated = np.zeros(num_envs, dtype=bool)
+        self._elapsed_steps = np.zeros(num_envs, dtype=np.int64)
+
+    def _load(self):
+        if self.isRender:
+            self._p = bullet_client.BulletClient(connection_mode=pybullet.GUI)
+        else:
+            self._p = bullet_client.BulletClient()
+        self.physicsClientId = self._p._client
+        self._p.configureDebugVisualizer(pybullet.COV_ENABLE_GUI, 0)
+
+        first = self.envs[0]
+        self.scene = first.create_single_player_scene(self._p, **first.scene_options())
+        self.scene.multiplayer = True  # robots act first, then a single global_step, then each _step observes
+        self.scene.episode_restart(self._p)
+
+        self._p.configureDebugVisualizer(pybullet.COV_ENABLE_RENDERING, 0)
+        for i, env in enumerate(self.envs):
+            env._p = self._p
+            env.physicsClientId = self.physicsClientId
+            env.ownsPhysicsClient = False
+            env.scene = env.stadium_scene = self.scene
+            env.robot.scene = self.scene
+            env.robot.player_n = i
+            env.robot.reset(self._p)  # loads the robot around the origin
+            env.parts, env.jdict, env.ordered_joints, env.robot_body = env.robot.addToScene(
+                self._p, self.scene.ground_plane_mjcf)
+            env.index_foot_contacts()
+            env.walk_target_y = env.robot.walk_target_y = self.lane_y[i]
+            # every joint, not only the motors robot.reset puts back, e.g. the root slides and hinge of the Hopper
+            env.robot._record_initial_state(env.robot_body_ids())
+        self._filter_inter_robot_collisions()
+        # the solver visits the contacts of all lanes in the order of the broadphase pairs: sorted, the order of
+        # the contacts of a lane does not depend on the other lanes, nor on the proxies the filters re-inserted
+        deterministic_pairs(self._p)
+        self._p.configureDebugVisualizer(pybullet.COV_ENABLE_RENDERING, 1)
+
+    def _filter_inter_robot_collisions(self):
+        '''
+        Put the links of every lane in a collision group of their own: robots collide with the ground, not with
+        the other lanes. That is one setCollisionFilterGroupMask per link. There are LANE_GROUPS groups, lanes
+        LANE_GROUPS apart share one and only their links are filtered pair by pair.
+        The group and mask replace the ones the MJCF importer derived from contype/conaffinity, e.g. the legs
+        of the Ant do not collide with each other: with Bullet's filter, two links collide if the group of
+        either one is in the mask of the other, as in MuJoCo, so the contype and conaffinity bits of a link
+        become its lane bit in the group and mask, and the mask keeps the world groups if the link collided
+        with the ground.
+        '''
+        links = []
+        for env in self.envs:
+            filters = extract_collision_filters_MJCF(env.robot.model_path)
+            lane_links = []
+            for body in env.robot_body_ids():
+                names = [self._p.getBodyInfo(body)[0]] + [
+                    self._p.getJointInfo(body, j)[12] for j in range(self._p.getNumJoints(body))]
+                for link, name in enumerate(names, -1):
+                    lane_links.append((body, link, filters.get(name.decode('utf8'), (1, 1))))
+            links.append(lane_links)
+
+        for i in range(self.num_envs):
+            lane = 1 << (2 + i % LANE_GROUPS)
+            for body, link, (contype, conaffinity) in links[i]:
+                group = lane if contype else 0
+                mask = (lane if conaffinity else 0) | (WORLD_GROUPS if contype or conaffinity else 0)
+                self._p.setCollisionFilterGroupMask(body, link, group, mask)
+            for j in range(i + LANE_GROUPS, self.num_envs, LANE_GROUPS):
+                for bodyA, linkA, _ in links[i]:
+                    for bodyB, linkB, _ in links[j]:
+                        self._p.setCollisionFilterPair(bodyA, bodyB, linkA, linkB, enableCollision=0)
+
+    def _reset_lane(self, i):
+        '''
+        Reset the robot of lane i in place: its bodies and all their joints are put back at rest where they
+        were loaded, as the restoreState of a single player reset does, the robot resets its motors as in a
+        single player reset, then it is moved sideways to its lane.
+        '''
+        env = self.envs[i]
+        env.robot._restore_initial_state()
+        env.robot.reset(self._p)
+        env.move_robot(0, self.lane_y[i], 0)
+        s = env.robot.calc_state()
+        env.frame = 0
+        env.done = 0
+        env.reward = 0
+        env.nbr_time_steps = 0
+        self._elapsed_steps[i] = 0
+        env.potential = env.robot.calc_potential()
+        env._generate_name_swap()
+        return s
+
+    def reset(self, **kwargs):
+        if self.physicsClientId < 0:
+            self._load()
+        # seeded once loaded, so that lane i draws its first episode as a single env seeded with seed + i
+        if 'seed' in kwargs.keys(): self.seed(kwargs['seed'])
+        for i in range(self.num_envs):
+            self._obs[i] = self._reset_lane(i)
+        self._terminated[:] = False
+        self._truncated[:] = False
+        return self._obs, {}
+
+    def step(self, actions):
+        '''
+        :param actions: (N, action_dim) array, one action per lane.
+        :return: (obs, rewards, terminated, truncated, infos), the arrays are (N, ...) and infos is a list of N dicts.
+        '''
+        for env, a in zip(self.envs, actions):
+            env.robot.apply_action(a)
+        self.scene.global_step()
+
+        infos = []
+        for i, (env, a) in enumerate(zip(self.envs, actions)):
+            state, reward, terminated, truncated, info = env.step(a)
+            self._obs[i] = state
+            self._rewards[i] = reward
+            self._elapsed_steps[i] += 1
+            if self.lane_max_episode_steps is not None and self._elapsed_steps[i] >= self.lane_max_episode_steps:
+                truncated = True
+            self._terminated[i] = terminated
+            self._truncated[i] = truncated
+            if self.auto_reset and (terminated or truncated):
+                info['final_observation'] = self._obs[i].copy()
+                self._obs[i] = self._reset_lane(i)
+            infos.append(info)
+        return self._obs, self._rewards, self._terminated, self._truncated, infos
+
+    def seed(self, seed=None):
+        return [env.seed(None if seed is None else seed + i)[0] for i, env in enumerate(self.envs)]
+
+    def close(self):
+        if self.physicsClientId >= 0:
+            self._p.disconnect()
+        self.physicsClientId = -1
@@ -1,5 +1,5 @@
 from pybulletgym.envs.roboschool.envs.locomotion.walker_base_env import WalkerBaseBulletEnv
-from pybulletgym.envs.roboschool.robots.locomotors import Walker2D
+from pybulletgym.envs.roboschool.robots.locomotors.walker2d import Walker2D
 
 
 class Walker2DBulletEnv(WalkerBaseBulletEnv):
@@ -1,13 +1,15 @@
 from pybulletgym.envs.roboschool.envs.env_bases import BaseBulletEnv
 from pybulletgym.envs.roboschool.scenes import StadiumScene
+from pybulletgym.envs.roboschool.scenes.scene_bases import ContactCache
 import pybullet
 import numpy as np
 
 
 class WalkerBaseBulletEnv(BaseBulletEnv):
-    def __init__(self, robot, render=False):
+    def __init__(self, robot, render=False, timestep=0.0166, frame_skip=1):
+        # the walkers have always stepped 0.0166 s at once, not with the 4 substeps of create_single_player_scene
         print("WalkerBase::__init__")
-        BaseBulletEnv.__init__(self, robot, render)
+        BaseBulletEnv.__init__(self, robot, render, timestep=timestep, frame_skip=frame_skip)
         self.camera_x = 0
         self.walk_target_x = 1e3  # kilometer away
         self.walk_target_y = 0
@@ -32,8 +34,7 @@ class WalkerBaseBulletEnv(BaseBulletEnv):
 
         self.parts, self.jdict, self.ordered_joints, self.robot_body = self.robot.addToScene(self._p,
                                                                                              self.stadium_scene.ground_plane_mjcf)
-        self.ground_ids = set([(self.parts[f].bodies[self.parts[f].bodyIndex], self.parts[f].bodyPartIndex) for f in
-                               self.foot_ground_object_names])
+        self.index_foot_contacts()
         self._p.configureDebugVisualizer(pybullet.COV_ENABLE_RENDERING, 1)
         if self.stateId < 0:
             self.stateId=self._p.saveState()
@@ -41,12 +42,25 @@ class WalkerBaseBulletEnv(BaseBulletEnv):
 
         return r
 
+    def index_foot_contacts(self):
+        "Keys of the feet and of the ground parts in the scene's contact cache, once the ground is in self.parts."
+        self.ground_ids = set([(self.parts[f].bodyIndex, self.parts[f].bodyPartIndex) for f in
+                               self.foot_ground_object_names])
+        self.ground_keys = ContactCache.keys(self.ground_ids)
+        self.foot_keys = ContactCache.keys([(f.bodyIndex, f.bodyPartIndex) for f in self.robot.feet])
+
+    def robot_body_ids(self):
+        "Ids of the bodies loaded for the robot, without the ground plane bodies that addToScene also records."
+        return sorted(set(part.bodyIndex for part in self.robot.parts.values()) - set(self.stadium_scene.ground_plane_mjcf))
+
     def move_robot(self, init_x, init_y, init_z):
         "Used by multiplayer stadium to move sideways, to another running lane."
-        self.cpp_robot.query_position()
-        pose = self.cpp_robot.root_part.pose()
-        pose.move_xyz(init_x, init_y, init_z)  # Works because robot loads around (0,0,0), and some robots have z != 0 that is left intact
-        self.cpp_robot.set_pose(pose)
+        for body in self.robot_body_ids():
+            position, orientation = self._p.getBasePositionAndOrientation(body)
+            # Works because robot loads around (0,0,0), and some robots have z != 0 that is left intact
+            self._p.resetBasePositionAndOrientation(
+                body, [position[0] + init_x, position[1] + init_y, position[2] + init_z], orientation)
+        self.robot.invalidate_link_snapshots()
 
     electricity_cost = -2.0	 # cost for using motors -- this parameter should be carefully tuned against reward for making progress, other values less improtant
     stall_torque_cost = -0.1  # cost for running electric current through a motor even at zero rotational speed, small
@@ -72,15 +86,9 @@ class WalkerBaseBulletEnv(BaseBulletEnv):
         progress = float(self.potential - potential_old)
 
         feet_collision_cost = 0.0
-        for i, f in enumerate(self.robot.feet):  # TODO: Maybe calculating feet contacts could be done within the robot code
-            contact_ids = set((x[2], x[4]) for x in f.contact_list())
-            # print("CONTACT OF '%d' WITH %d" % (contact_ids, ",".join(contact_names)) )
-            if self.ground_ids & contact_ids:
-                # see Issue 63: https://github.com/openai/roboschool/issues/63
-                # feet_collision_cost += self.foot_collision_cost
-                self.robot.feet_contact[i] = 1.0
-            else:
-                self.robot.feet_contact[i] = 0.0
+        # see Issue 63: https://github.com/openai/roboschool/issues/63
+        # feet_collision_cost += self.foot_collision_cost for feet touching anything but the ground
+        self.robot.feet_contact[:] = self.scene.contacts.touching(self.foot_keys, self.ground_keys)
 
         electricity_cost = self.electricity_cost * float(np.abs(a*self.robot.joint_speeds).mean())  # let's assume we have DC motor with controller, and reverse current braking
         electricity_cost += self.stall_torque_cost * float(np.square(a).mean())
@@ -9,8 +9,8 @@ class PusherBulletEnv(BaseBulletEnv):
         self.robot = Pusher()
         BaseBulletEnv.__init__(self, self.robot)
 
-    def create_single_player_scene(self, bullet_client):
-        return SingleRobotEmptyScene(bullet_client, gravity=9.81, timestep=0.0020, frame_skip=5)
+    def create_single_player_scene(self, bullet_client, gravity=9.81, timestep=0.0020, frame_skip=5):
+        return SingleRobotEmptyScene(bullet_client, gravity=gravity, timestep=timestep, frame_skip=frame_skip)
 
     def _step(self, a):
         self.robot.apply_action(a)
@@ -21,15 +21,7 @@ class PusherBulletEnv(BaseBulletEnv):
         potential_old = self.potential
         self.potential = self.robot.calc_potential()
 
-        joint_vel = np.array([
-            self.robot.shoulder_pan_joint.get_velocity(),
-            self.robot.shoulder_lift_joint.get_velocity(),
-            self.robot.upper_arm_roll_joint.get_velocity(),
-            self.robot.elbow_flex_joint.get_velocity(),
-            self.robot.forearm_roll_joint.get_velocity(),
-            self.robot.wrist_flex_joint.get_velocity(),
-            self.robot.wrist_roll_joint.get_velocity()
-        ])
+        joint_vel = self.robot.joint_velocities[self.robot.arm_joint_slots]
 
         action_product = np.matmul(np.abs(a), np.abs(joint_vel))
         action_sum = np.sum(a)
@@ -39,10 +31,7 @@ class PusherBulletEnv(BaseBulletEnv):
                 - 0.01 * action_sum  # stall torque require some energy
         )
 
-        stuck_joint_cost = 0
-        for j in self.robot.ordered_joints:
-            if np.abs(j.current_relative_position()[0]) - 1 < 0.01:
-                stuck_joint_cost += -0.1
+        stuck_joint_cost = -0.1 * np.count_nonzero(np.abs(self.robot.joint_relative_state[:, 0]) - 1 < 0.01)
 
         self.rewards = [float(self.potential - potential_old), float(electricity_cost), float(stuck_joint_cost)]
         self.HUD(state, a, False)
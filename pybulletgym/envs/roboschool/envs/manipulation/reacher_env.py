@@ -9,8 +9,8 @@ class ReacherBulletEnv(BaseBulletEnv):
         self.robot = Reacher()
         BaseBulletEnv.__init__(self, self.robot)
 
-    def create_single_player_scene(self, bullet_client):
-        return SingleRobotEmptyScene(bullet_client, gravity=0.0, timestep=0.0165, frame_skip=1)
+    def create_single_player_scene(self, bullet_client, gravity=0.0, timestep=0.0165, frame_skip=1):
+        return SingleRobotEmptyScene(bullet_client, gravity=gravity, timestep=timestep, frame_skip=frame_skip)
 
     def _step(self, a):
         assert (not self.scene.multiplayer)
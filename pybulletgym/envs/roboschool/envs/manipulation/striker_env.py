@@ -5,6 +5,8 @@ import numpy as np
 
 
 class StrikerBulletEnv(BaseBulletEnv):
+    episode_state_attributes = BaseBulletEnv.episode_state_attributes + ('_striked', '_min_strike_dist', '_strike_pos')
+
     def __init__(self):
         self.robot = Striker()
         BaseBulletEnv.__init__(self, self.robot)
@@ -12,8 +14,8 @@ class StrikerBulletEnv(BaseBulletEnv):
         self._min_strike_dist = np.inf
         self.strike_threshold = 0.1
 
-    def create_single_player_scene(self, bullet_client):
-        return SingleRobotEmptyScene(bullet_client, gravity=9.81, timestep=0.0020, frame_skip=5)
+    def create_single_player_scene(self, bullet_client, gravity=9.81, timestep=0.0020, frame_skip=5):
+        return SingleRobotEmptyScene(bullet_client, gravity=gravity, timestep=timestep, frame_skip=frame_skip)
 
     def _step(self, a):
         self.robot.apply_action(a)
@@ -24,15 +26,7 @@ class StrikerBulletEnv(BaseBulletEnv):
         potential_old = self.potential
         self.potential = self.robot.calc_potential()
 
-        joint_vel = np.array([
-            self.robot.shoulder_pan_joint.get_velocity(),
-            self.robot.shoulder_lift_joint.get_velocity(),
-            self.robot.upper_arm_roll_joint.get_velocity(),
-            self.robot.elbow_flex_joint.get_velocity(),
-            self.robot.forearm_roll_joint.get_velocity(),
-            self.robot.wrist_flex_joint.get_velocity(),
-            self.robot.wrist_roll_joint.get_velocity()
-        ])
+        joint_vel = self.robot.joint_velocities[self.robot.arm_joint_slots]
 
         action_product = np.matmul(np.abs(a), np.abs(joint_vel))
         action_sum = np.sum(a)
@@ -42,10 +36,7 @@ class StrikerBulletEnv(BaseBulletEnv):
                 - 0.01 * action_sum  # stall torque require some energy
         )
 
-        stuck_joint_cost = 0
-        for j in self.robot.ordered_joints:
-            if np.abs(j.current_relative_position()[0]) - 1 < 0.01:
-                stuck_joint_cost += -0.1
+        stuck_joint_cost = -0.1 * np.count_nonzero(np.abs(self.robot.joint_relative_state[:, 0]) - 1 < 0.01)
 
         dist_object_finger = self.robot.object.pose().xyz() - self.robot.fingertip.pose().xyz()
         reward_dist_vec = self.robot.object.pose().xyz() - self.robot.target.pose().xyz()		# TODO: Should the object and target really belong to the robot? Maybe split this off
@@ -54,7 +45,7 @@ class StrikerBulletEnv(BaseBulletEnv):
 
         if np.linalg.norm(dist_object_finger) < self.strike_threshold:
             self._striked = True
-            self._strike_pos = self.robot.fingertip.pose().xyz()
+            self._strike_pos = self.robot.fingertip.pose().xyz().copy()  # pose() is a view into the link snapshot
 
         if self._striked:
             reward_near_vec = self.robot.object.pose().xyz() - self._strike_pos
@@ -9,8 +9,8 @@ class ThrowerBulletEnv(BaseBulletEnv):
         self.robot = Thrower()
         BaseBulletEnv.__init__(self, self.robot)
 
-    def create_single_player_scene(self, bullet_client):
-        return SingleRobotEmptyScene(bullet_client, gravity=0.0, timestep=0.0020, frame_skip=5)
+    def create_single_player_scene(self, bullet_client, gravity=0.0, timestep=0.0020, frame_skip=5):
+        return SingleRobotEmptyScene(bullet_client, gravity=gravity, timestep=timestep, frame_skip=frame_skip)
 
     def _step(self, a):
         self.robot.apply_action(a)
@@ -20,15 +20,7 @@ class ThrowerBulletEnv(BaseBulletEnv):
         potential_old = self.potential
         self.potential = self.robot.calc_potential()
 
-        joint_vel = np.array([
-            self.robot.shoulder_pan_joint.get_velocity(),
-            self.robot.shoulder_lift_joint.get_velocity(),
-            self.robot.upper_arm_roll_joint.get_velocity(),
-            self.robot.elbow_flex_joint.get_velocity(),
-            self.robot.forearm_roll_joint.get_velocity(),
-            self.robot.wrist_flex_joint.get_velocity(),
-            self.robot.wrist_roll_joint.get_velocity()
-        ])
+        joint_vel = self.robot.joint_velocities[self.robot.arm_joint_slots]
 
         action_product = np.matmul(np.abs(a), np.abs(joint_vel))
         action_sum = np.sum(a)
@@ -38,17 +30,14 @@ class ThrowerBulletEnv(BaseBulletEnv):
                 - 0.01 * action_sum  # stall torque require some energy
         )
 
-        stuck_joint_cost = 0
-        for j in self.robot.ordered_joints:
-            if np.abs(j.current_relative_position()[0]) - 1 < 0.01:
-                stuck_joint_cost += -0.1
+        stuck_joint_cost = -0.1 * np.count_nonzero(np.abs(self.robot.joint_relative_state[:, 0]) - 1 < 0.01)
 
         object_xy = self.robot.object.pose().xyz()[:2]
         target_xy = self.robot.target.pose().xyz()[:2]
 
         if not self.robot._object_hit_ground and self.robot.object.pose().xyz()[2] < -0.25:						# TODO: Should the object and target really belong to the robot? Maybe split this off
             self.robot._object_hit_ground = True
-            self.robot._object_hit_location = self.robot.object.pose().xyz()
+            self.robot._object_hit_location = self.robot.object.pose().xyz().copy()  # pose() is a view into the link snapshot
 
         if self.robot._object_hit_ground:
             object_hit_xy = self.robot._object_hit_location[:2]
@@ -1 +1,19 @@
-from pybulletgym.envs.roboschool.envs.pendulum.inverted_pendulum_env import InvertedPendulumBulletEnv, InvertedPendulumSwingupBulletEnv
+import importlib
+
+# env name -> module, imported on first access: making the double pendulum does not import the single one
+_MODULES = {
+    'InvertedPendulumBulletEnv': 'inverted_pendulum_env',
+    'InvertedPendulumSwingupBulletEnv': 'inverted_pendulum_env',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f'{__name__}.{_MODULES[name]}'), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
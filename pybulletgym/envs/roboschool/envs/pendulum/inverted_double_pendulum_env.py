@@ -9,8 +9,8 @@ class InvertedDoublePendulumBulletEnv(BaseBulletEnv):
         BaseBulletEnv.__init__(self, self.robot, **kwargs)
         self.stateId = -1
 
-    def create_single_player_scene(self, bullet_client):
-        return SingleRobotEmptyScene(bullet_client, gravity=9.8, timestep=0.0165, frame_skip=1)
+    def create_single_player_scene(self, bullet_client, gravity=9.8, timestep=0.0165, frame_skip=1):
+        return SingleRobotEmptyScene(bullet_client, gravity=gravity, timestep=timestep, frame_skip=frame_skip)
     
     def _reset(self, **kwargs):
         if self.stateId >= 0:
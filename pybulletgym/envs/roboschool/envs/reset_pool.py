@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class ResetPool:
+    """
+    Pool of pre-sampled initial states of an env, see BaseBulletEnv.enable_reset_pool.
+    Every entry is a saveState snapshot of the physics server taken right after a full reset, together with
+    the Python episode state of the env and robot (see BaseBulletEnv._episode_state) and the first observation.
+    A pooled reset restores one of them, picked with the env's np_random, instead of running the robot's reset.
+    """
+
+    def __init__(self, size, refresh_every=0):
+        '''
+        :param size: number of initial states sampled when the pool is filled
+        :param refresh_every: if > 0, replace the oldest entry by a freshly sampled one every refresh_every
+        pooled resets, so that a long run sees more than size distinct initial states
+        '''
+        if size < 1:
+            raise ValueError(f"size of the reset pool should be at least 1, got {size}")
+        self.size = size
+        self.refresh_every = refresh_every
+        self.entries = []
+        self._resets = 0
+        self._oldest = 0
+
+    @property
+    def ready(self):
+        return len(self.entries) == self.size
+
+    def sample(self, env):
+        '''
+        Run a full reset of env and snapshot the state it leaves the physics server and the env in.
+        :return: (stateId, episode state, observation)
+        '''
+        s = env._reset()
+        return env._p.saveState(), env._episode_state(), np.array(s, copy=True)
+
+    def fill(self, env):
+        while len(self.entries) < self.size:
+            self.entries.append(self.sample(env))
+
+    def refresh_one(self, env):
+        '''
+        Replace the oldest entry. The fresh sample is a full reset of env, so this must only run
+        right before env is reset anyway.
+        '''
+        state_id = self.entries[self._oldest][0]
+        self.entries[self._oldest] = self.sample(env)
+        env._p.removeState(state_id)
+        self._oldest = (self._oldest + 1) % self.size
+
+    def reset(self, env):
+        '''
+        Reset env to one of the pooled initial states, filling the pool first if needed.
+        :return: the first observation of the episode
+        '''
+        if not self.ready:
+            self.fill(env)
+        elif self.refresh_every > 0 and self._resets % self.refresh_every == self.refresh_every - 1:
+            self.refresh_one(env)
+        self._resets += 1
+
+        state_id, episode_state, s = self.entries[int(env.np_random.uniform(0, self.size))]
+        env._p.restoreState(state_id)
+        env._set_episode_state(episode_state)
+        env.robot.invalidate_link_snapshots()
+        env.scene.contacts.invalidate()
+        if env.robot.initial_velocities:
+            # the initial impulses are external forces pending until the first step, saveState does not keep them
+            env.robot.robot_specific_dynamic_reset(env._p)
+        return s.copy()
+
+    def clear(self, env):
+        if env.physicsClientId >= 0:
+            for state_id, _, _ in self.entries:
+                env._p.removeState(state_id)
+        self.entries = []
+        self._resets = 0
+        self._oldest = 0
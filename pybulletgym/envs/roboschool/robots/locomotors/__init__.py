@@ -1,7 +1,26 @@
-from pybulletgym.envs.roboschool.robots.locomotors.ant import Ant
-from pybulletgym.envs.roboschool.robots.locomotors.atlas import Atlas
-from pybulletgym.envs.roboschool.robots.locomotors.half_cheetah import HalfCheetah
-from pybulletgym.envs.roboschool.robots.locomotors.hopper import Hopper
-from pybulletgym.envs.roboschool.robots.locomotors.humanoid import Humanoid
-from pybulletgym.envs.roboschool.robots.locomotors.humanoid_flagrun import HumanoidFlagrun, HumanoidFlagrunHarder
-from pybulletgym.envs.roboschool.robots.locomotors.walker2d import Walker2D
+import importlib
+
+# robot name -> module, imported on first access: making an env, which imports its robot module directly,
+# does not import the other robots
+_MODULES = {
+    'Ant': 'ant',
+    'Atlas': 'atlas',
+    'HalfCheetah': 'half_cheetah',
+    'Hopper': 'hopper',
+    'Humanoid': 'humanoid',
+    'HumanoidFlagrun': 'humanoid_flagrun',
+    'HumanoidFlagrunHarder': 'humanoid_flagrun',
+    'Walker2D': 'walker2d',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f'{__name__}.{_MODULES[name]}'), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
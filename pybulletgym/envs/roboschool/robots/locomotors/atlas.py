@@ -22,14 +22,16 @@ class Atlas(WalkerBase, URDFBasedRobot):
         x, y, z = self.head.pose().xyz()
         # Failure mode: robot doesn't bend knees, tries to walk using hips.
         # We fix that by a bit of reward engineering.
-        knees = np.array([j.current_relative_position() for j in [self.jdict["l_leg_kny"], self.jdict["r_leg_kny"]]], dtype=np.float32).flatten()
-        knees_at_limit = np.count_nonzero(np.abs(knees[0::2]) > 0.99)
+        # joint_relative_state was refreshed by calc_state() earlier in this step
+        knees = self.joint_relative_state[self.knee_slots, 0]
+        knees_at_limit = np.count_nonzero(np.abs(knees) > 0.99)
         return +4-knees_at_limit if z > 1.3 else -1
 
     def robot_specific_reset(self, bullet_client):
         WalkerBase.robot_specific_reset(self, bullet_client)
         self.set_initial_orientation(yaw_center=0, yaw_random_spread=np.pi)
         self.head = self.parts["head"]
+        self.knee_slots = self.joint_slots(["l_leg_kny", "r_leg_kny"])
 
     def set_initial_orientation(self, yaw_center, yaw_random_spread):
         if not self.random_yaw:
@@ -47,11 +47,13 @@ class Humanoid(WalkerBase, MJCFBasedRobot):
             self.robot_body.reset_orientation(p.getQuaternionFromEuler(orientation))
         self.initial_z = 0.8
 
+    def robot_specific_motor_reset(self):
+        force_gain = 1
+        self.set_motors(self.motors, [force_gain * power * self.power for power in self.motor_power])
+
     def apply_action(self, a):
         assert(np.isfinite(a).all())
-        force_gain = 1
-        for i, m, power in zip(range(17), self.motors, self.motor_power):
-            m.set_motor_torque(float(force_gain * power * self.power * np.clip(a[i], -1, +1)))
+        self.apply_motor_torques(a)
 
     def alive_bonus(self, z, pitch):
         return +2 if z > 0.78 else -1   # 2 here because 17 joints produce a lot of electricity cost just from policy noise, living must be better than dying
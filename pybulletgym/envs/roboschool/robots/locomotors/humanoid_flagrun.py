@@ -4,6 +4,8 @@ from pybulletgym.envs import gym_utils as ObjectHelper
 
 
 class HumanoidFlagrun(Humanoid):
+    episode_state_attributes = Humanoid.episode_state_attributes + ('flag_timeout',)
+
     def __init__(self):
         Humanoid.__init__(self)
         self.flag = None
@@ -28,17 +30,20 @@ class HumanoidFlagrun(Humanoid):
             self.flag = ObjectHelper.get_sphere(self._p, self.walk_target_x, self.walk_target_y, 0.7)
         self.flag_timeout = 600/self.scene.frame_skip  # match Roboschool
 
-    def calc_state(self):
+    def calc_state(self, out=None):
         self.flag_timeout -= 1
-        state = Humanoid.calc_state(self)
+        state = Humanoid.calc_state(self, out)
         if self.walk_target_dist < 1 or self.flag_timeout <= 0:
             self.flag_reposition()
-            state = Humanoid.calc_state(self)  # calculate state again, against new flag pos
+            state = Humanoid.calc_state(self, out)  # calculate state again, against new flag pos
             self.potential = self.calc_potential()	   # avoid reward jump
         return state
 
 
 class HumanoidFlagrunHarder(HumanoidFlagrun):
+    episode_state_attributes = HumanoidFlagrun.episode_state_attributes + (
+        'frame', 'on_ground_frame_counter', 'crawl_start_potential', 'crawl_ignored_potential')
+
     def __init__(self):
         HumanoidFlagrun.__init__(self)
         self.flag = None
@@ -3,6 +3,8 @@ import numpy as np
 
 
 class WalkerBase(XmlBasedRobot):
+    episode_state_attributes = ('initial_z', 'walk_target_x', 'walk_target_y', 'feet_contact', 'body_xyz')
+
     def __init__(self, power):
         self.power = power
         self.camera_x = 0
@@ -24,22 +26,25 @@ class WalkerBase(XmlBasedRobot):
             pass
         self.initial_z = None
 
+    def robot_specific_motor_reset(self):
+        # after robot_specific_reset, where the subclasses set the power_coef of their joints
+        self.set_motors(self.ordered_joints, [self.power * j.power_coef for j in self.ordered_joints])
+
     def apply_action(self, a):
         assert (np.isfinite(a).all())
-        for n, j in enumerate(self.ordered_joints):
-            j.set_motor_torque(self.power * j.power_coef * float(np.clip(a[n], -1, +1)))
+        self.apply_motor_torques(a)
 
-    def calc_state(self):
-        j = np.array([j.current_relative_position() for j in self.ordered_joints], dtype=np.float32).flatten()
+    def calc_state(self, out=None):
+        j = self.update_joint_states().reshape(-1)
         # even elements [0::2] position, scaled to -1..+1 between limits
         # odd elements  [1::2] angular speed, scaled to show -1..+1
         self.joint_speeds = j[1::2]
         self.joints_at_limit = np.count_nonzero(np.abs(j[0::2]) > 0.99)
 
         body_pose = self.robot_body.pose()
-        parts_xyz = np.array([p.pose().xyz() for p in self.parts.values()]).flatten()
+        parts_xyz = self.part_positions()
         self.body_xyz = (
-            parts_xyz[0::3].mean(), parts_xyz[1::3].mean(), body_pose.xyz()[2])  # torso z is more informative than mean z
+            parts_xyz[:, 0].mean(), parts_xyz[:, 1].mean(), body_pose.xyz()[2])  # torso z is more informative than mean z
         self.body_rpy = body_pose.rpy()
         z = self.body_xyz[2]
         if self.initial_z is None:
@@ -51,18 +56,21 @@ class WalkerBase(XmlBasedRobot):
             [self.walk_target_y - self.body_xyz[1], self.walk_target_x - self.body_xyz[0]])
         angle_to_target = self.walk_target_theta - yaw
 
-        rot_speed = np.array(
-            [[np.cos(-yaw), -np.sin(-yaw), 0],
-             [np.sin(-yaw), np.cos(-yaw), 0],
-             [		0,			 0, 1]]
-        )
-        vx, vy, vz = np.dot(rot_speed, self.robot_body.speed())  # rotate speed back to body point of view
+        # rotate speed back to body point of view, i.e. by -yaw around z
+        speed_x, speed_y, vz = self.robot_body.speed()
+        cos_yaw, sin_yaw = np.cos(yaw), np.sin(yaw)
+        vx = cos_yaw * speed_x + sin_yaw * speed_y
+        vy = -sin_yaw * speed_x + cos_yaw * speed_y
 
-        more = np.array([z-self.initial_z,
-                          np.sin(angle_to_target), np.cos(angle_to_target),
-                          0.3 * vx, 0.3 * vy, 0.3 * vz,  # 0.3 is just scaling typical speed into -1..+1, no physical sense here
-                          r, p], dtype=np.float32)
-        return np.clip(np.concatenate([more] + [j] + [self.feet_contact]), -5, +5)
+        obs = self._observation_buffer(out)
+        obs[:8] = (z-self.initial_z,
+                   np.sin(angle_to_target), np.cos(angle_to_target),
+                   0.3 * vx, 0.3 * vy, 0.3 * vz,  # 0.3 is just scaling typical speed into -1..+1, no physical sense here
+                   r, p)
+        obs[8:8 + j.size] = j
+        obs[8 + j.size:] = self.feet_contact
+        np.clip(obs, -5, +5, out=obs)
+        return self._observation(obs, out)
 
     def calc_potential(self):
         # progress in potential field is speed*dt, typical speed is about 2-3 meter per second, this potential will change 2-3 per frame (not per second),
@@ -7,6 +7,7 @@ class Reacher(MJCFBasedRobot):
 
     def __init__(self):
         MJCFBasedRobot.__init__(self, 'reacher.xml', 'body0', action_dim=2, obs_dim=9)
+        self.to_target_vec = np.zeros(3)
 
     def robot_specific_reset(self, bullet_client):
         self.jdict["target_x"].reset_current_position(
@@ -17,21 +18,22 @@ class Reacher(MJCFBasedRobot):
         self.target = self.parts["target"]
         self.central_joint = self.jdict["joint0"]
         self.elbow_joint = self.jdict["joint1"]
+        self.set_motors([self.central_joint, self.elbow_joint], [0.05, 0.05])
         self.central_joint.reset_current_position(self.np_random.uniform(low=-3.14, high=3.14), 0)
         self.elbow_joint.reset_current_position(self.np_random.uniform(low=-3.14, high=3.14), 0)
 
     def apply_action(self, a):
         assert (np.isfinite(a).all())
-        self.central_joint.set_motor_torque(0.05 * float(np.clip(a[0], -1, +1)))
-        self.elbow_joint.set_motor_torque(0.05 * float(np.clip(a[1], -1, +1)))
+        self.apply_motor_torques(a)
 
-    def calc_state(self):
+    def calc_state(self, out=None):
         theta, self.theta_dot = self.central_joint.current_relative_position()
         self.gamma, self.gamma_dot = self.elbow_joint.current_relative_position()
         target_x, _ = self.jdict["target_x"].current_position()
         target_y, _ = self.jdict["target_y"].current_position()
-        self.to_target_vec = np.array(self.fingertip.pose().xyz()) - np.array(self.target.pose().xyz())
-        return np.array([
+        np.subtract(self.fingertip.pose().xyz(), self.target.pose().xyz(), out=self.to_target_vec)
+        obs = self._observation_buffer(out)
+        obs[:] = (
             target_x,
             target_y,
             self.to_target_vec[0],
@@ -41,7 +43,8 @@ class Reacher(MJCFBasedRobot):
             self.theta_dot,
             self.gamma,
             self.gamma_dot,
-        ])
+        )
+        return self._observation(obs, out)
 
     def calc_potential(self):
         return -100 * np.linalg.norm(self.to_target_vec)
@@ -3,13 +3,16 @@ import numpy as np
 
 
 class Striker(MJCFBasedRobot):
+    episode_state_attributes = ('target_pos', 'object_pos', 'zero_offset', '_min_strike_dist', '_striked', '_strike_pos')
     min_target_placement_radius = 0.1
     max_target_placement_radius = 0.8
     min_object_placement_radius = 0.1
     max_object_placement_radius = 0.8
 
     def __init__(self):
-        MJCFBasedRobot.__init__(self, 'striker.xml', 'body0', action_dim=7, obs_dim=56)
+        # the layout calc_state packs: joint_state and joint_relative_state, (position, speed) of the 11 joints
+        # of striker.xml, the 3d to_target_vec, then the xyz of the fingertip, the object and the target
+        MJCFBasedRobot.__init__(self, 'striker.xml', 'body0', action_dim=7, obs_dim=2 * 2 * 11 + 3 + 3 * 3)
 
     def robot_specific_reset(self, bullet_client):
         # parts
@@ -25,6 +28,12 @@ class Striker(MJCFBasedRobot):
         self.forearm_roll_joint = self.jdict["r_forearm_roll_joint"]
         self.wrist_flex_joint = self.jdict["r_wrist_flex_joint"]
         self.wrist_roll_joint = self.jdict["r_wrist_roll_joint"]
+        self.arm_joint_slots = self.joint_slots([
+            "r_shoulder_pan_joint", "r_shoulder_lift_joint", "r_upper_arm_roll_joint", "r_elbow_flex_joint",
+            "r_forearm_roll_joint", "r_wrist_flex_joint", "r_wrist_roll_joint"])
+        self.set_motors([
+            self.shoulder_pan_joint, self.shoulder_lift_joint, self.upper_arm_roll_joint, self.elbow_flex_joint,
+            self.forearm_roll_joint, self.wrist_flex_joint, self.wrist_roll_joint], [0.05] * 7)
 
         self._min_strike_dist = np.inf
         self._striked = False
@@ -75,21 +84,18 @@ class Striker(MJCFBasedRobot):
 
     def apply_action(self, a):
         assert (np.isfinite(a).all())
-        self.shoulder_pan_joint.set_motor_torque(0.05 * float(np.clip(a[0], -1, +1)))
-        self.shoulder_lift_joint.set_motor_torque(0.05 * float(np.clip(a[1], -1, +1)))
-        self.upper_arm_roll_joint.set_motor_torque(0.05 * float(np.clip(a[2], -1, +1)))
-        self.elbow_flex_joint.set_motor_torque(0.05 * float(np.clip(a[3], -1, +1)))
-        self.forearm_roll_joint.set_motor_torque(0.05 * float(np.clip(a[4], -1, +1)))
-        self.wrist_flex_joint.set_motor_torque(0.05 * float(np.clip(a[5], -1, +1)))
-        self.wrist_roll_joint.set_motor_torque(0.05 * float(np.clip(a[6], -1, +1)))
+        self.apply_motor_torques(a)
 
-    def calc_state(self):
+    def calc_state(self, out=None):
         self.to_target_vec = self.target_pos - self.object_pos
-        return np.concatenate([
-            np.array([j.current_position() for j in self.ordered_joints]).flatten(),  # all positions
-            np.array([j.current_relative_position() for j in self.ordered_joints]).flatten(),  # all speeds
+        self.update_joint_states()
+        obs = self._pack(
+            self._observation_buffer(out),
+            self.joint_state,  # all positions
+            self.joint_relative_state,  # all speeds
             self.to_target_vec,
             self.fingertip.pose().xyz(),
             self.object.pose().xyz(),
             self.target.pose().xyz(),
-        ])
\ No newline at end of file
+        )
+        return self._observation(obs, out)
\ No newline at end of file
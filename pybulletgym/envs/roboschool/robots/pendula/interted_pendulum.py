@@ -24,7 +24,7 @@ class InvertedPendulum(MJCFBasedRobot):
             a[0] = 0
         self.slider.set_motor_torque(  100*float(np.clip(a[0], -1, +1)) )
 
-    def calc_state(self):
+    def calc_state(self, out=None):
         self.theta, self.theta_dot = self.j1.current_position()
         self.x, self.x_dot = self.slider.current_position()
         assert( np.isfinite(self.x) )
@@ -45,10 +45,12 @@ class InvertedPendulum(MJCFBasedRobot):
             print("theta_dot is inf")
             self.theta_dot = 0
 
-        return np.array([
+        obs = self._observation_buffer(out)
+        obs[:] = (
             self.x, self.x_dot,
             np.cos(self.theta), np.sin(self.theta), self.theta_dot
-        ])
+        )
+        return self._observation(obs, out)
 
 
 class InvertedPendulumSwingup(InvertedPendulum):
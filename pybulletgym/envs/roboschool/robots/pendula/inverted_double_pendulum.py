@@ -22,15 +22,17 @@ class InvertedDoublePendulum(MJCFBasedRobot):
         assert(np.isfinite(a).all())
         self.slider.set_motor_torque(200*float(np.clip(a[0], -1, +1)))
 
-    def calc_state(self):
+    def calc_state(self, out=None):
         theta, theta_dot = self.j1.current_position()
         gamma, gamma_dot = self.j2.current_position()
         x, vx = self.slider.current_position()
         self.pos_x, _, self.pos_y = self.pole2.pose().xyz()
         assert(np.isfinite(x))
-        return np.array([
+        obs = self._observation_buffer(out)
+        obs[:] = (
             x, vx,
             self.pos_x,
             np.cos(theta), np.sin(theta), theta_dot,
             np.cos(gamma), np.sin(gamma), gamma_dot,
-        ])
+        )
+        return self._observation(obs, out)
@@ -4,9 +4,10 @@ import numpy as np
 import os, inspect
 
 from pybulletgym.envs.roboschool.robots.utils import (
-  extract_initial_velocities_and_masses_MJCF,
+  load_boundary_conditions_MJCF,
   calculate_impulses,
 )
+from pybulletgym.utils.logging import contact_records
 
 currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
 parentdir = os.path.dirname(currentdir)
@@ -19,6 +20,12 @@ class XmlBasedRobot:
   """
 
   self_collision = True
+  # calc_state returns its preallocated observation buffer instead of a copy: the observation is then
+  # overwritten by the next calc_state
+  zero_copy_observations = False
+  # Python state of an episode that the physics server does not hold, e.g. randomly drawn targets,
+  # see episode_state
+  episode_state_attributes = ()
 
   def __init__(self, robot_name, action_dim, obs_dim, self_collision):
     self.parts = None
@@ -29,12 +36,15 @@ class XmlBasedRobot:
 
     high = np.ones([action_dim])
     self.action_space = gym.spaces.Box(-high, high)
-    high = np.inf * np.ones([obs_dim])
-    self.observation_space = gym.spaces.Box(-high, high)
+    high = np.inf * np.ones([obs_dim], dtype=np.float32)
+    self.observation_space = gym.spaces.Box(-high, high, dtype=np.float32)
+    self.observation = np.zeros(obs_dim, dtype=np.float32)  # written by calc_state, see _observation
 
     self.robot_name = robot_name
     self.self_collision = self_collision
     self.initial_velocities = {}
+    self._motor_batches = None
+    self._loaded_client = None  # client the bodies of URDF/SDF robots were loaded in, see _record_initial_state
 
   def addToScene(self, bullet_client, bodies):
     '''
@@ -103,8 +113,164 @@ class XmlBasedRobot:
 
           joints[joint_name].power_coef = 100.0
 
+    self._build_joint_state_buffers(ordered_joints)
+    self._build_link_snapshots(parts)
+
     return parts, joints, ordered_joints, self.robot_body
 
+  def _build_link_snapshots(self, parts):
+    '''
+    Attach to every part the LinkSnapshot of its body, and index the snapshot rows of all parts
+    so that part_positions() can gather them without going through the individual BodyParts.
+    :param parts: the dict of body parts returned by addToScene
+    '''
+    scene = getattr(self, 'scene', None)
+    snapshots = {}
+    part_rows = {}
+    for part in parts.values():
+      snapshot = snapshots.get(part.bodyIndex)
+      if snapshot is None:
+        snapshot = getattr(self, 'link_snapshots', {}).get(part.bodyIndex)
+        if snapshot is None or snapshot.scene is not scene:
+          snapshot = LinkSnapshot(self._p, part.bodyIndex, scene)
+        snapshots[part.bodyIndex] = snapshot
+      part.snapshot = snapshot
+      part_rows.setdefault(part.bodyIndex, []).append(part.bodyPartIndex + 1)
+    self.link_snapshots = snapshots
+    self._part_rows = [(snapshots[body_id], np.array(rows, dtype=np.intp)) for body_id, rows in part_rows.items()]
+
+  def invalidate_link_snapshots(self):
+    for snapshot in self.link_snapshots.values():
+      snapshot.invalidate()
+
+  def part_positions(self):
+    '''
+    :return: a (n_parts, 3) array with the position of every part in self.parts, taken from the link snapshots
+    '''
+    return np.concatenate([snapshot.get()[rows, LinkSnapshot.POSITION] for snapshot, rows in self._part_rows])
+
+  @staticmethod
+  def _group_joints_by_body(joints):
+    '''
+    :param joints: a list of Joint
+    :return: a list of (body_id, joint_indices, slots) with slots the positions of the body's joints in the list
+    '''
+    batches = {}
+    for slot, joint in enumerate(joints):
+      body_id = joint.bodies[joint.bodyIndex]
+      joint_indices, slots = batches.setdefault(body_id, ([], []))
+      joint_indices.append(joint.jointIndex)
+      slots.append(slot)
+    grouped = []
+    for body_id, (joint_indices, slots) in batches.items():
+      if slots == list(range(slots[0], slots[-1] + 1)):
+        slots = slice(slots[0], slots[-1] + 1)
+      else:
+        slots = np.array(slots)
+      grouped.append((body_id, joint_indices, slots))
+    return grouped
+
+  def _build_joint_state_buffers(self, ordered_joints):
+    '''
+    Group the ordered joints per body so that update_joint_states() needs a single getJointStates
+    call per body, and preallocate the float32 arrays shared by calc_state, the rewards and the logs.
+    :param ordered_joints: the list of controllable joints, in observation order
+    '''
+    self._joint_state_batches = self._group_joints_by_body(ordered_joints)
+    self.joint_slot = {joint.joint_name: slot for slot, joint in enumerate(ordered_joints)}
+
+    n = len(ordered_joints)
+    # column 0 is the position, column 1 the velocity; reshape(-1) gives the interleaved layout of the observations
+    self.joint_state = np.zeros((n, 2), dtype=np.float32)
+    self.joint_relative_state = np.zeros((n, 2), dtype=np.float32)
+    self.joint_positions = self.joint_state[:, 0]
+    self.joint_velocities = self.joint_state[:, 1]
+
+    has_limits = np.array([j.jointHasLimits for j in ordered_joints], dtype=bool)
+    lower = np.array([j.lowerLimit for j in ordered_joints], dtype=np.float64)
+    upper = np.array([j.upperLimit for j in ordered_joints], dtype=np.float64)
+    max_velocity = np.array([j.jointMaxVelocity for j in ordered_joints], dtype=np.float64)
+    revolute = np.array([j.jointType == Joint.JOINT_REVOLUTE_TYPE for j in ordered_joints], dtype=bool)
+    # same normalization as Joint.current_relative_position(), with unlimited joints left untouched
+    self._joint_pos_mid = np.where(has_limits, 0.5 * (lower + upper), 0.0).astype(np.float32)
+    self._joint_pos_scale = (2.0 / np.where(has_limits, upper - lower, 2.0)).astype(np.float32)
+    self._joint_vel_scale = np.where(
+      max_velocity > 0, 1.0 / np.where(max_velocity > 0, max_velocity, 1.0),
+      np.where(revolute, 0.1, 0.5)).astype(np.float32)
+
+  def joint_slots(self, joint_names):
+    '''
+    :param joint_names: names of joints in self.jdict
+    :return: the rows of self.joint_state / self.joint_relative_state holding these joints
+    '''
+    return np.array([self.joint_slot[name] for name in joint_names], dtype=np.intp)
+
+  def update_joint_states(self):
+    '''
+    Read the positions and velocities of all ordered joints with one getJointStates call per body.
+    Fills self.joint_state with the raw values and self.joint_relative_state with the values
+    normalized as in Joint.current_relative_position().
+    :return: self.joint_relative_state, a (n_joints, 2) float32 array
+    '''
+    for body_id, joint_indices, slots in self._joint_state_batches:
+      states = self._p.getJointStates(body_id, joint_indices)
+      self.joint_state[slots] = [s[:2] for s in states]
+    relative_positions = self.joint_relative_state[:, 0]
+    np.subtract(self.joint_positions, self._joint_pos_mid, out=relative_positions)
+    np.multiply(relative_positions, self._joint_pos_scale, out=relative_positions)
+    np.multiply(self.joint_velocities, self._joint_vel_scale, out=self.joint_relative_state[:, 1])
+    return self.joint_relative_state
+
+  def _observation_buffer(self, out):
+    '''
+    :return: the float32 array calc_state(out) writes the observation into: out, or the robot's preallocated buffer
+    '''
+    return self.observation if out is None else out
+
+  def _observation(self, obs, out):
+    '''
+    :return: what calc_state(out) returns once obs is written: out itself, the buffer in zero-copy mode, or a copy of it
+    '''
+    if out is not None or self.zero_copy_observations:
+      return obs
+    return obs.copy()
+
+  @staticmethod
+  def _pack(obs, *arrays):
+    '''
+    Copy arrays one after the other into obs, without the temporary of np.concatenate.
+    Raises a ValueError if they do not fill obs exactly, i.e. the obs_dim of the robot is wrong.
+    '''
+    offset = 0
+    for a in arrays:
+      a = np.ravel(a)
+      obs[offset:offset + a.size] = a
+      offset += a.size
+    if offset != obs.size:
+      raise ValueError(f"observation of {offset} values, obs_dim is {obs.size}")
+    return obs
+
+  def set_motors(self, joints, gains):
+    '''
+    Precompute the batched actuation path used by apply_motor_torques().
+    :param joints: the actuated joints, action[i] drives joints[i]
+    :param gains: the torque applied to joints[i] for action[i] == 1
+    '''
+    self._motor_batches = self._group_joints_by_body(joints)
+    self._motor_gains = np.asarray(gains, dtype=np.float64)
+    self._motor_torques = np.zeros(len(joints), dtype=np.float64)
+
+  def apply_motor_torques(self, a):
+    '''
+    Clip the action to [-1, 1], scale it by the motor gains and send it with one
+    setJointMotorControlArray(TORQUE_CONTROL) call per body.
+    '''
+    torques = self._motor_torques
+    np.clip(a[:len(torques)], -1, +1, out=torques)
+    np.multiply(torques, self._motor_gains, out=torques)
+    for body_id, joint_indices, slots in self._motor_batches:
+      self._p.setJointMotorControlArray(body_id, joint_indices, pybullet.TORQUE_CONTROL, forces=torques[slots])
+
   def robot_specific_dynamic_reset(self, physicsClient):
     dt = physicsClient.getPhysicsEngineParameters()['fixedTimeStep']
     initial_impulses = calculate_impulses(
@@ -142,6 +308,48 @@ class XmlBasedRobot:
   def robot_specific_reset(self, physicsClient):
     pass
 
+  def robot_specific_motor_reset(self):
+    '''
+    Called by reset() right after robot_specific_reset(), once the subclasses have set up their joints:
+    robots whose gains depend on these call set_motors() here.
+    '''
+    pass
+
+  def episode_state(self):
+    '''
+    :return: attribute name -> value of the episode_state_attributes that are set, not copied
+    '''
+    return {name: getattr(self, name) for name in self.episode_state_attributes if hasattr(self, name)}
+
+  def set_episode_state(self, state):
+    for name, value in state.items():
+      setattr(self, name, value)
+
+  def _needs_loading(self):
+    return self._loaded_client != self._p._client
+
+  def _record_initial_state(self, bodies):
+    '''
+    Remember the base pose and joint positions of freshly loaded bodies, so that later resets
+    restore them with _restore_initial_state instead of loading the bodies again.
+    '''
+    if np.isscalar(bodies):
+      bodies = [bodies]
+    self._initial_state = []
+    for body in bodies:
+      position, orientation = self._p.getBasePositionAndOrientation(body)
+      num_joints = self._p.getNumJoints(body)
+      joint_positions = [state[0] for state in self._p.getJointStates(body, range(num_joints))] if num_joints > 0 else []
+      self._initial_state.append((body, position, orientation, joint_positions))
+    self._loaded_client = self._p._client
+
+  def _restore_initial_state(self):
+    for body, position, orientation, joint_positions in self._initial_state:
+      self._p.resetBasePositionAndOrientation(body, position, orientation)
+      self._p.resetBaseVelocity(body, [0, 0, 0], [0, 0, 0])
+      for joint_index, joint_position in enumerate(joint_positions):
+        self._p.resetJointState(body, joint_index, joint_position, 0)
+
   def reset_pose(self, position, orientation):
     self.parts[self.robot_name].reset_pose(position, orientation)
 
@@ -159,7 +367,8 @@ class MJCFBasedRobot(XmlBasedRobot):
       full_path = self.model_xml
     else:
       full_path = os.path.join(os.path.dirname(__file__), "..", "..", "assets", "mjcf", self.model_xml)
-    self.boundary_conditions = extract_initial_velocities_and_masses_MJCF(full_path)
+    self.model_path = full_path
+    self.boundary_conditions = load_boundary_conditions_MJCF(full_path)
     self.initial_velocities = self.boundary_conditions['initial_velocities']
     self.link_masses = self.boundary_conditions['link_masses']
     
@@ -182,7 +391,9 @@ class MJCFBasedRobot(XmlBasedRobot):
         self.parts, self.jdict, self.ordered_joints, self.robot_body = self.addToScene(self._p, self.objects)
     self.robot_specific_dynamic_reset(self._p)
     self.robot_specific_reset(self._p)
+    self.robot_specific_motor_reset()
 
+    self.invalidate_link_snapshots()  # the reset moved the bodies without a global_step
     s = self.calc_state()  # optimization: calc_state() can calculate something in self.* for calc_potential() to use
 
     return s
@@ -207,30 +418,35 @@ class URDFBasedRobot(XmlBasedRobot):
 
   def reset(self, bullet_client):
     self._p = bullet_client
-    self.ordered_joints = []
 
-    if os.path.isabs(self.model_xml):
-      full_path = self.model_xml
-    else:
-      full_path = os.path.join(os.path.dirname(__file__), "..", "..", "assets", "robots", self.model_urdf)
-    print(full_path)
-
-    if self.self_collision:
-      self.parts, self.jdict, self.ordered_joints, self.robot_body = self.addToScene(self._p,
-        self._p.loadURDF(full_path,
-        basePosition=self.basePosition,
-        baseOrientation=self.baseOrientation,
-        useFixedBase=self.fixed_base,
-        flags=pybullet.URDF_USE_SELF_COLLISION))
+    if self._needs_loading():
+      # loaded once per client, later resets restore the state the bodies were loaded in
+      self.ordered_joints = []
+      if os.path.isabs(self.model_urdf):
+        full_path = self.model_urdf
+      else:
+        full_path = os.path.join(os.path.dirname(__file__), "..", "..", "assets", "robots", self.model_urdf)
+
+      if self.self_collision:
+        bodies = self._p.loadURDF(full_path,
+          basePosition=self.basePosition,
+          baseOrientation=self.baseOrientation,
+          useFixedBase=self.fixed_base,
+          flags=pybullet.URDF_USE_SELF_COLLISION)
+      else:
+        bodies = self._p.loadURDF(full_path,
+          basePosition=self.basePosition,
+          baseOrientation=self.baseOrientation,
+          useFixedBase=self.fixed_base)
+      self.parts, self.jdict, self.ordered_joints, self.robot_body = self.addToScene(self._p, bodies)
+      self._record_initial_state(bodies)
     else:
-      self.parts, self.jdict, self.ordered_joints, self.robot_body = self.addToScene(self._p,
-        self._p.loadURDF(full_path,
-        basePosition=self.basePosition,
-        baseOrientation=self.baseOrientation,
-        useFixedBase=self.fixed_base))
+      self._restore_initial_state()
 
     self.robot_specific_reset(self._p)
+    self.robot_specific_motor_reset()
 
+    self.invalidate_link_snapshots()  # the reset moved the bodies without a global_step
     s = self.calc_state()  # optimization: calc_state() can calculate something in self.* for calc_potential() to use
     self.potential = self.calc_potential()
 
@@ -260,13 +476,19 @@ class SDFBasedRobot(XmlBasedRobot):
   def reset(self, bullet_client):
     self._p = bullet_client
 
-    self.ordered_joints = []
-
-    self.parts, self.jdict, self.ordered_joints, self.robot_body = self.addToScene(self._p,  # TODO: Not sure if this works, try it with kuka
-      self._p.loadSDF(os.path.join("models_robot", self.model_sdf)))
+    if self._needs_loading():
+      # loaded once per client, later resets restore the state the bodies were loaded in
+      self.ordered_joints = []
+      bodies = self._p.loadSDF(os.path.join("models_robot", self.model_sdf))
+      self.parts, self.jdict, self.ordered_joints, self.robot_body = self.addToScene(self._p, bodies)  # TODO: Not sure if this works, try it with kuka
+      self._record_initial_state(bodies)
+    else:
+      self._restore_initial_state()
 
     self.robot_specific_reset(self._p)
+    self.robot_specific_motor_reset()
 
+    self.invalidate_link_snapshots()  # the reset moved the bodies without a global_step
     s = self.calc_state()  # optimization: calc_state() can calculate something in self.* for calc_potential() to use
     self.potential = self.calc_potential()
 
@@ -277,6 +499,55 @@ class SDFBasedRobot(XmlBasedRobot):
     return 0
 
 
+class LinkSnapshot:
+  """
+  Pose and velocity of every link of one body, fetched with a single getLinkStates call plus the
+  base queries and kept until the next Scene.global_step.
+  Row 0 holds the base, row k+1 the link k. Columns are position (3), orientation quaternion (4),
+  linear velocity (3) and angular velocity (3).
+  The array is read-only outside of refresh: the BodyPart accessors return views into it, shared by all their
+  callers until the next step, which must copy them to modify them.
+  """
+
+  POSITION = slice(0, 3)
+  ORIENTATION = slice(3, 7)
+  POSE = slice(0, 7)
+  LINEAR_VELOCITY = slice(7, 10)
+  ANGULAR_VELOCITY = slice(10, 13)
+
+  def __init__(self, bullet_client, body_id, scene=None):
+    self._p = bullet_client
+    self.body_id = body_id
+    self.scene = scene
+    self.link_indices = list(range(self._p.getNumJoints(body_id)))
+    self.data = np.zeros((len(self.link_indices) + 1, 13))
+    self.data.setflags(write=False)
+    self._step_count = None
+
+  def invalidate(self):
+    self._step_count = None
+
+  def get(self):
+    '''
+    :return: the (n_links + 1, 13) snapshot array, refreshed if a global_step happened since the last read
+    '''
+    if self.scene is None or self._step_count != self.scene.global_step_count:
+      self.refresh()
+    return self.data
+
+  def refresh(self):
+    data = self.data
+    position, orientation = self._p.getBasePositionAndOrientation(self.body_id)
+    linear_velocity, angular_velocity = self._p.getBaseVelocity(self.body_id)
+    data.setflags(write=True)  # the views taken from data stay read-only
+    data[0] = position + orientation + linear_velocity + angular_velocity
+    if self.link_indices:
+      link_states = self._p.getLinkStates(self.body_id, self.link_indices, computeLinkVelocity=1)
+      data[1:] = [s[0] + s[1] + s[6] + s[7] for s in link_states]
+    data.setflags(write=False)
+    self._step_count = self.scene.global_step_count if self.scene is not None else None
+
+
 class PoseHelper:  # dummy class to comply to original interface
   def __init__(self, body_part):
     self.body_part = body_part
@@ -294,10 +565,12 @@ class PoseHelper:  # dummy class to comply to original interface
 class BodyPart:
   def __init__(self, bullet_client, body_name, bodies, bodyIndex, bodyPartIndex):
     self.name = body_name
-    #self.bodies = bodies
+    self.bodies = bodies
     self._p = bullet_client
     self.bodyIndex = bodyIndex
     self.bodyPartIndex = bodyPartIndex
+    self.snapshot = None  # set by XmlBasedRobot.addToScene, accessors then return read-only views into it
+    self._row = bodyPartIndex + 1
     self.initialPosition = self.current_position()
     self.initialOrientation = self.current_orientation()
     self.bp_pose = PoseHelper(self)
@@ -310,13 +583,17 @@ class BodyPart:
     return np.array([x, y, z, a, b, c, d])
 
   def get_pose(self):
+    if self.snapshot is not None:
+      return self.snapshot.get()[self._row, LinkSnapshot.POSE]
     return self.state_fields_of_pose_of(self.bodyIndex, self.bodyPartIndex)
 
   def speed(self):
+    if self.snapshot is not None:
+      return self.snapshot.get()[self._row, LinkSnapshot.LINEAR_VELOCITY]
     if self.bodyPartIndex == -1:
       (vx, vy, vz), _ = self._p.getBaseVelocity(self.bodyIndex)
     else:
-      (x, y, z), (a, b, c, d), _,_,_,_, (vx, vy, vz), (vr, vp, vy) = self._p.getLinkState(self.bodyIndex, self.bodyPartIndex, computeLinkVelocity=1)
+      (x, y, z), (a, b, c, d), _,_,_,_, (vx, vy, vz), (vr, vp, vyaw) = self._p.getLinkState(self.bodyIndex, self.bodyPartIndex, computeLinkVelocity=1)
     return np.array([vx, vy, vz])
 
   def current_position(self):
@@ -335,13 +612,17 @@ class BodyPart:
     return self._p.getBaseVelocity(self.bodyIndex)
 
   def get_linear_velocity(self):
+    if self.snapshot is not None:
+      return self.snapshot.get()[self._row, LinkSnapshot.LINEAR_VELOCITY]
     if self.bodyPartIndex == -1:
       (vx, vy, vz), _ = self._p.getBaseVelocity(self.bodyIndex)
     else:
-      (x, y, z), (a, b, c, d), _,_,_,_, (vx, vy, vz), (vr, vp, vy) = self._p.getLinkState(self.bodyIndex, self.bodyPartIndex, computeLinkVelocity=1)
+      (x, y, z), (a, b, c, d), _,_,_,_, (vx, vy, vz), (vr, vp, vyaw) = self._p.getLinkState(self.bodyIndex, self.bodyPartIndex, computeLinkVelocity=1)
     return np.array([vx, vy, vz])
   
   def get_angular_velocity(self):
+    if self.snapshot is not None:
+      return self.snapshot.get()[self._row, LinkSnapshot.ANGULAR_VELOCITY]
     if self.bodyPartIndex == -1:
       (vx, vy, vz), (vr, vp, vy) = self._p.getBaseVelocity(self.bodyIndex)
     else:
@@ -350,9 +631,11 @@ class BodyPart:
 
   def reset_position(self, position):
     self._p.resetBasePositionAndOrientation(self.bodyIndex, position, self.get_orientation())
+    self._invalidate_snapshot()
 
   def reset_orientation(self, orientation):
     self._p.resetBasePositionAndOrientation(self.bodyIndex, self.get_position(), orientation)
+    self._invalidate_snapshot()
 
   def reset_velocity(self, linearVelocity=None, angularVelocity=None):
     if linearVelocity is None:
@@ -360,15 +643,29 @@ class BodyPart:
     if angularVelocity is None:
       angularVelocity = [0, 0, 0]
     self._p.resetBaseVelocity(self.bodyIndex, linearVelocity, angularVelocity)
+    self._invalidate_snapshot()
 
   def reset_pose(self, position, orientation):
     self._p.resetBasePositionAndOrientation(self.bodyIndex, position, orientation)
+    self._invalidate_snapshot()
+
+  def _invalidate_snapshot(self):
+    if self.snapshot is not None:
+      self.snapshot.invalidate()
 
   def pose(self):
     return self.bp_pose
 
   def contact_list(self):
-    return self._p.getContactPoints(self.bodyIndex, -1, self.bodyPartIndex, -1)
+    '''
+    :return: the contact points of the part with any link of the other bodies, as records of
+    pybulletgym.utils.logging.CONTACT_DTYPE with the part on the A side. Once the part is in a scene, they come
+    from the contact cache of the scene, see ContactCache.points.
+    '''
+    scene = self.snapshot.scene if self.snapshot is not None else None
+    if scene is not None:
+      return scene.contacts.points(self.bodyIndex, self.bodyPartIndex)
+    return contact_records(self._p.getContactPoints(bodyA=self.bodyIndex, linkIndexA=self.bodyPartIndex))
 
 
 class Joint:
@@ -1,4 +1,8 @@
 import xml.etree.ElementTree as ET
+import functools
+import json
+import operator
+import os
 
 
 def extract_initial_velocities_and_masses_MJCF(xml_file):
@@ -29,7 +33,6 @@ def extract_initial_velocities_and_masses_MJCF(xml_file):
             else:
               linear = [0, 0, 0]  # Default if not specified. 
               rlinear = [-1, 1, -1, 1, -1, 1]
-            print(f"Extracting initial linear velocity for {name} : {linear}")
             angular = velocity.find('angular')  
             if angular is not None:
               rangular = [
@@ -46,7 +49,6 @@ def extract_initial_velocities_and_masses_MJCF(xml_file):
             else:
               angular = [0, 0, 0]  # Default if not specified.
               rangular = [-1, 1, -1, 1, -1, 1]
-            print(f"Extracting initial angular velocity for {name} : {angular}")
             initial_velocities[name] = {
                 'linear': linear,
                 'angular': angular,
@@ -72,6 +74,101 @@ def extract_initial_velocities_and_masses_MJCF(xml_file):
     return rdict
 
 
+def extract_collision_filters_MJCF(xml_file):
+    '''
+    :return: body name -> (contype, conaffinity) of its geoms, or-ed together. The MJCF importer of pybullet
+    turns them into the collision filter group and mask of the link, there is no getter for these in pybullet.
+    Only the top-level <default> is applied, the geoms of the assets do not use default classes.
+    '''
+    root = ET.parse(xml_file).getroot()
+    contype, conaffinity = 1, 1
+    default = root.find('default')
+    if default is not None and default.find('geom') is not None:
+        contype = int(default.find('geom').get('contype', contype))
+        conaffinity = int(default.find('geom').get('conaffinity', conaffinity))
+
+    filters = {}
+    for body in root.iter('body'):
+        geoms = body.findall('geom')
+        if not geoms: continue
+        filters[body.get('name')] = (
+            functools.reduce(operator.or_, (int(geom.get('contype', contype)) for geom in geoms)),
+            functools.reduce(operator.or_, (int(geom.get('conaffinity', conaffinity)) for geom in geoms)),
+        )
+    return filters
+
+
+# Whether load_boundary_conditions_MJCF also keeps a compiled copy next to the assets by default.
+PERSIST_COMPILED_BOUNDARY_CONDITIONS = False
+COMPILED_SUFFIX = '.bc.json'
+
+_boundary_conditions_cache = {}
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict. Unlike a MappingProxyType it pickles and deep-copies, along with the robots and envs holding it.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return FrozenDict({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _read_compiled(path, mtime):
+    try:
+        with open(path + COMPILED_SUFFIX) as f:
+            compiled = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return compiled['boundary_conditions'] if compiled.get('mtime_ns') == mtime else None
+
+
+def _write_compiled(path, mtime, rdict):
+    tmp = f'{path}{COMPILED_SUFFIX}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'w') as f:
+            json.dump({'mtime_ns': mtime, 'boundary_conditions': rdict}, f)
+        os.replace(tmp, path + COMPILED_SUFFIX)
+    except OSError:
+        pass  # e.g. read-only install, the cache of this process still applies
+
+
+def load_boundary_conditions_MJCF(xml_file, persist=None):
+    '''
+    Process-wide cached extract_initial_velocities_and_masses_MJCF, keyed by (resolved path, mtime).
+    The returned records are shared between robots and therefore immutable: FrozenDicts and tuples.
+    :param persist: also read/write a compiled copy next to the asset, valid as long as the asset's mtime
+    does not change, so that other processes skip the XML parsing. Defaults to PERSIST_COMPILED_BOUNDARY_CONDITIONS.
+    '''
+    if persist is None:
+        persist = PERSIST_COMPILED_BOUNDARY_CONDITIONS
+    path = os.path.realpath(xml_file)
+    mtime = os.stat(path).st_mtime_ns
+    record = _boundary_conditions_cache.get((path, mtime))
+    if record is None:
+        rdict = _read_compiled(path, mtime) if persist else None
+        if rdict is None:
+            rdict = extract_initial_velocities_and_masses_MJCF(path)
+            if persist:
+                _write_compiled(path, mtime, rdict)
+        record = _boundary_conditions_cache[(path, mtime)] = _freeze(rdict)
+    return record
+
+
 def calculate_impulses(
     physicsClient,
     parts,
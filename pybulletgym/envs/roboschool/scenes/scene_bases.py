@@ -1,8 +1,10 @@
 import sys, os
 sys.path.append(os.path.dirname(__file__))
 import pybullet as p
+import numpy as np
 
 import gym
+from pybulletgym.utils.logging import contact_records
 
 
 class Scene:
@@ -21,6 +23,8 @@ class Scene:
         self.human_render_detected = False  # if user wants render("human"), we open test window
 
         self.multiplayer_robots = {}
+        self.global_step_count = 0  # lets per-step caches such as LinkSnapshot know when they are stale
+        self.contacts = ContactCache(self._p, self)
 
     def test_window(self):
         "Call this function every frame, to see what's going on. Not necessary in learning."
@@ -50,6 +54,86 @@ class Scene:
         observations from robots using step() with the same action.
         """
         self.cpp_world.step(self.frame_skip)
+        self.global_step_count += 1
+
+class ContactCache:
+    """
+    Contact points of the whole world, fetched with a single getContactPoints() the first time they are
+    needed after each global_step, and indexed by (body, link) so that rewards, observations and logs share them.
+    Parts are designated by keys, see ContactCache.keys.
+    """
+
+    def __init__(self, bullet_client, scene):
+        self._p = bullet_client
+        self.scene = scene
+        self.invalidate()
+
+    @staticmethod
+    def keys(body_links):
+        """
+        :param body_links: iterable of (body id, link index) pairs, link -1 being the base
+        :return: int64 array of one key per pair
+        """
+        body_links = np.asarray(list(body_links), dtype=np.int64).reshape(-1, 2)
+        return (body_links[:, 0] << 32) | (body_links[:, 1] + 1)
+
+    def invalidate(self):
+        "Used after resets, which move bodies without a global_step."
+        self._step_count = None
+
+    def get(self):
+        """
+        :return: structured array of pybulletgym.utils.logging.CONTACT_DTYPE, one record per contact point
+        """
+        if self._step_count != self.scene.global_step_count:
+            self.refresh()
+        return self._records
+
+    def refresh(self):
+        self._records = contact_records(self._p.getContactPoints())
+        self._keys_a = (self._records['bodyA'].astype(np.int64) << 32) | (self._records['linkA'] + 1)
+        self._keys_b = (self._records['bodyB'].astype(np.int64) << 32) | (self._records['linkB'] + 1)
+        self._step_count = self.scene.global_step_count
+
+    def points(self, body, link=-1):
+        """
+        Same as getContactPoints(bodyA=body, linkIndexA=link): the contacts of the part, which is always on the A side.
+        Unlike that query, the self-contacts of the part are returned whichever side of the pair it is on.
+        """
+        records = self.get()
+        key = self.keys([(body, link)])[0]
+        as_b = records[self._keys_b == key]  # a copy, the sides are swapped in place
+        as_b['bodyA'], as_b['bodyB'] = as_b['bodyB'].copy(), as_b['bodyA'].copy()
+        as_b['linkA'], as_b['linkB'] = as_b['linkB'].copy(), as_b['linkA'].copy()
+        as_b['normal'] *= -1
+        return np.concatenate([records[self._keys_a == key], as_b])
+
+    def touching(self, part_keys, other_keys):
+        """
+        :return: bool array, whether each of part_keys is in contact with any of other_keys
+        """
+        self.get()
+        touched = np.concatenate([
+            self._keys_a[np.isin(self._keys_b, other_keys)],
+            self._keys_b[np.isin(self._keys_a, other_keys)],
+        ])
+        return np.isin(part_keys, touched)
+
+    def normal_force_sums(self, part_keys):
+        """
+        :return: float64 array, sum of the normal forces of the contacts of each of part_keys
+        """
+        records = self.get()
+        part_keys = np.asarray(part_keys)
+        if len(part_keys) == 0:
+            return np.zeros(0)
+        keys = np.concatenate([self._keys_a, self._keys_b])
+        forces = np.concatenate([records['force'], records['force']])
+        sorter = np.argsort(part_keys)
+        rows = sorter[np.searchsorted(part_keys, keys, sorter=sorter).clip(max=len(part_keys) - 1)]
+        match = part_keys[rows] == keys
+        return np.bincount(rows[match], weights=forces[match], minlength=len(part_keys))
+
 
 class SingleRobotEmptyScene(Scene):
     multiplayer = False  # this class is used "as is" for InvertedPendulum, Reacher
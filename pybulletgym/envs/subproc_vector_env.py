@@ -0,0 +1,358 @@
+import functools
+import multiprocessing as mp
+import traceback
+
+import gym, gym.spaces, gym.vector.utils
+import numpy as np
+
+
+class WorkerError(RuntimeError):
+    """
+    Raised in the parent when a worker process failed: the exception it raised, with its traceback, or its death.
+    The replies of the other workers are left unread, the vector env can only be closed after it.
+    """
+
+
+class _RemoteTraceback:
+    """
+    Sent by a worker instead of its reply when a command raised, the exception itself may not pickle.
+    """
+
+    def __init__(self, formatted):
+        self.formatted = formatted
+
+
+def _observation_specs(num_envs, observation_space):
+    '''
+    :return: name -> (shape, dtype) of the observation buffers: 'observations' for a Box, e.g. the (stack, H, W)
+    pixels of BaseBulletEnv.enable_pixel_observations, and one 'observations_<key>' per key of a Dict of Boxes.
+    '''
+    if isinstance(observation_space, gym.spaces.Box):
+        return {'observations': ((num_envs,) + observation_space.shape, observation_space.dtype)}
+    if isinstance(observation_space, gym.spaces.Dict) and all(
+            isinstance(space, gym.spaces.Box) for space in observation_space.spaces.values()):
+        return {
+            f'observations_{key}': ((num_envs,) + space.shape, space.dtype)
+            for key, space in observation_space.spaces.items()
+        }
+    raise ValueError(f"observation space should be a Box or a Dict of Boxes, got {observation_space}")
+
+
+def _buffer_specs(num_envs, observation_space, action_space):
+    '''
+    :return: name -> (shape, dtype) of the buffers shared between the workers and the parent.
+    '''
+    specs = _observation_specs(num_envs, observation_space)
+    specs.update({
+        'actions': ((num_envs,) + action_space.shape, np.float32),
+        'rewards': ((num_envs,), np.float32),
+        'terminated': ((num_envs,), np.bool_),
+        'truncated': ((num_envs,), np.bool_),
+    })
+    return specs
+
+
+def _as_arrays(raw_buffers, specs):
+    return {
+        name: np.frombuffer(raw_buffers[name], dtype=dtype).reshape(shape)
+        for name, (shape, dtype) in specs.items()
+    }
+
+
+def _observation_buffers(buffers, observation_space):
+    '''
+    :return: the 'observations' buffer, or key -> buffer for a Dict observation space
+    '''
+    if isinstance(observation_space, gym.spaces.Dict):
+        return {key: buffers[f'observations_{key}'] for key in observation_space.spaces}
+    return buffers['observations']
+
+
+def _write_observation(observations, i, obs):
+    if isinstance(observations, dict):
+        for key, buffer in observations.items():
+            buffer[i] = obs[key]
+    else:
+        observations[i] = obs
+
+
+def _read_observation(observations, i):
+    '''
+    :return: a copy of observation i
+    '''
+    if isinstance(observations, dict):
+        return {key: buffer[i].copy() for key, buffer in observations.items()}
+    return observations[i].copy()
+
+
+def _rollout(env, state, action_sequence, discount):
+    '''
+    Restore state in env and roll out the actions of action_sequence from it, stopping early if the episode ends.
+    :return: (discounted return, final observation, terminated)
+    '''
+    env.set_state(state)
+    total, scale = 0.0, 1.0
+    obs, term = None, False
+    for a in action_sequence:
+        obs, reward, term, trunc, _ = env.step(a)
+        total += scale * reward
+        scale *= discount
+        if term:
+            break
+    if obs is None:
+        obs = env.robot.calc_state()
+    return total, obs, term
+
+
+def _worker(remote, parent_remote, env_fn, slots, raw_buffers, specs, observation_space, auto_reset):
+    '''
+    Runs the envs of the given slots, each one owning its own DIRECT BulletClient once reset.
+    Only the infos travel through the pipe, everything else is read from and written to the shared buffers.
+    An exception is sent back to the parent, which raises it as a WorkerError, and stops the worker.
+    '''
+    parent_remote.close()
+    envs = []
+    buffers = _as_arrays(raw_buffers, specs)
+    observations, actions = _observation_buffers(buffers, observation_space), buffers['actions']
+    rewards, terminated, truncated = buffers['rewards'], buffers['terminated'], buffers['truncated']
+    try:
+        envs.extend(env_fn() for _ in slots)
+        while True:
+            cmd, data = remote.recv()
+            if cmd == 'step':
+                for env in envs:
+                    env.unwrapped.set_log_mode('eager' if data else 'off')
+                infos = []
+                for env, i in zip(envs, slots):
+                    state, reward, term, trunc, info = env.step(actions[i])
+                    _write_observation(observations, i, state)
+                    rewards[i] = reward
+                    terminated[i] = term
+                    truncated[i] = trunc
+                    if auto_reset and (term or trunc):
+                        info['final_observation'] = _read_observation(observations, i)
+                        state, reset_info = env.reset()
+                        _write_observation(observations, i, state)
+                        if 'logs' in reset_info:
+                            info['final_logs'], info['logs'] = info.get('logs'), reset_info['logs']
+                    infos.append(info)
+                remote.send(infos)
+            elif cmd == 'reset':
+                seed, logs = data
+                infos = []
+                for env, i in zip(envs, slots):
+                    env.unwrapped.set_log_mode('eager' if logs else 'off')
+                    kwargs = {} if seed is None else {'seed': seed + i}
+                    state, info = env.reset(**kwargs)
+                    _write_observation(observations, i, state)
+                    infos.append(info)
+                terminated[list(slots)] = False
+                truncated[list(slots)] = False
+                remote.send(infos)
+            elif cmd == 'rollout':
+                state, candidates, discount = data
+                results = []
+                for env, i in zip(envs, slots):
+                    if i not in candidates:
+                        continue
+                    env = env.unwrapped  # the rollouts are not episode steps of the TimeLimit wrapper
+                    env.set_log_mode('off')
+                    if env.physicsClientId < 0:
+                        env.reset()
+                    indices, action_sequences = candidates[i]
+                    for index, action_sequence in zip(indices, action_sequences):
+                        results.append((index,) + _rollout(env, state, action_sequence, discount))
+                remote.send(results)
+            elif cmd == 'close':
+                break
+            else:
+                raise ValueError(f"unknown command {cmd!r}")
+    except Exception:
+        remote.send(_RemoteTraceback(traceback.format_exc()))
+    finally:
+        for env in envs:
+            env.close()
+        remote.close()
+
+
+class SubprocVectorEnv:
+    """
+    Runs num_envs copies of a BaseBulletEnv in a pool of worker processes, for the envs that cannot share
+    a physics server. Observations, actions, rewards and terminated/truncated flags go through preallocated
+    shared-memory buffers, the pipes only carry the commands and the info dicts. The observation space of the envs
+    can be a Box of any shape and dtype, e.g. pixels, or a Dict of Boxes, whose observations are dicts of arrays.
+
+    The arrays returned by reset() and step() are these shared buffers: they are overwritten by the next
+    call, copy them if they need to outlive it.
+    """
+
+    def __init__(self, env_fn, num_envs, envs_per_worker=1, auto_reset=True, logs=False, start_method=None):
+        '''
+        :param env_fn: gym id or picklable callable returning a new BaseBulletEnv.
+        :param envs_per_worker: number of envs stepped sequentially by each worker process.
+        :param auto_reset: reset an env as soon as it is done, the last observation of the episode
+        is then stored in info['final_observation'] (and its logs in info['final_logs']).
+        :param logs: whether info['logs'] is generated by default. When it is not, the envs run with
+        log_mode 'off' and no logs are built nor sent back.
+        :param start_method: multiprocessing start method, default of the platform if None.
+        '''
+        if isinstance(env_fn, str):
+            env_fn = functools.partial(gym.make, env_fn)
+        self.num_envs = num_envs
+        self.logs = logs
+        self.closed = False
+
+        probe = env_fn()  # BaseBulletEnv only connects to a physics server on reset
+        self.single_observation_space = probe.observation_space
+        self.single_action_space = probe.action_space
+        probe.close()
+        specs = _buffer_specs(num_envs, self.single_observation_space, self.single_action_space)
+        self.observation_space = gym.vector.utils.batch_space(self.single_observation_space, num_envs)
+        self.action_space = gym.spaces.Box(-1.0, 1.0, (num_envs,) + self.single_action_space.shape, dtype=np.float32)
+
+        ctx = mp.get_context(start_method)
+        # raw bytes, viewed with the dtype of each buffer
+        raw_buffers = {
+            name: ctx.RawArray('B', int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            for name, (shape, dtype) in specs.items()
+        }
+        buffers = _as_arrays(raw_buffers, specs)
+        self._observations = _observation_buffers(buffers, self.single_observation_space)
+        self._actions = buffers['actions']
+        self._rewards = buffers['rewards']
+        self._terminated = buffers['terminated']
+        self._truncated = buffers['truncated']
+
+        self.remotes, self.processes, self._worker_slots = [], [], []
+        for start in range(0, num_envs, envs_per_worker):
+            slots = range(start, min(start + envs_per_worker, num_envs))
+            self._worker_slots.append(slots)
+            remote, work_remote = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                args=(work_remote, remote, env_fn, slots, raw_buffers, specs, self.single_observation_space,
+                      auto_reset),
+                daemon=True,
+            )
+            process.start()
+            work_remote.close()
+            self.remotes.append(remote)
+            self.processes.append(process)
+
+    def _send(self, w, command):
+        try:
+            self.remotes[w].send(command)
+        except ConnectionError:
+            self._recv(w)  # raises the error the worker reported before exiting, or its death
+            raise WorkerError(f'worker {w} (pid {self.processes[w].pid}) closed its pipe') from None
+
+    def _recv(self, w, poll_interval=1.0):
+        '''
+        Wait for the reply of worker w, checking every poll_interval seconds that it is still alive.
+        '''
+        remote, process = self.remotes[w], self.processes[w]
+        while not remote.poll(poll_interval):
+            if not process.is_alive():
+                raise WorkerError(f'worker {w} (pid {process.pid}) died with exit code {process.exitcode}')
+        try:
+            reply = remote.recv()
+        except (EOFError, ConnectionError):
+            process.join(poll_interval)
+            raise WorkerError(f'worker {w} (pid {process.pid}) closed its pipe, exit code {process.exitcode}') from None
+        if isinstance(reply, _RemoteTraceback):
+            raise WorkerError(f'worker {w} (pid {process.pid}) failed:\n{reply.formatted}')
+        return reply
+
+    def _gather(self):
+        infos = []
+        for w in range(len(self.remotes)):
+            infos.extend(self._recv(w))
+        return infos
+
+    def reset(self, seed=None, logs=None):
+        '''
+        :param seed: env i is seeded with seed + i if not None.
+        :param logs: overrides the logs default for this call.
+        :return: (observations, infos)
+        '''
+        logs = self.logs if logs is None else logs
+        for w in range(len(self.remotes)):
+            self._send(w, ('reset', (seed, logs)))
+        return self._observations, self._gather()
+
+    def step_async(self, actions, logs=None):
+        np.copyto(self._actions, actions)
+        logs = self.logs if logs is None else logs
+        for w in range(len(self.remotes)):
+            self._send(w, ('step', logs))
+
+    def step_wait(self):
+        infos = self._gather()
+        return self._observations, self._rewards, self._terminated, self._truncated, infos
+
+    def step(self, actions, logs=None):
+        '''
+        :param actions: (num_envs, action_dim) array.
+        :param logs: overrides the logs default for this call.
+        :return: (observations, rewards, terminated, truncated, infos), infos is a list of num_envs dicts.
+        '''
+        self.step_async(actions, logs)
+        return self.step_wait()
+
+    def rollout(self, state, action_sequences, discount=1.0):
+        '''
+        Fork-and-evaluate: broadcast one env state to all the workers and roll out a different action sequence
+        from it in each copy. The candidates are spread evenly over the num_envs envs, each env restores
+        the state before every candidate it rolls out. A rollout stops early if its episode terminates.
+        The envs are left in the final state of their last rollout: reset or set_state them before stepping again.
+        :param state: EnvState or bytes returned by get_state() of an instance of the same env
+        :param action_sequences: (num_candidates, horizon, action_dim) array
+        :param discount: the reward of step t is weighted by discount**t in the returns
+        :return: (returns, final_observations, terminated) of the candidates, arrays of length num_candidates
+        '''
+        if not isinstance(state, (bytes, bytearray)):
+            state = state.to_bytes()  # pickled once instead of once per worker
+        action_sequences = np.asarray(action_sequences, dtype=np.float32)
+        num_candidates = len(action_sequences)
+        slot_candidates = {
+            i: (indices, action_sequences[indices])
+            for i, indices in enumerate(np.array_split(np.arange(num_candidates), self.num_envs)) if len(indices)
+        }
+        for w, slots in enumerate(self._worker_slots):
+            self._send(w, ('rollout', (state, {i: slot_candidates[i] for i in slots if i in slot_candidates}, discount)))
+
+        returns = np.zeros(num_candidates, dtype=np.float32)
+        final_observations = _observation_buffers({
+            name: np.zeros(shape, dtype=dtype)
+            for name, (shape, dtype) in _observation_specs(num_candidates, self.single_observation_space).items()
+        }, self.single_observation_space)
+        terminated = np.zeros(num_candidates, dtype=np.bool_)
+        for w in range(len(self.remotes)):
+            for index, total, obs, term in self._recv(w):
+                returns[index] = total
+                _write_observation(final_observations, index, obs)
+                terminated[index] = term
+        return returns, final_observations, terminated
+
+    def close(self, timeout=5.0):
+        '''
+        Stop the workers, also after a WorkerError: the replies left unread are drained first, since a worker blocked
+        sending a large one never reads its close command. A worker still alive after timeout seconds is terminated.
+        '''
+        if self.closed:
+            return
+        for remote in self.remotes:
+            try:
+                while remote.poll():
+                    remote.recv()
+                remote.send(('close', None))
+            except (EOFError, ConnectionError):
+                pass  # the worker is already gone
+        for process in self.processes:
+            process.join(timeout)
+            if process.is_alive():  # e.g. still computing a reply when its pipe was drained
+                process.terminate()
+                process.join()
+        for remote in self.remotes:
+            remote.close()
+        self.closed = True
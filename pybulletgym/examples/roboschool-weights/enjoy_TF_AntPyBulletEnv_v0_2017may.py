@@ -8,6 +8,7 @@ import gym
 import numpy as np
 import pybullet as p
 import pybulletgym.envs
+from pybulletgym.tests.roboschool.agents.weight_store import load_weights
 import time
 
 
@@ -75,240 +76,9 @@ def main():
                 if restart_delay == 0:
                     break
 
-weights_dense1_w = np.array([
-[ +0.2856, -0.4091, +0.3380, -0.1083, +0.1049, -0.0806, -0.0827, +0.0402, +0.2415, +0.0927, +0.1812, +0.5455, +0.3157, +0.1043, +0.0527, +0.3768, -0.2083, +0.1218, -0.0633, +0.3236, +0.2198, +0.0513, +0.3505, -0.1165, -0.1732, +0.2760, +0.0006, +0.0249, +0.5887, -0.2324, +0.1503, -0.0108, +0.1220, +0.2527, +0.0984, +0.5360, -0.0579, -0.0847, +0.1649, +0.0589, -0.2046, +0.5981, -0.1063, -0.1088, +0.3424, +0.3479, -0.1751, +0.2924, -0.0610, +0.0807, +0.3291, +0.0059, +0.0339, -0.2823, +0.2533, +0.3156, +0.1679, +0.2417, +0.1265, +0.0024, +0.0802, +0.2531, -0.2576, +0.3894, +0.3206, +0.2015, +0.3482, +0.1042, -0.2418, -0.0002, +0.1277, +0.1811, +0.1551, +0.5460, +0.1714, +0.1021, -0.1252, +0.0609, -0.0372, -0.0351, +0.1216, +0.0023, -0.2448, +0.0077, +0.0584, +0.2389, -0.0848, +0.3542, +0.3065, -0.2268, +0.2387, +0.3303, +0.4184, -0.1619, +0.2230, +0.2829, +0.3884, +0.1262, +0.6383, -0.1629, +0.3087, +0.0554, +0.2294, +0.0280, +0.4139, -0.1484, +0.1358, +0.3153, -0.2652, +0.2637, -0.1563, +0.0706, +0.4192, +0.2381, -0.3540, +0.2789, +0.2647, +0.0931, +0.1439, +0.3415, -0.2445, +0.1039, -0.3692, +0.5095, +0.0010, +0.0777, +0.3382, -0.1100],
-[ +0.0820, +0.6327, +1.0135, -0.1423, -0.0275, +0.0396, -0.5933, +0.3027, -0.2220, +0.1476, -0.0591, -0.7910, -0.0776, +0.2565, +0.0241, -1.1300, +0.1324, +0.9079, +0.2318, +0.5574, +1.0162, +0.1408, +0.7525, +0.3612, +0.6088, -0.2541, +0.8134, +0.1348, -0.1265, +0.7991, -0.2304, -0.4826, -0.4123, +0.2831, -0.5457, -0.3518, -0.9733, -0.1654, +0.2409, +0.3971, +0.6624, +0.0728, +0.2200, -0.2126, -0.5299, -0.1858, -0.3467, -0.2776, -0.2004, -0.7567, +0.4417, -0.4378, -0.6799, +0.3789, +0.2937, -0.1247, +0.5540, -1.0124, -0.5759, +0.0308, +0.2971, +1.1300, -0.1185, +0.5303, +0.0527, +0.3392, +0.7436, -0.3578, -0.0559, +0.2165, -0.5860, +0.9427, -0.2522, -0.0805, +0.9314, +1.4173, +0.6216, +0.6923, +0.6592, -0.0457, +0.5152, -0.3523, -0.5135, +0.6466, -0.4804, +0.0006, +0.3223, -0.1548, +1.5508, +0.6204, +0.2618, -0.0392, -0.6208, +0.0237, +0.0577, -0.2913, -0.3893, -0.1459, -0.1103, +0.7485, -0.0045, +0.0640, +0.0726, -0.0966, +0.0452, +0.2741, -0.3389, +0.8830, +0.9819, +0.3915, -0.1127, -0.2653, -0.6842, +0.2389, -0.4349, +1.4013, -0.4442, +1.1846, -0.7550, +0.5812, -0.2940, +0.7046, +0.4730, -0.2155, +0.1432, +0.1518, +0.5336, -0.0827],
-[ -0.2503, +0.2354, -0.0468, +0.1318, -0.0161, +0.1235, -0.1649, -0.1380, -0.1816, -0.0953, -0.0303, -0.4337, +0.0159, -0.2893, -0.1178, -0.1779, +0.0557, -0.0788, -0.1745, -0.1349, +0.1942, +0.1707, -0.3289, +0.1177, -0.3084, +0.0423, +0.0006, -0.1240, -0.2685, -0.0578, +0.3282, -0.3570, +0.0039, +0.3399, -0.3599, -0.3346, -0.2273, -0.0044, -0.0425, -0.2483, -0.2284, -0.5528, -0.2406, -0.0144, -0.0306, +0.1037, +0.0497, -0.3302, +0.0505, +0.0054, -0.2037, -0.0112, +0.1068, -0.1273, +0.1019, -0.0463, -0.0527, -0.0015, -0.1546, -0.2187, +0.0633, -0.1969, -0.0954, -0.0111, -0.5329, +0.1480, -0.1007, +0.1115, -0.0692, -0.3348, +0.1361, -0.1606, -0.1103, -0.3221, -0.2678, -0.1543, -0.4900, -0.2455, -0.0798, -0.0545, +0.0848, +0.0149, -0.1908, +0.1721, +0.0687, -0.2002, -0.1194, +0.1023, -0.3005, -0.2030, -0.0681, -0.2440, -0.2892, -0.4305, -0.2357, +0.0932, -0.4055, -0.0629, -0.1043, -0.5354, -0.1120, -0.1867, -0.1219, -0.2403, -0.5562, -0.1247, -0.5158, -0.0720, -0.2935, -0.2138, +0.1382, +0.3068, -0.1444, +0.0100, -0.3312, -0.6305, +0.0030, -0.2372, -0.0005, -0.3775, +0.1123, +0.0166, -0.0000, -0.0605, -0.5071, +0.0482, -0.1440, -0.0311],
-[ -0.2697, +0.0706, +0.3032, -0.1729, +0.3361, -0.0424, -0.1621, -0.1890, +0.0724, -0.4940, +0.0174, +0.2439, -0.4449, +0.2452, -0.2110, +0.2058, -0.3416, -0.0957, +0.0431, +0.2706, +0.0075, -0.2335, -0.4697, -0.4996, -0.0722, -0.2389, -0.0721, -0.2428, +0.4497, +0.1403, +0.0491, +0.3252, -0.3800, -0.2324, +0.2014, +0.4212, +0.4495, -0.2843, +0.2277, +0.0246, -0.6231, -0.1313, -0.5353, -0.3726, -0.1220, -0.6917, -0.2465, -0.1089, -0.2945, +0.5820, -0.2255, +0.0518, +0.1999, +0.0492, +0.1157, -0.0289, -0.7021, +0.2170, +0.2487, -0.1803, -0.0788, -0.7116, +0.2452, +0.0250, +0.5466, -0.6420, -0.0797, -0.5767, -0.1020, +0.3390, -0.1549, +0.4149, +0.1835, +0.8112, -0.3514, +0.3155, -0.6475, -0.2191, +0.1377, +0.0273, -0.0859, +0.0621, -0.9109, -0.3396, +0.3122, -0.2752, -0.3375, -0.2920, +0.1554, -0.6032, -0.3321, +0.1136, -0.0712, -0.3951, +0.2268, -0.2402, +0.4850, +0.1052, +0.5524, -0.4844, +0.5053, +0.0377, -0.1097, +0.2861, -0.1864, -0.3226, -0.0154, -0.2144, -0.6764, -1.0064, -0.2201, -0.3494, -0.1009, -0.0346, +0.0222, -0.4648, -0.6888, +0.0936, -0.7490, +0.2389, -0.0461, -0.0490, -0.4350, -0.5020, -0.6949, +0.3147, +0.3905, -0.4302],
-[ -0.5894, -0.0462, -0.0671, +0.1779, -0.2985, -0.0093, +0.1025, -0.2851, -0.5022, +0.4617, -0.0050, -0.4186, -0.4120, +0.5342, -0.4466, -0.5710, -0.0778, +0.5455, +0.4230, -0.1727, +0.0248, +0.6199, -0.0249, -0.0536, -0.2538, -0.0548, -0.5637, +0.1861, -0.3756, +0.6562, -0.0309, -0.7059, -0.5196, -0.6593, -0.0786, -0.4255, -0.2951, -0.3396, +0.2999, +0.2590, +0.5004, +0.3659, -0.1944, -0.5518, -0.0093, +0.3915, -0.0654, +0.7140, -0.0118, -0.3306, +0.4059, -0.5650, -0.4346, +0.8268, -0.2418, -0.6769, -0.1529, -0.1019, -0.0935, -0.4321, +0.3257, -0.2702, -0.0989, +0.2711, -0.6210, +0.4389, +0.3887, -0.1652, -0.0982, +0.0433, -0.1120, +0.2608, +0.1155, -0.3326, -0.5094, +0.0474, +0.1239, -0.2204, -0.1056, -0.6978, +0.1862, -0.2300, -0.1165, +0.1509, +0.7566, -0.5543, +0.3839, -0.5120, +0.3099, -0.2034, +0.7276, +0.2385, -0.7288, -0.1266, -0.2343, -0.5672, -0.0057, -0.0186, -0.3665, -1.2855, +0.6746, -0.1203, -0.3309, -0.8603, +0.4811, -0.1538, +0.5446, +0.0038, +0.1556, +0.5776, -0.1994, -0.3110, -0.4141, +0.0772, +0.1195, +0.4368, +0.3796, +0.3990, -0.3452, +0.0268, -0.0037, -0.2803, +0.7420, -0.5205, +0.7103, +0.0814, +0.0917, +0.5727],
-[ +0.9108, -1.2019, -0.8828, -0.0571, +0.4640, -0.4255, -0.3412, -0.1130, +0.5679, -0.0657, +0.0851, -0.4367, -0.3447, -1.0903, -0.1277, +0.0440, +0.1664, +0.3279, -0.1176, -0.2553, -0.5594, -0.1823, +0.0093, -0.1161, +0.0341, -0.9688, -0.2799, +0.7136, +0.4686, -0.7197, -0.0798, -0.4068, -0.2519, +0.3220, +0.6010, +0.6546, -0.5138, +0.6600, -0.2747, -0.6502, +1.1478, +0.7705, -0.8645, -0.7124, +0.4578, -0.1423, -0.6454, -0.6139, -0.2964, -0.3525, +0.2287, -0.5368, -1.0776, -0.0507, -0.3517, -0.5014, -0.1767, -0.5016, +0.8044, -0.3985, +0.2099, +0.2479, -1.3310, +0.1198, +0.9254, -0.4103, +0.0248, -0.3546, +0.2374, +0.7145, -0.2494, -0.2125, -0.3934, +0.2301, -0.7252, +0.0734, +0.2172, +0.1852, -0.4918, -0.6549, +0.3549, +0.9117, -0.2437, +0.4721, +0.7126, +0.5653, +0.4648, -0.0169, -0.1650, +1.1287, +0.2412, +1.1366, +0.9122, +0.2840, -0.7930, +0.6158, -1.0912, +0.2805, +1.1295, -0.4873, +1.0141, -0.5452, +0.2255, +0.9590, +0.4029, -1.3217, +0.1508, +0.8827, -0.8346, +0.1531, -0.9785, -0.1839, +1.2149, +1.0538, +0.3230, +0.0808, -0.1425, -1.4677, +0.1845, +0.6411, -0.8535, +1.3519, -0.1753, +0.4364, -0.1985, -0.2911, +0.2662, -0.9084],
-[ +0.0887, -0.7902, -0.1326, +0.2560, +0.5971, +0.1597, +0.6151, -0.2445, -0.1579, +0.3995, +0.6582, +0.6882, +0.6858, -0.0499, +0.7302, -0.0497, -0.6517, +0.3105, -0.5837, +0.0370, -0.2824, +0.2725, +0.0053, -0.0114, +0.4586, +0.0917, -0.0565, -0.1905, +0.8068, -0.0370, +0.1055, -0.5045, +0.0999, +0.4123, +0.0117, -0.2204, -0.2399, -0.4052, -0.1977, -0.2043, -0.3355, -0.0034, +0.5239, -0.0669, -0.4476, +0.5272, +0.1968, -0.0636, -0.0077, +0.0786, +0.4349, +0.8252, -0.1576, -0.3040, +0.4199, +0.6836, +0.0844, -0.2492, +0.2916, -0.5348, +0.6261, -0.2533, +0.4726, +0.3358, -0.4089, +0.3682, -0.2293, +0.3252, +0.1088, -0.0533, +0.3884, -0.1629, +0.2775, -0.3031, -0.0119, +0.5219, -0.3374, -0.1560, +0.0500, +0.3756, +0.5114, -0.2009, +0.1710, -0.4174, +0.2280, -0.2902, +0.4603, +0.2395, -0.0964, +0.2353, -0.0310, -0.4563, -0.4219, -0.1862, -0.6264, -0.6686, +0.2240, +0.1773, +0.2184, -0.3676, +0.7615, +0.0471, +0.3136, -0.1120, -0.1764, -0.5694, +0.7293, -0.0837, +0.0061, -0.3985, -0.5278, -0.2859, +0.0929, -0.1284, -0.0300, -0.0944, -0.0390, +0.2991, -0.1451, +0.1105, -0.4419, -0.7432, -0.2460, -0.5057, +0.6673, +1.0114, +0.1792, +0.3065],
-[ -0.6564, +0.6125, -0.3640, +0.1619, -0.2321, +0.5720, +0.6131, -0.5911, +0.5526, +0.3226, -0.1944, -0.1839, +0.3572, +0.4781, +0.3407, +0.1641, +0.3172, -0.0047, -0.5162, -0.1206, -0.3861, +0.1791, -0.3154, +0.2562, -0.3293, +0.0456, +0.4672, -0.3446, -0.1234, +0.3884, +0.1968, -0.0986, +1.2169, +0.3088, +0.1092, -0.5128, -0.1868, +0.1527, -1.0628, +0.2786, +0.8325, +0.4390, +0.7205, +1.3926, +0.7260, +0.1448, +1.1186, -0.5237, +0.7353, +0.2267, -0.2913, +0.6712, -0.2731, +0.4048, +0.2022, +0.2905, -0.1395, +0.1775, +0.3433, +1.9090, -0.5115, -0.0573, +0.3704, -0.0411, -0.9364, -0.3512, -0.2041, +0.1542, +0.2627, -0.5482, +0.0865, +0.1783, -0.2311, -1.5702, -0.0176, +0.8767, -0.4654, -0.1130, -0.1795, +0.6021, +0.3102, -0.4057, +0.4632, -0.0942, +0.4566, +0.0989, -0.5076, -0.3882, +0.3039, +0.5014, -0.5293, -0.0868, -0.4451, -0.5433, -0.0461, -0.2973, +0.3207, -0.6808, -1.2056, +0.7728, +0.4685, +0.2351, +0.2659, -0.2359, -0.9062, +0.7528, -0.1476, +0.6847, +0.1755, -0.0489, +0.6044, +0.9700, -0.9183, +0.1199, +0.1771, -0.5627, -0.3509, -0.0693, +0.4640, -0.0557, +1.0644, -0.7226, +0.1818, -1.0610, -0.7919, +1.0787, -0.1449, +0.6288],
-[ -0.2821, +0.1942, +0.0717, -0.1533, +0.2884, +0.0299, -0.4759, +0.1094, +0.0928, -0.5330, -0.4834, +0.1220, +0.4441, +0.0950, -0.2181, -0.3184, -0.1734, +0.2083, -0.0679, +0.0449, +0.1293, -0.2203, -0.4006, +0.1973, +0.4127, -0.1489, +0.2313, +0.1979, -0.3278, -0.0182, +0.1668, +0.5720, +0.0830, -0.4511, -0.0183, +0.3112, -0.1480, +0.4522, -0.4363, -0.0033, +0.0456, -0.3984, -0.1388, -0.1651, -0.5918, +0.5272, -0.3076, +0.3667, -0.1151, +0.8332, +0.0800, -0.0647, -0.0477, -0.1672, -0.2390, +0.3837, -0.0609, +0.1687, +0.2350, +0.0576, +0.1809, -0.9367, +0.5738, +0.5234, +0.0063, +0.5833, -0.1264, -0.1810, +0.2093, +0.3804, +0.4890, +0.1374, -0.3955, -0.2193, -0.3411, -0.2258, +0.3689, -0.2886, +0.1800, +0.2246, -0.3125, +0.5031, -0.1732, +0.4497, -0.2867, +0.1692, +0.2127, +0.2622, -0.1449, +0.4516, +0.3948, -0.5770, -0.2663, +0.1198, -0.4118, -0.2319, +0.0458, +0.7989, -0.2666, +0.5099, +0.1698, -0.2164, -0.1695, -0.3694, +0.4706, +0.2198, +0.2426, +0.3539, +0.2527, -0.1951, -0.3628, +0.2259, +0.2184, +0.3123, +0.1581, -0.4492, -0.1066, +0.1484, +0.3531, +0.0580, +0.1617, +0.3627, -0.7292, -0.4043, -0.6717, +0.4356, -0.2808, -0.2858],
-[ -0.3475, -0.0438, +0.3943, -0.9454, -0.0676, +0.5420, +0.0486, -0.3051, -1.0394, -0.5628, +0.1000, +0.4686, +0.1047, +0.6092, -0.0295, -0.0841, -0.6189, -0.2652, +0.6656, +0.4027, -0.3481, +0.0851, +0.0883, +0.2802, -0.2617, -0.4973, +1.1301, -0.8747, -0.0359, +0.0684, -0.3017, -0.3851, +0.0739, +0.0212, -0.1619, -0.4641, -0.3448, -0.2891, -0.1347, -0.4114, +0.0257, -0.1971, -0.7760, -0.0600, -0.7219, -0.2177, -0.7149, -1.4175, +0.4650, +0.2970, +0.2164, +0.1605, +0.2960, -0.0941, -0.6133, -0.3279, +0.2995, -0.7627, -0.4375, -0.2131, +0.5522, -0.1457, +0.3077, +0.3471, +0.2723, -0.3329, +0.6586, -0.2858, -0.9763, -0.1005, +0.4768, -0.2830, +0.3709, +0.2231, -0.2970, -0.0227, +0.4660, +0.0485, -0.1268, +0.2986, -0.1887, -0.2624, +0.6477, -0.3838, +0.2028, +0.1874, -0.1547, -0.7356, -0.2964, -0.5112, +0.5242, -0.2078, -0.3975, -0.0907, +0.5330, +0.1397, -0.5146, +0.2458, +0.5131, +0.2961, -0.1090, -0.0372, +0.2060, -0.2964, +0.8767, +0.3651, +0.5461, +0.7021, -0.7075, -0.3400, -0.9134, -0.0393, +0.3066, +0.0670, -0.2127, -0.0001, -0.0257, +0.0683, +0.1032, -0.4013, +0.4372, +0.7734, -1.0677, -0.5434, +0.0179, +0.1156, +0.5057, -0.7392],
-[ +0.6845, -0.4383, +0.4872, +0.0337, -0.5214, +0.3372, -0.2544, +0.3252, +0.1244, -0.0537, +0.3436, +0.0441, -0.1664, -0.1286, +0.9051, +0.6243, +0.1279, -0.3978, -0.4463, -0.6320, -0.4879, -0.0646, -0.0833, -0.0981, -0.1637, -0.0102, -0.5135, -0.3484, -0.3294, +0.1523, +0.7086, +0.1241, +0.1427, -0.1268, -0.2152, -0.4389, -0.3871, -0.2253, +0.2274, +0.1638, +0.3830, +0.0758, +0.2766, -0.4313, -0.3447, +0.5139, +0.0702, -0.7301, +0.2489, -0.2315, +0.4823, -0.1761, +0.1126, -0.2033, +0.6136, +0.1210, +0.4397, +0.2120, -0.3228, -0.0294, +0.0316, -0.0530, -0.5844, +0.1468, +0.5722, +0.5126, -0.3906, +0.1985, +0.4183, -0.4121, +0.5311, -0.0552, +0.1256, +0.5112, -0.1565, +0.4151, -0.0674, -0.7475, -0.0087, +0.4671, -0.3835, -0.8014, -0.0984, -0.4115, +0.4680, -0.4746, +0.0263, +0.2254, -0.4636, -0.0526, +0.0329, -0.6224, +0.1628, +0.1484, +0.2757, +0.1010, -0.0662, +0.1431, +0.3350, -0.0244, -0.0363, -0.2423, +0.2825, +0.4420, +1.0574, -0.5121, -0.1705, +0.4002, +0.0021, -0.4088, -0.0184, +0.1179, +0.4331, -0.3388, -0.2149, +0.5182, +0.7147, +0.2308, -0.2920, +0.2585, -0.0006, +0.2654, -0.0136, +0.3788, -0.3258, +0.4393, +0.1283, +0.1638],
-[ -0.3958, -0.1723, +0.0041, -0.1713, +0.1163, +0.9317, +0.1024, +0.3821, -0.5272, -0.1965, -1.2950, -0.0896, -0.0509, +0.4697, -0.9789, +0.9504, +0.9781, +0.1087, +0.3547, +0.1490, -0.6933, +0.0642, -0.2842, -0.4972, -0.3845, +0.2326, -0.2337, -0.7827, -0.0600, +0.5650, +0.8874, -0.3840, -0.6595, -0.6787, -0.4388, -0.8687, -0.2893, -1.0843, +0.3562, +0.1733, +0.4882, -0.2395, +0.3340, +0.3259, +0.0118, +0.3943, -0.1122, +0.0261, +0.2895, -0.1793, -0.6270, +1.0038, -0.4197, +0.1312, +0.5332, +0.2492, +0.1200, +0.6193, +0.0708, -0.0898, -0.4113, -0.2571, -0.3703, +1.3534, +0.3064, -0.3420, +0.0751, -0.2390, +0.4730, -0.0710, -0.6082, -0.0621, -0.7128, +0.0342, -0.2973, +1.0688, +0.5756, -0.4482, -0.7317, +0.6677, -0.2893, -1.0595, +0.5063, +0.2384, -0.0241, -0.0483, +0.5890, +0.4075, +0.2774, -0.3506, -0.3246, -0.1290, -0.4692, -0.5019, -0.5848, -0.3720, +0.3620, -0.2611, +0.8221, +0.1117, +0.1067, +0.5905, -0.3737, +0.1316, +0.4962, -0.1595, +0.1623, +1.0253, +0.4063, -0.3844, +0.5407, +0.2100, -0.2984, +0.8594, -0.7372, -0.1105, +0.5597, +0.1740, -0.9340, -0.2020, -0.1063, +0.4312, +0.1656, -0.8614, +0.0234, +0.4053, +0.2024, +0.0626],
-[ +0.3669, +0.3593, -0.0679, +0.3940, -0.9204, +0.1025, -0.1689, +0.6320, +0.3582, -0.2730, -0.3401, +0.5420, +0.1045, -0.1997, -0.4225, +0.5526, +0.3061, -0.3005, +0.1425, +0.2908, +0.0791, +0.3145, -0.3164, -0.2949, -0.2283, -0.5429, +0.1733, +0.1975, +0.1159, +0.3973, -0.5349, +0.1466, -0.2287, -0.4473, -0.4484, -0.1103, +0.4081, -0.2773, +0.3694, -0.6277, -0.0604, -0.2044, +0.2405, -0.8861, -1.1240, +0.0556, +0.0223, +0.0884, -0.6452, +0.0812, +0.2555, -0.5136, -0.2579, -0.0254, +0.4603, -0.3547, +0.2863, +0.0858, -0.2448, -0.1999, -0.3094, -0.7570, -0.1114, -0.0045, +0.6206, -0.2205, -0.0834, -0.5264, +0.5787, +0.2510, +0.3055, +0.6086, +0.1200, +0.0357, -0.1737, -0.1313, +0.4764, -0.3230, -0.3782, +0.3621, -0.2281, -0.4303, +0.5640, +0.5459, -0.0745, -0.2958, +0.1598, -0.2153, +0.2673, +0.4034, +0.0226, +0.1286, -0.3545, -0.4070, -0.2406, -0.1634, -0.0783, +0.6329, +0.3980, -0.2605, +0.2381, -0.2010, -0.1000, +0.3910, +0.0025, -0.2878, +0.0189, +0.2230, +0.4205, +0.1812, +0.0964, -0.6297, +0.2513, -0.2243, +0.0616, +0.2949, -0.8054, -0.0157, -0.1560, -0.4856, +0.1065, -0.3170, -0.3207, -0.4832, -0.1724, -0.1985, +0.1615, -0.5231],
-[ +0.1502, +0.1263, +0.3691, -0.2445, -0.2294, +0.1696, +0.4260, -0.4073, -0.3526, -0.0995, +0.0118, -0.2520, -0.5770, +0.1645, -0.5140, -0.1315, -0.4054, +0.4050, +0.4091, +0.4156, +0.1958, -0.0018, +0.4402, +0.0407, -0.1550, +0.3260, -0.5984, -0.5423, -0.0081, +0.3311, -0.2417, -0.2983, -0.0229, -0.5054, +0.0148, +0.1414, -0.1635, +0.6437, +0.9040, -0.1526, +0.6908, +1.2097, -0.1414, -0.5378, -0.4508, +0.0576, -0.5288, -0.6764, +0.9012, +0.1000, -0.2793, -0.2411, -0.0810, +0.6758, +0.3308, -0.5293, -0.2459, -0.0823, +0.0820, -0.7715, +0.5418, -0.5643, -0.3646, +0.4732, -0.0883, -0.0692, +0.3908, -0.3652, -0.4002, -0.3069, +0.2307, -0.3974, -0.2452, -0.6176, +0.1380, +0.2980, +0.6655, -0.2056, +0.0333, -0.3240, -1.2843, -0.1259, +1.1622, +0.3627, -0.1679, +0.6800, -0.2267, +0.2362, -0.0507, -0.1413, +0.2503, -0.5978, -0.9194, +0.2369, +0.5321, -0.4427, +0.2876, +0.3368, +0.5545, -0.4450, +0.2571, +0.4898, +0.6034, +0.2236, +0.0011, -0.4392, +0.3809, -0.2146, -0.1374, +0.0637, -0.4852, -0.0325, +0.5547, -0.5392, +0.3382, -0.0263, +0.1119, -0.5638, +0.8715, -0.2044, -0.7598, +0.6241, +0.2881, -0.3804, +0.4588, +0.2541, +0.3476, -0.0141],
-[ +0.2340, -0.3097, +0.1328, +0.1492, +0.2735, -0.7588, -0.2059, +0.2854, -1.0919, +0.3341, -0.1496, -0.0754, -0.6094, +0.2697, -0.2989, -0.3690, +0.1993, +0.2189, +0.1199, +0.0099, -0.1689, +0.2214, -0.1943, +0.1307, -0.3045, +0.3797, +0.0547, +0.6835, -0.9322, -0.0897, -0.3947, +0.2783, -0.2957, -0.8735, -0.0857, -0.5275, +0.5872, +0.1125, +0.3264, +0.1085, -0.2542, -0.1712, -0.1670, -0.0907, -0.4145, -0.1559, -0.1683, +0.1396, -0.0608, -0.4183, +0.1501, -0.0744, +0.6009, -0.3488, +0.0600, -0.1671, -0.9331, -0.2067, +0.2982, -0.4334, -0.9677, +0.1867, -0.0084, -0.4228, -0.2115, +0.3280, +0.2394, +0.0311, -0.0103, +0.2755, +0.4475, -0.1920, +0.1652, +0.1196, -0.1093, -0.4222, +1.0664, +0.1558, +0.3881, -1.4208, -0.6818, -0.0486, -0.0218, +0.2288, -0.5064, +0.1701, +0.3040, -0.0079, -0.0437, -0.1605, -0.6087, -0.2500, +0.0799, +0.5584, +0.6784, +0.2731, -0.2145, +0.2343, +0.2560, +0.1749, -0.3732, +0.0208, -0.7439, -0.0895, +0.2646, -0.2037, -0.6270, -0.9166, +0.4650, +0.0876, +0.4140, -0.5085, +0.6740, -0.9125, +0.2592, +0.8056, +0.2206, -0.2435, +0.0648, +0.0790, +0.0676, +0.6078, +0.1500, +0.2579, +0.6270, -0.4166, +0.2167, +0.2587],
-[ -0.6869, -1.2532, +0.5147, +1.2637, -0.2554, +0.8228, +0.2481, -0.5951, -1.2476, +0.6364, +1.5374, -0.0955, +0.0997, -0.6819, +0.2029, -0.6230, +0.1415, -0.0057, -0.6143, +0.8542, -0.9662, -0.2502, -0.4263, +0.7339, -0.6119, +1.3317, -0.3264, -0.2859, +0.8607, +0.4652, +0.7761, -0.1911, +0.9349, -1.2767, -0.3979, -0.1446, +0.3565, +0.0987, +0.4651, +0.4175, -0.8598, -0.0698, +0.2101, -1.0191, +0.3386, -0.8061, +0.1306, +0.2496, +0.1610, -0.3182, -0.3485, -0.2170, -0.8648, -0.7257, -0.7880, -1.0330, -0.2050, +1.1819, +0.0586, -1.4075, -0.5363, -0.6277, +0.4401, +0.1976, -0.0799, +0.4374, +0.0549, -0.8748, +0.3757, +0.2235, +0.1204, +0.4534, +1.1956, +0.6497, -0.8471, -0.0833, -0.2274, +0.3909, +0.5884, -0.2598, -0.0392, +0.1970, +0.5909, -0.7688, +0.3490, +0.6633, +2.0425, +0.4622, -0.8812, -0.4726, +0.9418, -0.1776, -1.1585, -0.3635, +0.7697, +0.4182, +0.2191, -0.2996, -0.8620, -0.4153, -0.2173, -0.8207, +0.5243, -0.5698, +0.0565, +0.2763, -0.4199, +0.2476, +0.6535, -0.4769, -0.4259, +0.2979, -0.1168, -0.3108, +0.1613, +0.3998, +0.5336, -0.4033, +0.0084, +0.9511, -0.1251, -0.2039, -0.2658, -0.5147, +0.3438, -0.3128, -0.2120, +0.4101],
-[ +0.2121, +0.0458, +0.0966, -0.1909, -0.1630, -0.2852, +0.0075, -0.2155, -0.0629, +0.1217, +0.0489, +0.2674, -0.1357, +0.7580, +0.0394, +0.1849, +0.2186, +0.0919, -0.0582, +0.0811, -0.2470, +0.4404, +0.4534, -0.0258, +0.4894, +0.1105, +0.1572, +0.1051, -0.2135, +0.1338, -0.2483, +0.2294, +0.4080, -0.2635, -0.6115, -0.6237, -0.1793, +0.5117, -0.2792, +0.0733, +0.5426, -0.2688, -0.4095, -0.1793, -0.0157, +0.0190, +0.4212, -0.0357, +0.6304, -0.3873, +0.3924, -0.0861, +0.6672, -0.4723, -0.1297, -0.3288, -0.6972, -0.1781, -0.4545, +0.5582, -0.1303, -0.0516, +0.7788, +0.0142, -0.2343, +0.6808, -0.0081, -0.2134, -0.0809, -0.2294, -0.1111, -0.6365, -0.1107, +0.3189, -0.5341, -0.0996, +0.0316, -0.5004, +0.1849, +0.3280, +0.0008, -0.3973, +0.4816, +0.1103, +0.1240, -0.4628, +0.1310, -0.6613, -0.3732, -0.1561, -0.3627, -0.1388, +0.1114, +0.2950, +0.0092, -0.1535, -0.2932, +0.0699, -0.0546, -0.1053, +0.4289, -0.2362, -0.2584, -0.1726, -0.0949, -0.0362, +0.2322, +0.3950, +0.4641, +0.7640, +0.3092, +0.4914, +0.2736, +0.3157, +0.5094, -0.2677, -0.0304, +0.5290, -0.1541, +0.4361, +0.7528, +0.1171, -0.4145, -0.6882, +0.3426, +0.0556, -0.4773, -0.3244],
-[ +0.1956, +0.1411, -0.1178, -0.4152, -0.4311, +0.8176, +0.0779, -0.3809, -0.4114, +0.4712, -0.4344, -0.2139, -0.1640, -0.2804, -0.1627, +0.4153, +0.1441, -0.0034, +1.2698, +0.6388, +0.6887, +0.3232, +0.6699, -0.4265, -0.2310, -0.4578, -0.1124, -0.0999, +0.6439, +0.2424, -0.8201, -0.9492, +0.3796, +0.0581, -0.4657, -0.2927, +0.2837, +0.1804, -0.1202, +0.3552, +0.3751, +0.1974, +0.2472, +0.4008, +0.0195, +0.3877, -0.0637, +0.2603, -0.3156, -0.2780, -0.4614, -0.3423, +0.5843, -0.4884, -0.2875, +0.1293, -0.0482, +0.3154, -0.1461, -0.2471, +0.6120, +0.0867, +0.4732, -0.1967, -0.2645, +0.9138, -0.5977, -0.2765, -0.4727, -0.5815, +0.0225, -0.0835, -0.2688, +0.4517, -0.5937, +0.0246, +0.6287, -0.0022, -0.3399, -0.3237, -0.2632, -0.5175, +0.3992, +0.0535, +0.0226, +0.2662, +0.1523, -0.6824, -0.3497, -0.1999, +0.1842, +0.1421, -0.1967, -0.4185, -0.2236, +0.0956, -0.2740, -0.0225, +0.0631, +0.6854, -0.0791, -0.0231, -0.4041, -0.1458, -0.1564, +0.6051, +0.9266, +0.4423, -0.0485, +0.1817, +0.0502, -0.4416, +0.3662, -0.0397, +0.1136, +0.4185, -0.9586, +0.5222, +0.4192, +0.7460, -0.1631, -0.1646, -0.0479, -0.3892, -0.2540, +0.9087, -0.0765, +1.2772],
-[ +0.4488, -0.3346, +0.8797, +0.4681, +0.1887, +0.1747, +0.6390, +0.4812, -0.2087, +0.0780, +0.1529, +0.4104, -0.1816, +0.3295, +0.0669, +0.2162, -0.0938, +0.2174, -0.1737, -0.1142, -0.4596, -0.8221, +0.1460, -0.0529, +0.0091, +0.2910, -0.0069, +0.0269, +0.3302, +0.2057, -0.2453, -0.1601, -0.3126, -0.1870, +0.4375, +0.1843, -0.1943, -0.3884, -0.3279, +0.2304, -0.4774, -0.2126, -0.0953, -0.2638, -0.2560, +0.3985, -0.4843, +0.0108, -0.3235, +0.4747, +0.0984, +0.4887, -0.0731, -0.1361, -0.2360, +0.5858, +0.6585, -0.1947, +0.3593, -0.1992, +0.1642, -0.1906, +0.5165, +0.3017, +0.1850, +0.4195, -0.5015, +0.4992, +0.1888, +0.2433, -0.0199, +0.2201, +0.2489, -0.0059, +0.3244, +0.0615, -0.0830, +0.0901, +0.0987, -0.1308, -0.2390, +0.3367, +0.1630, -0.0879, -0.5759, -0.3706, +0.1402, +0.1441, -0.6210, +0.4549, +0.3207, -0.0909, -0.3474, +0.0062, -0.2868, +0.4860, +0.3282, -0.0616, +0.0435, -0.1916, -0.1337, +0.1767, -0.0441, +0.1377, -0.0714, -0.2422, +0.4145, -0.2775, +0.3438, -0.2590, +0.2416, +0.0796, +0.2678, -0.5077, -0.0722, +0.0602, +0.2200, +0.3370, -0.1364, +0.3795, +0.2717, -0.1259, +0.3194, +0.0890, +0.4020, -0.6233, +0.4707, -0.2599],
-[ +0.4315, -0.5242, +0.2993, +0.2586, -0.4536, +0.7252, +1.0447, +0.6436, +0.6565, -0.0306, -0.3917, +0.0166, -0.8798, -0.1608, -0.4328, +0.0445, +0.3390, +1.2367, +0.9440, +0.9838, -0.4572, -0.4492, +0.4107, -0.0530, -0.4856, +1.1638, -0.2589, +0.6477, -0.5231, -0.0183, -0.4494, -0.6078, +0.3157, +0.0966, +0.4945, +0.7510, +0.4720, -0.5626, -0.6421, +0.6448, -0.5423, +0.1364, -0.0387, -0.2223, -0.0231, -0.6804, +0.2425, -0.1449, -0.0750, +0.4714, -0.4510, +0.8352, +0.1629, +0.0985, -0.1184, +1.0701, +0.6010, -0.6381, -0.3502, -0.5364, -0.7213, +0.3615, +0.7297, -0.7086, +0.6527, +0.3366, -0.2960, -0.8704, +0.0380, -0.8244, -0.6834, -0.2081, -0.4857, -0.8519, -0.2393, -0.3309, -0.3599, +0.1116, -0.4067, +0.5794, -0.5252, +0.2352, +0.2287, -1.0552, -0.2218, -0.3554, -0.1419, -0.6236, -0.2989, -1.2390, -0.2218, +0.4722, -0.1092, +0.3008, -0.0389, -0.3754, +1.4747, -0.2283, +0.4314, -1.1489, -0.7093, +0.6276, +0.1810, +0.5491, -0.5756, +0.3173, +0.6483, +0.8906, -0.4209, -0.5796, +1.0200, -0.6163, -0.1214, -0.1258, +0.5805, +0.2950, +0.2307, +0.4381, +0.4400, -0.1583, +0.5816, -0.2036, -0.5437, -0.4232, +0.0940, -0.2808, +0.3216, -0.2525],
-[ +0.0742, +0.4380, -0.1123, +0.1466, -0.2904, +0.2372, -0.0534, +0.1450, +0.4487, +0.1276, +0.2094, +0.2912, -0.4848, -0.1227, -0.0124, +0.1027, -0.2706, -0.4136, +0.2279, +0.3685, +0.5077, +0.4813, -0.2295, -0.0581, -0.2173, +0.0079, -0.4921, +0.0092, +0.3458, +0.6057, -0.5006, -0.2395, +0.5917, +0.1108, +0.2833, +0.2301, +0.1825, +0.1964, -0.0255, -0.0449, -0.0345, -1.0167, +0.0476, -0.2173, +0.0279, +0.0429, +0.2997, +0.1938, -0.3537, -0.2747, +0.2032, -0.2481, -0.0964, -0.7288, -0.4086, -0.3281, -0.5330, -0.0353, +0.0908, -0.0745, -0.3914, -0.0477, +0.3210, -0.4763, +0.4682, +0.1382, -0.1023, -0.4761, -0.3149, +0.2353, -0.5013, +0.3278, +0.7215, +0.5220, +0.2365, +0.0376, +0.0850, +0.0728, -0.5511, -0.2774, +0.3453, +0.5757, -0.4881, +0.1291, +0.3019, -0.5095, -0.3132, -0.0783, +0.3169, +0.1090, -0.2678, +0.0573, +0.0323, +0.4465, +0.2120, +0.1226, -0.2121, -0.5436, -0.3721, -0.2470, +0.2039, -0.2365, -0.2653, -0.6544, +0.2113, +0.0409, -0.2423, -0.0809, -0.3150, +0.4188, +0.2396, +0.0892, -0.3252, +0.0785, -0.0765, +0.0001, -0.1093, +0.0154, +0.2728, -0.3279, -0.5862, -0.3453, +0.3352, +0.2447, +0.1718, -0.0457, +0.1011, +0.0055],
-[ +0.0624, +0.4458, +0.4019, +0.8994, -0.6486, -0.1769, +0.4868, +0.9355, -0.2429, +0.7262, +0.6965, -0.0365, -0.6536, +0.3626, -0.2547, -0.1860, +0.2543, +0.4959, -0.6441, +0.2759, +0.4728, -0.7154, +0.4143, -0.5522, +0.4175, -0.4754, -0.2388, +0.6940, +0.1767, -0.0695, -0.5299, -0.7597, +0.2607, +0.0011, -0.2511, +0.2057, -0.2618, +0.8556, -0.0538, +0.6507, -0.0294, +0.0506, +0.5690, +0.9084, +0.3703, +0.3960, +0.6274, -0.2553, -0.3905, -0.4587, +0.6875, -0.7533, +0.2636, +0.0411, +0.0147, -0.4051, -0.2924, +0.0527, -0.6806, -0.0558, +0.3568, +0.0074, +0.7132, +0.3295, -0.4066, +0.7340, +0.1515, -0.5188, -0.5649, -0.2111, +0.0307, +0.4785, +0.1403, +0.3972, +0.3874, -0.6252, -0.7443, +0.3098, -0.0559, -0.4157, +0.0956, -0.5464, +0.1054, -0.0222, -0.2876, -0.7069, -0.7060, -0.5730, -0.3187, -0.3308, +1.0375, -0.8244, -0.9502, -0.0767, +0.5329, +0.1996, -0.0616, -0.7486, -0.3553, +0.6040, -0.8704, +0.2485, +0.7603, -0.7057, -0.1106, -0.2849, -0.3432, -0.4080, -0.3912, -0.0188, -0.3057, +0.2499, -0.1263, -0.1666, -0.1307, -0.1352, +0.0337, -0.4882, -0.0702, +0.1477, -0.0856, -0.2110, +0.4851, +0.0950, -0.1593, -0.0592, +0.3819, -0.2539],
-[ -0.3277, +0.1814, -0.3611, -0.3536, +0.9558, -0.1371, -0.9228, +0.7332, -0.1135, -0.3220, +0.4618, +0.0046, -0.1908, -0.1740, -0.2697, +0.1673, -0.0277, +0.2209, -0.2079, +0.5537, +0.3612, +0.2695, +0.3291, -0.8728, +0.4467, -0.2909, -0.1597, -0.6550, -0.0407, -0.5847, +0.3041, +0.4567, -0.0534, -0.3562, -0.6015, +0.5992, +0.5897, +0.2154, -0.2170, +0.1209, +0.2172, -0.0841, +0.0595, -0.2743, +0.2453, -0.0516, +0.6076, -0.1599, -0.1639, +0.6758, -0.6129, -0.4856, -0.1665, +0.2961, +0.1685, -0.2497, +0.7368, -0.1308, -0.0867, +0.2630, -0.8968, -0.5963, -0.3214, +0.1025, +0.1405, +0.1901, +0.5998, -0.3181, -0.4843, +0.5493, -0.0508, +0.0764, -0.4598, +0.1588, +0.5656, -0.4946, +0.2046, -0.3919, +0.0494, -0.1187, -0.3681, +0.2047, +0.0572, -0.0279, +0.3694, -0.2163, +0.1243, -0.1322, +0.1684, -0.2716, -0.2936, -0.1226, +0.3318, +0.5098, +0.5054, +0.6682, -0.1864, -0.6823, -0.1102, -0.2002, -0.3101, -0.4739, +0.7084, +0.2078, -0.0477, +0.5757, +0.2804, -0.0118, -0.1011, -0.4933, +0.1299, +0.0906, +0.1697, +0.1583, +0.2360, -0.0804, +0.8859, -0.2989, +0.0533, +0.2189, -0.4457, +0.3204, -0.3140, +0.0131, -0.1737, +0.2181, -0.4677, -0.1006],
-[ -0.8126, +0.1990, +0.5124, -0.6074, +0.1914, +0.0813, -0.4273, -0.9015, -0.6596, -0.7723, +0.0850, +0.8301, +0.3937, -0.0051, -0.4537, +0.0449, +1.8714, -0.9737, -0.6382, +0.9047, +0.4053, +0.6448, -0.6425, -0.2780, -0.5496, -0.7814, +0.1890, -0.0449, +0.3741, -0.3408, -0.0122, +0.0116, -0.5959, +0.1219, -0.5759, -0.1331, -0.4107, -0.0134, -0.3225, +0.2390, -0.2296, +0.9920, -0.1071, +0.3630, +0.8198, +0.0303, +0.3771, -0.8828, +0.6714, -0.1488, +0.0408, -0.3381, +0.3740, +0.6765, +0.2284, +0.1534, +0.0127, -1.0164, +0.2159, +0.3989, -0.0969, +0.4181, -0.6163, +0.2185, +0.5617, -0.5112, +0.2564, -0.2430, +0.2221, +0.7438, +0.2085, -0.2271, -0.7645, +0.2447, +0.0580, -0.2986, -0.3843, +0.4457, +1.1948, +0.3098, +0.4203, +0.1285, +0.1100, +0.0654, +0.1632, -0.1969, +0.4257, -0.2921, -0.4148, -0.6491, +0.0640, +1.0732, +0.3787, -0.8488, +0.7749, -0.6143, -0.3522, -0.6646, -0.0218, -0.4335, +0.1399, +0.6476, -1.1843, -0.2402, -0.4294, +0.9316, -0.2125, -0.4109, +1.2925, +0.3828, +0.3296, -0.0682, -0.3338, +0.6236, +0.5535, -0.7328, +0.2679, -1.2653, +0.4066, +1.0549, +0.7709, +0.1907, -0.0912, -0.5897, +0.4094, -0.2027, -0.7482, +0.0041],
-[ +0.0151, -0.3742, +0.0016, +0.2834, +0.1383, +0.0585, -0.7797, +0.2568, -0.2497, +0.0606, +0.1941, +0.1929, +0.0807, -0.0506, +0.0821, +0.2228, +0.0671, -0.3058, +0.1571, +0.0677, -0.2029, +0.2194, -0.2530, +0.0500, -0.4600, -0.2309, -0.0687, -0.3576, +0.0130, -0.0976, -0.0143, +0.1618, -0.3840, -0.0062, +0.1015, +0.2622, +0.0436, -0.2084, -0.3667, -0.0176, +0.3798, -0.1638, +0.3623, +0.0450, +0.1132, -0.2585, +0.3003, +0.0910, -0.3317, -0.3344, -0.0952, -0.2291, +0.2999, -0.0652, +0.2557, -0.3650, +0.0745, +0.0989, +0.1088, +0.2606, -0.3433, -0.2269, +0.1071, -0.4127, +0.0438, -0.0027, -0.4558, -0.8596, -0.0528, -0.3395, +0.2788, -0.0144, -0.5132, -0.1118, +0.1520, +0.1987, -0.6925, -0.3463, -0.5606, +0.2373, -0.0452, -0.1289, +0.4662, -0.3166, +0.0866, +0.2533, +0.4591, -0.0308, -0.3316, +0.1370, -0.1116, -0.1013, -0.0797, +0.1959, -0.4299, -0.1954, +0.2309, +0.2581, -0.0489, +0.1615, +0.6893, +0.1740, +0.1636, -0.1154, +0.3753, +0.0447, +0.0770, +0.1540, -0.2353, +0.2607, -0.1375, +0.2752, +0.0977, -0.1261, +0.6568, +0.0207, +0.1612, +0.2390, -0.7583, -0.0295, -0.1044, -0.3573, -0.0536, +0.1232, -0.4262, +0.0862, -0.0726, +0.3601],
-[ -0.5548, -0.1920, -0.1439, -0.2483, -0.2082, +0.2122, +0.2975, -0.0369, +0.1039, +0.1244, -0.2222, -0.4510, -0.0367, -0.3843, +0.0420, -0.0774, -0.4945, -0.1076, +0.0751, -0.3280, +0.1379, -0.3938, -0.3873, +0.3270, +0.0236, +0.0715, +0.0896, +0.1184, -0.2641, +0.0510, -0.3702, +0.0130, +0.3300, +0.0556, +0.2294, +0.1442, -0.1642, +0.2728, -0.2139, +0.0856, +0.2201, -0.1087, +0.3973, -0.1710, -0.3188, -0.2484, -0.2577, +0.4702, -0.4588, -0.1338, -0.0958, -0.1490, -0.0467, +0.2776, -0.1214, +0.0956, -0.2453, -0.1851, -0.6091, -0.2544, -0.0672, +0.0316, -0.2612, -0.1510, +0.0608, -0.4044, -0.5566, -0.3592, -0.5053, -0.2740, -0.5723, -0.2479, -0.3828, -0.0039, +0.2360, -0.3965, +0.2531, -0.2019, -0.5607, +0.1221, -0.0773, -0.0489, -0.4456, -0.0804, +0.0646, +0.2497, -0.4190, +0.0741, -0.6103, -0.4852, +0.0652, +0.1799, +0.2872, -0.4064, +0.1900, +0.0633, +0.0661, +0.0996, -0.2651, -0.0885, -0.2680, -0.5878, -0.1839, +0.2367, +0.3337, +0.1498, -0.3725, +0.3615, -0.5109, -0.1843, -0.1727, -0.1397, +0.1574, +0.0561, +0.3344, +0.0321, +0.0132, +0.0869, -0.2513, +0.2337, -0.2482, -0.0790, +0.1544, -0.3034, -0.1849, +0.0757, -0.2174, -0.5574],
-[ +0.5490, -0.4549, -0.1807, -0.1592, -0.3788, -0.5189, -0.3193, -0.2197, +0.1731, +0.0376, -0.0203, +0.1929, +0.2335, -0.1647, -0.1995, +0.0219, +0.0582, +0.4244, -0.5565, +0.0563, -0.1738, +0.0395, +0.3419, -0.4511, +0.3530, -0.0868, +0.1509, -0.3145, +0.1942, -0.5813, -0.5611, -0.2145, +0.3324, -0.1938, -0.1914, -0.1679, +0.1673, +0.0441, -0.1303, -0.0111, -0.5023, -0.2911, +0.2364, -0.0646, -0.0100, -0.0791, +0.2281, -0.1580, +0.5276, -0.0730, +0.3710, -0.0632, -0.2827, -0.4295, -0.9110, -0.0882, -0.0346, -0.1583, -0.7173, -0.1413, -0.6280, +0.1766, -0.2437, -0.3187, -0.2748, -0.1086, -0.2328, +0.3354, -0.3041, -0.0570, +0.1021, -0.3893, +0.0137, -0.1443, +0.2737, -0.0007, -0.3881, +0.1483, +0.5163, -0.3890, -0.2129, -0.0672, +0.0883, +0.3756, -0.5196, -0.0377, +0.3687, +0.0005, -0.0266, -0.5761, -0.1695, -0.3244, +0.2822, +0.5312, -0.4635, +0.0570, +0.1477, -0.0760, -0.0655, -0.0777, -0.3997, -0.6029, +0.0564, -0.4778, -0.3137, -0.5685, -0.1534, -0.1205, -0.1739, +0.3745, +0.1266, -0.1687, -0.7521, +0.1720, -0.6872, +0.2064, -0.1344, +0.1887, -0.1305, +0.2296, -0.2478, +0.1684, -0.0571, -0.0419, -0.3555, +0.0154, -0.3511, -0.0239],
-[ -0.3780, -0.0914, -0.1854, -0.0867, +0.0707, -0.0432, +0.1008, -1.0046, +0.1248, +0.0778, -0.0427, +0.2416, +0.0008, -0.0101, -0.4476, -0.5558, +0.0581, -0.6113, -0.2540, -0.6178, -0.4318, -0.3423, +0.3608, -0.1651, -0.3607, +0.1386, -0.3745, +0.0981, -0.4823, +0.0222, +0.2264, -0.2605, +0.3376, +0.3309, -0.2458, -0.4256, -0.2320, -0.1249, +0.0601, +0.4954, +0.0609, -0.0214, -0.5550, -0.5377, -0.1116, +0.3434, +0.2198, -0.2050, -0.1425, -0.1160, -0.1088, +0.3296, -0.1532, -0.1229, -0.1750, -0.2386, +0.2166, +0.1215, +0.1890, -0.4310, -0.2282, -0.0927, -0.1166, +0.1719, -0.4427, +0.0348, -0.3925, -0.0549, -0.1108, +0.1640, +0.1764, +0.2961, +0.4874, -0.5198, -0.1629, -0.1281, +0.0984, +0.2756, -0.3100, +0.4790, -0.1045, -0.1158, -0.1894, -0.0491, +0.2014, -0.1137, -0.3516, -0.3540, -0.2153, +0.1554, -0.2093, -0.7217, -0.0483, -0.1205, -0.0052, +0.0623, -0.9125, -0.2332, -0.4875, +0.5284, +0.3595, +0.2822, +0.0158, -0.4752, -0.1192, +0.2230, -0.0346, -0.7476, +0.1063, +0.2522, -0.4063, -0.1613, -0.0444, -0.1514, -0.1480, -0.0707, -0.0311, -0.6826, +0.0449, -0.0401, -0.0937, -0.1488, -0.0981, -0.3116, +0.5926, -0.7581, +0.4659, -0.1110]
-])
-
-weights_dense1_b = np.array([ -0.0148, -0.0390, -0.2168, -0.0866, -0.0677, -0.1575, +0.0077, -0.1385, -0.0953, -0.2318, -0.1402, -0.0267, -0.0565, -0.1655, -0.0944, -0.1856, +0.1183, -0.0606, -0.1517, -0.1972, -0.0256, -0.1761, -0.2543, -0.1125, -0.1902, -0.1462, +0.0160, -0.2130, -0.1644, +0.0530, -0.0384, -0.1030, -0.1822, -0.0219, -0.1597, -0.1946, -0.1177, -0.1970, -0.1569, -0.2162, -0.0256, -0.2618, -0.2127, -0.0910, -0.1862, -0.0517, -0.0811, -0.2137, +0.0810, -0.2098, -0.2763, -0.0980, -0.0986, -0.0983, -0.2186, -0.1723, -0.0822, -0.1072, -0.1466, -0.3015, +0.2120, -0.0178, +0.0700, -0.1122, -0.2641, -0.1767, -0.0722, +0.0859, -0.3453, -0.2988, -0.0838, -0.1928, -0.0916, -0.1749, -0.0969, -0.2420, -0.0859, -0.1487, -0.0692, -0.0028, -0.0989, -0.1322, -0.0582, -0.2906, -0.1255, -0.0026, +0.0352, -0.2485, -0.0592, -0.0695, -0.1047, -0.1616, -0.2268, -0.1474, -0.2683, +0.1161, -0.1794, -0.1011, -0.1924, +0.0348, -0.0169, -0.3281, -0.2085, -0.2750, -0.3329, -0.1793, -0.2296, -0.2289, -0.1589, -0.3225, +0.0159, -0.2951, -0.0156, -0.0544, -0.1193, -0.1563, -0.1691, -0.1292, +0.0228, -0.2741, -0.0235, -0.0564, +0.1007, -0.0648, -0.1383, -0.0235, -0.0557, -0.0005])
-
-weights_dense2_w = np.array([
-[ +0.0547, +0.0221, +0.0159, -0.3500, +0.1057, -0.3978, -0.4751, -0.2686, -0.2984, -0.3477, -0.7638, +0.3041, -0.9283, +0.3769, +0.3866, +0.1042, -0.5446, -1.0826, -0.3685, +0.0957, -1.1452, +0.4594, -0.2719, -0.5546, -0.4310, +0.4055, +0.3174, -0.6414, +0.4058, +0.0122, -0.6446, +0.0312, -0.2846, +0.3681, -0.2635, +0.4684, -0.0438, -0.1535, +0.0279, -0.3398, +0.0489, +0.2915, -0.2513, -1.0484, +0.1129, -0.7923, +0.1379, -0.2217, +0.1685, -0.0273, +0.2727, -0.1051, -0.3335, +0.4067, +0.1543, -0.0099, -0.2005, -0.5140, -0.1314, -0.0537, -0.6073, -0.2714, +0.4734, +0.0307],
-[ +0.1983, -0.4372, +0.2649, -0.6106, -0.5667, +0.2295, +0.2821, -0.1570, +0.1007, +0.0072, +0.1053, +0.1223, +0.5393, +0.0445, +0.4042, +0.1218, +0.1946, +0.3514, +0.6725, +0.3489, -0.2839, -0.3705, +0.2665, +0.2710, +0.2836, +0.1292, -0.2779, -0.3549, -0.6220, -0.0934, -0.6794, +0.2522, -0.0012, -0.7044, +0.0819, -0.1884, -0.5545, +0.2331, +0.0573, +0.1692, +0.3610, -0.5304, +0.0751, +0.4747, -0.1379, +0.1396, -0.1418, +0.2756, -0.3771, -0.5534, -0.7892, -0.5082, -0.4949, -0.5125, +0.3863, -0.4106, -0.3488, +0.3701, -0.0261, -0.2519, +0.3600, -0.0131, -0.5443, -0.2148],
-[ -0.4168, +0.0202, -0.3568, +0.3985, +0.0842, -0.1247, -0.1143, +0.3105, +0.0295, +0.1222, -0.9825, +0.2732, +0.1502, -0.1901, +0.2854, -0.0271, +0.2689, +0.2394, -0.0163, +0.3020, +0.1345, +0.2447, -0.1126, -0.5997, -0.1411, +0.3111, +0.1018, -0.1057, -0.2686, -0.0710, -0.2928, -0.0877, -0.5635, -0.0538, +0.0074, +0.0630, -0.9421, -0.1443, -0.7025, -0.5890, -0.2607, -0.3678, -0.9102, -0.0042, -0.0763, -0.2665, +0.2550, -0.1257, -0.0960, -0.4207, -0.3315, +0.3159, -0.1579, +0.6020, +0.1635, -0.1936, +0.1230, -0.0245, -0.1494, -0.1828, -0.1856, -1.0757, -0.9589, -0.2000],
-[ +0.3752, -0.3057, +0.3341, -0.2068, +0.3930, -0.3313, -0.3786, +0.2107, +0.0767, +0.2396, +0.4759, +0.4447, -0.0988, -0.3320, -0.3001, +0.1111, -0.3114, -0.0926, +0.5017, -0.0114, -0.2243, -0.0705, -0.2502, +0.1573, -0.5134, -0.0888, +0.3586, +0.1723, +0.1582, +0.3832, -0.4192, -0.3290, +0.1729, +0.0234, +0.3742, +0.2108, +0.0021, +0.1886, +0.4553, -0.0405, -0.2013, +0.0391, +0.0099, -0.3560, -0.2403, -0.5404, -0.0850, -1.1031, +0.2303, +0.2130, -0.0970, -0.0781, -0.1787, +0.0094, +0.0652, +0.0435, +0.1182, -0.3572, -0.1822, +0.3167, -0.4896, -0.3626, -0.1668, -0.2644],
-[ -0.3002, -0.1710, +0.0482, -0.2977, +0.6775, +0.2932, +0.3891, -0.1426, -0.3008, +0.1301, -0.6758, -0.1576, +0.1714, +0.3555, -0.6530, +0.2284, -0.5148, -0.2974, +0.1985, -0.0305, +0.5279, -0.3357, -0.4142, -0.2472, -0.0224, -0.1873, +0.1376, -0.4045, +0.1122, +0.2617, +0.4392, -0.1154, -0.2372, -0.0144, +0.0885, -0.4898, +0.1629, +0.2722, -0.4575, -0.2204, +0.5557, -0.3414, +0.1573, -0.0259, +0.0639, -0.1291, -0.6438, -0.6169, +0.2151, -0.0527, +0.1338, +0.1200, +0.0151, -0.4535, +0.3047, -0.4136, -0.0690, -0.8133, -0.3369, -0.2327, +0.3387, -0.6738, -0.2590, -0.2750],
-[ -0.5166, -0.2531, -0.5999, -0.0659, -0.0589, -0.1377, -0.0247, -0.3631, -0.1956, +0.2281, +0.0912, +0.2150, -0.0213, -0.2618, -0.3139, -0.6331, +0.2083, +0.0745, -0.0525, +0.4477, +0.2109, -0.1076, +0.3572, +0.4534, -0.2742, -0.0868, -0.4000, +0.3491, +0.0116, +0.1590, -0.0994, +0.0526, -0.3198, -0.2717, -0.1091, +0.2476, -0.6484, -0.0838, +0.1230, -1.4295, -0.4766, -0.0778, -0.5194, -1.0485, -0.4056, +0.5590, +0.1986, +0.0920, -0.2564, -0.0405, +0.1153, +0.0622, +0.1561, +0.6891, -0.2484, +0.3777, +0.4026, +0.4245, +0.5501, -0.2535, +0.1263, -0.5236, -0.3086, -0.4384],
-[ +0.0267, +0.4426, -0.1992, +0.0821, -0.9791, -0.3588, -0.4260, -0.1455, -0.0490, -0.1547, -0.2543, -0.3684, +0.3642, -0.0006, -0.3487, -0.0551, +0.0879, +0.1316, -0.5557, +0.5368, -0.0159, +0.3170, -0.1802, -0.6798, +0.0029, -0.2864, -0.0650, +0.1866, +0.0697, +0.5808, -0.1085, -0.2594, +0.3730, -0.0222, +0.0780, -0.1649, -0.7503, +0.2781, +0.2997, -0.6883, -0.2393, -0.9101, -0.3439, -0.0368, +0.2190, -0.1207, +0.1521, -0.6376, +0.5755, -0.2450, +0.2238, -0.3727, +0.0233, +0.0576, -0.1159, +0.4381, +0.1958, +0.0134, +0.3485, -0.4711, +0.2344, +0.0854, -1.0917, +0.3356],
-[ +0.3785, +0.3636, -0.3251, +0.3122, +0.2442, -0.5955, -0.0093, -0.3778, -0.2082, -0.1958, -0.8252, +0.1736, +0.1166, +0.8199, +0.3367, -0.1289, +0.4549, +0.2460, +0.1128, +0.3572, -0.2274, -0.2742, -0.5444, -0.1523, +0.0356, +0.3113, +0.0246, -0.5069, -0.3344, +0.1946, +0.0670, +0.1407, +0.7479, +0.3682, +0.8027, +0.2609, -0.4183, -0.1806, +0.1140, +0.2086, +0.0652, +0.0760, +0.2543, -0.7174, -0.5935, -0.2738, +0.1096, -0.4978, +0.4936, -0.2776, +0.6209, +0.1223, -0.4159, -0.2111, +0.2914, -0.3457, -0.2449, +0.0895, +0.0807, +0.5205, -0.2385, -0.1925, +0.1622, +0.0880],
-[ -0.2673, -0.3082, +0.5204, +0.3821, +0.2027, -0.0957, +0.3922, -0.0725, +0.0775, -0.1621, +0.1395, -0.0934, -0.5586, +0.4102, +0.4102, -0.0876, -0.8250, -0.3138, +0.0615, +0.0265, -0.8760, +0.3662, +0.3313, -0.0017, +0.2562, +0.0531, +0.0796, +0.0291, +0.1880, -0.2079, -1.4376, +0.0385, -0.4895, +0.4806, -0.4420, -0.4066, +0.1672, +0.0695, -1.0768, +0.0349, -0.5809, +0.0600, +0.0560, -0.1884, +0.1944, -0.4875, -0.2761, -0.1072, -0.5009, +0.2840, +0.0430, -0.4216, -0.5786, +0.0545, +0.1343, +0.3776, +0.3305, +0.4333, +0.0847, +0.4369, -0.0030, +0.0307, +0.3003, +0.2691],
-[ +0.0893, -0.4704, -0.2054, +0.3949, -0.2963, -0.2947, -0.3435, +0.3517, -0.8073, +0.0914, +0.2846, +0.0485, -0.1339, +0.1669, -0.2241, -0.7245, -0.5583, -0.0823, -0.3668, +0.0645, -0.1111, -0.3214, -0.3099, +0.1846, +0.3734, +0.0287, -0.2115, +0.0354, +0.3143, -0.1244, +0.0086, -0.0529, +0.2437, -0.3184, +0.4261, +0.0090, -0.1972, -0.2668, -0.0503, -0.3085, +0.0711, +0.0746, +0.0209, -0.2126, -0.0542, -0.0856, -0.0140, -0.5341, +0.3074, +0.6249, -0.0955, +0.1454, -0.0128, +0.1829, -0.3874, -1.1490, +0.3613, -0.0753, +0.2431, +0.0126, -0.4169, +0.4549, -0.2987, +0.1634],
-[ +0.2796, -0.8066, -0.1895, +0.0652, +0.0235, -0.0806, -0.6463, +0.2801, -0.1388, +0.2654, +0.1312, +0.2453, -0.3954, -0.6161, -0.0602, +0.0419, +0.1494, +0.2994, +0.2134, -0.1138, -0.1966, -0.3912, -0.4885, -0.4361, +0.0082, +0.2686, +0.5057, +0.2438, +0.2241, +0.2533, +0.0221, +0.2056, -0.3449, +0.1963, -0.1053, +0.1093, +0.2248, -0.1142, +0.3292, -0.0353, -0.1378, -0.4590, +0.1552, -0.6599, -0.4846, -0.2242, +0.7134, -1.2819, -0.2578, +0.0916, +0.4744, -0.1979, -0.2302, +0.0517, +0.1801, -0.0128, +0.2979, -0.6418, -0.4409, -0.1068, -0.3446, +0.0824, +0.1677, -0.2113],
-[ +0.0620, +0.0141, +0.8828, +0.1967, -0.2820, -0.3151, -0.4239, -0.0684, +0.2535, -0.1108, -0.4921, +0.1686, -0.1226, +0.0875, -0.4216, +0.2957, +0.2862, +0.0746, -0.1089, +0.0779, +0.0448, -0.1151, +0.2984, -0.2249, -0.1200, -0.1098, +0.4338, -0.3360, +0.0512, -0.1089, -0.1694, -0.0086, +0.2826, -0.0504, +0.0745, +0.1197, -0.1845, -0.0413, +0.0941, +0.1136, -0.7052, -0.9186, -0.2386, -0.1812, -0.0689, -0.7612, -0.4205, +0.2777, +0.5319, -0.3707, -0.2872, +0.0674, +0.1655, +0.3701, -0.4204, -0.0941, +0.0053, +0.1772, -0.8221, +0.3939, +0.0265, -0.0402, -0.4258, -0.4838],
-[ +0.0312, +0.4064, -0.0163, -0.3321, +0.2323, -0.2347, +0.1756, -0.1976, +0.0030, -0.3264, +0.1410, -0.8448, -0.1253, -0.1722, +0.0647, -0.6614, +0.0124, -0.5357, -0.2659, -0.5198, -0.1104, +0.0036, +0.5971, +0.2923, +0.2818, -0.3823, +0.1973, -0.0398, +0.5571, +0.1238, +0.2223, -0.1846, +0.0045, +0.2834, +0.2652, -0.5670, +0.1025, +0.0954, -0.6847, +0.2716, -0.1995, +0.2227, -0.0417, -0.5204, -0.4656, +0.0143, +0.1697, +0.2654, -0.0200, +0.0227, -0.1669, +0.0093, +0.1622, -1.0894, +0.3023, -0.0433, -0.8114, -0.3466, -0.0044, -0.4344, +0.5942, -0.2995, +0.2493, -0.2656],
-[ +0.0884, -0.1168, +0.2659, -0.2658, -0.0894, -0.3646, +0.0123, -0.2345, -0.1249, -0.5543, -0.4367, +0.0704, +0.1846, -0.5260, -0.0185, -0.1435, -0.0243, +0.2774, -0.1795, -0.2214, +0.0297, +0.1819, +0.0135, +0.0257, +0.1465, +0.5108, -0.0764, -0.2536, +0.1924, -0.3582, -0.1813, -0.2825, +0.1625, -0.4450, +0.1806, +0.2287, +0.1214, -0.2687, +0.1684, -0.4179, -0.1748, -1.4161, +0.0182, +0.3509, +0.2804, +0.1512, -0.4392, +0.1313, +0.0852, -0.6827, +0.0465, -0.1457, +0.0937, +0.4504, -0.2384, -0.2387, -0.5351, -0.4227, +0.2521, -0.1205, +0.3281, -0.4157, -0.0388, -0.0779],
-[ -0.4328, +0.1671, -0.2333, +0.3447, +0.2475, -0.0963, -0.0289, -0.1134, -0.6314, -0.0779, -0.0052, -0.5183, +0.1591, -0.1890, -0.1690, -1.2456, +0.1215, -0.7981, -0.7112, -0.1237, -0.4438, +0.2475, +0.2704, -0.3184, +0.0800, -0.3449, +0.1936, -0.2232, +0.0352, -0.0664, -0.0191, +0.1109, -0.1613, +0.1971, -0.2887, -0.6279, +0.4588, +0.2611, +0.0068, -0.1602, +0.1105, +0.1328, +0.2169, +0.0899, -0.4866, -0.2267, +0.0581, -0.2022, -0.7508, +0.0740, -0.6069, +0.5649, +0.0207, +0.1216, -0.1130, -0.8590, +0.0055, -0.0647, +0.3094, -0.3780, -0.2064, +0.4434, -0.4378, +0.2624],
-[ -0.1505, +0.4615, -0.9363, +0.1984, -0.2306, +0.1047, +0.2547, -0.4131, -0.2132, -0.6349, +0.0660, -0.0981, +0.3538, +0.5521, -0.1076, -0.4321, -0.2629, -0.2857, -0.1064, +0.1612, -0.5917, +0.1856, +0.2716, -0.6279, +0.2015, +0.0297, +0.1344, -0.6113, +0.1501, -0.0768, +0.3218, +0.5261, +0.0611, +0.1559, +0.5267, +0.0392, -0.4469, -0.3359, +0.3373, +0.1011, +0.0721, -0.0051, -0.3831, -1.0682, +0.3176, +0.0177, +0.1255, -0.0222, +0.2602, -0.0707, +0.6271, +0.0442, -0.7024, +0.3064, -0.6523, -0.1607, -0.1061, +0.6141, +0.2525, +0.4590, -0.1475, -0.2303, -0.1497, +0.1568],
-[ -0.6547, +0.1965, +0.5732, +0.0585, -0.7985, +0.2784, +0.1409, +0.3753, +0.5077, -0.2973, +0.4522, -0.0481, -0.0250, -0.1732, -0.0189, +0.1741, +0.1811, -0.5026, +0.3383, -0.2984, -0.1815, -0.2687, +0.1435, -0.5299, -0.5446, +0.2488, +0.0848, +0.2456, -0.6651, -0.4723, -0.2933, -0.2168, +0.1354, -0.1201, +0.7322, +0.3879, -0.5529, +0.0442, +0.1429, +0.2459, -0.3643, -1.2003, -0.0014, -0.0881, -0.2888, -0.1497, -0.4499, +0.2563, +0.1399, +0.3984, -0.3034, -0.2152, -0.1062, -0.0971, +0.4006, -0.2250, -0.3419, -0.2266, -0.3736, +0.5701, -0.6925, -0.0455, -0.0159, -0.5060],
-[ +0.2558, +0.0784, +0.5193, +0.1619, +0.2345, -0.3461, +0.1533, +0.0035, -0.6782, -0.8183, -0.9718, +0.4590, +0.1314, +0.2691, +0.0578, +0.3015, +0.1275, -0.2170, -0.1059, -0.3437, +0.2150, -0.0420, -0.1466, -0.3230, -0.2263, -0.2463, +0.3428, -0.2851, -0.1670, +0.8334, -0.3321, -0.5703, +0.4210, -0.3807, +0.5608, +0.1184, +0.0216, +0.3875, -0.0818, -0.3773, +0.2697, +0.0836, -0.5769, +0.1107, +0.2502, +0.1319, +0.1555, -0.5250, -0.0333, -0.2451, -0.0840, -0.2520, -0.5473, +0.5264, -0.2354, -0.4220, -0.0929, -1.0100, -0.2290, +0.3894, +0.1722, +0.2778, +0.2404, +0.5252],
-[ +0.3719, -0.1570, +0.0631, -0.1366, -0.0117, +0.1695, +0.2635, -0.5559, -0.5966, +0.0401, +0.4796, -0.0389, +0.4392, -0.1852, +0.4559, +0.0249, +0.1135, +0.1914, -0.0850, +0.8742, +0.3766, -1.2051, +0.1491, +0.3556, -0.6834, -0.6127, -0.3816, -0.2803, -0.9287, -0.6655, +0.4073, -0.1513, +0.3072, -0.1859, -0.6259, -0.1803, +0.0372, +0.0066, +0.0768, +0.3041, +0.4044, +0.2719, +0.0495, -0.4712, -0.0753, -0.1619, +0.4040, +0.3667, -1.2573, -0.0153, +0.2433, -0.4797, -0.1008, +0.2793, -0.5162, +0.0750, -0.1875, +0.6019, +0.2983, -0.2629, +0.3859, -0.1606, -0.0607, +0.2640],
-[ -0.7689, +0.1244, -0.0722, +0.1658, +0.0536, +0.0774, -0.0666, -0.3190, +0.3863, +0.0221, +0.3311, -0.0757, +0.2848, -0.4570, +0.1558, +0.1559, +0.1904, +0.2411, -0.0255, +0.2793, +0.2985, -0.3438, +0.0476, -0.4403, -0.5639, +0.1262, -0.2366, -0.5360, -0.0511, +0.1175, -0.2260, -0.4008, -0.3002, -0.7550, -0.7351, -0.0725, -0.3370, +0.5923, -0.2017, +0.1863, +0.3965, -0.3253, -0.0685, +0.0485, -0.0183, +0.1959, +0.2554, -0.1661, -0.9667, +0.1877, -0.1062, -0.4295, -0.2307, +0.0769, +0.1511, -0.7353, -0.4450, +0.2015, -0.3559, +0.6302, +0.1058, +0.3851, +0.0694, -0.5665],
-[ +0.2654, -0.7518, +0.1643, -0.0339, -0.0219, -0.0515, +0.4850, +0.1158, -0.3727, +0.1568, -0.2977, +0.3162, +0.0700, -0.4247, +0.2545, +0.2225, -0.0498, +0.4013, -0.1575, -0.3545, -0.2154, -0.9544, -0.0608, +0.2827, +0.2211, +0.1790, -0.0234, -0.1396, -1.2595, -0.1827, +0.2853, +0.0978, +0.1027, -0.2280, -0.5227, -0.5996, +0.2517, +0.3419, +0.4186, +0.4399, +0.4078, -0.3085, +0.1905, +0.3559, -0.1620, +0.3125, -0.0422, +0.1617, -0.0414, +0.4358, -0.4426, -0.4533, -0.7251, -0.4293, +0.0632, +0.0825, +0.1159, +0.6398, +0.2352, +0.3725, +0.3426, +0.1757, -0.2817, -0.5600],
-[ +0.0965, +0.1435, -0.0668, -0.0310, +0.0492, +0.3276, +0.0812, +0.1402, +0.0513, -1.0857, -0.1374, -1.0262, -0.7472, +0.1752, +0.1458, -0.3731, -0.2896, +0.1206, +0.2268, -0.4120, +0.2665, -0.4842, -0.0096, -0.3069, -0.0961, -0.1954, +0.3195, -0.4060, -0.2027, +0.1026, +0.3581, +0.0684, +0.2964, -0.3857, +0.3346, +0.2853, -0.1779, +0.6816, -0.1396, -0.1068, +0.0874, +0.2093, +0.0690, -0.1075, +0.3425, +0.0184, +0.5206, +0.3363, +0.2432, +0.1155, -0.4405, -0.4702, +0.0007, -0.6360, -0.1712, +0.0258, +0.1292, +0.1699, +0.0017, +0.1035, -0.0856, +0.3821, +0.0642, -0.1730],
-[ -0.2957, -1.8336, +0.0635, -0.1502, -0.3054, -0.0347, +0.4553, -1.5017, -0.1386, +0.2204, -1.5949, -0.1060, +0.0207, -0.3453, +0.1805, +0.1862, +0.1077, +0.0503, +0.4847, +0.0824, -0.1334, +0.1013, -0.0132, -0.2091, -0.0147, +0.3173, -0.5393, -0.1905, -0.6108, -0.4315, +0.1379, +0.3715, +0.4988, +0.0204, -1.0445, -0.7534, +0.3054, +0.1166, -0.2072, +0.2696, -0.0510, -0.2593, -0.1224, -0.7100, -0.0739, -0.4827, +0.2711, -0.1706, +0.3453, +0.2951, +0.0905, -0.7676, +0.3072, +0.4110, -0.7400, -0.0282, +0.3160, +0.0045, +0.3315, -0.1876, -0.5153, -0.0300, +0.0528, -0.0902],
-[ -0.0392, -0.2831, -0.8638, +0.0181, -0.1839, +0.1190, +0.1256, +0.0349, +0.0335, +0.3621, +0.0015, -0.0992, -0.2544, -0.6373, -0.5993, +0.3642, +0.0229, -1.3911, +0.0442, +0.3622, -0.0907, +0.0980, -0.1975, +0.2308, -1.1896, -0.4979, +0.1135, -0.0943, +0.0679, -0.0002, -0.0083, -0.8543, +0.2544, -0.0756, -0.9005, -0.0970, -0.0499, +0.2011, -0.0504, -0.4152, -0.1189, +0.0047, +0.1132, +0.1040, -0.0365, -0.1372, +0.0665, -0.3832, -0.3141, +0.0644, -0.0858, -0.2961, +0.2374, +0.3307, +0.2823, -0.0944, -0.1386, -0.1009, +0.1643, -0.8802, -0.2065, +0.2246, +0.1913, -0.0572],
-[ -0.1170, -0.4247, +0.2971, -0.0218, +0.2794, -0.3040, +0.1894, -0.0772, -0.4478, +0.0155, -0.8504, -0.2509, -0.0805, +0.0955, +0.2145, +0.3553, -0.4790, +0.0649, -0.0476, -0.0949, -0.0201, +0.0573, +0.1713, +0.0237, -0.1585, +0.2141, -0.3027, -0.2567, -0.1553, +0.1717, -0.2864, +0.1060, -0.0100, -0.7441, -0.0440, -0.5248, +0.4325, +0.0117, -0.0124, +0.4722, +0.3972, +0.3061, -0.0881, +0.0888, +0.1247, +0.0465, -0.3472, +0.0608, +0.1640, +0.0900, +0.0040, -0.2854, -0.3570, -0.2206, +0.4373, -0.0944, -0.0799, -1.0422, +0.0771, -0.6116, +0.5273, -0.0734, +0.0059, +0.0125],
-[ -0.1478, -0.0775, -0.4148, +0.2235, +0.0244, -0.4050, -0.1933, -0.1451, +0.3546, +0.4780, -0.0377, +0.3747, -0.2634, +0.1820, -0.2871, -0.0375, -0.1472, -1.0087, +0.3116, +0.0882, +0.1714, -0.1267, +0.0243, +0.1244, -0.6763, +0.3206, +0.1243, +0.3372, +0.0311, +0.2017, -0.1272, +0.1254, +0.2171, +0.1646, -0.3122, -0.2863, -0.0401, +0.0408, +0.2649, -0.9490, +0.1101, +0.0612, +0.0200, +0.0067, -0.1735, +0.4192, +0.5672, -0.4306, -0.2337, +0.1219, -0.0581, -0.6563, +0.2676, +0.0907, +0.0774, +0.3393, +0.3514, -0.5195, +0.2571, -1.0322, -0.3714, +0.1705, -0.2050, -0.1214],
-[ +0.2841, +0.2037, +0.0734, -0.3167, -0.2534, +0.3772, +0.3707, -0.0807, +0.2971, +0.1787, +0.0742, -0.7424, +0.0534, -0.6033, -0.2538, -0.1693, -0.0417, +0.1408, -0.0786, +0.0125, -0.2959, +0.3026, +0.1068, +0.3710, -0.0259, -0.2119, +0.2311, +0.1579, +0.4271, -0.1637, -0.1047, -1.4823, +0.1537, -0.6320, +0.0265, -0.3799, +0.2478, -0.5812, -0.1404, -0.0219, -0.1906, -0.0507, +0.1606, +0.3727, +0.2747, +0.0747, -0.1603, +0.3651, +0.0592, -0.2988, +0.1446, -0.4449, +0.0282, +0.1628, +0.1572, -0.9307, -0.5926, +0.0564, +0.4344, -0.2915, -0.0055, -0.0388, -0.2319, +0.0708],
-[ -0.1260, -1.1956, -0.3519, -0.1696, -0.5884, -0.3108, -0.2285, +0.2627, +0.3962, +0.0449, +0.0626, +0.2328, +0.0144, +0.1303, +0.3914, -0.8420, +0.4524, -0.4737, -0.5874, -0.2379, -0.0688, -0.0159, +0.1504, -0.8424, -0.3590, -0.3149, -0.3955, -0.0819, -0.2932, +0.1551, -0.0380, -0.3986, -0.0895, -1.1964, +0.2346, +0.0107, -0.5550, +0.0978, -0.2178, -0.0702, +0.0130, -0.0487, +0.1236, +0.2701, -0.0855, -0.6003, +0.0025, -0.4898, -0.4901, +0.3732, -0.1348, -0.0001, +0.0022, +0.4124, -0.2319, -0.8846, +0.1981, +0.3517, +0.3260, +0.2913, -0.6865, -0.1172, -0.1017, -0.2988],
-[ -0.1994, -0.0318, -0.6611, +0.0667, +0.0348, -0.2005, -0.0708, -0.8554, -0.2964, +0.1114, +0.2106, -0.3456, +0.0631, -0.6458, -0.4482, +0.4112, +0.4312, +0.0396, -0.8510, +0.3383, -0.3657, -0.3998, -0.0279, -0.3247, +0.2809, +0.0671, -0.1980, -0.3156, -0.1614, +0.1241, +0.1267, +0.0882, -0.8523, +0.3680, -0.1008, +0.3258, +0.7330, -0.0226, +0.2324, +0.2983, -0.4784, -0.0821, -0.3784, -0.5416, -0.0020, +0.0128, -0.1557, +0.1735, -0.0400, +0.3065, +0.0703, -0.1273, +0.3064, -0.0101, -0.5155, +0.1910, +0.0411, +0.2573, -0.3383, +0.1305, +0.0244, -0.0700, -0.5478, -0.2243],
-[ +0.6525, -0.1060, +0.0967, -0.2523, -0.0679, -0.2359, -0.1002, -0.1302, -0.2785, -0.0323, -0.2069, -0.4863, +0.4068, -0.2921, +0.0689, +0.0659, +0.3440, +0.0730, -0.2341, +0.1442, +0.0321, -0.4033, +0.3169, +0.2174, -0.3649, -0.3458, -0.0410, +0.1900, -0.3263, +0.0535, +0.2253, -0.0717, +0.2190, -0.3860, +0.4562, -0.0471, -0.6580, +0.1243, +0.0968, -0.0801, +0.2969, -0.1420, +0.0635, +0.3387, -0.0512, +0.0064, +0.3651, -0.0423, +0.0007, -0.5414, -0.1172, -0.1081, -0.1545, -0.0802, -0.9081, +0.1538, -0.0143, +0.0015, -0.2125, -0.1439, +0.3589, -0.6707, -0.6915, +0.2103],
-[ +0.1954, +0.0473, +0.0005, -0.2376, +0.2730, -0.2364, +0.1537, -0.3518, -0.2333, -0.6985, +0.1143, -0.4291, -0.4548, -0.0803, -0.5521, -0.4564, -0.5651, -1.0630, +0.1796, -0.0002, +0.0015, -0.3317, -0.7872, -0.0555, -0.0872, -0.0989, -0.2793, +0.2904, -0.2892, +0.2572, +0.2525, -0.3601, +0.1851, -0.3061, +0.4080, -0.9798, -0.0559, -0.0152, -0.2210, -0.2351, -1.2633, -1.3520, +0.1842, -0.8754, -0.3290, -0.2398, -0.1657, -0.3064, +0.4170, -0.1810, +0.3617, -0.0774, +0.1052, -1.0043, -0.0412, +0.1861, -0.0364, -0.0832, -0.3337, -0.0208, -0.4717, +0.2991, +0.5363, -0.7141],
-[ -0.2813, -0.3716, -0.0886, -0.5633, +0.1087, +0.1772, -0.0322, -0.1692, +0.3300, -1.0514, -0.1952, -0.5817, +0.1098, +0.2299, +0.1408, -0.8174, -1.5817, -0.0897, +0.4067, -0.8538, +0.2466, -0.2321, -0.0760, +0.3167, +0.1953, -0.0280, +0.1107, -0.1015, +0.1602, -0.1283, +0.0893, +0.2528, +0.3058, +0.4486, +0.0661, -0.6155, +0.1135, -0.0380, -0.1616, -0.2837, +0.0692, +0.0797, -0.0934, +0.1645, -0.6896, -0.1260, +0.0314, -0.0450, -0.2893, -0.1417, -0.0603, -0.3250, +0.2633, -0.4442, -0.2169, +0.0100, -1.6046, -0.8446, +0.0547, -0.2022, +0.1854, +0.2163, +0.1098, -0.4998],
-[ -0.2718, +0.0985, +0.1143, +0.5034, +0.1062, -0.2774, +0.0928, +0.4507, -0.2889, +0.1647, +0.1606, -0.5096, +0.0797, +0.2081, +0.1015, -0.0662, -0.5561, +0.0133, -0.1913, +0.4173, -0.2062, -0.0683, -0.0707, -0.3881, -0.1940, -0.1059, +0.1708, -0.0068, +0.4992, +0.1805, -0.0863, -0.1116, +0.2974, +0.6512, +0.2988, -0.7671, -0.3240, -0.2382, -0.3154, -0.4172, -0.0090, +0.3568, +0.0629, -0.4475, +0.0085, +0.3164, +0.8345, -0.9105, +0.4016, +0.0489, +0.1487, -0.1455, -0.0914, +0.3481, -0.0170, -0.2977, +0.0686, -0.3068, +0.4279, +0.1365, +0.0191, +0.3697, +0.2504, -0.2336],
-[ -0.4281, -0.1639, -0.6842, -0.0854, -0.3867, +0.1215, +0.2188, -0.0905, -0.0237, +0.3002, -0.1625, -0.0496, +0.2249, +0.0999, -0.0021, -0.0105, +0.0438, -0.2453, -0.7972, -0.0544, -0.6363, +0.4864, +0.1242, +0.0230, +0.3307, -0.4536, -0.1405, +0.2291, -0.3801, -0.1614, -0.0584, +0.2719, -0.2294, +0.1266, -0.7109, -0.3877, +0.3089, -0.3075, -0.5052, +0.2617, -0.8302, -0.1543, +0.4105, -0.1404, -0.2835, -0.1752, -0.3642, +0.1386, -0.1469, +0.3241, +0.0407, +0.1294, +0.0788, -0.0815, -0.7150, +0.2538, +0.5408, +0.5778, +0.2923, -0.3580, -0.0519, +0.2803, +0.0072, +0.1857],
-[ +0.1413, -0.4943, -0.6837, +0.2482, -0.1298, -0.2851, -0.0800, -0.9522, -0.0827, -0.4602, +0.1367, +0.2338, +0.4496, +0.0029, -0.6388, -0.3566, -0.1129, -0.2587, +0.1929, +0.2315, -0.1974, +0.1578, +0.2540, +0.2304, +0.0193, -0.2805, -0.0064, -0.3831, +0.2310, +0.2366, -0.0409, +0.0743, -0.6095, +0.3397, -0.5128, -0.0056, +0.3138, +0.4122, +0.0952, -0.1192, -0.1181, -0.1224, +0.3857, -0.1165, -0.0761, -0.5138, -0.4998, -0.1310, -1.3272, -0.0823, +0.2054, +0.3836, +0.1094, -0.1651, +0.1319, +0.0349, +0.0455, +0.3051, -0.2890, -0.3378, +0.4504, -0.4409, +0.0342, +0.2857],
-[ -0.6909, -0.2404, -0.5480, +0.1982, +0.7179, -0.1566, +0.5150, -0.3021, -0.1896, +0.3692, -0.2610, +0.1676, +0.2646, -0.0779, -0.6376, -0.4375, +0.0814, -0.0594, +0.1491, +0.6636, -0.0098, -0.4666, -0.5695, -0.4680, +0.3753, -0.2631, -0.3479, -1.0949, -0.1768, -0.0397, -0.2667, +0.2302, -0.3895, +0.2984, -0.1895, -0.1393, -0.1342, +0.5137, +0.0543, -0.1336, -0.0678, -0.9658, -0.4799, +0.4449, -0.0855, -0.0889, +0.0750, -0.0107, -0.8546, -0.1215, -0.0314, +0.0430, +0.4070, -0.4824, +0.0688, +0.3415, +0.0656, +0.0570, +0.0387, +0.4817, +0.1426, +0.0509, +0.0760, -0.4065],
-[ +0.4383, +0.1584, -0.0754, +0.1745, +0.0786, +0.2143, +0.1374, +0.0865, +0.4707, -0.6604, +0.4382, +0.2705, -0.0253, +0.2995, -0.4382, -0.0289, -0.4109, +0.0659, -0.0184, +0.3955, -0.0828, -0.7735, -0.0186, -0.3625, -0.3181, -0.1457, +0.3396, -0.2431, -0.1825, +0.1364, +0.1260, +0.0534, +0.2614, -0.0357, +0.2487, +0.1936, +0.4056, +0.2736, +0.3650, +0.2727, +0.3510, +0.0828, +0.1987, +0.0946, -0.3942, +0.2064, +0.1439, +0.1201, -0.4372, +0.2936, +0.1877, +0.1580, -0.2083, -0.2638, +0.0890, -0.4047, +0.0004, -0.0605, -0.2715, +0.0797, +0.1276, +0.4446, -0.2733, +0.2584],
-[ -0.5070, -0.6084, +0.1098, +0.2952, +0.3233, +0.1273, -0.1590, +0.4029, -0.0075, -0.2986, -0.0453, -0.0251, +0.0636, -0.3285, +0.3005, +0.4278, -1.2692, -0.3260, -0.3904, -0.4674, -0.1919, +0.1708, -0.2957, -0.3654, +0.0608, +0.3880, -0.3380, -0.0002, -0.1227, +0.0483, -0.3408, +0.2696, -0.2904, -0.8352, +0.2176, -0.8516, +0.1110, -0.0138, -0.6308, -0.2065, +0.5916, -0.0596, -0.0420, +0.4001, +0.1048, -0.1863, +0.2619, +0.0696, +0.2273, -0.1749, -0.4023, +0.4499, -1.5990, -0.4454, -0.0222, -0.4018, -0.3324, +0.1569, -0.0777, +0.0774, -0.2870, +0.2780, +0.1298, -0.5494],
-[ +0.4041, +0.2116, +0.1746, +0.3060, +0.3644, +0.2566, -0.2467, +0.0528, -0.1645, -0.2514, +0.3191, -0.0146, -0.2756, -0.1343, -0.1539, -0.4656, -0.0026, -0.0629, -0.3565, -0.7495, -0.6157, -0.2922, +0.0272, +0.3853, -0.3030, +0.1152, +0.6219, +0.0596, +0.2660, +0.3633, +0.3082, +0.4234, +0.1700, -0.7490, +0.6056, +0.0380, -0.1250, +0.1593, -0.0863, -0.3877, -0.0154, -0.6906, -0.1813, -0.1751, -0.0309, +0.0954, -0.0752, +0.1333, -0.3153, +0.0735, +0.2958, -0.0313, -0.0686, -0.0086, -0.3676, +0.4638, -0.0175, +0.0595, +0.4441, +0.0093, +0.2578, +0.1221, +0.0885, +0.2014],
-[ -0.5199, +0.6037, +0.1349, +0.0017, +0.1035, -0.1073, +0.4821, -0.2727, -0.7271, +0.4909, -0.4462, +0.0574, +0.2442, -0.4101, +0.2368, -0.0281, +0.1593, +0.2608, -0.1477, -0.0326, +0.1544, -0.2897, -0.3711, -1.0289, -0.1497, +0.3172, -0.6857, +0.1492, -0.0524, +0.1699, +0.0543, -0.1961, +0.0100, -0.5156, -0.5196, +0.0112, -0.3831, -0.2663, -0.4071, -0.5762, -0.4060, -0.1983, +0.4095, +0.0808, +0.1072, +0.2126, +0.1083, -0.3055, +0.4092, +0.0916, -0.0140, +0.0065, -0.2017, -0.8640, +0.0456, -0.0038, +0.2211, -0.3172, +0.0554, -0.1270, -0.1246, -0.0759, -0.3650, -0.3657],
-[ -0.3915, -0.5535, -0.1423, -0.3716, -0.7515, +0.3826, +0.1549, -0.0311, +0.1627, -0.5930, +0.5855, -0.1633, -0.5803, -0.2441, +0.4444, -0.0405, +0.5196, +0.3439, -0.7971, +0.3043, -0.1354, -0.3644, +0.4925, +0.1056, +0.1867, +0.3991, -0.6626, +0.1049, -0.0140, -0.8950, +0.1062, -0.0186, +0.0854, -0.2033, +0.1403, -0.3018, -0.6041, -0.4544, +0.3293, -1.0832, +0.0505, +0.1097, -0.4619, -0.3131, +0.5037, -1.0137, -0.3421, +0.1212, -1.0994, +0.0358, +0.4906, -0.0352, -0.1116, -0.1726, -1.1999, -0.4828, +0.3461, -0.2870, -0.1895, +0.0537, +0.0167, +0.0602, -0.2372, -0.1231],
-[ -0.2542, +0.8363, -0.2559, +0.0872, -0.1544, +0.1869, +0.4374, -0.4973, +0.3678, -0.8425, -0.9891, +0.1042, +0.1624, -0.0964, -0.1170, +0.2177, +0.1344, -0.3417, +0.5302, -0.3181, -0.8319, -0.0489, -0.3692, +0.3340, -0.1902, -0.0889, -0.0784, -0.2664, -1.1404, +0.2895, +0.0599, +0.0680, +0.4447, -0.1955, -0.2036, +0.1605, -0.4091, +0.3005, +0.4971, +0.0056, -1.0584, -0.9754, +0.4259, -0.4642, +0.3212, -1.0444, -0.4395, +0.1104, -0.2354, -0.2754, -0.1138, -0.1852, +0.5298, -0.1715, -0.6177, -0.5564, -0.5845, -0.9398, -0.5432, -0.4941, -0.5598, -0.2745, -0.7410, +0.0811],
-[ +0.3484, +0.2363, -0.2313, +0.2903, +0.0599, +0.1981, +0.0264, +0.0365, -0.6788, +0.5058, +0.5024, -0.1606, -0.1466, +0.0896, -0.1695, -1.3626, +0.2203, -0.0972, -0.0547, -0.2063, +0.3971, -0.3022, -0.0741, +0.4433, +0.0614, +0.0450, -0.2246, -0.3360, -0.5529, +0.0350, -0.2026, -0.1587, -0.1705, +0.0967, -0.3402, +0.2256, +0.0723, +0.2559, +0.2409, +0.0809, +0.2522, +0.1735, +0.2135, -1.4875, -0.6041, +0.3822, -0.0542, -0.7500, +0.2439, +0.2342, -0.2002, +0.2322, -0.7495, +0.1338, +0.0136, -0.5508, +0.0944, +0.1229, -0.3225, +0.2776, -0.0289, +0.0075, +0.1089, +0.4093],
-[ -0.4983, -0.0860, -0.6441, +0.0981, -0.1997, -0.1528, -0.3994, -0.0600, -0.1746, -0.2651, -0.2522, +0.0370, -0.0651, -0.1543, -0.0061, -0.1030, -0.8072, -0.5816, -0.1532, -0.4045, +0.0006, +0.2646, +0.4261, +0.3321, +0.1915, -0.0374, -0.2416, +0.2430, +0.2274, +0.1678, -0.1648, +0.5931, -0.3600, -0.0454, -0.2038, +0.3763, +0.1858, -0.1298, -0.5252, +0.4314, +0.3626, -0.6726, -0.1011, +0.0262, -0.1636, +0.1911, -0.8712, +0.5409, +0.0053, +0.4764, -0.5827, +0.2690, +0.1905, -0.2930, -0.5309, +0.0933, +0.6593, +0.0569, +0.1535, -0.0866, -0.2559, -0.1172, -0.7115, -0.0318],
-[ -0.3941, +0.2379, -0.7244, -0.5779, -0.1544, +0.0214, +0.1138, -0.0033, +0.2314, -0.5746, +0.1439, -0.2131, -0.3561, -0.9263, -0.4184, -0.0513, +0.5047, -0.0148, +0.2949, -0.4070, +0.2619, +0.0486, -0.9044, -0.0877, +0.1956, -0.2011, -0.4901, +0.6367, -0.1576, -0.2315, +0.0778, -0.3715, +0.2394, -0.0715, -0.0091, +0.3945, +0.1454, +0.2826, +0.2854, +0.0383, -0.7265, -0.4513, -0.0195, +0.1877, +0.1825, -0.1004, +0.0741, -0.5238, -0.7622, +0.4092, +0.4336, +0.1936, +0.3382, +0.3516, +0.2307, -1.4502, +0.5835, -0.5750, -0.7338, +0.2978, -0.5406, +0.0339, -0.3202, +0.2325],
-[ -0.0698, -0.8776, -0.9628, -0.2211, +0.0842, +0.2107, +0.0941, -0.2500, -0.3662, +0.0578, -0.4750, -0.2181, -0.1686, -0.2689, +0.1411, -0.8256, +0.3186, -0.3517, -0.4490, +0.0117, +0.2536, -0.0792, +0.0725, +0.0385, +0.2386, +0.0666, -0.2312, +0.0256, +0.1604, -0.0002, -0.0714, -0.6004, -0.1841, -1.4967, -0.5932, +0.2548, -1.1410, -0.4043, -0.5033, -0.2187, -0.7987, +0.5275, +0.0285, -0.8600, -0.2614, +0.0639, +0.3257, +0.4107, +0.2087, -0.1072, -0.1157, +0.0467, -0.6435, -1.0427, -0.5286, +0.0459, +0.1097, -0.2149, +0.0394, -0.3587, +0.1313, -0.6886, -0.1345, -0.5884],
-[ +0.5300, -0.3907, -0.0105, -0.7121, -0.3486, +0.0401, +0.2562, +0.3037, +0.2092, -0.0210, +0.3676, -0.0227, -0.1761, -0.1304, +0.0840, -0.1310, +0.2111, +0.0926, -0.2739, -0.3635, -0.5617, -0.1553, +0.0314, -0.4018, +0.4185, +0.0401, -0.1099, +0.2949, +0.2019, -0.1762, -0.3477, +0.3448, +0.3568, +0.0361, +0.3788, -0.1996, +0.1723, -0.1428, +0.0066, +0.3473, -0.3308, +0.4851, +0.1993, +0.2379, -0.1148, -0.1366, +0.1673, +0.0433, +0.4188, +0.1589, +0.1478, -0.2602, -0.3324, +0.4604, -0.4275, -0.1584, +0.1039, +0.1074, -0.4238, +0.7423, -0.3097, +0.4578, +0.0754, -0.2779],
-[ +0.1529, -0.1575, +0.0819, +0.0579, +0.4000, -0.2372, +0.2025, +0.3456, +0.4460, +0.6892, -0.3688, +0.0596, +0.7114, +0.0582, +0.2526, +0.0559, -0.3033, -0.2083, -0.2725, +0.2148, +0.6348, -0.0939, -0.3589, +0.3578, -0.0897, -0.4104, -0.2510, -0.1750, -0.0342, +0.2579, -0.2709, +0.1463, -0.2980, +0.6216, -0.3951, +0.2358, +0.5241, -0.1989, +0.0439, +0.2978, +0.2848, +0.4379, -0.1006, +0.4004, -1.3318, +0.0721, -0.7419, -0.4410, +0.1182, -0.1377, -0.3649, +0.3684, -0.1349, -0.3452, +0.1427, -0.3848, -0.1854, -0.2795, -0.0527, -0.1123, -0.0352, -0.5523, -0.0433, +0.5344],
-[ -0.5747, +0.6322, -0.8440, -0.1528, -0.1161, +0.0448, -0.2353, +0.6576, +0.3179, +0.1904, -0.5284, +0.1620, -0.6215, -0.2991, +0.1852, +0.0115, -0.2674, -0.6372, +0.3602, -0.1317, +0.0330, +0.0931, -0.0091, -0.2444, -0.1673, +0.1395, -0.2460, +0.0833, -0.0209, -0.5390, -0.1847, -0.3628, +0.1574, -0.2920, -0.2394, +0.4293, -0.0784, +0.5356, +0.2715, -0.2624, -0.5728, -1.0559, -0.2006, +0.4380, +0.2419, -0.1679, +0.5417, +0.1381, -0.2034, -0.0121, +0.3109, +0.4409, +0.6114, -0.1056, -0.5598, -0.3813, -0.1363, +0.0551, +0.4501, -0.1133, +0.0976, +0.4507, +0.5136, -0.4507],
-[ -0.9244, -0.6286, -0.3487, +0.3031, +0.5490, -0.0417, +0.1368, +0.0454, +0.1623, -0.2627, +0.1115, +0.2481, +0.1029, -0.8995, -0.2601, +0.0153, -0.1716, +0.2178, +0.1816, +0.4099, +0.3247, -0.5553, -0.6924, -0.0171, +0.0062, -0.1994, -0.2239, -0.0970, +0.4365, -0.2650, +0.0827, -0.5745, -0.1020, +0.0077, -0.2992, -0.2860, -0.3540, +0.1319, -0.2205, -0.1654, -0.6664, +0.3699, +0.5765, +0.4030, -0.1225, -0.0918, +0.0005, +0.2558, -0.2505, +0.2503, -0.3338, -0.0020, +0.1167, -0.9499, -0.1115, +0.1646, +0.2288, -0.6132, -0.0171, -0.6352, +0.3016, -0.8156, -0.0234, -0.1960],
-[ -0.1446, -0.0614, -0.5054, +0.0903, -0.6342, -0.3637, -0.4531, +0.3534, -0.3720, +0.1497, -0.0799, -0.4266, -0.4212, -0.0637, +0.2497, -0.2035, +0.0224, -0.2292, -0.4062, -0.1081, -0.8317, +0.3876, -0.1462, +0.3375, -0.2768, +0.2942, -0.0415, -0.0010, +0.1652, +0.3646, -0.4710, -0.3447, -0.3278, +0.2597, -0.1056, -0.2106, +0.0542, -0.0294, +0.2012, +0.2639, -0.1646, -0.0958, +0.7079, +0.1167, +0.3802, -0.3459, -0.1004, +0.3548, +0.3814, +0.1147, -0.0515, +0.0656, +0.0187, +0.4013, -0.4644, +0.3470, +0.0240, +0.0587, +0.3188, +0.3168, +0.0652, -0.1883, -0.1926, -0.2713],
-[ -0.5894, -0.5153, -1.0262, -0.2579, -0.1002, +0.0868, -0.2158, -0.5245, +0.1173, -0.5855, +0.1135, +0.1471, -0.1395, +0.0561, -0.7122, -0.1065, -0.0323, -0.7822, -0.1447, -0.0733, +0.2652, +0.0712, +0.3987, +0.2479, -0.0321, +0.0163, -0.4509, +0.5805, +0.4090, +0.0009, +0.0661, -0.2575, +0.4356, +0.1165, -0.4437, -0.0218, -0.0202, -0.0969, -0.0273, -0.3226, -0.0146, -1.0215, -0.2444, -0.3282, +0.1432, +0.1515, -0.0272, -0.5475, -0.0752, -0.0464, +0.3280, +0.2803, +0.4469, -0.1728, +0.1299, -0.3028, +0.1950, -0.1140, +0.1167, -0.7595, +0.0355, -0.3649, +0.0557, +0.3914],
-[ -0.0846, -0.1685, +0.2284, -0.2308, -0.2823, -0.1744, -0.4141, +0.2608, -0.0387, -0.3320, -0.1776, +0.1127, +0.2196, +0.2047, +0.1583, -0.4179, -1.1789, -0.2604, +0.2216, -0.2943, -0.1386, +0.2381, +0.2102, -0.9876, +0.2734, +0.2302, +0.0747, -0.0731, +0.3148, -0.7059, -0.0752, +0.2228, +0.2243, -0.0902, +0.1300, +0.1532, -0.0828, -0.4113, -0.3630, +0.1029, +0.1319, +0.2420, +0.0834, +0.2050, -0.1922, -0.2458, -0.1244, +0.1475, +0.0999, +0.3175, +0.0888, +0.5254, +0.1428, +0.1467, -0.4229, -0.7336, -0.1727, -0.0493, +0.3679, +0.1458, -0.1008, -0.0171, -0.2563, -0.1038],
-[ +0.1402, -0.1713, +0.0748, -0.1560, -0.2416, +0.4341, +0.6550, -0.3423, +0.0628, +0.1346, +0.4624, +0.2883, -0.0514, -0.4130, -0.5822, +0.5217, -0.1437, +0.3471, +0.2181, -0.2431, -0.5769, -0.0424, +0.2626, +0.4983, +0.2075, -0.1028, +0.0161, +0.1407, -0.0833, +0.2390, +0.0417, +0.2823, +0.5103, -0.6378, -0.0536, -0.0393, -0.0651, +0.2310, +0.1614, +0.3542, -0.9074, -0.6099, -0.6084, -0.2096, +0.3871, -0.4172, -0.3355, -0.0663, +0.0204, -0.2276, +0.0557, -0.4072, -0.0672, -0.5691, -0.0667, +0.1840, +0.0315, -0.5422, +0.2810, -0.6101, +0.0672, +0.2098, +0.2070, -0.0607],
-[ +0.1965, -0.2065, +0.3365, -0.2497, -0.0590, +0.0630, +0.3852, -0.0385, -0.2316, +0.1742, +0.0175, +0.3616, +0.0664, +0.0959, -0.4834, -0.0115, -0.3736, -0.6134, +0.4486, -0.6497, -0.4091, -0.2319, +0.4347, -0.1304, -0.3359, -0.1652, +0.2525, +0.0212, +0.0533, +0.2644, -0.4857, +0.0716, +0.1842, -1.0370, +0.2084, +0.3405, -0.5086, +0.0427, -0.5776, -0.2903, -0.2391, -0.2570, -0.3302, -0.4522, +0.1341, +0.1451, -0.6259, +0.3231, +0.1005, -0.7788, +0.2834, +0.4262, -0.6278, -0.2713, -0.7403, +0.0574, +0.0764, -0.7498, -0.2167, -0.2668, +0.2389, +0.3858, +0.4294, -0.1692],
-[ -0.6005, -0.3342, -0.0341, -0.0976, -0.1294, -0.0055, +0.1565, +0.1378, -0.4799, -0.0769, +0.0385, +0.4254, +0.0979, +0.2879, -0.3212, +0.7339, -0.2134, -0.3846, -0.1997, +0.0673, +0.5370, -0.2301, +0.1499, +0.2798, +0.3384, +0.1293, -0.2867, -0.4863, +0.3093, +0.1156, -0.3691, -0.0511, -0.6717, +0.2799, +0.1184, +0.7869, +0.0988, +0.2327, -0.3219, -0.3663, -0.1863, -0.2751, -0.6367, +0.1387, -1.2061, +0.5445, -0.2497, -0.6187, -0.3262, +0.2336, +0.0923, +0.4471, +0.4191, +0.5987, +0.5211, -0.2479, -0.0383, -0.0975, +0.0296, -0.6031, +0.2865, -0.6888, -0.4697, +0.3444],
-[ -0.8969, -0.3619, -0.2047, -0.1343, -0.3042, -0.1042, -0.0415, -0.1624, -0.2147, -0.1016, -0.7889, +0.3418, +0.0868, -0.4342, -0.2084, +0.3734, +0.4318, -0.1115, +0.2490, +0.4559, -0.2937, -0.5159, -1.1121, -0.0804, +0.1388, -0.4097, +0.1953, -0.0861, +0.0755, +0.0578, -0.0600, -0.0519, +0.2378, -0.7286, -0.8340, -0.9214, -0.1790, -1.2709, -0.5294, +0.0270, -0.4837, +0.1236, +0.3863, -0.3191, +0.1822, -0.1040, -0.3779, +0.1810, -0.0920, -0.1269, +0.5072, -0.3267, +0.3822, -1.1616, +0.2350, +0.4796, +0.1842, -0.1957, +0.0444, -0.6974, -0.4900, -0.4579, -0.1375, -0.5128],
-[ +0.4125, +0.1846, -0.2687, +0.4047, +0.2415, -0.3568, -0.5222, +0.0550, -0.2090, -0.3538, +0.4196, -0.2383, -0.2984, +0.0796, -0.2891, -0.0922, -0.4071, -0.5568, -0.2258, -0.0513, +0.3008, -0.4999, -0.0981, +0.2177, +0.4061, +0.3386, +0.0729, +0.2200, +0.0887, +0.2734, +0.1983, -0.3363, -0.0570, +0.0283, +0.4889, +0.5389, -0.4052, -0.5635, +0.3627, -0.2224, -0.0141, -0.0919, +0.2747, -0.1352, -0.0483, +0.2405, -0.1205, +0.1157, +0.1593, -0.6906, +0.3747, +0.0316, -0.3510, -0.0224, -0.1504, +0.2385, +0.2176, -0.6219, +0.0703, +0.6161, +0.1639, -0.3518, +0.0277, +0.5706],
-[ +0.2870, -0.7338, -0.1045, -0.0942, +0.0845, +0.3805, +0.0079, -0.7205, +0.0955, -0.4537, +0.0731, +0.1386, +0.2017, +0.2059, -0.3269, -0.5290, -0.8150, -0.6405, +0.1613, -0.1068, +0.1682, +0.0145, +0.0655, -0.0025, -0.2245, +0.4070, +0.1686, -0.8228, +0.2429, -0.0431, +0.0035, +0.0513, -0.0154, +0.1894, +0.2753, +0.2020, -0.0720, -0.1562, -0.2747, -0.1583, -0.9408, -0.8700, -0.2165, +0.0506, -1.3863, -0.0658, -0.3209, -0.3702, -0.6101, -0.0353, +0.1048, +0.1970, +0.2671, -0.3384, +0.1256, -0.2245, -0.4526, -0.0493, -0.3827, +0.0560, +0.0338, -0.1525, -0.2141, -0.0425],
-[ -0.1422, +0.1337, -0.9957, -0.5735, -0.2927, -0.4815, +0.4319, +0.0342, +0.0668, +0.3405, -0.0740, -0.1619, +0.5172, -0.4340, +0.1856, +0.2209, -0.4643, +0.6153, +0.4239, -0.9462, +0.2372, +0.1935, +0.0449, +0.0913, +0.5925, +0.0728, -0.3116, +0.3045, -0.1049, -0.3677, -0.2878, -0.2252, +0.1939, -1.5561, +0.0153, -0.1803, -0.6259, -0.3834, -0.6172, -0.0133, -0.2826, -0.2731, +0.3053, +0.0552, -0.0550, -0.5861, -0.2372, +0.1009, +0.2500, -0.4699, +0.0561, -0.2214, +0.3366, +0.1667, -0.0716, -0.0938, +0.0177, -0.9000, +0.1185, -0.3892, +0.1251, -0.1854, +0.1612, -0.2577],
-[ +0.4538, -0.9701, +0.1504, +0.4843, -0.9331, +0.1328, -0.3539, -0.5484, +0.2910, -0.1758, +0.1974, -0.1809, -0.3994, -1.0207, +0.1626, -0.3537, +0.3522, +0.3263, -1.0539, +0.1426, -0.8538, -0.0698, +0.1850, +0.7717, +0.4812, -0.0657, +0.8718, -0.6112, +0.0877, -0.4540, +0.5209, +0.2496, -0.1358, -0.2268, +0.1259, -0.3139, -0.2353, -1.0745, +0.4902, +0.3386, -0.7974, -1.2774, +0.0222, -0.0120, +0.3418, +0.0277, -0.1518, +0.1329, -0.2840, -0.6863, -0.1258, +0.0503, +0.6224, -0.9175, -0.4380, +0.0616, -0.2948, -0.1367, -0.7437, -0.5496, -0.0115, -0.2441, -1.3192, +0.0898],
-[ -0.8492, +0.2324, -1.0937, -0.0072, -0.5556, +0.1550, -0.0198, +0.2518, -0.2527, -0.4283, +0.0591, -0.5192, +0.1214, -0.0950, +0.0202, +0.4282, +0.2584, -0.7877, -0.8089, +0.0275, -0.5099, +0.3571, +0.0930, +0.0660, -0.0577, -0.3545, +0.0622, +0.5885, +0.3251, -0.6699, +0.4005, +0.1462, -0.1288, -0.8976, -0.5042, +0.1200, +0.1997, -0.0740, +0.0969, +0.2668, -0.6573, -0.0003, +0.3727, +0.0478, +0.1457, -0.9810, -0.1764, +0.1550, -0.2832, +0.4197, -0.4164, -0.1324, +0.0982, +0.3429, +0.1463, +0.0178, +0.2783, +0.1799, +0.4229, +0.0707, -1.0676, +0.0656, -0.2406, +0.1123],
-[ -0.2739, +0.4278, +0.5050, +0.4886, +0.0866, -0.6754, -0.2957, -0.7517, -0.1715, -0.0754, -0.0733, +0.0049, +0.4403, -0.5811, +0.1439, -0.1410, -0.4331, +0.0514, -0.1729, +0.4406, +0.0236, +0.1144, +0.3210, -0.0241, -0.1087, -0.7359, +0.4433, -0.1967, +0.4850, -0.3577, -0.2777, -0.1381, +0.0488, +0.4510, +0.0785, -0.1526, -0.0759, +0.3004, -0.0124, -0.3421, -0.3625, -0.2688, -0.6088, +0.1834, -0.1742, -0.3992, -0.0729, -0.0954, +0.1403, +0.2244, -1.0269, +0.0389, +0.0357, +0.2483, -0.0966, -0.1649, +0.0946, +0.0789, -0.8485, +0.8510, -0.2052, +0.0063, +0.3289, -0.2707],
-[ -0.0008, -0.1527, +0.1871, +0.0008, -0.5502, +0.1705, -0.0862, -1.7449, -0.4099, -1.2881, -0.2889, -0.6813, -0.1696, -0.3554, -0.0171, -0.1756, +0.0394, -0.0584, +0.0541, +0.2665, +0.2842, +0.7106, -0.1510, +0.1608, -0.0213, +0.4420, -0.5489, -0.2275, +0.2123, +0.2702, +0.1270, +0.1165, +0.0307, -0.9451, +0.5018, -0.7310, +0.4341, -0.0568, -0.1530, +0.3782, -0.8706, -0.1489, -0.3021, -0.3795, +0.0077, +0.3951, +0.0642, +0.0071, +0.0698, -0.6238, -0.0427, +0.0675, +0.0150, -0.3453, -0.6300, +0.1152, +0.0628, -0.1176, +0.1059, -0.3573, -0.0405, -0.4776, -0.3119, -0.1392],
-[ -0.1531, +0.2170, +0.1452, +0.3291, -0.1676, +0.4282, +0.6817, -1.1171, -0.0246, -0.1068, -0.1326, +0.0996, +0.5856, +0.0621, -0.4004, -1.4584, +0.1328, +0.2980, +0.6669, +0.2422, -0.5000, -0.0695, +0.0159, -0.5761, -0.2003, +0.1373, -0.1083, -0.7715, -0.4855, +0.1736, +0.1171, +0.1248, -0.9882, -0.0027, +0.1430, +0.2150, +0.0139, +0.3390, +0.2071, +0.0626, -0.3002, -0.4146, -0.2301, +0.1151, -0.3078, -0.7258, -0.1942, +0.0928, +0.4019, -0.5398, -0.1712, +0.3604, -0.0307, +0.5086, +0.1574, +0.1295, -0.1964, +0.2544, -0.4195, -0.1106, +0.1878, -0.7051, -0.3494, -0.2784],
-[ -0.1671, +0.2359, -0.3504, -0.0875, -0.0657, -0.0707, -0.2190, +0.3783, +0.0052, +0.3745, -0.5688, +0.2605, -0.3190, +0.5080, +0.4697, -0.0987, +0.2703, +0.1677, -0.6767, -0.3178, +0.4836, +0.5635, -0.7103, -0.0746, +0.1034, +0.2430, -0.4251, -0.1090, -0.5547, +0.2012, -0.3403, -0.3141, +0.1168, -0.2846, -0.3791, -0.6774, -0.1252, -0.2180, -0.0656, +0.0353, -0.7226, +0.2728, -0.1778, -0.3260, +0.3339, +0.0653, +0.3684, -0.1632, +0.2573, -0.2883, +0.0009, +0.1928, -1.0397, -0.7210, -0.8038, -0.2165, +0.1618, -0.0957, +0.2977, +0.2513, +0.0480, -0.4479, -0.0804, -0.1824],
-[ +0.3119, +0.0566, +0.0424, -0.4121, +0.2908, -0.0512, +0.0101, -0.2033, -0.0291, -0.4058, +0.1809, -0.3684, -0.1681, +0.3278, -0.1494, +0.3727, -0.5309, +0.2718, +0.3946, -0.6974, -0.1518, -1.1048, +0.0306, +0.2203, +0.1070, +0.4206, +0.2177, -0.0350, -0.2504, -0.1273, +0.2011, -0.3807, -0.0330, -0.0830, +0.0246, +0.2361, +0.2504, -0.0618, -0.4662, +0.1870, -0.0266, -0.7132, -0.1990, +0.2201, +0.2257, +0.2032, +0.5247, +0.0135, -0.5164, -0.4449, -0.1256, -0.2228, -0.3297, -0.0180, -0.4429, -1.1518, -0.6446, +0.0484, -0.0231, -0.1286, +0.2235, +0.4159, -0.4084, +0.1132],
-[ +0.2173, -0.4447, +0.0845, -0.0702, +0.1410, +0.0165, -0.2067, -0.0764, +0.2809, +0.1371, -0.6168, +0.0406, -0.4437, -0.1373, -0.0030, -0.3000, -0.3696, -0.3191, -0.1415, +0.2761, -0.0324, +0.0190, -0.1383, +0.0778, -0.5184, +0.1510, -0.0283, -0.6965, +0.3637, -0.2210, -0.0611, -0.0446, +0.1991, -0.0131, +0.3577, -0.5313, +0.0258, -0.5449, -0.6727, -0.1732, +0.1289, -0.2922, -0.2036, -0.2062, -0.5262, +0.2311, -0.5273, -0.3758, +0.0734, +0.2520, +0.5800, +0.1337, -0.0203, +0.2392, +0.4818, +0.1183, -0.2960, -1.3139, -0.3598, -0.4217, +0.5906, +0.3120, +0.0842, -0.0189],
-[ -0.2034, -0.2470, +0.0815, +0.3712, -0.2452, -0.2641, -0.4384, -0.0659, -0.1397, -0.0294, +0.5793, +0.4600, -0.6904, +0.1172, -0.3046, +0.3242, +0.0302, -1.3304, +0.3182, -0.1053, +0.3679, -0.3855, -0.2545, -0.2798, -0.2702, +0.0962, -0.3428, +0.1185, +0.0799, -0.1985, -0.7122, -0.1967, -0.1748, +0.0686, +0.5070, +0.2390, -0.3882, -0.1285, +0.1746, +0.0770, -0.7113, -0.3933, +0.0402, -0.5497, +0.1689, -0.0035, -0.1905, -0.4365, +0.1926, -0.0179, +0.2188, +0.1091, +0.2962, -0.0157, -0.1560, -0.1427, -0.3535, +0.3942, -0.8826, -0.0166, +0.1164, -0.8110, +0.5112, -0.4452],
-[ +0.1235, -0.1364, +0.0059, -0.1658, +0.1140, +0.2574, +0.0619, -0.0737, +0.2568, -0.1101, -0.0517, +0.0775, +0.3710, -0.3755, -0.5272, -0.1628, +0.0063, -0.2183, +0.3528, +0.3519, -0.0413, -0.1653, -0.1039, +0.1532, -0.0121, +0.0628, +0.1186, -0.0342, +0.6432, +0.2785, +0.1194, -0.1340, -0.0801, +0.5283, +0.0979, +0.1328, -0.0234, +0.0730, -0.2662, +0.3805, +0.2164, -0.5923, +0.2952, -0.1686, +0.0913, +0.4924, -0.6039, -0.2342, +0.0168, -0.4053, -0.1432, +0.1093, -0.5354, -0.1532, -0.0843, -0.2759, -0.5059, -0.5240, +0.2169, +0.1137, +0.1778, -0.8917, -0.0479, -0.4231],
-[ -0.0225, +0.2392, +0.2313, +0.2092, -0.2090, +0.5269, -0.2119, -0.6104, +0.2067, +0.1138, -0.0775, +0.2780, -0.3904, +0.2525, -0.5334, -0.0438, +0.3420, -0.1981, +0.3290, -0.3555, -0.2135, -0.1317, +0.2700, -0.0619, -0.6285, +0.2862, +0.3542, -0.6501, +0.2822, +0.1852, +0.2532, -0.0958, +0.2226, +0.0876, +0.0229, +0.0259, -0.1851, -0.2623, +0.0520, +0.1087, -0.1129, +0.4673, +0.0371, -0.5383, -0.2881, -0.3649, -0.2050, +0.0659, -0.1629, -0.2505, +0.2957, +0.1168, +0.1865, +0.3650, -0.2477, +0.2141, +0.1328, -0.3441, -0.4943, -0.1007, +0.2719, -0.2334, -0.0244, +0.2138],
-[ +0.0426, +0.2374, -0.6527, +0.2165, -0.0192, -0.2015, +0.1225, +0.4667, -0.2282, -0.1058, +0.1764, +0.3174, +0.1419, -0.2757, +0.1073, +0.0635, +0.0248, -0.3573, -0.4414, -0.0629, -0.3135, -1.3118, +0.1522, -0.0582, +0.0370, +0.4431, +0.3450, -0.1012, -0.5598, +0.1954, -0.0399, +0.1511, +0.3362, +0.0511, +0.0086, +0.6763, -0.3848, +0.3133, -0.4143, +0.0054, -0.2434, -0.0314, +0.4777, -0.2695, +0.1945, -0.4941, +0.2321, -0.2950, -0.2499, -0.7564, +0.2191, +0.0811, -0.6030, +0.0595, +0.2227, +0.1896, +0.1723, +0.0892, -0.2741, +0.4445, +0.3701, -0.4163, -0.3526, +0.0082],
-[ +0.2931, -0.0836, +0.1128, -0.2699, -0.1293, -0.9413, -0.3849, -0.0243, -0.1199, -0.0149, -0.1323, +0.1631, -0.3434, -0.7035, -0.4271, -0.0106, +0.5124, +0.3303, -0.4026, +0.1950, -0.1408, -0.3412, +0.0869, -0.3608, -0.4225, +0.1374, +0.1295, +0.2215, +0.6199, +0.5064, -0.0815, +0.1034, -0.2661, +0.2258, -0.0738, +0.1143, +0.2495, +0.2205, +0.1754, -0.4842, -0.1246, -0.2890, +0.3604, -0.9065, -0.3236, -0.1017, +0.2657, +0.2487, +0.1089, -0.1155, +0.3416, +0.0721, -0.0109, -0.0288, -0.1186, +0.2537, +0.2910, -0.2570, -0.4873, -0.0378, +0.4349, +0.1140, -0.8302, +0.1782],
-[ +0.1030, +0.1304, -0.0909, -0.2364, -0.2500, -0.3028, -0.0546, -0.6416, -0.1898, -0.3917, -0.2705, -0.3312, +0.3570, -0.2017, -0.0537, -0.6308, +0.0019, -0.1418, +0.2843, -0.0999, -0.5335, +0.1763, -0.3687, +0.1857, +0.0332, +0.4558, +0.2883, -0.0218, -0.2059, +0.4931, +0.4608, +0.0538, -0.5530, -0.1249, +0.1417, -0.6702, -0.2335, -0.7719, +0.2778, +0.0543, -0.0728, +0.1623, +0.4363, -0.3137, -1.1796, +0.3349, -0.1091, -0.1050, -1.2196, +0.1470, -0.3972, +0.5019, +0.1066, +0.4256, -0.1710, -1.0880, -0.0445, +0.2020, +0.0078, +0.2894, -0.1972, -0.4168, -0.5523, +0.0526],
-[ -0.1724, -0.1460, -0.4037, +0.0507, +0.3517, -0.1470, +0.2463, -0.9503, -0.5646, +0.2897, -0.3478, +0.0671, -0.0199, -0.2202, -0.1675, -0.9212, +0.4622, +0.1569, -0.0368, +0.1945, -0.0634, -0.9858, +0.0529, -0.0555, +0.1661, -0.0465, -0.0869, -0.0138, +0.0404, -0.7938, +0.0083, +0.3436, -1.1259, +0.1878, -0.5468, +0.0276, -0.1077, +0.5194, -0.1782, +0.1574, +0.3799, +0.0166, +0.1506, -0.2308, -0.5062, -0.6700, +0.0766, -0.2727, -0.5081, +0.0889, +0.0337, -0.0512, +0.2099, -0.3992, +0.2682, -0.1567, +0.1432, +0.1219, -0.1049, +0.2016, -0.2421, +0.3822, -0.3316, -0.0221],
-[ -0.0998, +0.3567, -0.9238, +0.2816, -0.0369, +0.3637, -0.1214, -0.4277, -0.4980, -0.0801, +0.1680, -0.4083, -0.4140, -0.1989, +0.1607, -0.4560, +0.1918, -0.2292, -0.0623, -0.3424, -0.1217, -0.0239, +0.3148, +0.0673, +0.4032, +0.2976, -0.1841, +0.4275, -0.3250, -0.3160, +0.0484, +0.3713, +0.3938, +0.0258, -0.2029, -0.0053, -0.4931, +0.2625, -0.3302, -0.0181, -0.8182, -0.2774, -0.1506, -1.1460, -0.4011, -0.2439, +0.0196, +0.2232, +0.8174, -0.0484, +0.1209, -0.0140, -0.3340, +0.3268, +0.0327, -0.1059, +0.1514, +0.3105, -0.0121, -0.3407, -0.1831, -0.1004, +0.3739, +0.1763],
-[ +0.4708, -0.0521, +0.0590, -0.1178, +0.0997, +0.5031, -0.3283, -0.4129, -0.0462, -0.9110, -0.1623, -0.7761, -0.0343, -0.1479, -0.2679, -1.0075, +0.4896, -0.2684, +0.1089, -0.5597, -0.1109, -0.1651, +0.4689, +0.6028, -0.6288, -0.0128, -0.3020, +0.0826, -0.0618, +0.5606, +0.6067, -0.0180, +0.4340, -0.4646, +0.2367, -0.1164, -0.5773, -0.0936, -1.4304, -0.2006, +0.2534, +0.1214, +0.4082, +0.4421, -0.0296, +0.7033, +0.4593, +0.0166, -0.3860, -0.4448, +0.0253, +0.3424, +0.1747, +0.4142, -0.5072, +0.0198, -0.2323, +0.2584, -0.5340, -0.2674, +0.3111, +0.0950, -1.2430, -0.3871],
-[ -0.3554, -0.4261, -0.3969, +0.1330, +0.3218, -0.1343, +0.3053, -0.5123, -0.0876, -0.1438, +0.1724, +0.4915, +0.3161, -0.6318, +0.0695, -0.0161, -0.0747, -0.1576, +0.2199, +0.0535, +0.3710, -0.1703, +0.0093, -0.2971, -0.3412, +0.0165, +0.1949, -0.2908, +0.1133, -0.0025, -0.0251, -0.3991, -0.5825, +0.1080, -0.5219, +0.3805, -0.0868, -0.0036, -0.4767, +0.3711, -0.0467, -0.3188, +0.3101, -0.4350, -0.5693, +0.0831, -0.0943, +0.0603, -0.3070, +0.1510, -0.3361, -0.3525, -0.0654, -0.2628, +0.0655, -0.3440, +0.0953, -0.0180, -0.3156, -0.1640, -0.2534, +0.2776, -0.5039, +0.4039],
-[ +0.1528, -0.4957, -0.3149, -0.6788, +0.5233, +0.3255, +0.7413, +0.1437, +0.7073, -0.1607, -0.0156, +0.8259, -0.4460, -0.4434, -0.0353, +0.1706, +0.0603, -0.2323, +0.3872, -0.2852, +0.1093, +0.5235, -0.4943, -0.0429, +0.0298, +0.3845, -0.4493, -0.5962, +0.2980, +0.1263, +0.4735, +0.3274, +0.2746, -0.2191, +0.0693, -0.1408, +0.3724, -0.1717, -0.4673, +0.0807, -0.3967, -0.4441, +0.1146, +0.3469, +0.0416, +0.4874, +0.2353, -0.2750, -0.2053, +0.3934, +0.3132, +0.5396, +0.7412, -0.6986, +0.2424, -0.2640, -0.4363, -1.1939, -0.1710, +0.2154, -0.1753, +0.0985, +0.2595, +0.2793],
-[ -0.0573, +0.0183, -0.8290, -0.3792, -0.4697, +0.1927, +0.2986, +0.0933, +0.6088, -0.0466, +0.0604, +0.2636, -0.2967, +0.7121, -0.3530, +0.4662, -0.1525, -1.1248, +0.1679, +0.1166, -0.1709, -0.0463, +0.2697, -0.1441, +0.1371, -0.8555, -0.7195, -0.0514, -0.1252, -0.2504, -0.1861, -0.2676, +0.3947, +0.2097, +0.1032, -0.1152, -0.6395, +0.0102, -0.3397, +0.9433, -1.0032, +0.3374, +0.3034, -0.5279, +0.2076, -0.2374, -0.2158, +0.6702, +0.3128, -0.0549, +0.0874, -0.4102, +0.1829, -0.4387, -0.5966, +0.2051, +0.4078, +0.1916, -0.1082, -0.0840, +0.0112, +0.2095, +0.4739, +0.0592],
-[ +0.0712, -0.1285, -0.3152, -0.2810, +0.1589, -0.5851, +0.2913, +0.4122, +0.3443, +0.1250, +0.3089, -0.6933, -0.1485, -0.2361, +0.0330, -0.0679, +0.5881, +0.0105, -0.6269, -0.3111, -0.0086, +0.3774, +0.1192, +0.3908, +0.2166, +0.0512, +0.0148, +0.1214, +0.0431, +0.3745, +0.1041, +0.1479, +0.0928, +0.2105, -0.2576, +0.1054, +0.1603, -0.0741, -0.9277, +0.0946, -0.4804, -0.8540, +0.2943, -0.2224, -0.3795, -0.2643, -0.3990, +0.1907, -0.0094, +0.2209, -0.3091, -0.3027, -0.2061, -0.0633, +0.1596, -0.0254, +0.0329, +0.1977, -0.0670, -0.0397, -0.2621, +0.1125, -0.3700, +0.0390],
-[ +0.3480, -0.7664, -0.4568, +0.1871, +0.5560, -0.1744, +0.3469, -0.2509, +0.2379, -0.0506, +0.2119, +0.3410, +0.2622, -0.6715, +0.1367, -0.4652, -1.4492, +0.2345, -0.0107, +0.3638, +0.1392, +0.1721, +0.1263, -0.4381, -0.1557, -0.0970, +0.4355, -0.3398, +0.3974, +0.1136, -0.1181, -0.0664, -0.0990, +0.2637, +0.0006, +0.1281, +0.0642, +0.4717, -0.3359, +0.0537, -0.0195, -0.3825, +0.1724, +0.3125, -0.4619, -0.2560, -0.1729, +0.0146, -0.9450, -0.0293, -0.1295, -0.1973, +0.3303, -0.4519, +0.3595, +0.2745, +0.0131, +0.0422, -0.5244, +0.0894, +0.1912, -0.3745, +0.1748, +0.0928],
-[ -0.1506, +0.2073, +0.2138, -0.2598, -1.1459, +0.2474, +0.2124, +0.2297, +0.0995, +0.4783, +0.1605, -0.6660, -0.4947, -0.1636, -1.4091, +0.2500, -0.1069, +0.0376, -0.2405, +0.1701, +0.1519, -0.4186, +0.4935, -0.8247, +0.1552, +0.1344, -0.1138, -0.3214, +0.1920, -0.6936, -0.3714, -0.1434, +0.1774, +0.1123, +0.1861, +0.7214, -0.0433, -0.1770, +0.2506, -0.5951, -0.0325, -0.2234, -0.4408, -0.5731, +0.4697, -0.0485, -0.2623, +0.3801, -0.2302, -0.4792, -0.0723, -0.8690, +0.4120, +0.0801, -0.5035, +0.6318, -0.4286, -1.7760, -0.1839, +0.1031, +0.0964, +0.2205, +0.1453, +0.1327],
-[ +0.0565, +0.1102, +0.0555, -0.3907, +0.3093, +0.6011, -0.1821, -0.8135, -0.3734, -0.4417, +0.3651, -0.3520, -0.6925, +0.0480, +0.4059, -0.0637, +0.1310, +0.1907, +0.1613, -0.2027, +0.1738, -0.4830, +0.4008, -0.2709, +0.0293, +0.2790, -0.2094, -0.3615, +0.1121, -0.3976, +0.2432, +0.1350, -0.3801, +0.0290, -0.3612, -0.1686, -0.2163, -0.2304, -0.6177, +0.3902, -0.3066, +0.2993, +0.0292, +0.3404, -0.0150, -0.1280, -0.2364, +0.1865, +0.0298, -0.2680, -0.1932, -0.1310, -0.2946, -0.9964, -0.4285, -0.4160, -0.1354, +0.2941, +0.0927, -0.1026, -0.1780, +0.1622, +0.0649, -0.8204],
-[ +0.1894, -0.0970, -0.2627, -0.2888, -0.1052, -0.0090, +0.1697, +0.1585, +0.0807, +0.2906, -0.1213, -0.4320, -0.3194, +0.4379, -0.3009, +0.2913, -0.0138, -0.2332, -0.2100, -0.0920, +0.0030, -0.1944, -0.1362, -0.0683, +0.1916, +0.2277, +0.0020, +0.0376, -0.2581, +0.0203, +0.0945, -0.0273, -0.1834, -0.1477, +0.3891, -0.8760, -0.7327, -0.3924, -0.7739, -0.2062, -0.9386, +0.0510, +0.1158, -0.5032, +0.0522, +0.0838, -0.2942, +0.0945, -0.2562, -0.2678, +0.0716, +0.1929, -0.2012, -0.6123, -0.3913, +0.0878, +0.4618, +0.3128, +0.2354, -0.1198, +0.2178, +0.4765, -0.2785, -0.1888],
-[ -0.2206, +0.3318, +0.2938, +0.4148, -0.0502, +0.6339, +0.1075, +0.0466, -0.0205, -0.0399, +0.1343, -0.1876, +0.1697, -0.1137, -0.3068, -1.2581, -0.4032, -0.2526, -0.0501, -0.4212, +0.2251, -0.1790, -0.4869, +0.6200, -0.5371, -0.5877, +0.0569, -0.3732, +0.1879, -0.5597, +0.3479, -0.6712, +0.2906, -0.3752, -0.3008, -0.0225, -0.0610, -0.1636, +0.4039, +0.1432, +0.2402, -0.0871, +0.1529, +0.0566, +0.1538, +0.1572, +0.1036, -0.0355, -0.7213, +0.2796, +0.1821, +0.1483, +0.2256, -0.2517, +0.2175, -1.6318, -0.3699, +0.0168, +0.1499, -0.2434, +0.4927, +0.3871, +0.4436, +0.3241],
-[ -0.3785, +0.3710, +0.5153, -0.2213, +0.1006, +0.0343, -0.3430, -1.3048, +0.2934, -1.1390, +0.0764, -0.4633, -0.3503, -0.1963, -0.6778, +0.1066, +0.3581, -0.4359, +0.2323, -0.0946, +0.3556, +0.0036, +0.1852, -0.4234, -0.7639, +0.1503, +0.5572, -0.0908, -0.0304, +0.3589, +0.4023, +0.2161, -0.3031, -0.5656, +0.4415, -0.2330, -0.2778, -0.1847, -0.4498, -0.1618, +0.0821, -0.0945, -0.2184, -0.4628, +0.4103, +0.3438, -0.2311, -0.2477, +0.3549, +0.3910, +0.1714, +0.2460, -0.5765, -0.3045, -0.0702, -0.1728, -0.4134, -0.1338, -1.0295, +0.2805, -0.6990, +0.7314, +0.2259, -0.0369],
-[ -0.7765, -0.8213, +0.0711, +0.2292, +0.2640, -0.1111, +0.0706, -0.9447, -0.0118, +0.0427, +0.2097, -0.0662, -0.2773, -0.4894, -0.7694, -0.3649, +0.1166, -0.3336, +0.3578, +0.0796, -0.1630, -0.1352, -0.0720, +0.1224, -0.3877, +0.1955, -0.1440, -0.0612, +0.1912, -0.1973, -0.0973, -0.0560, -0.7027, +0.2532, -0.3607, -0.1223, +0.0162, -0.0028, +0.4377, -0.0581, -0.3754, -0.2387, +0.0088, -0.0455, -0.1477, +0.4253, -0.0914, -0.7833, -0.1639, -0.0433, +0.0863, +0.2265, -0.0409, +0.0313, +0.1362, +0.4949, -0.0978, -0.5833, +0.0432, -0.4087, -0.1731, -0.0662, +0.4147, +0.1439],
-[ +0.0350, +0.1548, +0.0131, +0.0115, -0.3387, +0.2374, +0.3363, -0.5082, +0.5767, -1.2487, +0.1592, +0.1192, -0.9356, +0.0592, +0.4122, -0.4330, -0.3213, -1.4197, +0.3280, -0.2136, -0.4984, +0.2073, -0.0745, -0.2410, -0.2374, -0.0251, +0.2538, +0.2056, +0.0789, -0.5060, +0.3261, +0.2714, -0.3186, -0.1567, -0.0758, +0.2377, +0.1467, +0.5026, -0.3973, +0.9726, -0.0972, -0.0295, +0.0114, -0.3803, +0.2799, -0.3394, +0.1301, +0.0501, -0.1194, +0.3699, +0.0053, -0.4543, +0.2368, -0.1180, -0.0139, -0.3556, -0.1657, +0.2425, +0.1212, +0.0460, -0.3302, +0.0835, +0.1524, +0.2809],
-[ +0.5912, +0.3751, -0.7060, -0.6319, -0.0354, +0.0242, +0.0191, +0.1079, -0.2649, +0.3621, +0.0965, -0.0276, -1.0230, -0.3146, +0.2075, -0.6826, -0.3492, -0.0961, -0.5934, -0.6186, +0.0199, +0.2130, -0.7184, +0.4223, +0.0614, +0.1626, +0.2471, +0.2255, -0.2649, +0.1865, +0.2010, -0.0649, -0.7986, +0.3571, -0.7812, +0.0793, -1.1885, -0.7985, -0.4967, -0.0632, +0.1954, -0.3144, +0.1585, -0.2425, +0.0907, +0.0252, -0.9084, +0.3666, -0.5707, -0.5022, +0.2995, +0.2105, +0.5991, +0.0387, +0.0628, +0.1833, -0.1081, -0.6146, -1.9594, +0.3486, +0.4696, -0.0909, +0.2579, -0.8427],
-[ +0.0336, -0.4557, -0.6614, +0.4449, +0.0964, +0.1173, -0.4679, +0.3083, -0.3942, +0.2012, +0.0582, -1.3162, +0.0455, -0.5111, -0.6087, +0.2155, -0.0063, -0.1217, -0.0372, +0.0719, +0.3264, +0.4321, -0.5644, +0.4457, +0.6958, +0.3130, +0.1354, -0.0940, +0.1247, -0.1034, -0.3069, -0.5462, -0.3833, -0.2013, +0.0727, -0.2046, -0.6196, -0.2577, +0.1981, +0.0947, +0.2343, +0.2706, -0.0317, -0.4985, +0.2393, +0.2797, -0.0232, -0.4649, +0.6968, +0.1224, -0.0383, -0.5945, -0.5035, +0.0959, -0.3727, +0.7081, -0.1661, +0.1211, -0.1007, -0.2776, +0.2769, +0.3188, -0.8125, -0.2640],
-[ -0.2121, +0.1708, -0.0225, -0.0678, -0.0867, -0.0663, +0.2636, +0.2387, +0.2040, -0.2074, -0.4069, -0.1904, -0.0885, -0.4112, -0.5617, +0.3723, +0.4653, -0.2569, -0.3289, +0.4304, -0.0073, +0.0809, -0.0856, -0.0631, -0.2508, -0.3386, -0.8901, +0.1858, -0.1145, -0.0091, -0.0037, +0.3607, -0.0357, -0.7050, -0.2968, +0.3616, +0.2470, +0.2633, -0.0279, +0.0722, -0.4222, -0.1375, -0.4831, -0.2887, +0.0935, -0.0073, -0.4007, -0.1702, -0.2263, +0.3825, +0.1574, +0.6085, -0.1626, -1.7196, +0.3131, +0.2672, -0.1385, +0.3224, +0.3787, -0.0462, -0.3012, -0.5527, -0.4602, +0.1942],
-[ -0.6093, -0.9537, +0.1757, -0.3976, -0.0383, +0.7251, +0.3466, +0.4402, -0.0774, -0.4007, +0.0816, -0.0457, -0.1168, +0.2660, +0.1250, -0.5599, +0.2008, +0.8158, -0.4430, +0.4986, -0.5222, +0.3090, +0.0151, -0.1805, +0.1431, -0.1892, -0.6358, -0.2858, -0.2296, -0.1724, -0.4177, +0.0810, +0.0851, -0.0888, +0.2480, -0.2108, +0.2010, +0.0679, +0.0160, +0.1122, -0.5618, +0.0329, -0.1360, -0.5033, -0.3957, -0.2492, +0.5305, -0.7473, -0.2721, -0.0429, -0.0304, +0.0405, +0.6790, -0.1740, +0.3304, -0.0981, -0.4455, -0.0456, -0.1221, +0.2468, -0.6452, +0.0697, +0.3481, -0.0379],
-[ -0.1121, -0.5130, -0.5136, +0.3138, +0.2760, -0.3535, -0.3125, +0.3587, -0.4589, -0.1302, -0.3529, +0.4531, +0.1770, +0.2400, -0.0107, -0.2273, -0.0549, -0.1933, +0.0799, +0.0211, +0.0974, -0.3228, -0.1341, -0.5369, +0.2466, -0.2529, -0.0108, -0.3154, -0.0725, -0.1345, -0.2088, -0.0873, -0.3675, +0.0120, +0.0838, -0.1347, +0.2473, +0.4509, +0.4634, +0.1623, +0.0152, +0.4995, +0.4125, -0.0801, -0.9684, -1.0005, +0.1577, +0.3948, -0.1291, +0.1197, -0.0382, +0.1272, -0.4528, -0.1108, -0.2218, -1.0994, -0.0977, -0.3832, +0.1989, +0.3940, +0.2129, -0.1267, +0.2891, -0.4566],
-[ +0.2013, -0.4966, +0.3134, +0.2968, +0.4050, +0.3077, -0.0970, +0.0265, -0.6194, -0.4650, +0.2879, -0.5189, +0.0415, -0.0279, -0.2265, +0.2703, -0.0049, -0.1062, +0.0758, +0.5811, -0.4047, -0.4008, -0.5073, -0.1825, +0.3934, +0.1870, +0.0549, +0.2662, -0.1832, +0.0716, -0.5844, +0.0985, +0.1388, -0.4097, +0.3492, +0.3050, -0.3009, -0.3748, -0.0855, -0.2690, +0.0865, +0.0847, -0.2502, +0.4930, -0.4957, -0.0679, +0.2032, -0.5270, -0.0298, -0.6239, -0.3869, +0.1205, +0.2789, -0.4187, -0.4100, -1.3293, +0.0339, -1.2127, -0.4629, -0.4488, -0.3622, +0.3658, -0.1273, -0.9988],
-[ +0.0618, -0.6976, -0.2739, -0.4951, +0.3629, -0.0572, -0.0423, -0.1126, -0.0084, +0.0039, -1.1347, +0.0766, +0.5972, -0.2661, -0.1608, -0.1188, -0.5734, +0.2740, -0.1348, -0.0046, -0.2420, +0.4932, -0.3493, +0.0077, -0.2928, +0.1936, -0.4306, +0.0672, -0.2478, +0.2933, +0.4783, +0.1112, +0.0508, +0.5279, -0.0602, -0.6082, +0.0254, -0.1455, +0.0860, -0.0137, +0.2181, +0.4595, -0.1020, +0.2738, -0.3845, +0.1527, +0.0903, +0.2459, -0.1028, -0.0204, +0.3592, -0.1899, +0.0156, -0.3667, +0.2428, -0.2370, +0.4264, -0.1857, +0.1354, -0.1368, +0.1373, +0.3646, -0.1913, -0.2312],
-[ -0.1679, -0.2973, +0.3421, +0.2689, -0.0877, +0.2735, -0.1347, -0.2523, -0.0631, +0.1108, +0.2597, +0.4530, +0.1214, -0.1416, -0.5936, -0.1322, -0.2734, -0.7423, +0.1697, +0.0126, -0.2423, -0.0829, +0.4345, +0.2280, +0.1167, +0.0169, -0.1051, +0.4623, +0.1274, +0.1364, -0.7264, +0.2868, +0.2049, +0.0837, -0.6358, +0.0789, +0.1073, +0.5686, +0.3086, -0.5808, +0.7224, -0.5558, -0.5012, -0.0334, +0.1128, -0.4420, +0.0341, -0.0761, -0.6116, -0.1187, -0.0079, +0.1517, +0.1157, -0.0825, +0.0421, -0.4036, +0.2306, -0.1724, +0.0817, +0.0796, +0.2520, -0.0839, -0.1000, +0.2560],
-[ -0.1568, +0.1256, +0.2687, +0.5304, +0.0616, +0.2620, -0.1174, -0.0828, +0.2457, -0.7009, -0.2341, +0.1980, -0.1387, +0.0767, -0.1147, -0.3794, -0.0804, -0.9129, +0.4222, -0.0307, -0.4511, +0.0235, +0.2063, -0.0281, -0.6208, -0.3369, -0.2876, -0.1240, +0.0289, -0.1814, -0.0107, -0.6183, -0.0970, -0.1725, +0.0277, -0.2143, +0.4770, -0.3520, +0.2918, -0.2149, +0.0670, +0.2961, +0.0475, -0.2314, +0.4138, -0.6241, -0.5202, +0.6909, -0.1022, -1.0779, +0.0202, +0.3129, -0.1340, +0.0622, -0.1117, -0.2848, +0.1219, -0.2674, +0.2004, -0.4155, -0.0463, +0.1513, -0.0398, +0.3006],
-[ -0.6542, +0.7595, -1.3221, +0.0988, -0.3465, +0.4240, -0.0449, -0.8170, +0.0414, +0.1441, -0.6610, +0.0711, +0.1398, +0.6336, +0.0080, -0.0566, -0.0857, +0.1501, -0.0995, +0.1385, +0.2677, +0.0367, +0.1083, -0.0359, -0.1822, +0.1932, -0.1764, -0.4851, -0.0244, -0.3504, -0.0213, -0.1195, -0.2686, -0.5418, -0.4927, +0.3825, -0.0737, +0.0830, -0.2684, +0.2176, +0.1968, -0.2227, -0.3244, -0.6385, +0.1551, -0.2165, -0.0925, +0.1828, +0.4494, -0.1357, -0.0456, -0.0027, +0.1056, +0.3863, -0.1894, +0.0876, -0.1854, +0.1973, +0.3061, +0.0674, +0.6454, -0.2473, +0.2778, +0.3394],
-[ +0.1184, +0.0655, -0.4564, +0.1047, +0.0245, -0.3896, -0.4310, +0.2791, -0.4074, -0.2665, -0.4304, +0.6561, -0.6748, +0.1907, +0.5614, -1.5843, -0.0335, +0.1814, +0.3863, -0.3579, +0.0952, -0.3241, +0.0511, +0.4439, +0.5712, -0.4604, +0.1338, +0.7400, +0.2259, -0.5242, -0.5329, -0.4611, -0.1593, +0.0052, +0.1623, -0.3202, -0.5784, +0.0174, -0.8842, -0.4272, +0.3299, -0.2110, +0.0281, +0.4345, -0.0094, +0.4800, +0.0468, -0.1435, -0.1890, +0.4818, +0.3842, +0.5413, +0.0015, -0.1571, -0.0965, -0.2082, +0.3220, -0.4657, -0.2957, -0.4660, +0.1112, +0.0833, -1.0452, +0.2931],
-[ -0.1050, -0.3930, -0.8470, -0.1539, +0.0283, +0.0506, -0.2962, +0.1335, +0.1858, +0.2597, +0.1192, +0.0226, -1.1154, +0.4943, -0.2086, +0.3223, -0.2796, -0.7304, -0.3808, -0.2430, +0.1130, -1.4927, -0.0413, +0.1508, +0.2756, -0.1085, +0.0958, -0.0511, -0.1654, -0.5590, +0.4892, +0.3117, -0.4354, -0.5566, -0.2910, +0.1871, -0.3210, +0.0707, -1.4751, -0.0064, -0.3395, +0.1091, -0.3423, -0.1070, +0.6077, -0.6818, +0.0364, +0.1810, -0.2418, -0.4348, +0.2138, -0.4457, +0.1850, +0.1663, -0.4589, -0.0590, +0.0140, -1.0031, +0.1671, +0.3095, -0.1959, -0.2354, +0.1129, -0.0914],
-[ +0.1642, +0.1094, +0.3448, -0.0749, -0.0180, +0.2558, +0.4060, +0.3335, +0.4197, -0.1441, -0.2556, +0.6254, -0.3226, -0.6062, -0.2805, -0.1570, -0.3601, -0.3835, -0.2042, -0.0328, +0.1023, +0.0759, +0.2519, -0.1706, -0.0075, -0.4085, -0.3140, -0.1070, +0.0632, +0.0191, -0.4709, -0.2254, +0.0114, +0.3076, +0.2059, +0.5133, -0.2243, +0.2795, +0.3773, +0.0803, -0.4325, -0.9119, -0.1979, -0.6436, -0.2572, -0.3237, -0.4447, +0.5916, -0.3867, +0.0101, +0.1406, -0.1133, +0.2802, -0.6540, -0.3323, +0.4628, -0.0367, -0.2508, +0.2539, -0.3993, -0.5283, -0.2690, -0.3873, -0.3024],
-[ -0.1436, -0.5517, -0.4431, +0.5327, -0.2588, +0.0900, -0.4125, -0.2162, -0.1184, +0.2474, -0.1347, +0.1252, -0.0133, +0.0987, -0.4174, +0.3728, -0.1239, -0.2282, +0.0385, -0.1100, +0.6123, -0.4759, -0.3614, -0.0685, +0.3599, -0.0198, +0.1704, -0.0608, -0.0503, +0.4438, -0.7307, +0.3350, +0.1720, +0.4469, -0.0751, +0.0401, +0.3470, -0.0172, +0.0262, -0.0346, +0.1317, -0.1553, +0.2946, -0.2742, +0.2364, -0.0640, +0.2536, -1.0183, +0.0773, -0.2492, +0.0397, -0.3045, -0.3429, -0.3352, -0.5485, +0.3430, +0.1481, -0.4997, +0.0928, -0.2616, -0.1770, +0.5925, +0.1034, +0.1339],
-[ -0.2951, +0.0378, +0.0823, +0.0307, +0.0271, +0.3036, -0.0292, -0.2978, +0.0779, +0.1428, -0.4928, +0.2944, +0.2024, +0.1920, -1.0302, +0.3304, +0.0657, +0.0634, +0.3791, +0.0085, +0.0081, +0.2927, -0.0241, -0.2411, -0.7849, -0.1806, -0.0433, +0.3816, -0.0558, -0.1094, -0.0139, +0.1603, +0.4586, -0.7991, +0.1147, -0.5045, +0.0183, -0.3893, -0.0443, -0.1665, +0.0342, -0.2120, -0.1391, -0.4926, +0.1438, +0.1863, -0.7227, +0.3673, -0.1077, -0.9778, +0.7210, +0.3733, +0.0778, -0.4336, -0.3407, -0.0074, +0.0330, -0.4428, +0.1380, -0.8513, +0.0357, +0.4141, +0.1583, +0.2167],
-[ +0.2654, +0.0174, +0.2618, +0.1341, -0.1338, -0.1338, -0.2252, -0.1168, -0.0680, -0.1107, -0.7590, +0.0632, -0.0997, +0.2548, -0.8639, -0.7354, +0.2814, -0.4214, +0.2266, +0.0072, +0.1706, +0.3742, +0.2437, -0.5361, -0.2646, -0.3248, +0.1836, -1.9472, -0.0832, -0.0410, +0.4056, -0.4654, -0.3995, -0.4292, -0.4182, -0.4856, -0.8076, -0.7141, -0.2657, +0.0958, +0.0713, -0.2720, -0.2588, -0.5835, +0.4793, -0.4319, -0.1098, -0.3144, +0.4965, -0.4547, +0.3820, +0.4288, +0.0844, +0.5179, -0.0320, -0.8708, -0.0751, +0.1578, +0.0879, -0.4416, +0.1729, -0.1362, -0.5350, -0.3401],
-[ -0.2118, +0.3834, +0.3130, +0.3395, -0.3651, -0.0606, +0.4956, +0.0693, -0.0051, -1.4244, +0.1108, +0.0637, +0.1052, -0.0301, -0.0014, +0.0911, -0.8848, +0.1114, +0.0666, +0.3995, +0.4920, -0.5034, -0.3851, +0.1373, -0.1200, +0.3886, +0.0684, -0.0183, -0.4282, -0.0734, -0.1273, -0.4760, +0.1408, +0.5883, -0.0509, -0.2998, -0.3337, +0.1388, -0.2568, -0.1320, +0.1283, -0.5020, +0.1919, +0.1973, +0.3350, -0.0218, +0.7082, -0.2393, +0.0386, -0.9842, -0.6694, -0.5423, +0.0867, -0.8208, -0.1974, +0.3153, -0.2347, -0.7509, +0.1957, -0.2120, -0.1423, +0.0256, -0.5109, -0.5835],
-[ -1.1792, -0.6405, -0.2588, -0.0688, -0.5575, +0.2734, -0.2927, -0.9779, +0.3497, -0.7755, -0.3234, -0.2550, +0.3339, -0.4122, -0.0858, +0.3816, +0.4377, -0.9395, -0.0228, +0.2162, -0.0766, -0.2358, -1.2153, -0.0550, -0.0737, +0.2427, -0.2674, +0.1653, -0.3603, +0.2592, -0.3009, +0.0850, -0.1091, -0.6973, -0.4073, -0.6798, -0.0625, -0.3739, -0.0816, +0.0060, +0.1769, +0.5716, -0.2536, -0.3430, +0.1475, +0.0754, -0.1260, +0.2230, +0.0758, -0.1088, -0.0445, +0.2242, +0.1145, +0.4178, -0.6738, -0.2665, -0.0909, -0.7142, -0.1012, -0.4404, +0.0002, -0.0546, -0.3006, -0.0512],
-[ -0.9125, +0.3809, -0.2227, +0.1087, -0.3885, +0.2956, +0.2774, -0.5007, -0.3132, +0.0619, -0.1097, +0.1279, -0.0931, +0.1050, -0.3562, -1.4404, -0.4041, -0.1452, +0.2098, -0.3736, +0.4604, +0.3447, +0.3285, -0.4358, -0.0095, -1.4794, +0.1615, -0.3714, -0.1101, +0.2171, -0.2488, -0.5689, -0.0069, -0.3341, +0.4860, +0.1670, -0.5619, -0.2339, -0.4304, -0.1604, -0.1719, -0.1354, -0.1688, +0.5730, +0.0874, +0.9201, +0.4451, -0.1082, +0.5830, -0.5734, +0.8476, +0.1526, -0.0611, +0.0482, +0.4043, +0.1631, +0.0934, +0.5185, -0.4728, -0.7169, +0.2903, -0.1128, +0.1467, +0.0853],
-[ +0.2255, -0.1422, +0.6191, -0.5573, -0.4242, +0.6153, -0.0805, -0.6878, +0.0707, +0.1314, -1.1376, -0.4014, +0.0828, -0.1102, +0.4117, +0.1082, -0.1197, -0.0014, +0.2616, -0.4504, -0.1758, -0.5121, +0.4080, -0.7097, -1.0162, -0.0971, -0.1583, -0.4393, +0.2060, -0.2875, -0.0826, +0.0484, +0.1807, -1.0531, +0.1788, -0.2329, -1.2088, -1.2534, -0.3840, -0.3139, +0.1190, -0.4243, -0.3891, -0.1715, +0.2351, -0.0939, -0.1855, -0.4761, +0.4378, +0.1383, -0.0800, +0.1091, -0.3985, +0.0516, -0.1441, +0.0286, -1.0542, +0.4448, -0.8192, +0.4307, -0.2630, -0.6092, -0.0993, -0.1385],
-[ +0.1763, -0.3222, +0.2001, -0.5100, -0.0191, +0.3838, -0.2628, +0.4131, -0.3282, +0.5341, +0.1770, -0.3993, -0.4334, +0.3543, +0.4917, -0.3028, -0.5898, +0.2188, +0.4483, -0.4407, -0.1927, +0.0154, +0.1614, -0.7020, +0.3948, +0.1950, +0.0146, +0.4208, +0.3840, -0.2642, +0.7406, -0.1180, -0.0369, -0.8693, +0.2694, -0.0968, +0.0402, -0.1230, -0.2885, +0.0380, -0.4557, +0.2529, -0.1008, -0.1731, -0.8810, -0.2787, +0.4076, +0.1796, +0.4104, +0.3133, -0.5395, +0.0393, -0.2067, +0.7584, -0.3746, +0.0869, +0.6750, +0.3594, -0.3354, +0.2386, -0.1971, +0.0392, -0.0169, -0.1902],
-[ +0.2144, -0.3314, +0.2725, -0.0827, -0.0906, +0.0674, +0.1273, -0.4302, +0.2808, -0.8198, -0.0832, +0.3300, +0.4027, +0.0423, +0.2126, +0.1215, +0.1076, -0.3192, -0.0130, +0.2427, -0.1374, +0.1292, +0.1993, -0.5142, -0.1865, +0.0820, +0.0993, +0.1877, -0.3977, +0.0706, -0.7814, +0.2711, +0.4268, -0.1433, +0.4873, +0.5543, +0.0717, +0.2401, -0.0935, -0.2784, +0.2711, +0.2732, -0.8383, -0.2575, -0.0303, +0.0535, +0.1117, -0.3160, +0.2767, +0.1754, +0.0219, -0.0515, +0.0079, -0.7837, +0.1359, +0.0749, -0.2690, +0.1145, -0.1394, +0.2234, -0.8230, +0.2444, -0.5010, -0.0515],
-[ -0.7577, -0.1246, -0.6416, -0.1292, +0.1269, -0.1601, -0.7096, +0.5698, +0.1452, +0.2287, -0.1673, +0.1212, -0.0779, -0.3946, -0.6451, -1.1095, -0.7062, -0.0777, +0.1132, -0.2283, +0.0272, -0.0535, -0.0579, +0.3027, +0.3611, -0.0492, +0.0490, +0.1978, -0.1055, +0.1079, +0.2022, +0.1964, -0.3552, +0.0624, -0.2604, -0.3808, +0.0454, +0.3496, +0.1034, -0.1317, +0.2831, -0.8189, +0.2068, -0.0665, -0.2932, -0.3625, +0.1067, -0.3037, +0.3838, +0.0383, +0.1815, +0.2562, -0.0403, -0.0175, -0.1908, -0.7806, +0.1274, +0.1829, -0.1783, +0.2590, -0.4242, -0.0020, +0.2163, -0.7718],
-[ -0.1172, -0.2910, +0.1343, +0.1023, +0.2716, +0.2049, -0.6185, +0.2182, -0.1194, -0.0311, -0.4619, +0.2636, +0.2120, -0.2086, +0.0149, +0.0339, +0.2969, -0.3070, -0.2462, -0.1908, -0.2441, +0.3313, +0.6891, +0.1639, -1.0531, -0.1253, -0.2737, +0.2814, +0.1508, +0.1255, +0.4555, -0.0806, -0.0359, +0.0192, -0.0501, +0.3172, +0.0013, -0.8248, -0.1446, -0.1389, +0.3792, +0.3625, -0.2145, +0.0517, +0.2897, +0.0143, +0.0080, +0.1945, -0.4495, -0.0941, +0.5322, +0.2886, -0.0868, -1.5349, +0.0948, -0.7860, +0.5374, -0.5335, -0.0638, -0.1858, +0.0161, -0.2840, -0.3180, +0.3528],
-[ -0.3348, +0.2055, -0.9754, -0.4012, +0.4188, -0.2831, +0.1521, +0.1827, +0.1194, +0.0318, -0.0500, -0.4176, -0.3061, +0.0976, -0.0334, -0.0595, -1.2187, -0.2892, -0.0487, -0.3854, -0.0304, +0.1867, -0.0166, +0.2530, +0.2887, -0.2363, -0.1904, +0.2580, +0.0583, +0.3023, -0.0038, -0.3527, +0.3573, -0.0487, -0.0710, -0.4197, +0.1109, +0.1214, -0.5087, +0.3008, -1.3029, -0.4291, -0.0687, +0.1112, +0.1664, +0.4177, +0.0462, +0.0217, +0.3115, +0.2880, +0.1207, -0.1077, +0.1978, +0.0262, +0.2084, -0.4996, +0.0478, +0.3084, -0.0012, -0.2354, -0.5644, +0.1193, +0.0854, -0.5877],
-[ -0.3103, -0.3814, +0.1322, -0.1447, -0.2558, +0.0371, +0.0856, +0.1248, +0.2103, -0.2475, -0.2205, +0.3099, +0.3163, -0.1651, +0.2838, +0.2346, -0.3855, -0.2486, -0.3396, -0.0437, +0.3671, -0.0069, +0.4828, -0.6932, -0.7277, +0.3441, -0.8020, +0.4863, +0.1061, -0.2418, -0.2396, -0.0053, -0.1668, -0.2948, -0.0782, -0.0149, +0.3159, +0.2116, +0.2267, -0.2058, +0.1034, -0.0827, +0.0529, +0.0069, +0.1822, +0.0000, +0.0525, +0.2258, -0.2335, -0.0016, -0.1231, +0.8993, -0.6615, -0.8643, -0.1698, -0.1447, +0.0801, -1.4432, -0.2538, +0.1848, +0.1005, +0.3882, +0.0458, +0.0405],
-[ +0.3984, +0.1613, +0.5291, +0.1697, -0.2074, -0.4148, -0.3233, -0.3691, -0.1697, -0.0608, -1.2200, +0.2840, -0.7305, -0.2600, +0.2990, +0.0959, -0.0343, +0.2958, +0.1014, -0.2986, -0.6878, +0.1185, -0.4202, -0.5000, -0.2732, +0.0477, +0.0419, -0.4453, -0.3634, -0.2955, +0.1807, +0.2088, -0.1500, -0.1789, -0.2411, -0.3513, -0.2156, +0.1619, -0.7682, -0.2928, +0.2605, +0.4007, +0.1044, -0.7360, +0.1440, -0.4713, -0.2737, -0.5854, +0.0717, +0.5728, +0.3894, +0.1652, -0.5978, +0.2093, +0.2174, -0.3677, -0.2305, -0.1676, -1.2163, -0.3159, -0.5652, -0.1905, -0.1668, +0.2184],
-[ -0.0008, -1.0383, +1.1172, -0.3757, +0.1185, +0.2778, +0.1407, -0.1279, -0.5174, -0.4343, +0.0887, -0.0483, -0.0541, -0.3713, -0.3302, +0.4045, +0.4483, -0.6313, +0.0040, +0.1367, +0.2285, -0.2697, -1.1601, +0.0076, +0.1744, +0.1132, -0.1431, -0.3811, -0.6136, +0.2844, -0.1848, -0.5152, -1.0414, -0.4109, -0.7278, -0.0349, +0.1370, -0.1978, +0.5068, +0.1623, -0.2598, -0.5556, +0.2846, -0.1811, -1.5462, -0.2162, +0.5351, -0.2391, -0.1035, -0.2865, -0.1122, +0.4251, -0.2923, -0.8803, +0.1712, +0.1824, +0.2363, -0.6512, +0.2178, -0.4485, -0.3429, -0.1578, +0.1009, -0.1692],
-[ +0.0041, +0.4229, +0.0388, +0.5734, +0.1830, -0.5990, +0.0260, -0.4107, -0.1851, -0.2277, -0.0275, -0.2505, +0.4437, +0.3490, +0.2597, -0.1346, -0.5125, -0.1878, -0.4422, +0.0793, +0.0946, +0.1463, +0.3695, +0.4150, +0.2463, -0.4557, +0.4123, +0.2879, +0.6034, -0.5302, -0.7214, -0.2835, -0.0240, +0.2951, +0.3102, -0.2566, -0.0515, -0.1121, -0.5604, -0.3810, +0.4285, +0.9055, -0.2602, +0.2380, -0.3954, -0.0396, +0.6154, +0.0981, +0.4571, +0.0322, +0.2965, +0.1396, -0.0881, -0.0175, +0.3386, -0.0699, +0.1114, +0.3103, +0.0885, -0.2483, +0.3396, -0.5895, -0.4524, +0.4458],
-[ -0.7421, -0.1838, +0.0929, +0.1654, -0.1778, +0.1589, +0.1777, +0.1539, +0.6931, -0.0002, +0.0366, -0.2482, +0.3404, -0.6776, -0.0599, -0.9906, -0.1703, -0.2741, -0.2623, +0.2435, +0.1282, -0.2218, -0.4463, -0.0515, -0.1126, +0.5793, -0.4053, +0.3077, -0.2113, -0.1654, -0.4019, +0.3054, -0.2755, -0.0359, -1.3564, +0.7528, +0.0788, +0.2060, +0.1633, -0.4355, +0.2035, -0.2194, -0.0381, -0.1512, -0.7473, +0.2736, -0.0204, -0.4578, -0.4144, +0.0076, -0.6070, +0.0851, +0.4764, -0.3511, -0.1171, -0.8141, +0.1976, +0.2906, +0.0918, +0.2261, +0.2769, +0.1746, +0.5881, -0.8917],
-[ -0.3276, -0.1296, +0.3245, -0.0630, +0.1080, -0.0923, -0.0555, -0.4351, -0.4805, +0.1625, -0.7317, +0.0232, -0.0290, -1.2621, +0.0074, +0.6063, -0.0992, +0.2137, -0.0525, -0.1596, +0.2326, +0.7151, -0.2879, -0.9427, +0.0728, +0.3451, -1.3029, -0.1453, -0.0766, -0.1260, +0.2174, +0.2524, -0.0272, -0.9901, -0.2757, -0.0532, +0.0768, -0.6334, +0.2368, +0.1227, -0.6449, -0.0662, +0.3466, -0.1741, +0.1209, +0.4601, +0.1192, -0.0727, -0.3973, -0.2250, +0.1601, +0.1562, -0.2805, -0.0830, -0.0274, -0.4325, +0.0951, -0.1183, +0.1025, +0.0261, -0.6047, -0.0146, -0.1957, +0.0218],
-[ +0.1081, +0.3138, +0.3278, -0.7791, +0.1543, -0.1908, +0.3635, +0.0070, +0.3577, -0.0404, -0.8582, -0.4834, +0.3016, -0.6306, -0.4563, +0.1801, -0.2791, -0.6206, +0.0517, +0.5410, +0.1347, +0.4778, +0.0558, -0.0759, -0.0772, +0.1917, -0.7159, -0.0643, -0.1721, -0.5170, -0.3511, -0.3017, +0.1299, -0.7527, -0.1136, -0.3605, -0.3682, -0.0709, +0.0723, -0.2196, -0.9063, -0.3520, -0.3413, +0.2594, +0.1649, -0.5071, -0.1584, +0.1231, +0.0057, -0.4875, +0.2410, -0.2405, +0.3705, -1.0071, +0.3241, +0.0207, -0.4803, -0.4314, +0.1130, -0.0724, +0.2252, -0.2790, +0.0415, +0.0660],
-[ -1.0239, +0.0612, -0.1775, +0.0616, +0.3968, +0.1192, -0.0637, -1.3325, +0.0141, -0.3692, -0.2163, +0.1634, +0.1818, +0.1767, -0.3110, -0.5755, -0.2020, -0.1910, +0.4489, -0.0309, +0.2252, +0.0045, +0.0525, -0.9357, +0.0912, -0.2257, +0.2897, +0.4927, +0.0509, -0.3725, +0.2843, -0.8260, -0.1409, -1.0330, -0.1377, +0.2625, +0.0637, -0.5822, -1.0901, +0.2305, -0.0809, -0.4811, -0.2776, +0.1618, -0.6189, +0.1608, +0.2586, -0.4005, -0.0048, -0.4438, -0.0799, +0.1356, +0.0141, -0.1191, +0.3150, -0.4819, -0.2142, +0.1938, +0.2875, -0.5401, +0.0929, -0.3865, -0.0821, -0.5999],
-[ +0.4043, -0.0639, -0.3917, +0.0908, +0.0894, -0.4655, -0.2022, +0.3332, -0.2707, +0.0466, +0.1355, +0.1318, -0.3180, -0.3957, -0.0124, -0.7214, -0.2792, +0.3177, -0.5455, -0.5225, -0.2927, -0.2688, +0.0192, +0.3940, +0.0514, +0.2258, -0.3504, -0.0024, +0.0145, -0.2194, -0.0040, +0.2842, -0.0667, -0.4815, +0.2162, +0.1778, -0.7473, +0.4520, +0.1720, -0.5224, -0.0490, -0.5519, -0.3571, +0.4386, -0.1868, -0.2627, -0.3350, -0.7849, -0.1009, +0.1432, -0.2389, +0.1923, -0.4800, +0.0100, -0.0507, +0.0151, +0.3257, +0.0299, +0.0118, +0.2283, -0.2633, +0.2229, -0.7595, +0.1507],
-[ +0.2797, -0.2386, -0.0121, +0.2439, -0.0317, -0.0390, +0.0581, -0.8813, -0.5392, -0.2527, -0.4720, +0.4787, +0.3710, +0.0434, +0.0702, -1.0678, -0.0195, -0.6846, -0.7418, +0.0543, -0.3187, -0.1510, -0.3590, -0.0902, +0.2195, +0.0943, -0.0384, -0.7203, +0.0316, -0.0647, +0.1894, +0.2490, -1.3374, +0.3883, +0.1207, +0.4036, +0.3255, +0.3757, +0.2444, +0.2612, -1.5274, +0.1092, +0.5718, -0.1929, -0.1531, -0.2330, +0.0539, +0.2055, -0.8240, +0.1292, -0.4835, +0.5281, +0.1944, -0.3389, -0.3689, +0.4941, +0.0330, +0.0938, +0.4999, -0.2465, -0.2547, +0.3286, -0.2172, +0.4791],
-[ +0.4580, +0.6728, +0.1603, -0.5751, -0.8616, +0.0422, -0.3104, -0.2042, +0.4133, +0.3150, -0.8036, -0.5332, +0.5432, +0.2999, +0.1480, -0.2845, -0.9013, -0.0924, -0.6048, -0.1631, -0.1127, -0.3833, -0.5830, -1.1764, -1.2800, -0.0174, -0.2561, +0.1081, +0.3352, +0.1175, +0.3419, +0.7590, +0.4220, -0.8411, +0.0312, +0.3287, +0.2295, -0.0867, -0.6239, +0.0633, +0.3005, -0.0838, -0.4589, -0.2385, +0.2734, -0.2946, -0.2759, -0.4446, +0.0052, -0.3499, -0.3503, +0.1211, -0.1839, -0.2803, +0.0158, +0.2441, +0.4413, -0.4929, +0.3714, +0.5445, -0.0731, -0.3297, -0.5428, +0.4811],
-[ -0.3528, +0.2554, +0.1195, +0.2853, -0.0731, -0.0237, -0.0755, +0.3719, -0.5900, +0.3071, +0.1961, -0.3822, -0.3113, +0.3011, +0.1113, -0.1598, -0.0299, +0.6281, +0.1811, +0.1312, +0.1971, -0.4736, +0.7463, -0.0154, +0.4255, -0.3671, +0.3200, -0.1815, -0.4259, +0.1115, +0.4232, -0.3993, +0.0706, -0.1901, +0.1188, -0.6964, -0.5131, -0.5996, -0.0103, +0.1504, +0.0713, -0.0430, -0.8008, +0.1890, -0.2637, +0.1984, +0.0119, +0.1025, -0.9490, -0.0255, +0.2795, +0.2354, -0.1830, +0.1894, -0.1928, -0.8840, +0.3929, +0.1748, +0.1588, +0.4326, -0.0759, +0.1664, +0.2102, -0.3707],
-[ +0.0479, -0.0155, -0.3830, +0.0390, -0.0793, -0.1159, -0.0263, -0.3720, -0.9581, +0.2546, -0.4353, +0.2756, -0.0628, +0.0360, +0.1591, -0.7122, +0.1463, -0.1078, -0.5880, +0.1476, -0.0437, -0.6911, -0.0355, +0.2766, -0.3426, +0.2286, -0.2323, -0.2819, -0.0887, +0.5000, -0.0338, -0.1563, -0.0168, +0.0500, -0.1077, +0.4968, -1.1365, +0.1814, -0.1388, -0.1080, +0.0761, -0.4107, +0.3764, +0.3308, +0.0905, -0.2821, -0.2366, -0.2618, +0.2762, -0.2521, +0.1400, -0.1133, +0.0411, -0.0475, -0.4804, +0.4348, -0.1652, +0.0103, +0.2100, -0.3716, +0.1860, -0.3946, -0.1734, +0.2052],
-[ -0.0266, -0.2590, -0.1527, +0.2632, -0.1506, -0.0040, -0.3828, -0.7623, -0.1620, -0.1641, +0.0927, +0.1030, -0.1890, +0.2110, +0.1634, -1.4356, +0.1170, -0.7333, -0.3429, -0.3402, +0.5740, +0.2288, +0.0264, -0.0770, +0.0611, +0.2538, +0.5611, -0.0635, -0.0885, -0.0698, +0.2153, +0.0752, -0.2368, +0.2113, -0.8473, -0.7176, -0.3615, -0.2906, +0.0310, +0.0041, -0.3076, +0.1850, +0.0959, -0.1510, +0.1042, +0.0781, +0.1000, -0.0701, -0.0252, +0.6513, +0.1680, +0.3624, -0.5958, -0.6897, +0.1336, -0.0600, +0.0437, -0.2525, +0.1216, -0.2053, +0.0452, +0.8903, -0.0487, -0.0072]
-])
-
-weights_dense2_b = np.array([ +0.2226, +0.0124, +0.0027, +0.2335, +0.0952, +0.0250, +0.1087, +0.1225, +0.0476, +0.1535, +0.0940, +0.0421, +0.0967, +0.0431, -0.2867, -0.1520, -0.0796, +0.0041, +0.0599, +0.0139, -0.0608, -0.0695, +0.0222, +0.0420, -0.0988, +0.0851, +0.2547, +0.0361, +0.0341, +0.0986, +0.1827, -0.1344, +0.1575, +0.0374, +0.0497, -0.1436, +0.1622, +0.2187, +0.0257, +0.0680, -0.0228, +0.0215, +0.1596, -0.0594, -0.0886, -0.0006, -0.0940, +0.1568, +0.0610, +0.1915, +0.1162, +0.0765, -0.1731, -0.0258, +0.0896, -0.2285, +0.0948, +0.0286, +0.1174, +0.0382, +0.2536, +0.3435, +0.0281, +0.2328])
-
-weights_final_w = np.array([
-[ -0.0133, +0.0628, -0.6441, +0.2383, +0.4270, +0.1927, -0.3628, +0.3698],
-[ -0.0089, +0.0614, +0.0522, -0.3912, -0.1872, -0.7369, +0.0852, -0.1505],
-[ +0.2779, +0.7024, -0.3493, -0.2124, -0.0220, +0.0741, +0.0670, -0.1029],
-[ -0.0519, +0.2775, -0.3879, -0.0335, +0.1150, +0.0789, -0.1963, +0.1992],
-[ +0.0241, +0.2946, +0.2777, -0.2040, +0.4150, +0.0810, -0.0170, -0.0202],
-[ -0.2781, +0.0243, -0.0485, +0.1249, -0.0354, -0.0327, +0.2284, -0.3674],
-[ -0.1843, +0.1452, -0.0728, +0.2894, +0.1892, +0.0013, +0.1527, -0.3815],
-[ +0.4556, -0.1760, +0.0188, -0.2475, -0.3291, -0.3527, -0.6556, -0.5543],
-[ +0.0309, +0.3396, +0.0626, -0.0045, +0.2597, -0.2234, +0.3634, -0.1476],
-[ -0.3221, +0.4484, +0.0538, +0.2543, -0.3213, +0.4323, -0.2503, +0.0654],
-[ +0.5351, -0.2229, -0.1097, +0.1062, -0.5535, +0.4454, +0.1802, +0.1971],
-[ +0.1813, +0.0778, +0.1647, -0.1118, +0.4696, -0.3322, -0.2033, -0.0201],
-[ +0.1423, +0.2278, +0.0263, +0.1439, +0.0134, -0.5282, +0.1236, -0.0416],
-[ +0.1217, +0.1197, -0.5194, +0.4029, -0.1307, -0.4352, -0.0514, -0.2256],
-[ +0.1484, +0.0685, +0.4156, +0.1887, -0.7306, +0.1027, -0.4018, +0.0134],
-[ +0.2326, +0.0218, +0.0390, +0.0010, -0.5719, +0.0264, -0.4600, -0.3220],
-[ -0.0586, -0.3066, +0.2050, +0.1253, +0.4542, +0.1711, -0.6051, +0.0061],
-[ +0.0108, -0.5588, -0.3976, +0.3375, +0.3065, +0.2118, -0.4879, +0.1444],
-[ -0.1443, -0.2895, -0.3992, +0.0409, +0.3109, -0.0295, -0.2016, -0.3679],
-[ -0.2630, +0.2348, +0.2592, +0.1778, -0.1501, -0.2856, +0.3477, +0.1416],
-[ -0.3078, -0.3138, +0.2040, -0.3254, +0.2891, +0.0228, -0.3580, +0.2438],
-[ -0.0035, -0.1374, +0.9035, +0.1420, +0.1437, -0.1159, -0.1822, +0.2037],
-[ +0.2533, -0.0089, -0.1549, +0.1085, -0.5376, -0.0639, +0.3232, +0.0673],
-[ -0.1033, +0.2733, +0.1426, +0.4075, -0.1140, +0.1152, +0.2189, +0.7337],
-[ +0.0682, -0.1010, +0.2224, +0.4526, +0.0599, +0.1290, -0.5523, +0.0333],
-[ +0.1089, -0.1139, -0.0310, -0.2661, +0.0781, -0.1955, -0.2610, +0.1017],
-[ +0.0011, +0.4399, -0.2365, -0.1523, -0.1508, +0.2314, +0.1414, +0.1116],
-[ +0.0014, -0.0973, +0.6542, -0.0039, -0.2656, -0.1597, +0.0158, -0.0201],
-[ -0.1700, +0.0102, +0.1321, -0.1934, -0.2208, +0.0057, +0.1504, +0.3798],
-[ +0.1586, +0.0557, +0.1042, -0.4201, +0.0613, -0.0152, -0.3855, +0.1035],
-[ -0.0969, -0.0936, +0.1289, -0.4031, +0.1148, +0.3258, +0.2017, -0.2499],
-[ +0.5422, -0.3985, -0.0758, -0.0241, +0.1124, +0.0043, -0.0495, -0.1127],
-[ +0.1679, -0.1337, -0.2102, -0.0678, +0.0768, -0.5881, +0.0327, -0.1429],
-[ +0.2756, -0.1772, -0.3729, -0.0931, +0.6402, -0.0739, -0.1221, +0.5423],
-[ -0.2310, -0.6409, -0.0729, -0.2143, +0.0735, -0.3279, -0.1317, -0.2060],
-[ -0.0864, +0.0344, -0.5635, +0.3137, -0.0566, -0.3874, -0.0119, +0.0187],
-[ +0.4066, +0.1192, +0.2065, +0.0546, +0.2182, +0.6743, +0.2802, -0.0638],
-[ +0.2526, +0.6688, -0.0943, -0.2531, +0.1259, +0.1115, +0.0581, -0.0340],
-[ +0.1820, +0.2927, -0.2457, +0.0310, -0.3335, -0.5889, +0.0088, +0.3045],
-[ +0.0072, -0.0702, +0.1246, +0.0875, +0.0488, +0.2379, -0.1760, -0.5422],
-[ +0.1416, +0.1796, -0.7311, +0.0016, -0.4996, +0.0724, -0.4854, +0.2310],
-[ -0.5525, +0.1246, +0.8667, +0.3521, -0.7227, +0.4473, +0.0805, -0.1707],
-[ -0.3557, +0.0798, +0.5322, -0.0827, +0.1836, +0.2784, -0.1676, -0.1012],
-[ -0.6738, +0.5545, -0.3111, +0.2171, -0.3377, -0.2039, -0.1205, +0.1212],
-[ -0.2249, -0.1037, -0.4715, -0.3616, +0.2250, +0.0999, +0.4772, -0.0679],
-[ -0.4895, -0.2557, +0.0892, -0.0000, -0.4443, +0.2913, -0.0450, -0.3303],
-[ -0.2729, +0.0973, +0.2516, -0.4313, -0.1743, -0.2386, -0.1142, -0.0440],
-[ -0.6820, +0.2449, -0.1079, +0.3047, +0.0325, -0.0980, +0.1868, -0.1600],
-[ -0.2085, -0.2897, -0.4539, -0.0506, +0.1225, +0.1976, -0.2360, +0.6553],
-[ +0.5299, +0.2876, +0.2354, -0.0884, -0.1821, +0.3841, -0.0701, +0.0278],
-[ -0.1594, -0.4837, +0.1483, -0.1280, +0.0962, -0.1932, +0.1730, +0.0544],
-[ +0.2879, -0.1846, +0.1474, -0.3383, +0.1483, +0.1159, +0.3761, +0.2326],
-[ -0.0960, -0.0727, -0.3099, +0.0548, +0.2339, -0.2232, +0.6066, +0.3826],
-[ -0.0171, +0.1490, -0.3324, -0.0231, +0.0700, -0.6364, -0.1944, +0.3094],
-[ +0.0804, -0.0278, +0.0182, -0.3807, -0.3628, -0.3564, +0.2279, -0.0226],
-[ +0.4219, +0.0741, +0.1299, +0.4700, +0.1927, +0.0849, -0.1574, +0.5607],
-[ +0.0810, -0.0815, +0.1356, +0.2048, -0.1404, -0.0222, -0.2464, +0.4991],
-[ +0.3000, +0.0862, -0.3917, +0.4117, +0.0306, +0.0788, -0.0403, -0.6423],
-[ -0.2445, +0.4847, +0.0478, -0.2170, -0.3700, +0.0189, +0.0001, -0.0335],
-[ +0.3710, -0.0115, -0.4207, -0.4245, +0.2041, -0.0875, -0.2369, -0.6424],
-[ -0.3608, +0.0539, -0.3928, -0.0352, +0.2832, +0.1003, -0.0082, +0.3201],
-[ +0.2221, -0.0399, +0.2092, -0.1670, -0.5146, +0.2273, +0.3011, -0.2879],
-[ +0.1500, +0.3236, +0.1295, -0.0763, -0.2708, +0.6542, +0.1379, -0.0646],
-[ +0.1291, +0.0417, +0.1386, +0.0166, +0.1373, +0.1956, +0.4986, +0.5690]
-])
-
-weights_final_b = np.array([ -0.0680, +0.1401, -0.0628, -0.1317, +0.1489, +0.1844, -0.1147, +0.0137])
+# the weights are memory-mapped from the .npy files of pybulletgym/tests/roboschool/agents/weights
+(weights_dense1_w, weights_dense2_w, weights_final_w), (weights_dense1_b, weights_dense2_b, weights_final_b) = \
+    load_weights("AntPyBulletEnv-v0")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,56 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+# each snippet runs in a fresh interpreter, what it prints is read back as json
+SNIPPETS = {
+    'import pybulletgym': "import pybulletgym",
+    'gym.make': "import gym, pybulletgym; gym.make({env_id!r})",
+}
+
+REPORT = """
+import json, sys, time
+start = time.perf_counter()
+{snippet}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'modules': len(sys.modules),
+    'pkg_resources': 'pkg_resources' in sys.modules,
+    'pybulletgym_modules': sorted(m for m in sys.modules if m.startswith('pybulletgym')),
+}}))
+"""
+
+
+def measure(snippet, repeats):
+    runs = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, '-c', REPORT.format(snippet=snippet)],
+                                check=True, capture_output=True, text=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    result = dict(runs[-1])
+    result['seconds'] = statistics.median(run['seconds'] for run in runs)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import time of pybulletgym, in fresh interpreters.')
+    parser.add_argument('--env', default='HopperPyBulletEnv-v0', help='env id made after the import')
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--verbose', action='store_true', help='list the pybulletgym modules that were imported')
+    args = parser.parse_args(argv)
+
+    for name, snippet in SNIPPETS.items():
+        result = measure(snippet.format(env_id=args.env), args.repeats)
+        print(f"{name}: {result['seconds'] * 1000:.1f} ms (median of {args.repeats}), "
+              f"{result['modules']} modules, pkg_resources imported: {result['pkg_resources']}")
+        if args.verbose:
+            print('  ' + '\n  '.join(result['pybulletgym_modules']))
+    print('Run `python -X importtime -c "import pybulletgym"` for the per-module breakdown.')
+
+
+if __name__ == '__main__':
+    main()
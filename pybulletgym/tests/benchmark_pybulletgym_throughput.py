@@ -0,0 +1,168 @@
+import argparse
+import json
+import multiprocessing as mp
+import resource
+import sys
+import time
+import traceback
+
+import numpy as np
+
+
+# metric -> whether a higher value is better, used to tell regressions apart from improvements
+METRICS = {
+    'construction_s': False,
+    'first_reset_s': False,
+    'steps_per_sec': True,
+    'resets_per_sec': True,
+    'peak_rss_mb': False,
+}
+
+
+def registered_env_ids():
+    import gym
+    import pybulletgym  # required to register the pybullet envs
+    return [spec.id for spec in gym.envs.registry.values() if str(spec.entry_point).startswith('pybulletgym.')]
+
+
+def _peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == 'darwin' else rss / 2**10  # bytes on macOS, kilobytes elsewhere
+
+
+def _done(step_output):
+    '''
+    :return: whether the episode is over, or that of any lane for the (N,) flags of a vector env
+    '''
+    return np.any(step_output[2]) or (len(step_output) == 5 and np.any(step_output[3]))
+
+
+def measure(env_id, logs, steps, resets, warmup, seed):
+    '''
+    Runs in a fresh process, so that construction time and peak RSS are those of this env alone.
+    Vector envs, e.g. VectorStadiumEnv, step and reset all their lanes at once: their steps/sec and resets/sec
+    count the steps and resets of the N lanes, and their lanes are only reset by the env itself if it auto-resets.
+    :return: metric name -> value, see METRICS, plus num_envs
+    '''
+    import gym
+    import pybulletgym  # required to register the pybullet envs
+
+    results = {}
+    start = time.perf_counter()
+    env = gym.make(env_id)  # rendering stays off
+    results['construction_s'] = time.perf_counter() - start
+    num_envs = getattr(env.unwrapped, 'num_envs', 1)
+    auto_reset = getattr(env.unwrapped, 'auto_reset', False)
+    if hasattr(env.unwrapped, 'set_log_mode'):
+        env.unwrapped.set_log_mode('eager' if logs else 'off')
+    elif logs:
+        env.close()
+        return None  # this env has no logs to turn on
+
+    env.action_space.seed(seed)
+    actions = [env.action_space.sample() for _ in range(warmup + steps)]
+
+    start = time.perf_counter()
+    env.reset(seed=seed)
+    results['first_reset_s'] = time.perf_counter() - start
+
+    step_time = 0.0
+    for i, a in enumerate(actions):
+        start = time.perf_counter()
+        step_output = env.step(a)
+        if i >= warmup:
+            step_time += time.perf_counter() - start
+        if not auto_reset and _done(step_output):
+            env.reset()
+    results['steps_per_sec'] = num_envs * steps / step_time
+
+    start = time.perf_counter()
+    for _ in range(resets):
+        env.reset()
+    results['resets_per_sec'] = num_envs * resets / (time.perf_counter() - start)
+
+    env.close()
+    results['peak_rss_mb'] = _peak_rss_mb()
+    results['num_envs'] = num_envs
+    return results
+
+
+def _measure_job(job):
+    try:
+        return measure(*job)
+    except Exception:
+        return {'error': traceback.format_exc()}
+
+
+def compare(results, baseline, tolerance):
+    '''
+    :return: list of (key, metric, value, baseline value) that regressed by more than the tolerance.
+    '''
+    regressions = []
+    for key, metrics in results.items():
+        for metric, higher_is_better in METRICS.items():
+            reference = baseline.get(key, {}).get(metric)
+            value = metrics.get(metric)
+            if reference is None or value is None:
+                continue
+            if higher_is_better and value < reference * (1 - tolerance):
+                regressions.append((key, metric, value, reference))
+            if not higher_is_better and value > reference * (1 + tolerance):
+                regressions.append((key, metric, value, reference))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Throughput benchmark of the registered pybullet-gym envs.')
+    parser.add_argument('--envs', nargs='*', default=None, help='env ids to benchmark, all registered ones by default')
+    parser.add_argument('--steps', type=int, default=2000)
+    parser.add_argument('--warmup', type=int, default=100)
+    parser.add_argument('--resets', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', default=None, help='json file written by a previous run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='relative change tolerated before a regression')
+    args = parser.parse_args(argv)
+
+    env_ids = args.envs or registered_env_ids()
+    jobs = [(env_id, logs, args.steps, args.resets, args.warmup, args.seed) for env_id in env_ids for logs in (False, True)]
+
+    results = {}
+    ctx = mp.get_context('spawn')
+    for job in jobs:
+        key = f"{job[0]}/logs_{'on' if job[1] else 'off'}"
+        print('[BENCHMARK]', key, '...')
+        # one process per measure, run one at a time not to disturb the timings
+        with ctx.Pool(1, maxtasksperchild=1) as pool:
+            metrics = pool.apply(_measure_job, (job,))
+        if metrics is None:
+            continue
+        results[key] = metrics
+        if 'error' in metrics:
+            print(metrics['error'])
+        else:
+            print(' '.join(f"{metric}={value:.4g}" for metric, value in metrics.items()))
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print('Results written to', args.output)
+
+    failed = [key for key, metrics in results.items() if 'error' in metrics]
+    if failed:
+        print('The following envs have problems:', failed)
+
+    regressions = []
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for key, metric, value, reference in regressions:
+            print(f'[REGRESSION] {key} {metric}: {value:.4g} vs {reference:.4g} in the baseline')
+        if not regressions:
+            print(f'No regression beyond {args.tolerance:.0%} against', args.baseline)
+
+    return 1 if failed or regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
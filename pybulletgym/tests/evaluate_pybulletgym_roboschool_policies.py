@@ -0,0 +1,129 @@
+import argparse
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+import traceback
+
+import numpy as np
+
+from pybulletgym.tests.roboschool.agents.weight_store import AGENT_MODULES, load_weights
+
+
+# env and policy of each env id, built once per worker process
+_cache = {}
+
+
+def _env_and_agent(env_id):
+    if env_id not in _cache:
+        import gym
+        import pybulletgym  # required to register the pybullet envs
+        from pybulletgym.tests.roboschool.agents.policies import SmallReactivePolicy
+
+        env = gym.make(env_id)
+        if hasattr(env.unwrapped, 'set_log_mode'):
+            env.unwrapped.set_log_mode('off')
+        weights, biases = load_weights(env_id)
+        _cache[env_id] = env, SmallReactivePolicy(env.observation_space, env.action_space, weights, biases)
+    return _cache[env_id]
+
+
+def run_episode(job):
+    '''
+    :param job: (env_id, seed, max_steps)
+    :return: dict of the episode results
+    '''
+    env_id, seed, max_steps = job
+    result = {'env_id': env_id, 'seed': seed, 'pid': os.getpid()}
+    try:
+        env, agent = _env_and_agent(env_id)
+        start = time.perf_counter()
+        obs, _ = env.reset(seed=seed)
+        total_reward = 0.0
+        steps = 0
+        while steps < max_steps:
+            step_output = env.step(agent.act(obs))
+            obs, r = step_output[0], step_output[1]
+            total_reward += r
+            steps += 1
+            if step_output[2] or (len(step_output) == 5 and step_output[3]):
+                break
+        result.update(total_reward=float(total_reward), steps=steps, wall_s=time.perf_counter() - start)
+    except Exception:
+        result['error'] = traceback.format_exc()
+    return result
+
+
+def summarize(episodes):
+    '''
+    :return: env id -> mean/std/min/max of the returns over the seeds, and the wall-clock stats
+    '''
+    summary = {}
+    for env_id in sorted(set(e['env_id'] for e in episodes)):
+        done = [e for e in episodes if e['env_id'] == env_id and 'error' not in e]
+        returns = np.array([e['total_reward'] for e in done])
+        wall = np.array([e['wall_s'] for e in done])
+        steps = sum(e['steps'] for e in done)
+        summary[env_id] = {
+            'episodes': len(done),
+            'errors': sum(1 for e in episodes if e['env_id'] == env_id and 'error' in e),
+            'mean_return': float(returns.mean()) if len(done) else None,
+            'std_return': float(returns.std()) if len(done) else None,
+            'min_return': float(returns.min()) if len(done) else None,
+            'max_return': float(returns.max()) if len(done) else None,
+            'mean_steps': steps / len(done) if len(done) else None,
+            'mean_episode_wall_s': float(wall.mean()) if len(done) else None,
+            'steps_per_sec': steps / wall.sum() if len(done) and wall.sum() > 0 else None,
+        }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Parallel seeded evaluation of the pretrained roboschool policies.')
+    parser.add_argument('--envs', nargs='*', default=None, help='env ids to evaluate, all the ones with weights by default')
+    parser.add_argument('--seeds', type=int, default=16, help='number of seeds, i.e. of episodes, per env')
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--max-steps', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--start-method', default=None, help='multiprocessing start method, platform default if None')
+    parser.add_argument('--output', default='evaluation_results.json')
+    args = parser.parse_args(argv)
+
+    env_ids = args.envs or list(AGENT_MODULES.keys())
+    # jobs of the same env next to each other, so that workers mostly reuse the env they already built
+    jobs = [(env_id, seed, args.max_steps) for env_id in env_ids
+            for seed in range(args.first_seed, args.first_seed + args.seeds)]
+
+    start = time.perf_counter()
+    episodes = []
+    with mp.get_context(args.start_method).Pool(args.workers) as pool:
+        for result in pool.imap_unordered(run_episode, jobs):
+            episodes.append(result)
+            if 'error' in result:
+                print('[FAIL]', result['env_id'], 'seed', result['seed'], ':', result['error'])
+    wall_s = time.perf_counter() - start
+
+    episodes.sort(key=lambda e: (e['env_id'], e['seed']))
+    summary = summarize(episodes)
+    for env_id, stats in summary.items():
+        if stats['episodes']:
+            print(f"{env_id}: return {stats['mean_return']:.1f} +- {stats['std_return']:.1f} "
+                  f"over {stats['episodes']} seeds, {stats['steps_per_sec']:.0f} steps/s per worker")
+        else:
+            print(f"{env_id}: no episode completed")
+    print(f"{len(jobs)} episodes in {wall_s:.1f}s with {args.workers} workers")
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'summary': summary,
+            'episodes': episodes,
+            'wall_clock': {'total_s': wall_s, 'workers': args.workers, 'jobs': len(jobs)},
+        }, f, indent=2)
+    print('Results written to', args.output)
+
+    return 1 if any(stats['errors'] for stats in summary.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,3 +17,101 @@ class SmallReactivePolicy:
         x = relu(np.dot(x, self.weights[1]) + self.biases[1])
         x = np.dot(x, self.weights[2]) + self.biases[2]
         return x
+
+
+class BatchedSmallReactivePolicy:
+    """
+    SmallReactivePolicy over a batch of observations, in float32.
+    The intermediate activations and the actions are written to buffers allocated once per batch size:
+    the returned actions are overwritten by the next call, copy them if they need to outlive it.
+    """
+    def __init__(self, weights, biases):
+        self.weights = [np.ascontiguousarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.ascontiguousarray(b, dtype=np.float32) for b in biases]
+        self.obs_dim = self.weights[0].shape[0]
+        self.action_dim = self.weights[-1].shape[1]
+        self._buffers = None
+
+    def _buffers_for(self, n):
+        if self._buffers is None or self._buffers[0].shape[0] != n:
+            self._buffers = [np.empty((n, w.shape[1]), dtype=np.float32) for w in self.weights]
+        return self._buffers
+
+    def act(self, obs):
+        """
+        :param obs: (N, obs_dim) observations, or a single (obs_dim,) observation
+        :return: (N, action_dim) float32 actions, or (action_dim,) for a single observation
+        """
+        obs = np.asarray(obs, dtype=np.float32)
+        x = obs.reshape(-1, self.obs_dim)
+        buffers = self._buffers_for(x.shape[0])
+        for i, (w, b, out) in enumerate(zip(self.weights, self.biases, buffers)):
+            np.matmul(x, w, out=out)
+            out += b
+            if i < len(self.weights) - 1:
+                np.maximum(out, 0, out=out)  # relu, in place
+            x = out
+        return x if obs.ndim > 1 else x[0]
+
+
+class MultiSmallReactivePolicy:
+    """
+    Several SmallReactivePolicy, e.g. of different envs, evaluated in one call on one batch of observations.
+    The batch is (batch, obs_dim) and the actions (batch, action_dim), with the largest obs_dim and action_dim of
+    the policies: a policy with fewer observations reads the first columns of its rows, one with fewer actions
+    leaves the last columns of its rows at zero.
+    When all the policies have layers of the same shapes and the rows come in n_policies equal blocks, their weights
+    are stacked and the whole batch goes through three batched matmuls, otherwise each policy runs its own rows.
+    The returned actions are overwritten by the next call, copy them if they need to outlive it.
+    """
+    def __init__(self, weights_and_biases):
+        '''
+        :param weights_and_biases: list of (weights, biases), one per policy
+        '''
+        self.policies = [BatchedSmallReactivePolicy(w, b) for w, b in weights_and_biases]
+        self.obs_dim = max(policy.obs_dim for policy in self.policies)
+        self.action_dim = max(policy.action_dim for policy in self.policies)
+        shapes = set(tuple(w.shape for w in policy.weights) for policy in self.policies)
+        self.stacked = len(shapes) == 1
+        if self.stacked:
+            self.weights = [np.stack(layer) for layer in zip(*[p.weights for p in self.policies])]
+            self.biases = [np.stack(layer)[:, None, :] for layer in zip(*[p.biases for p in self.policies])]
+        self._buffers = None
+        self._actions = None
+
+    def _stacked_act(self, x):
+        n = len(self.policies)
+        x = x.reshape(n, -1, self.obs_dim)
+        if self._buffers is None or self._buffers[0].shape[1] != x.shape[1]:
+            self._buffers = [np.empty((n, x.shape[1], w.shape[2]), dtype=np.float32) for w in self.weights]
+        for i, (w, b, out) in enumerate(zip(self.weights, self.biases, self._buffers)):
+            np.matmul(x, w, out=out)
+            out += b
+            if i < len(self.weights) - 1:
+                np.maximum(out, 0, out=out)
+            x = out
+        return x.reshape(-1, self.action_dim)
+
+    def act(self, obs, policy_ids=None):
+        """
+        :param obs: (batch, obs_dim) observations
+        :param policy_ids: (batch,) index of the policy of every row. By default the rows are split in n_policies
+        equal blocks, block k going through policy k.
+        :return: (batch, action_dim) float32 actions
+        """
+        x = np.asarray(obs, dtype=np.float32).reshape(-1, self.obs_dim)
+        if policy_ids is None:
+            if len(x) % len(self.policies):
+                raise ValueError(f"a batch of {len(x)} rows cannot be split between {len(self.policies)} policies")
+            if self.stacked:
+                return self._stacked_act(x)
+            policy_ids = np.repeat(np.arange(len(self.policies)), len(x) // len(self.policies))
+        policy_ids = np.asarray(policy_ids)
+        if self._actions is None or self._actions.shape[0] != len(x):
+            self._actions = np.empty((len(x), self.action_dim), dtype=np.float32)
+        for k, policy in enumerate(self.policies):
+            rows = np.flatnonzero(policy_ids == k)
+            if len(rows):
+                self._actions[rows, :policy.action_dim] = policy.act(x[rows, :policy.obs_dim])
+                self._actions[rows, policy.action_dim:] = 0
+        return self._actions
@@ -0,0 +1,133 @@
+import argparse
+import importlib
+import os
+
+import numpy as np
+
+
+# env id -> module of this package holding the pretrained SmallReactivePolicy weights as numpy literals
+AGENT_MODULES = {
+    # pendula
+    'InvertedPendulumPyBulletEnv-v0': 'InvertedPendulumPyBulletEnv_v0_2017may',
+    'InvertedDoublePendulumPyBulletEnv-v0': 'InvertedDoublePendulumPyBulletEnv_v0_2017may',
+    'InvertedPendulumSwingupPyBulletEnv-v0': 'InvertedPendulumSwingupPyBulletEnv_v0_2017may',
+
+    # manipulators
+    'ReacherPyBulletEnv-v0': 'ReacherPyBulletEnv_v0_017may',
+
+    # locomotors
+    'Walker2DPyBulletEnv-v0': 'Walker2DPyBulletEnv_v0_2017may',
+    'HalfCheetahPyBulletEnv-v0': 'HalfCheetahPyBulletEnv_v0_2017may',
+    'AntPyBulletEnv-v0': 'AntPyBulletEnv_v0_2017may',
+    'HopperPyBulletEnv-v0': 'HopperPyBulletEnv_v0_2017may',
+    'HumanoidPyBulletEnv-v0': 'HumanoidPyBulletEnv_v0_2017may',
+    'HumanoidFlagrunPyBulletEnv-v0': 'HumanoidFlagrunPyBulletEnv_v0_2017may',
+    'HumanoidFlagrunHarderPyBulletEnv-v0': 'HumanoidFlagrunHarderPyBulletEnv_v1_2017jul',
+    'AtlasPyBulletEnv-v0': 'AtlasPyBulletEnv_v0_2017jul',
+}
+
+# weights of an env other than the ones of AGENT_MODULES, keyed by <env id>_<date> instead of the env id
+ARCHIVED_MODULES = {
+    'HumanoidFlagrunHarderPyBulletEnv-v0_2017may': 'HumanoidFlagrunHarderPyBulletEnv_v0_2017may',
+}
+
+LAYERS = ('dense1', 'dense2', 'final')
+ARRAYS = tuple(f'weights_{layer}_{kind}' for kind in ('w', 'b') for layer in LAYERS)
+
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'weights')
+
+
+class WeightStore:
+    """
+    Lazy loader of the pretrained policy weights, keyed by env id (or by a key of ARCHIVED_MODULES).
+    Converted weights are read from <root>/<env id>/<array>.npy, memory-mapped read-only, or from
+    <root>/<env id>.npz. The .npy files of AGENT_MODULES and ARCHIVED_MODULES are committed in weights/, re-run
+    convert when a module changes. Env ids that were not converted fall back to importing their module.
+    """
+
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = root
+        self._loaded = {}
+
+    def __contains__(self, env_id):
+        return _module_name(env_id) is not None or os.path.isdir(self._npy_dir(env_id)) or os.path.isfile(self._npz_path(env_id))
+
+    def __getitem__(self, env_id):
+        return self.load(env_id)
+
+    def _npy_dir(self, env_id):
+        return os.path.join(self.root, env_id)
+
+    def _npz_path(self, env_id):
+        return os.path.join(self.root, env_id + '.npz')
+
+    def arrays(self, env_id):
+        '''
+        :return: array name -> array, see ARRAYS
+        '''
+        if env_id not in self._loaded:
+            if os.path.isdir(self._npy_dir(env_id)):
+                arrays = {name: np.load(os.path.join(self._npy_dir(env_id), name + '.npy'), mmap_mode='r')
+                          for name in ARRAYS}
+            elif os.path.isfile(self._npz_path(env_id)):
+                with np.load(self._npz_path(env_id)) as npz:  # zipped, cannot be memory-mapped
+                    arrays = {name: npz[name] for name in ARRAYS}
+            else:
+                if _module_name(env_id) is None:
+                    raise KeyError(env_id)
+                module = importlib.import_module(__package__ + '.' + _module_name(env_id))
+                arrays = {name: getattr(module, name) for name in ARRAYS}
+            self._loaded[env_id] = arrays
+        return self._loaded[env_id]
+
+    def load(self, env_id):
+        '''
+        :return: (weights, biases) of the three dense layers, as expected by SmallReactivePolicy
+        '''
+        arrays = self.arrays(env_id)
+        return ([arrays[f'weights_{layer}_w'] for layer in LAYERS],
+                [arrays[f'weights_{layer}_b'] for layer in LAYERS])
+
+
+_default_store = None
+
+
+def _module_name(env_id):
+    return AGENT_MODULES.get(env_id, ARCHIVED_MODULES.get(env_id))
+
+
+def load_weights(env_id):
+    '''
+    :return: (weights, biases) of the pretrained policy of env_id, from the default WeightStore
+    '''
+    global _default_store
+    if _default_store is None:
+        _default_store = WeightStore()
+    return _default_store.load(env_id)
+
+
+def convert(env_ids=None, root=DEFAULT_ROOT, compressed=False):
+    '''
+    Write the weights of the agent modules as .npy files (or one .npz per env if compressed), so that
+    WeightStore no longer has to import the modules.
+    '''
+    for env_id in env_ids or list(AGENT_MODULES.keys()) + list(ARCHIVED_MODULES.keys()):
+        module = importlib.import_module(__package__ + '.' + _module_name(env_id))
+        arrays = {name: np.asarray(getattr(module, name)) for name in ARRAYS}
+        os.makedirs(root, exist_ok=True)
+        if compressed:
+            np.savez_compressed(os.path.join(root, env_id + '.npz'), **arrays)
+        else:
+            os.makedirs(os.path.join(root, env_id), exist_ok=True)
+            for name, array in arrays.items():
+                np.save(os.path.join(root, env_id, name + '.npy'), array)
+        print('Converted', env_id)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert the agent weight modules to .npy/.npz files.')
+    parser.add_argument('--envs', nargs='*', default=None)
+    parser.add_argument('--root', default=DEFAULT_ROOT)
+    parser.add_argument('--compressed', action='store_true', help='one .npz per env, which cannot be memory-mapped')
+    args = parser.parse_args()
+    convert(args.envs, args.root, args.compressed)
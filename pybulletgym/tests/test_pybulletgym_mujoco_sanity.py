@@ -10,9 +10,13 @@ for env_name in envs:
         print('[TESTING] ENV', env_name, '...')
         env = gym.make(env_name)
         #env.render(mode='human')
-        env.reset()
+        obs = env.reset()
+        if isinstance(obs, tuple):  # (obs, info) from the envs with the new reset API
+            obs = obs[0]
+        assert obs.dtype == env.observation_space.dtype and obs.shape == env.observation_space.shape
         #time.sleep(1)
-        env.step(np.random.random(env.action_space.shape))
+        obs = env.step(np.random.random(env.action_space.shape))[0]
+        assert obs.dtype == env.observation_space.dtype and obs.shape == env.observation_space.shape
         #time.sleep(1)
         env.close()
         print('[SUCCESS] ENV', env_name, '\n')
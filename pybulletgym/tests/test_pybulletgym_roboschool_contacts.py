@@ -0,0 +1,83 @@
+import sys
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.envs.roboschool.scenes.scene_bases import ContactCache
+
+
+def check_contact_cache(env_name, steps=60):
+    '''
+    Step a walker and check, after every step, the scene's contact cache against getContactPoints queries:
+    the contact points and normal-force sums of every part, and the feet contact flags.
+    '''
+    env = gym.make(env_name).unwrapped
+    env.reset(seed=7)
+    env.action_space.seed(7)
+    p, cache = env._p, env.scene.contacts
+    body_links = sorted(set((part.bodyIndex, part.bodyPartIndex) for part in env.parts.values()))
+    keys = ContactCache.keys(body_links)
+    assert len(set(keys.tolist())) == len(body_links)
+    np.testing.assert_array_equal(keys >> 32, [body for body, _ in body_links])
+    np.testing.assert_array_equal((keys & 0xffffffff) - 1, [link for _, link in body_links])
+
+    contacts = 0
+    for _ in range(steps):
+        env.step(env.action_space.sample())
+        world = p.getContactPoints()
+        forces = cache.normal_force_sums(keys)
+        for (body, link), force in zip(body_links, forces):
+            # the contacts of the part, on either side of the pair, seen from the part
+            raw = [(c[2], c[4], c[9]) for c in world if (c[1], c[3]) == (body, link)]
+            raw += [(c[1], c[3], c[9]) for c in world if (c[2], c[4]) == (body, link)]
+            cached = cache.points(body, link)
+            assert sorted(raw) == sorted(cached[['bodyB', 'linkB', 'force']].tolist())
+            np.testing.assert_allclose(force, sum(c[2] for c in raw))
+            # getContactPoints(bodyA=...) only finds the self-contacts of the part on the A side
+            queried = [(c[2], c[4], c[9]) for c in p.getContactPoints(bodyA=body, linkIndexA=link) if c[2] != body]
+            assert sorted(queried) == sorted(c for c in raw if c[0] != body)
+        for part in env.parts.values():
+            np.testing.assert_array_equal(part.contact_list(), cache.points(part.bodyIndex, part.bodyPartIndex))
+        raw_feet = [any((c[2], c[4]) in env.ground_ids for c in p.getContactPoints(bodyA=f.bodyIndex, linkIndexA=f.bodyPartIndex))
+                    for f in env.robot.feet]
+        np.testing.assert_array_equal(env.robot.feet_contact, raw_feet)
+        contacts += len(cache.get())
+    env.close()
+    assert contacts > 0, f'{env_name}: no contact in {steps} steps'
+    print(f'[SUCCESS] {env_name}: {contacts} cached contacts over {steps} steps')
+
+
+def check_mujoco_feet_contacts(env_name, steps=100):
+    '''
+    Check the feet contact flags of a MuJoCo walker, read from the contact cache, against getContactPoints queries.
+    '''
+    env = gym.make(env_name).unwrapped
+    env.seed(7)
+    env.reset()
+    p = env._p
+    rng = np.random.default_rng(7)
+    touching = 0
+    for _ in range(steps):
+        _, _, done, _, _ = env.step(rng.uniform(-1, 1, env.action_space.shape))
+        raw_feet = [any((c[2], c[4]) in env.ground_ids for c in p.getContactPoints(bodyA=f.bodies[f.bodyIndex], linkIndexA=f.bodyPartIndex))
+                    for f in env.robot.feet]
+        np.testing.assert_array_equal(env.robot.feet_contact, raw_feet)
+        touching += sum(raw_feet)
+        if done:
+            env.reset()
+    env.close()
+    assert touching > 0, f'{env_name}: no foot contact in {steps} steps'
+    print(f'[SUCCESS] {env_name}: {touching} foot contacts over {steps} steps')
+
+
+def test_contact_cache():
+    for env_name in ['HopperPyBulletEnv-v0', 'HumanoidPyBulletEnv-v0']:
+        check_contact_cache(env_name)
+
+
+def test_mujoco_feet_contacts():
+    check_mujoco_feet_contacts('AntMuJoCoEnv-v0')
+
+
+if __name__ == '__main__':
+    check_contact_cache(sys.argv[1] if len(sys.argv) > 1 else 'HumanoidPyBulletEnv-v0')
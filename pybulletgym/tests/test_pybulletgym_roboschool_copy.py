@@ -0,0 +1,32 @@
+import copy
+import pickle
+import sys
+
+import gym
+import pybulletgym  # required for the Bullet envs to be initialized
+
+
+def check_copy(env_name):
+    '''
+    Deep-copy and pickle an env that has not been reset yet, and check that the robot's cached boundary
+    conditions survive the round trip and stay read-only.
+    '''
+    env = gym.make(env_name).unwrapped
+    for clone in (copy.deepcopy(env), pickle.loads(pickle.dumps(env))):
+        assert clone.robot.boundary_conditions == env.robot.boundary_conditions
+        try:
+            clone.robot.boundary_conditions['link_masses'] = {}
+        except TypeError:
+            pass
+        else:
+            raise AssertionError(f'{env_name}: the boundary conditions of the copy can be modified')
+    print(f'[SUCCESS] {env_name}: deep-copied and pickled')
+
+
+def test_copy():
+    for env_name in ['HopperPyBulletEnv-v0', 'HumanoidPyBulletEnv-v0']:
+        check_copy(env_name)
+
+
+if __name__ == '__main__':
+    check_copy(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
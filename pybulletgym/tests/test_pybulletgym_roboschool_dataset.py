@@ -0,0 +1,113 @@
+import sys
+import tempfile
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.utils.dataset import DatasetReader, DatasetWriter
+
+
+def check_dataset(env_name, steps=500, shard_size=128, flush_every=16):
+    '''
+    Record random steps of the env into a dataset, reading it while it is written, and check the rows against
+    the observations and rewards the env returned.
+    '''
+    env = gym.make(env_name)
+    with tempfile.TemporaryDirectory() as directory:
+        writer = DatasetWriter(directory, shard_size=shard_size, flush_every=flush_every, contacts=True)
+        env.unwrapped.attach_recorder(writer)
+        obs, _ = env.reset(seed=7)
+        observations, rewards = [], []
+        reader = None
+        for step in range(steps):
+            observations.append(obs.copy())
+            obs, reward, terminated, truncated, _ = env.step(env.action_space.sample())
+            rewards.append(reward)
+            if terminated or truncated:
+                obs, _ = env.reset()
+            if step == steps // 2:
+                reader = DatasetReader(directory)
+                assert 0 < len(reader) <= step + 1
+                np.testing.assert_allclose(reader.column('observation'), observations[:len(reader)])
+        writer.close()
+        env.close()
+
+        assert reader.refresh() == steps
+        np.testing.assert_allclose(reader.column('observation'), observations)
+        np.testing.assert_allclose(reader.column('reward'), rewards, rtol=1e-6)
+        rows = np.random.default_rng(7).integers(steps, size=32)
+        np.testing.assert_allclose(reader.gather(rows, ['observation'])['observation'], np.array(observations)[rows])
+        reader.contacts(steps - 1)
+    print(f'[SUCCESS] {env_name}: {steps} rows in shards of {shard_size}')
+
+
+def check_dict_dataset(env_name, steps=20):
+    '''
+    Record pixel and state observations, stored in one column per key, and check them and the empty ranges.
+    '''
+    env = gym.make(env_name)
+    env.unwrapped.enable_pixel_observations(stack=2, proprioceptive=True, width=32, height=24, grayscale=True)
+    with tempfile.TemporaryDirectory() as directory:
+        with DatasetWriter(directory, shard_size=16, flush_every=4) as writer:
+            env.unwrapped.attach_recorder(writer)
+            obs, _ = env.reset(seed=7)
+            pixels, states = [], []
+            for _ in range(steps):
+                pixels.append(obs['pixels'].copy())
+                states.append(obs['state'].copy())
+                obs, _, terminated, truncated, _ = env.step(env.action_space.sample())
+                if terminated or truncated:
+                    obs, _ = env.reset()
+        env.close()
+
+        reader = DatasetReader(directory)
+        assert 'observation' not in reader.columns
+        np.testing.assert_array_equal(reader.column('observation_pixels'), pixels)
+        np.testing.assert_allclose(reader.column('observation_state'), states)
+        empty = reader.column('observation_pixels', steps, steps)
+        assert empty.shape == (0, 2, 24, 32) and empty.dtype == np.uint8
+        assert reader.column('reward', 5, 5).dtype == np.float32
+    print(f'[SUCCESS] {env_name}: {steps} rows of dict observations')
+
+
+def check_truncated_rows(env_name, max_episode_steps=5, episodes=4, shard_size=5):
+    '''
+    Record episodes cut by the TimeLimit wrapper, which the writer below it does not see, and check that the
+    last row of each one is marked truncated once the next reset arrives, also when that row sealed a shard.
+    '''
+    env = gym.make(env_name, max_episode_steps=max_episode_steps)
+    with tempfile.TemporaryDirectory() as directory:
+        with DatasetWriter(directory, shard_size=shard_size, flush_every=2) as writer:
+            env.unwrapped.attach_recorder(writer)
+            env.reset(seed=7)
+            for _ in range(episodes):
+                terminated = truncated = False
+                while not (terminated or truncated):
+                    _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+                assert truncated and not terminated
+                env.reset()
+        env.close()
+
+        reader = DatasetReader(directory)
+        expected = np.zeros(episodes * max_episode_steps, dtype=bool)
+        expected[max_episode_steps - 1::max_episode_steps] = True
+        np.testing.assert_array_equal(reader.column('truncated'), expected)
+        assert not reader.column('terminated').any()
+    print(f'[SUCCESS] {env_name}: {episodes} episodes truncated after {max_episode_steps} steps, in shards of {shard_size}')
+
+
+def test_dataset():
+    check_dataset('HopperPyBulletEnv-v0')
+
+
+def test_dict_dataset():
+    check_dict_dataset('HopperPyBulletEnv-v0')
+
+
+def test_truncated_rows():
+    for shard_size in [3, 5]:
+        check_truncated_rows('ReacherPyBulletEnv-v0', shard_size=shard_size)
+
+
+if __name__ == '__main__':
+    check_dataset(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
@@ -0,0 +1,65 @@
+import sys
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+
+
+def check_link_velocities(env_name, steps=20):
+    '''
+    Check that the linear velocity of every part, from the link snapshot or queried without it, is the linear
+    velocity of getLinkState: its vy is not the yaw rate that follows it in the returned tuple.
+    '''
+    env = gym.make(env_name)
+    env.reset(seed=7)
+    for _ in range(steps):
+        env.step(env.action_space.sample())
+    p = env.unwrapped._p
+    for part in env.unwrapped.robot.parts.values():
+        if part.bodyPartIndex == -1:
+            expected = p.getBaseVelocity(part.bodyIndex)[0]
+        else:
+            expected = p.getLinkState(part.bodyIndex, part.bodyPartIndex, computeLinkVelocity=1)[6]
+        np.testing.assert_allclose(part.get_linear_velocity(), expected, atol=1e-12)
+        snapshot, part.snapshot = part.snapshot, None
+        np.testing.assert_allclose(part.get_linear_velocity(), expected, atol=1e-12)
+        np.testing.assert_allclose(part.speed(), expected, atol=1e-12)
+        part.snapshot = snapshot
+    env.close()
+    print(f'[SUCCESS] {env_name}: linear velocities of {len(env.unwrapped.robot.parts)} parts')
+
+
+def check_read_only_parts(env_name, steps=5):
+    '''
+    Check that the views the parts return into the link snapshot cannot be written to, so that no caller
+    changes what the later readers of the same step see.
+    '''
+    env = gym.make(env_name)
+    env.reset(seed=7)
+    for _ in range(steps):
+        env.step(env.action_space.sample())
+    for part in env.unwrapped.robot.parts.values():
+        position = part.current_position().copy()
+        for accessor in [part.get_pose, part.current_position, part.current_orientation, part.speed,
+                         part.get_linear_velocity, part.get_angular_velocity]:
+            try:
+                accessor()[0] += 5
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f'{part.name}.{accessor.__name__}() returned a writable view')
+        np.testing.assert_array_equal(part.current_position(), position)
+    env.close()
+    print(f'[SUCCESS] {env_name}: the views of {len(env.unwrapped.robot.parts)} parts are read-only')
+
+
+def test_link_velocities():
+    check_link_velocities('AntPyBulletEnv-v0')
+
+
+def test_read_only_parts():
+    check_read_only_parts('HopperPyBulletEnv-v0')
+
+
+if __name__ == '__main__':
+    check_link_velocities(sys.argv[1] if len(sys.argv) > 1 else 'AntPyBulletEnv-v0')
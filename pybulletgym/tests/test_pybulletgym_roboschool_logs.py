@@ -0,0 +1,132 @@
+import sys
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.utils.logging import LazyLogs, contact_records, joint_state_records, kinematics_records
+
+
+def check_log_modes(env_name, steps=30):
+    '''
+    Step envs in the 'off', 'lazy' and 'eager' log modes with the same seed and actions, and check that 'off'
+    leaves the logs out and that the lazy logs, rendered once all the steps are done, are the eager logs
+    of their step. These are generated in the lazy env itself: the order of the contact points is not the same
+    in two physics clients.
+    '''
+    envs = {}
+    for log_mode in ['off', 'lazy', 'eager']:
+        envs[log_mode] = gym.make(env_name).unwrapped
+        envs[log_mode].set_log_mode(log_mode)
+    infos = {log_mode: [env.reset(seed=7)[1]] for log_mode, env in envs.items()}
+    lazy_env = envs['lazy']
+    eager_logs = []
+    actions = np.random.default_rng(7).uniform(-1, 1, (steps,) + lazy_env.action_space.shape).astype(np.float32)
+    for action in actions:
+        for log_mode, env in envs.items():
+            infos[log_mode].append(env.step(action)[4])
+        lazy_env.set_log_mode('eager')
+        eager_logs.append(lazy_env._generate_logs())
+        lazy_env.set_log_mode('lazy')
+    for env in envs.values():
+        env.close()
+
+    assert all('logs' not in info for info in infos['off'])
+    assert all(isinstance(info['logs'], list) for info in infos['eager'])
+    for info, logs in zip(infos['lazy'][1:], eager_logs):
+        assert isinstance(info['logs'], LazyLogs)
+        assert info['logs'] == logs
+    print(f'[SUCCESS] {env_name}: lazy logs of {steps} steps render to the eager logs')
+
+
+def check_records(env_name, max_steps=200):
+    '''
+    Step the env until the robot touches the ground, then check the structured log records against the raw
+    pybullet queries they are built from, and the records captured by the lazy logs of that step against them.
+    '''
+    env = gym.make(env_name).unwrapped
+    env.set_log_mode('lazy')
+    env.reset(seed=7)
+    env.action_space.seed(7)
+    for _ in range(max_steps):
+        logs = env.step(env.action_space.sample())[4]['logs']
+        if len(logs.state['contacts']):
+            break
+    p = env._p
+
+    points = p.getContactPoints()
+    assert len(points) > 0, f'{env_name}: no contact to check after {max_steps} steps'
+    records = contact_records(points)
+    for record, point in zip(records, points):
+        assert (record['bodyA'], record['linkA'], record['bodyB'], record['linkB']) == (point[1], point[3], point[2], point[4])
+        np.testing.assert_array_equal(record['position'], point[5])
+        np.testing.assert_array_equal(record['normal'], point[7])
+        assert record['force'] == point[9]
+    np.testing.assert_array_equal(logs.state['contacts'], records)
+
+    parts = logs.state['parts']
+    kinematics = kinematics_records(parts)
+    for record, part in zip(kinematics, parts.values()):
+        assert (record['body'], record['link']) == (part.bodyIndex, part.bodyPartIndex)
+        np.testing.assert_allclose(record['position'], part.current_position())
+        np.testing.assert_allclose(record['linear_velocity'], part.get_linear_velocity())
+    np.testing.assert_array_equal(logs.state['kinematics'], kinematics)
+
+    robot_id = env.robot_body_ids()[0]
+    joint_states = p.getJointStates(robot_id, list(range(p.getNumJoints(robot_id))))
+    joints = joint_state_records(robot_id, joint_states)
+    np.testing.assert_array_equal(joints['position'], [s[0] for s in joint_states])
+    np.testing.assert_array_equal(joints['velocity'], [s[1] for s in joint_states])
+    np.testing.assert_array_equal(joints['force'], [s[3] for s in joint_states])
+    env.close()
+    print(f'[SUCCESS] {env_name}: {len(records)} contact, {len(kinematics)} kinematics and {len(joints)} joint records')
+
+
+def check_name_index(env_name, max_steps=200):
+    '''
+    Check that the contact logs of an env with obfuscated names only show the swapped names, looked up in the
+    (body, link) index built at reset without querying the physics server.
+    '''
+    env = gym.make(env_name).unwrapped
+    env.obfuscate_logs = True
+    env.set_log_mode('lazy')
+    env.reset(seed=7)
+    env.action_space.seed(7)
+    for _ in range(max_steps):
+        logs = env.step(env.action_space.sample())[4]['logs']
+        if len(logs.state['contacts']):
+            break
+    assert len(logs.state['contacts']) > 0, f'{env_name}: no contact to check after {max_steps} steps'
+
+    names = logs.state['names']
+    for part_name, part in env.robot.parts.items():
+        if 'link' in part_name:
+            continue  # bookkeeping parts are not logged, see _logged_parts
+        assert names.link(part.bodyIndex, part.bodyPartIndex) == env.nameSwap[part_name]
+
+    get_body_info, calls = env._p.getBodyInfo, []
+    env._p.getBodyInfo = lambda *args, **kwargs: calls.append(args) or get_body_info(*args, **kwargs)
+    contact_logs = logs.render()[1]
+    del env._p.getBodyInfo
+    assert not calls, f'{env_name}: {len(calls)} getBodyInfo calls to render the contacts'
+    swapped = {name for real_name, name in env.nameSwap.items() if real_name != name}
+    for line in contact_logs[::4]:
+        body_a, link_a, body_b, link_b = line[len('Contact between '):].replace("'s link", '').replace(' and', '').split()
+        assert {link_a, link_b} <= swapped, line
+    env.close()
+    print(f'[SUCCESS] {env_name}: {len(logs.state["contacts"])} contacts logged with obfuscated names')
+
+
+def test_log_modes():
+    check_log_modes('HopperPyBulletEnv-v0')
+
+
+def test_records():
+    check_records('HopperPyBulletEnv-v0')
+
+
+def test_name_index():
+    check_name_index('HopperPyBulletEnv-v0')
+
+
+if __name__ == '__main__':
+    check_log_modes(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
@@ -0,0 +1,36 @@
+import sys
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+
+
+def check_pixel_observations(env_name, stack=4, steps=10):
+    '''
+    Step the env in pixel observation mode and check the declared space and that the stacked frames are the last
+    rendered ones, oldest first.
+    '''
+    env = gym.make(env_name)
+    env.unwrapped.enable_pixel_observations(stack=stack, proprioceptive=True, width=64, height=48, grayscale=True)
+    assert env.observation_space['pixels'].shape == (stack, 48, 64)
+
+    obs, _ = env.reset(seed=7)
+    assert env.observation_space['pixels'].contains(obs['pixels'])
+    frames = [obs['pixels'][-1].copy()]
+    assert all(np.array_equal(frame, frames[0]) for frame in obs['pixels'])
+    for _ in range(steps):
+        obs = env.step(env.action_space.sample())[0]
+        frames.append(obs['pixels'][-1].copy())
+        expected = ([frames[0]] * stack + frames)[-stack:]
+        assert all(np.array_equal(a, b) for a, b in zip(obs['pixels'], expected))
+        assert obs['state'].shape == env.unwrapped.robot.observation_space.shape
+    env.close()
+    print(f'[SUCCESS] {env_name}: {steps} steps of {stack} stacked frames')
+
+
+def test_pixel_observations():
+    check_pixel_observations('HopperPyBulletEnv-v0')
+
+
+if __name__ == '__main__':
+    check_pixel_observations(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
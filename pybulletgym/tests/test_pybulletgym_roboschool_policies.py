@@ -0,0 +1,82 @@
+import sys
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.tests.roboschool.agents.policies import (
+    BatchedSmallReactivePolicy, MultiSmallReactivePolicy, SmallReactivePolicy)
+from pybulletgym.tests.roboschool.agents.weight_store import load_weights
+
+
+def observations(env_name, steps=64):
+    '''
+    :return: (steps, obs_dim) observations of an episode of the env driven by its pretrained policy
+    '''
+    env = gym.make(env_name)
+    policy = SmallReactivePolicy(env.observation_space, env.action_space, *load_weights(env_name))
+    obs, _ = env.reset(seed=7)
+    rows = []
+    for _ in range(steps):
+        rows.append(obs.copy())
+        obs, _, terminated, truncated, _ = env.step(policy.act(obs))
+        if terminated or truncated:
+            obs, _ = env.reset()
+    env.close()
+    return np.array(rows)
+
+
+def reference_actions(weights, biases, obs):
+    policy = SmallReactivePolicy(None, None, weights, biases)
+    return np.array([policy.act(row) for row in obs])
+
+
+def check_batched_policy(env_name, rtol=1e-5, atol=1e-5):
+    '''
+    Check that BatchedSmallReactivePolicy acts like SmallReactivePolicy on every row, single observations included.
+    '''
+    weights, biases = load_weights(env_name)
+    obs = observations(env_name)
+    expected = reference_actions(weights, biases, obs)
+    policy = BatchedSmallReactivePolicy(weights, biases)
+    actions = policy.act(obs)
+    assert actions.shape == expected.shape and actions.dtype == np.float32
+    np.testing.assert_allclose(actions, expected, rtol=rtol, atol=atol)
+    np.testing.assert_allclose(policy.act(obs[:5]), expected[:5], rtol=rtol, atol=atol)  # another batch size
+    np.testing.assert_allclose(policy.act(obs[3]), expected[3], rtol=rtol, atol=atol)
+    print(f'[SUCCESS] {env_name}: batched actions match, max error {np.abs(actions - expected).max():.2e}')
+
+
+def check_multi_policy(env_names, rtol=1e-5, atol=1e-5):
+    '''
+    Check that MultiSmallReactivePolicy acts like the SmallReactivePolicy of every row, in blocks and with
+    interleaved policy_ids, and with the stacked weights of policies of the same shapes.
+    '''
+    weights_and_biases = [load_weights(env_name) for env_name in env_names]
+    obs = [observations(env_name, steps=8) for env_name in env_names]
+    expected = [reference_actions(w, b, o) for (w, b), o in zip(weights_and_biases, obs)]
+    policy = MultiSmallReactivePolicy(weights_and_biases)
+    batch = np.zeros((8 * len(env_names), policy.obs_dim), dtype=np.float32)
+    padded = np.zeros((8 * len(env_names), policy.action_dim), dtype=np.float32)  # the missing actions stay zero
+    for k, (o, e) in enumerate(zip(obs, expected)):
+        batch[8 * k:8 * (k + 1), :o.shape[1]] = o
+        padded[8 * k:8 * (k + 1), :e.shape[1]] = e
+
+    np.testing.assert_allclose(policy.act(batch), padded, rtol=rtol, atol=atol)
+    order = np.random.default_rng(7).permutation(len(batch))
+    policy_ids = np.repeat(np.arange(len(env_names)), 8)[order]
+    np.testing.assert_allclose(policy.act(batch[order], policy_ids), padded[order], rtol=rtol, atol=atol)
+    print(f'[SUCCESS] {env_names}: multi-policy actions match, stacked={policy.stacked}')
+
+
+def test_batched_policy():
+    for env_name in ['HopperPyBulletEnv-v0', 'HumanoidPyBulletEnv-v0']:
+        check_batched_policy(env_name)
+
+
+def test_multi_policy():
+    check_multi_policy(['HopperPyBulletEnv-v0', 'Walker2DPyBulletEnv-v0', 'HalfCheetahPyBulletEnv-v0'])
+    check_multi_policy(['HopperPyBulletEnv-v0', 'HopperPyBulletEnv-v0'])
+
+
+if __name__ == '__main__':
+    check_batched_policy(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
@@ -0,0 +1,48 @@
+import sys
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.envs.roboschool.envs.env_bases import BaseBulletEnv
+
+
+def check_profiler(env_name, steps=20, renders=3):
+    '''
+    Profile the reset and steps of an env and check the number of times every phase was timed, that the
+    histograms hold all of them and that the physics-server calls are counted in the phase they were made in.
+    '''
+    env = gym.make(env_name).unwrapped
+    env.enable_profiler(in_info=True)
+    env.reset(seed=7)
+    for _ in range(steps):
+        _, _, _, _, info = env.step(env.action_space.sample())
+        assert {'apply_action', 'global_step', 'rewards_and_contacts'} <= set(info['profile'])
+    for _ in range(renders):
+        env.render(mode='rgb_array')
+    report = env.profile_report()
+    env.close()
+
+    expected = {'apply_action': steps, 'global_step': steps, 'rewards_and_contacts': steps, '_render': renders}
+    if isinstance(env, BaseBulletEnv):  # unlike the mujoco envs, the roboschool envs time their resets and have logs
+        expected['reset'] = 1
+        if env.log_mode != 'off':
+            expected['_generate_logs'] = steps + 1  # the reset logs included
+    for phase, count in expected.items():
+        assert report[phase]['count'] == count, f"{env_name}: {phase} timed {report[phase]['count']} times, not {count}"
+    assert report['calc_state']['count'] >= steps
+    for phase, stats in report.items():
+        assert stats['histogram'].sum() == stats['count'], phase
+        assert 0 <= stats['min'] <= stats['mean'] <= stats['max'], phase
+    assert report['global_step']['api_calls'].get('stepSimulation', 0) >= steps
+    assert 'stepSimulation' not in report['calc_state']['api_calls']
+    assert report['_render']['api_calls'].get('getCameraImage', 0) == renders
+    print(f'[SUCCESS] {env_name}: ' + ', '.join(f"{phase} {stats['count']}" for phase, stats in sorted(report.items())))
+
+
+def test_profiler():
+    for env_name in ['HopperPyBulletEnv-v0', 'HopperMuJoCoEnv-v0']:
+        check_profiler(env_name)
+
+
+if __name__ == '__main__':
+    check_profiler(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
@@ -0,0 +1,82 @@
+import os
+import sys
+import tempfile
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.utils.recording import EpisodeRecorder
+
+
+def check_recording(env_name, backend='thread', steps=10, every=2):
+    '''
+    Record a short episode of the env every few steps, then read back its episode_XXXXXX.npz and check the
+    frames and step data against what the env returned. The reset record has no action nor reward.
+    '''
+    env = gym.make(env_name)
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = EpisodeRecorder(directory, every=every, policy='block', backend=backend)
+        env.unwrapped.attach_recorder(recorder)
+        obs, _ = env.reset(seed=7)
+        observations, actions, rewards = [obs.copy()], [], []
+        for step in range(1, steps + 1):
+            action = env.action_space.sample()
+            obs, reward, _, _, _ = env.step(action)
+            if step % every == 0:
+                observations.append(obs.copy())
+                actions.append(action)
+                rewards.append(reward)
+        recorder.close()
+        env.close()
+
+        assert sorted(os.listdir(directory)) == ['episode_000000.npz']
+        with np.load(os.path.join(directory, 'episode_000000.npz')) as episode:
+            np.testing.assert_array_equal(episode['step'], np.arange(0, steps + 1, every))
+            np.testing.assert_allclose(episode['observation'], observations)
+            np.testing.assert_allclose(episode['action'], actions)
+            np.testing.assert_allclose(episode['reward'], rewards, rtol=1e-6)
+            assert len(episode['terminated']) == len(episode['truncated']) == len(observations) - 1
+            frames = episode['frame']
+            assert frames.shape[0] == len(observations) and frames.shape[-1] == 3 and frames.dtype == np.uint8
+    assert recorder.dropped == 0
+    print(f'[SUCCESS] {env_name}: {len(observations)} steps recorded with the {backend} backend')
+
+
+def check_truncated_records(env_name, backend='thread', max_episode_steps=5, episodes=3):
+    '''
+    Record episodes cut by the TimeLimit wrapper, which the recorder below it does not see, and check that the
+    last step record of each one is marked truncated once the next reset arrives.
+    '''
+    env = gym.make(env_name, max_episode_steps=max_episode_steps)
+    with tempfile.TemporaryDirectory() as directory:
+        with EpisodeRecorder(directory, frames=False, policy='block', backend=backend) as recorder:
+            env.unwrapped.attach_recorder(recorder)
+            env.reset(seed=7)
+            for _ in range(episodes):
+                truncated = False
+                while not truncated:
+                    _, _, _, truncated, _ = env.step(env.action_space.sample())
+                env.reset()
+        env.close()
+
+        expected = np.zeros(max_episode_steps, dtype=bool)
+        expected[-1] = True
+        for i in range(episodes):
+            with np.load(os.path.join(directory, f'episode_{i:06d}.npz')) as episode:
+                np.testing.assert_array_equal(episode['truncated'], expected)
+                assert not episode['terminated'].any()
+    print(f'[SUCCESS] {env_name}: {episodes} episodes truncated after {max_episode_steps} steps with the {backend} backend')
+
+
+def test_recording():
+    for backend in ['thread', 'process']:
+        check_recording('HopperPyBulletEnv-v0', backend)
+
+
+def test_truncated_records():
+    for backend in ['thread', 'process']:
+        check_truncated_records('ReacherPyBulletEnv-v0', backend)
+
+
+if __name__ == '__main__':
+    check_recording(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
@@ -0,0 +1,51 @@
+import sys
+
+import gym
+import numpy as np
+import pybullet
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.utils.rendering import GRAY_WEIGHTS
+
+
+def check_frame_renderer(env_name, width=64, height=48, downsample=2):
+    '''
+    Render rgb_array frames of an env in DIRECT mode and check their shapes, that they are written into the
+    same preallocated buffers from frame to frame and that the grayscale, downsampled frames are converted from
+    the RGB ones.
+    '''
+    env = gym.make(env_name).unwrapped
+    env.configure_rendering(width=width, height=height)
+    env.reset(seed=7)
+    renderer = env.frame_renderer
+    frame = env.render(mode='rgb_array')
+    assert frame.shape == (height, width, 3) and frame.dtype == np.uint8
+    assert frame.any(), f'{env_name}: black frame'
+    assert renderer._renderer_for(env._p) == pybullet.ER_TINY_RENDERER
+    projection = renderer.projection_matrix(env._p)
+
+    env.step(env.action_space.sample())
+    assert env.render(mode='rgb_array') is frame
+    assert renderer.projection_matrix(env._p) is projection
+
+    env.configure_rendering(grayscale=True, downsample=downsample)
+    gray = env.render(mode='rgb_array')
+    shape = (-(-height // downsample), -(-width // downsample))
+    assert gray.shape == shape and gray.dtype == np.uint8
+    assert env.render(mode='rgb_array') is gray
+    rgb = renderer.rgb[::downsample, ::downsample].astype(np.float32)
+    expected = sum(np.float32(weight) * rgb[:, :, channel] for channel, weight in enumerate(GRAY_WEIGHTS))
+    np.testing.assert_allclose(gray, expected.astype(np.uint8), atol=1)
+
+    env.configure_rendering(fov=45)
+    env.render(mode='rgb_array')
+    assert renderer.projection_matrix(env._p) is not projection
+    env.close()
+    print(f'[SUCCESS] {env_name}: {frame.shape} rgb and {gray.shape} grayscale frames')
+
+
+def test_frame_renderer():
+    check_frame_renderer('HopperPyBulletEnv-v0')
+
+
+if __name__ == '__main__':
+    check_frame_renderer(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
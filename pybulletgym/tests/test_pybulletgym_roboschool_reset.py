@@ -0,0 +1,94 @@
+import sys
+import time
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+
+
+def check_constant_resets(env_name, episodes, window=100, slowdown=2.0):
+    '''
+    Reset the env over many short episodes and check that the number of bodies in the world
+    and the reset time do not grow, i.e. that the robot is loaded once and then only restored.
+    '''
+    env = gym.make(env_name)
+    env.reset(seed=7)
+    p = env.unwrapped._p
+    num_bodies = p.getNumBodies()
+
+    durations = []
+    for episode in range(episodes):
+        env.step(env.action_space.sample())
+        start = time.perf_counter()
+        env.reset()
+        durations.append(time.perf_counter() - start)
+        assert p.getNumBodies() == num_bodies, \
+            f'{env_name}: {p.getNumBodies()} bodies after {episode + 1} resets, {num_bodies} after the first one'
+    env.close()
+
+    first, last = np.median(durations[:window]), np.median(durations[-window:])
+    assert last <= slowdown * first, \
+        f'{env_name}: median reset time went from {first * 1000:.2f} ms to {last * 1000:.2f} ms'
+    print(f'[SUCCESS] {env_name}: {num_bodies} bodies, reset {first * 1000:.2f} ms -> {last * 1000:.2f} ms over {episodes} episodes')
+
+
+def check_pooled_resets(env_name, size, episodes):
+    '''
+    Reset the env from a pool of initial states and check that every reset lands on one of them:
+    the observation is a pooled one and matches the state the physics server was restored to.
+    '''
+    env = gym.make(env_name)
+    env.unwrapped.enable_reset_pool(size)
+    env.reset(seed=7)
+    pooled = [entry[2] for entry in env.unwrapped.reset_pool.entries]
+    assert len(pooled) == size
+    assert all(s.shape == env.observation_space.shape for s in pooled), f'{env_name}: pooled states of the wrong shape'
+
+    for episode in range(episodes):
+        for _ in range(10):
+            env.step(env.action_space.sample())
+        obs, _ = env.reset()
+        assert any(np.array_equal(obs, s) for s in pooled), f'{env_name}: reset {episode} is not a pooled state'
+        np.testing.assert_allclose(obs, env.unwrapped.robot.calc_state(), atol=1e-6)
+    env.close()
+    print(f'[SUCCESS] {env_name}: {episodes} resets from a pool of {size} initial states')
+
+
+def check_scene_timestep(env_name, timestep, frame_skip, env_kwargs=None):
+    '''
+    Check the physics timestep and number of substeps per env step the scene of the env sets up.
+    :param env_kwargs: arguments of the env, e.g. its own timestep and frame_skip
+    '''
+    env = gym.make(env_name, **(env_kwargs or {}))
+    env.reset(seed=7)
+    parameters = env.unwrapped._p.getPhysicsEngineParameters()
+    env.close()
+    assert parameters['numSubSteps'] == frame_skip, f"{env_name}: {parameters['numSubSteps']} substeps, not {frame_skip}"
+    np.testing.assert_allclose(parameters['fixedTimeStep'], timestep * frame_skip)
+    print(f'[SUCCESS] {env_name}: {frame_skip} substeps of {timestep:.6f} s')
+
+
+def test_urdf_robot_resets_are_constant():
+    check_constant_resets('AtlasPyBulletEnv-v0', episodes=2000)
+
+
+def test_pooled_resets():
+    for env_name in ['ReacherPyBulletEnv-v0', 'InvertedPendulumPyBulletEnv-v0', 'InvertedDoublePendulumPyBulletEnv-v0']:
+        check_pooled_resets(env_name, size=8, episodes=50)
+    for env_name in ['PusherPyBulletEnv-v0', 'StrikerPyBulletEnv-v0', 'ThrowerPyBulletEnv-v0']:
+        check_pooled_resets(env_name, size=4, episodes=10)
+
+
+def test_scene_timesteps():
+    check_scene_timestep('AtlasPyBulletEnv-v0', 0.0165 / 8, 8)
+    check_scene_timestep('HopperPyBulletEnv-v0', 0.0166, 1)
+    check_scene_timestep('HumanoidFlagrunPyBulletEnv-v0', 0.0166, 1)
+    check_scene_timestep('InvertedPendulumPyBulletEnv-v0', 0.01, 2, {'timestep': 0.01, 'frame_skip': 2})
+    for env_name in ['PusherPyBulletEnv-v0', 'StrikerPyBulletEnv-v0', 'ThrowerPyBulletEnv-v0']:
+        check_scene_timestep(env_name, 0.002, 5)
+    check_scene_timestep('ReacherPyBulletEnv-v0', 0.0165, 1)
+
+
+if __name__ == '__main__':
+    check_constant_resets(sys.argv[1] if len(sys.argv) > 1 else 'AtlasPyBulletEnv-v0',
+                          episodes=int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
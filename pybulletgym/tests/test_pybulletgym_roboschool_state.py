@@ -0,0 +1,121 @@
+import multiprocessing as mp
+import sys
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.envs.subproc_vector_env import SubprocVectorEnv
+
+
+def check_state_roundtrip(env_name, steps_before=20, steps_after=20, atol=1e-4):
+    '''
+    Snapshot the env in the middle of an episode, replay the same actions from the bytes of the snapshot
+    and check that the episode goes the same way.
+    '''
+    env = gym.make(env_name)
+    env.unwrapped.enable_sorted_pairs()
+    env.reset(seed=7)
+    env.action_space.seed(7)
+    for _ in range(steps_before):
+        env.step(env.action_space.sample())
+
+    data = env.unwrapped.get_state(serializable=True).to_bytes()
+    actions = [env.action_space.sample() for _ in range(steps_after)]
+    first = [env.step(a)[:2] for a in actions]
+    potential = env.unwrapped.potential
+
+    env.unwrapped.set_state(data)
+    second = [env.step(a)[:2] for a in actions]
+    env.close()
+
+    for (obs1, r1), (obs2, r2) in zip(first, second):
+        np.testing.assert_allclose(obs1, obs2, atol=atol)
+        np.testing.assert_allclose(r1, r2, atol=atol)
+    np.testing.assert_allclose(potential, env.unwrapped.potential, atol=atol)
+    print(f'[SUCCESS] {env_name}: state of {len(data)} bytes replayed over {steps_after} steps')
+
+
+def test_state_roundtrip():
+    for env_name in ['ReacherPyBulletEnv-v0', 'InvertedPendulumSwingupPyBulletEnv-v0', 'HopperPyBulletEnv-v0',
+                     'HumanoidFlagrunHarderPyBulletEnv-v0']:
+        check_state_roundtrip(env_name)
+
+
+def _episode(env_name, steps, snapshot_at, conn):
+    env = gym.make(env_name)
+    env.unwrapped.enable_sorted_pairs()
+    env.reset(seed=7)
+    env.action_space.seed(7)
+    observations = []
+    for t in range(steps):
+        if t == snapshot_at:
+            env.unwrapped.get_state(serializable=True).to_bytes()
+        observations.append(env.step(env.action_space.sample())[0])
+    env.close()
+    conn.send(np.array(observations))
+
+
+def check_snapshot_is_read_only(env_name, steps=200, snapshot_at=20):
+    '''
+    Run the same episode twice, taking a snapshot in the middle of one of them, and check that the snapshot
+    did not change the episode. Each episode runs in a process forked from this one, with sorted broadphase
+    pairs: in their default order, two runs of the same episode without any snapshot already drift apart.
+    '''
+    ctx = mp.get_context('fork')
+    pipes, processes = [], []
+    for at in [None, snapshot_at]:
+        parent, child = ctx.Pipe()
+        pipes.append(parent)
+        processes.append(ctx.Process(target=_episode, args=(env_name, steps, at, child)))
+    for process in processes:
+        process.start()
+    episodes = [parent.recv() for parent in pipes]
+    for process in processes:
+        process.join()
+    np.testing.assert_array_equal(episodes[0], episodes[1])
+    print(f'[SUCCESS] {env_name}: snapshot at step {snapshot_at} left the {steps} steps unchanged')
+
+
+def test_snapshot_is_read_only():
+    for env_name in ['HumanoidPyBulletEnv-v0', 'AntPyBulletEnv-v0', 'Walker2DPyBulletEnv-v0']:
+        check_snapshot_is_read_only(env_name)
+
+
+def check_fork_and_evaluate(env_name, num_envs=2, num_candidates=6, horizon=10, atol=1e-4):
+    '''
+    Broadcast the state of a local env to worker envs and check that their rollouts of random action
+    sequences give the same returns as rolling them out locally.
+    '''
+    env = gym.make(env_name)
+    env.reset(seed=7)
+    env.action_space.seed(7)
+    for _ in range(10):
+        env.step(env.action_space.sample())
+    state = env.unwrapped.get_state(serializable=True)
+    action_sequences = np.random.default_rng(7).uniform(-1, 1, (num_candidates, horizon) + env.action_space.shape)
+
+    vector_env = SubprocVectorEnv(env_name, num_envs)
+    returns, final_observations, terminated = vector_env.rollout(state, action_sequences)
+    vector_env.close()
+
+    for j, action_sequence in enumerate(action_sequences):
+        env.unwrapped.set_state(state)
+        total = 0.0
+        for a in action_sequence.astype(np.float32):
+            obs, reward, term, _, _ = env.unwrapped.step(a)
+            total += reward
+            if term:
+                break
+        np.testing.assert_allclose(returns[j], total, atol=atol, rtol=1e-5)
+        np.testing.assert_allclose(final_observations[j], obs, atol=atol)
+        assert terminated[j] == term
+    env.close()
+    print(f'[SUCCESS] {env_name}: {num_candidates} rollouts of {horizon} steps over {num_envs} workers')
+
+
+def test_fork_and_evaluate():
+    check_fork_and_evaluate('HopperPyBulletEnv-v0')
+
+
+if __name__ == '__main__':
+    check_state_roundtrip(sys.argv[1] if len(sys.argv) > 1 else 'HumanoidFlagrunHarderPyBulletEnv-v0')
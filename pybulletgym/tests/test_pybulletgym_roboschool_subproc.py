@@ -0,0 +1,197 @@
+import functools
+import os
+import signal
+import sys
+import threading
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.envs.subproc_vector_env import SubprocVectorEnv, WorkerError
+
+
+def check_shared_buffers(env_name, num_envs=4, envs_per_worker=2, steps=30, atol=1e-5):
+    '''
+    Reset and step the envs of a SubprocVectorEnv through its shared buffers, and check them against single envs
+    with the same seeds and actions.
+    '''
+    vector_env = SubprocVectorEnv(env_name, num_envs, envs_per_worker=envs_per_worker, auto_reset=False)
+    observations, infos = vector_env.reset(seed=7)
+    assert len(infos) == num_envs
+    envs = [gym.make(env_name) for _ in range(num_envs)]
+    np.testing.assert_allclose(observations, [env.reset(seed=7 + i)[0] for i, env in enumerate(envs)], atol=atol)
+
+    actions = np.random.default_rng(7).uniform(-1, 1, (steps,) + vector_env.action_space.shape).astype(np.float32)
+    for action in actions:
+        observations, rewards, terminated, truncated, infos = vector_env.step(action)
+        assert len(infos) == num_envs
+        for i, env in enumerate(envs):
+            obs, reward, term, trunc, _ = env.step(action[i])
+            np.testing.assert_allclose(observations[i], obs, atol=atol)
+            np.testing.assert_allclose(rewards[i], reward, atol=atol, rtol=1e-5)
+            assert terminated[i] == term and truncated[i] == trunc
+        if terminated.any() or truncated.any():
+            break
+    vector_env.close()
+    for env in envs:
+        env.close()
+    print(f'[SUCCESS] {env_name}: {num_envs} envs stepped through the shared buffers')
+
+
+class _FailingInWorkers:
+    """
+    Makes the env in the parent process, for its spaces, and raises in the workers.
+    """
+
+    def __init__(self, env_name):
+        self.env_name = env_name
+        self.parent_pid = os.getpid()
+
+    def __call__(self):
+        if os.getpid() != self.parent_pid:
+            raise ValueError(f'{self.env_name} cannot be made in a worker')
+        return gym.make(self.env_name)
+
+
+def check_worker_failures(env_name):
+    '''
+    Check that the parent raises a WorkerError instead of waiting forever when a worker raises, or is killed.
+    '''
+    failing = SubprocVectorEnv(_FailingInWorkers(env_name), 2)
+    killed = SubprocVectorEnv(env_name, 2)
+    killed.reset(seed=7)
+    os.kill(killed.processes[1].pid, signal.SIGKILL)
+    for vector_env in [failing, killed]:
+        try:
+            vector_env.reset(seed=7)
+            vector_env.step(np.zeros(vector_env.action_space.shape))
+        except WorkerError as e:
+            print(f'[SUCCESS] {env_name}: {str(e).splitlines()[0]}')
+        else:
+            raise AssertionError(f'{env_name}: the failure of a worker went unnoticed')
+        finally:
+            vector_env.close()
+
+
+class _FailingBesideLargeInfos(gym.Wrapper):
+    """
+    The env seeded with fail_seed raises on step, the others reply with infos larger than a pipe buffer.
+    """
+
+    def __init__(self, env_name, fail_seed):
+        super().__init__(gym.make(env_name))
+        self.fail_seed = fail_seed
+        self.seed_ = None
+
+    def reset(self, **kwargs):
+        self.seed_ = kwargs.get('seed')
+        return self.env.reset(**kwargs)
+
+    def step(self, action):
+        if self.seed_ == self.fail_seed:
+            raise ValueError('failing step')
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        info['payload'] = np.zeros(2**22)
+        return obs, reward, terminated, truncated, info
+
+
+def _make_failing_beside_large_infos():
+    return _FailingBesideLargeInfos('HopperPyBulletEnv-v0', fail_seed=7)
+
+
+def check_close_after_failure(timeout=60):
+    '''
+    Check that close returns after a WorkerError while another worker is blocked sending a large reply.
+    '''
+    vector_env = SubprocVectorEnv(_make_failing_beside_large_infos, 2)
+    vector_env.reset(seed=7)
+    try:
+        vector_env.step(np.zeros(vector_env.action_space.shape))
+    except WorkerError:
+        pass
+    else:
+        raise AssertionError('the failure of worker 0 went unnoticed')
+    closing = threading.Thread(target=vector_env.close, daemon=True)
+    closing.start()
+    closing.join(timeout)
+    assert not closing.is_alive(), f'close did not return within {timeout}s'
+    assert not any(process.is_alive() for process in vector_env.processes)
+    print('[SUCCESS] closed after a WorkerError beside a large reply')
+
+
+def _make_pixels(proprioceptive):
+    env = gym.make('HopperPyBulletEnv-v0')
+    env.unwrapped.enable_pixel_observations(stack=2, proprioceptive=proprioceptive, width=32, height=24)
+    return env
+
+
+def _make_tuple_observations():
+    env = gym.make('HopperPyBulletEnv-v0')
+    env.observation_space = gym.spaces.Tuple((env.observation_space, env.observation_space))
+    return env
+
+
+def check_pixel_buffers(proprioceptive, num_envs=2, steps=5):
+    '''
+    Reset and step envs with (stack, H, W, 3) uint8 pixel observations, alone in a Box or beside the state in a
+    Dict, and check the shared buffers against single envs with the same seeds and actions.
+    '''
+    env_fn = functools.partial(_make_pixels, proprioceptive)
+    vector_env = SubprocVectorEnv(env_fn, num_envs, auto_reset=False)
+    envs = [env_fn() for _ in range(num_envs)]
+    if not proprioceptive:
+        assert vector_env.observation_space.shape == (num_envs,) + envs[0].observation_space.shape
+
+    def check(observations, single_observations):
+        if proprioceptive:
+            for key in ['pixels', 'state']:
+                np.testing.assert_allclose(observations[key], [obs[key] for obs in single_observations], atol=1e-5)
+        else:
+            assert observations.dtype == np.uint8
+            np.testing.assert_array_equal(observations, single_observations)
+
+    observations, _ = vector_env.reset(seed=7)
+    check(observations, [env.reset(seed=7 + i)[0] for i, env in enumerate(envs)])
+    actions = np.random.default_rng(7).uniform(-1, 1, (steps,) + vector_env.action_space.shape).astype(np.float32)
+    for action in actions:
+        observations = vector_env.step(action)[0]
+        check(observations, [env.step(action[i])[0] for i, env in enumerate(envs)])
+    vector_env.close()
+    for env in envs:
+        env.close()
+    print(f'[SUCCESS] {"dict" if proprioceptive else "pixel"} observations stepped through the shared buffers')
+
+
+def check_unsupported_observations():
+    try:
+        SubprocVectorEnv(_make_tuple_observations, 2)
+    except ValueError as e:
+        assert 'Box or a Dict of Boxes' in str(e)
+    else:
+        raise AssertionError('a Tuple observation space was accepted')
+    print('[SUCCESS] a Tuple observation space raises a ValueError')
+
+
+def test_shared_buffers():
+    check_shared_buffers('HopperPyBulletEnv-v0')
+
+
+def test_worker_failures():
+    check_worker_failures('HopperPyBulletEnv-v0')
+
+
+def test_close_after_failure():
+    check_close_after_failure()
+
+
+def test_pixel_buffers():
+    for proprioceptive in [False, True]:
+        check_pixel_buffers(proprioceptive)
+
+
+def test_unsupported_observations():
+    check_unsupported_observations()
+
+
+if __name__ == '__main__':
+    check_shared_buffers(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
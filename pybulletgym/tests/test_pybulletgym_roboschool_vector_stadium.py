@@ -0,0 +1,119 @@
+import sys
+
+import gym
+import numpy as np
+import pybulletgym  # required for the Bullet envs to be initialized
+from pybulletgym.envs.roboschool.envs.env_state import deterministic_pairs
+
+
+def check_independent_lanes(env_name, num_envs=4, steps=50, atol=1e-5):
+    '''
+    Step the lanes of a vector stadium env and independent single envs with the same seeds and actions,
+    and check that every lane goes the way its single env does. The lanes are stacked on top of each other
+    (lane_width=0), so any collision between robots of different lanes would show.
+    '''
+    vector_env = gym.make(env_name.replace('PyBulletEnv', 'VectorStadiumEnv'), num_envs=num_envs, lane_width=0.0,
+                          auto_reset=False)
+    observations, _ = vector_env.reset(seed=7)
+    envs = [gym.make(env_name).unwrapped for _ in range(num_envs)]
+    single_observations = []
+    for i, env in enumerate(envs):
+        # the first reset of a walker computes its potential before the ground is added to the robot's parts
+        env.reset(seed=7 + i)
+        single_observations.append(env.reset(seed=7 + i)[0])
+        deterministic_pairs(env._p)  # as in the vector env, see VectorStadiumEnv._load
+    np.testing.assert_allclose(observations, single_observations, atol=atol)
+
+    # the lanes are not reset when done (auto_reset=False), they keep stepping like the single envs
+    actions = np.random.default_rng(7).uniform(-1, 1, (steps,) + vector_env.action_space.shape).astype(np.float32)
+    for action in actions:
+        observations, rewards, terminated, _, _ = vector_env.step(action)
+        for i, env in enumerate(envs):
+            obs, reward, term, _, _ = env.step(action[i])
+            np.testing.assert_allclose(observations[i], obs, atol=atol)
+            np.testing.assert_allclose(rewards[i], reward, atol=atol, rtol=1e-5)
+            assert terminated[i] == term
+    vector_env.close()
+    for env in envs:
+        env.close()
+    print(f'[SUCCESS] {env_name}: {num_envs} lanes stepped {steps} times like single envs')
+
+
+def check_lane_truncation(env_name, num_envs=3, steps=45):
+    '''
+    Step a vector stadium env with a short time limit and check that every lane is truncated after that many
+    steps of its own episode, counted from its last reset, and that it is then reset. The default time limit
+    is the max_episode_steps of the single env.
+    '''
+    vector_id = env_name.replace('PyBulletEnv', 'VectorStadiumEnv')
+    default_env = gym.make(vector_id, num_envs=1)
+    assert default_env.unwrapped.lane_max_episode_steps == gym.spec(env_name).max_episode_steps
+    default_env.close()
+
+    limit = 10
+    vector_env = gym.make(vector_id, num_envs=num_envs, lane_max_episode_steps=limit)
+    vector_env.reset(seed=7)
+    rng = np.random.default_rng(7)
+    elapsed = np.zeros(num_envs, dtype=int)
+    truncations = 0
+    for _ in range(steps):
+        _, _, terminated, truncated, infos = vector_env.step(rng.uniform(-1, 1, vector_env.action_space.shape))
+        elapsed += 1
+        np.testing.assert_array_equal(truncated, elapsed >= limit)
+        for i, info in enumerate(infos):
+            assert ('final_observation' in info) == (terminated[i] or truncated[i])
+        truncations += truncated.sum()
+        elapsed[terminated | truncated] = 0
+    vector_env.close()
+    assert truncations > 0, f'{env_name}: no lane truncated in {steps} steps'
+    print(f'[SUCCESS] {env_name}: {truncations} lane truncations after {limit} steps in {steps} steps')
+
+
+def _episode_lengths(env, episodes, reset):
+    lengths, length = [], 0
+    while len(lengths) < episodes:
+        _, _, terminated, truncated, _ = env.step(np.zeros(env.action_space.shape, dtype=np.float32))
+        length += 1
+        if np.any(terminated) or np.any(truncated):
+            lengths.append(length)
+            length = 0
+            reset()
+    return lengths
+
+
+def check_auto_reset_episodes(env_name, episodes=5):
+    '''
+    Let the robot of a single lane fall over and over with zero actions, and check that the episodes after each
+    auto reset last as long as those of a single env reset every time: the reset of a lane puts back all the
+    joints of the robot, e.g. the root slides and hinge of the Hopper, not only its base and its motors.
+    '''
+    vector_env = gym.make(env_name.replace('PyBulletEnv', 'VectorStadiumEnv'), num_envs=1, lane_width=0.0)
+    vector_env.reset(seed=7)
+    vector_lengths = _episode_lengths(vector_env, episodes, lambda: None)
+    vector_env.close()
+
+    env = gym.make(env_name)
+    env.reset(seed=7)
+    single_lengths = _episode_lengths(env, episodes, env.reset)
+    env.close()
+    assert vector_lengths == single_lengths, \
+        f'{env_name}: episodes of {vector_lengths} steps, {single_lengths} in a single env'
+    print(f'[SUCCESS] {env_name}: {episodes} auto reset episodes of {vector_lengths} steps, as in a single env')
+
+
+def test_independent_lanes():
+    for env_name in ['HopperPyBulletEnv-v0', 'AntPyBulletEnv-v0']:
+        check_independent_lanes(env_name)
+
+
+def test_lane_truncation():
+    check_lane_truncation('HalfCheetahPyBulletEnv-v0')
+
+
+def test_auto_reset_episodes():
+    for env_name in ['HopperPyBulletEnv-v0', 'HalfCheetahPyBulletEnv-v0']:
+        check_auto_reset_episodes(env_name)
+
+
+if __name__ == '__main__':
+    check_independent_lanes(sys.argv[1] if len(sys.argv) > 1 else 'HopperPyBulletEnv-v0')
@@ -0,0 +1,288 @@
+import json
+import os
+
+import numpy as np
+
+from pybulletgym.utils.logging import CONTACT_DTYPE, kinematics_records
+
+
+INDEX = 'index.json'
+
+
+def _write_json(path, content):
+    # written next to the index and renamed over it, so that readers never see a partial index
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(content, f)
+    os.replace(tmp_path, path)
+
+
+def _descr(dtype):
+    return dtype.descr if dtype.fields else dtype.str
+
+
+def _dtype(descr):
+    # inverse of _descr, json turned the field tuples of a structured dtype into lists
+    if isinstance(descr, str):
+        return np.dtype(descr)
+    return np.dtype([tuple(tuple(x) if isinstance(x, list) else x for x in field) for field in descr])
+
+
+class DatasetWriter:
+    """
+    Streams the transitions of a BaseBulletEnv into columnar, memory-mapped .npy shards, see
+    BaseBulletEnv.attach_recorder. Only the roboschool envs call recorders, the MuJoCo BaseBulletEnv has no
+    attach_recorder. Every shard holds shard_size rows of the columns:
+    - observation: the observation the action was taken from, or one observation_<key> column per key of dict
+      observations, e.g. observation_pixels and observation_state with BaseBulletEnv.enable_pixel_observations
+    - action, reward, terminated, truncated
+    - first: whether the observation is the first of an episode
+    - kinematics (optional): the kinematics records of the logged parts, see pybulletgym.utils.logging
+    - contact_offsets (optional): the contacts of row i are contacts[contact_offsets[i]:contact_offsets[i + 1]]
+
+    Each observation is copied once, straight into the row it is observed in. The last observation of an episode
+    is not stored, as in most offline RL datasets: terminated/truncated mark its row.
+    The writer is called from BaseBulletEnv.step, below the TimeLimit wrapper of gym.make, which only truncates
+    the episode on its way out: the row of the last step is marked truncated when the next reset arrives before
+    the episode terminated. Until then, and for the last episode of the dataset, it reads truncated=False.
+    The number of complete rows is published in index.json every flush_every rows, DatasetReader only reads these,
+    so the dataset can be read while it is written. The ragged contacts of a shard are written when the shard is full.
+    """
+
+    def __init__(self, directory, shard_size=2**16, flush_every=1024, kinematics=False, contacts=False):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.shard_size = shard_size
+        self.flush_every = flush_every
+        self.kinematics = kinematics
+        self.contacts = contacts
+        self.shards = []  # (name, rows) of the sealed shards
+        self.rows = 0  # complete rows of the current shard
+        self._columns = None
+        self._specs = None
+        self._contacts = []
+        self._contact_count = 0
+        self._pending = False  # whether the current row holds an observation waiting for its action
+        self.closed = False
+
+    def _create_specs(self, env, obs):
+        if isinstance(obs, dict):
+            specs = {}
+            for key, value in obs.items():
+                value = np.asarray(value)
+                specs[f'observation_{key}'] = (value.dtype, value.shape)
+        else:
+            obs = np.asarray(obs)
+            specs = {'observation': (obs.dtype, obs.shape)}
+        specs.update({
+            'action': (np.dtype(env.action_space.dtype), env.action_space.shape),
+            'reward': (np.dtype(np.float32), ()),
+            'terminated': (np.dtype(np.bool_), ()),
+            'truncated': (np.dtype(np.bool_), ()),
+            'first': (np.dtype(np.bool_), ()),
+        })
+        if self.kinematics:
+            parts, _ = env._logged_parts()
+            specs['kinematics'] = (kinematics_records(parts).dtype, (len(parts),))
+        if self.contacts:
+            specs['contact_offsets'] = (np.dtype(np.int64), ())
+        return specs
+
+    def _shard_name(self, i):
+        return f'shard_{i:06d}'
+
+    def _open_shard(self):
+        name = self._shard_name(len(self.shards))
+        os.makedirs(os.path.join(self.directory, name), exist_ok=True)
+        self._columns = {
+            column: np.lib.format.open_memmap(
+                os.path.join(self.directory, name, column + '.npy'), mode='w+', dtype=dtype, shape=(self.shard_size,) + shape)
+            for column, (dtype, shape) in self._specs.items()
+        }
+        self.rows = 0
+        self._contacts = []
+        self._contact_count = 0
+
+    def _seal_shard(self):
+        name = self._shard_name(len(self.shards))
+        if self.contacts:
+            contacts = np.concatenate(self._contacts) if self._contacts else np.zeros(0, dtype=CONTACT_DTYPE)
+            np.save(os.path.join(self.directory, name, 'contacts.npy'), contacts)
+        for column in self._columns.values():
+            column.flush()
+        self.shards.append((name, self.rows))
+        self._columns = None
+        self.flush()
+
+    def flush(self):
+        '''
+        Publish the complete rows in the index.
+        '''
+        if self._columns is not None:
+            for column in self._columns.values():
+                column.flush()
+        shards = [{'name': name, 'rows': rows, 'sealed': True} for name, rows in self.shards]
+        if self._columns is not None:
+            shards.append({'name': self._shard_name(len(self.shards)), 'rows': self.rows, 'sealed': False})
+        _write_json(os.path.join(self.directory, INDEX), {
+            'shard_size': self.shard_size,
+            'columns': {column: {'dtype': _descr(dtype), 'shape': list(shape)} for column, (dtype, shape) in self._specs.items()},
+            'shards': shards,
+        })
+
+    def _begin_row(self, obs, first):
+        if self._columns is None:
+            self._open_shard()
+        if isinstance(obs, dict):
+            for key, value in obs.items():
+                self._columns[f'observation_{key}'][self.rows] = value
+        else:
+            self._columns['observation'][self.rows] = obs
+        self._columns['first'][self.rows] = first
+        self._pending = True
+
+    def _truncate_last_row(self):
+        if self.rows > 0:
+            self._columns['truncated'][self.rows - 1] = True
+        else:  # the row sealed the previous shard
+            name, rows = self.shards[-1]
+            truncated = np.load(os.path.join(self.directory, name, 'truncated.npy'), mmap_mode='r+')
+            truncated[rows - 1] = True
+            truncated.flush()
+
+    def on_reset(self, env, obs):
+        if self._specs is None:
+            self._specs = self._create_specs(env, obs)
+        if self._pending and not self._columns['first'][self.rows]:
+            # reset before the episode ended, e.g. by the TimeLimit above the env: its last step was truncated
+            self._truncate_last_row()
+        self._begin_row(obs, first=True)
+
+    def on_step(self, env, action, obs, reward, terminated, truncated):
+        if not self._pending:
+            return  # stepped before the first reset this writer saw
+        row = self.rows
+        columns = self._columns
+        columns['action'][row] = action
+        columns['reward'][row] = reward
+        columns['terminated'][row] = terminated
+        columns['truncated'][row] = truncated
+        if self.kinematics:
+            columns['kinematics'][row] = kinematics_records(env._logged_parts()[0])
+        if self.contacts:
+            records = env.scene.contacts.get()
+            columns['contact_offsets'][row] = self._contact_count
+            self._contacts.append(records)
+            self._contact_count += len(records)
+        self.rows += 1
+        self._pending = False
+
+        if self.rows == self.shard_size:
+            self._seal_shard()
+        elif self.rows % self.flush_every == 0:
+            self.flush()
+        if not (terminated or truncated):
+            self._begin_row(obs, first=False)
+
+    def close(self):
+        '''
+        Seal the current shard, the rows of a shard that is not full are the ones listed in the index.
+        '''
+        if self.closed:
+            return
+        if self._columns is not None:
+            self._seal_shard()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class DatasetReader:
+    """
+    Reads the shards of a DatasetWriter, possibly while it is still writing: refresh() picks up the rows
+    published since the last call. Columns are memory-mapped read-only, nothing is loaded before it is indexed.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._memmaps = {}
+        self.refresh()
+
+    def refresh(self):
+        with open(os.path.join(self.directory, INDEX)) as f:
+            index = json.load(f)
+        self.columns = list(index['columns'].keys())
+        self._specs = index['columns']
+        self.shards = index['shards']
+        self._starts = np.cumsum([0] + [shard['rows'] for shard in self.shards])
+        return len(self)
+
+    def __len__(self):
+        return int(self._starts[-1])
+
+    def _memmap(self, shard, column):
+        key = (shard['name'], column)
+        if key not in self._memmaps:
+            self._memmaps[key] = np.load(os.path.join(self.directory, shard['name'], column + '.npy'), mmap_mode='r')
+        return self._memmaps[key]
+
+    def shard(self, i, column):
+        '''
+        :return: read-only memory-mapped view of the complete rows of column in shard i
+        '''
+        shard = self.shards[i]
+        return self._memmap(shard, column)[:shard['rows']]
+
+    def column(self, column, start=0, stop=None):
+        '''
+        :return: rows start:stop of column, a view if they are in one shard, else a copy, with no rows if the range is empty
+        '''
+        stop = len(self) if stop is None else min(stop, len(self))
+        pieces = []
+        for i, shard in enumerate(self.shards):
+            lo, hi = max(start, self._starts[i]), min(stop, self._starts[i + 1])
+            if lo < hi:
+                pieces.append(self.shard(i, column)[lo - self._starts[i]:hi - self._starts[i]])
+        if len(pieces) == 1:
+            return pieces[0]
+        if pieces:
+            return np.concatenate(pieces)
+        spec = self._specs[column]
+        return np.zeros((0,) + tuple(spec['shape']), dtype=_dtype(spec['dtype']))
+
+    def gather(self, rows, columns=None):
+        '''
+        :param rows: array of row indices, e.g. a random minibatch
+        :return: column name -> array of these rows
+        '''
+        rows = np.asarray(rows)
+        shard_ids = np.searchsorted(self._starts, rows, side='right') - 1
+        batch = {}
+        for column in columns or [c for c in self.columns if c != 'contact_offsets']:
+            out = None
+            for i in np.unique(shard_ids):
+                selected = shard_ids == i
+                values = self.shard(i, column)[rows[selected] - self._starts[i]]
+                if out is None:
+                    out = np.empty((len(rows),) + values.shape[1:], dtype=values.dtype)
+                out[selected] = values
+            batch[column] = out
+        return batch
+
+    def contacts(self, row):
+        '''
+        :return: the contact records of row, only available once its shard is sealed
+        '''
+        i = int(np.searchsorted(self._starts, row, side='right') - 1)
+        shard = self.shards[i]
+        if not shard['sealed']:
+            raise ValueError(f"the contacts of {shard['name']} are written when it is full")
+        offsets = self._memmap(shard, 'contact_offsets')
+        contacts = self._memmap(shard, 'contacts')
+        local = row - self._starts[i]
+        end = offsets[local + 1] if local + 1 < shard['rows'] else len(contacts)
+        return contacts[offsets[local]:end]
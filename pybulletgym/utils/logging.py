@@ -1,105 +1,241 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Callable
+from collections.abc import Sequence
 import pybullet as pb
 import numpy as np
 
 
-def log_contacts(p, parts: Dict[str,object], NS: Dict[str,str]) -> List[str]:
+# Structured records the text logs are rendered from.
+CONTACT_DTYPE = np.dtype([
+    ('bodyA', np.int32),
+    ('linkA', np.int32),
+    ('bodyB', np.int32),
+    ('linkB', np.int32),
+    ('position', np.float64, (3,)),
+    ('normal', np.float64, (3,)),
+    ('force', np.float64),
+])
+
+KINEMATICS_DTYPE = np.dtype([
+    ('body', np.int32),
+    ('link', np.int32),
+    ('position', np.float64, (3,)),
+    ('orientation', np.float64, (4,)),
+    ('linear_velocity', np.float64, (3,)),
+    ('angular_velocity', np.float64, (3,)),
+])
+
+JOINT_STATE_DTYPE = np.dtype([
+    ('body', np.int32),
+    ('joint', np.int32),
+    ('position', np.float64),
+    ('velocity', np.float64),
+    ('force', np.float64),
+])
+
+
+class LazyLogs(Sequence):
+    '''
+    Stand-in for the list of logs returned by BaseBulletEnv._generate_logs.
+    It holds the raw numeric state captured during the step and only renders the text
+    the first time it is read, so that training loops that never look at info['logs'] don't pay for it.
+    The captured records (see CONTACT_DTYPE, KINEMATICS_DTYPE and JOINT_STATE_DTYPE) are available
+    through the state property without rendering anything.
     '''
-    Log contacts in a string
 
-    # TODO : update nameswap approach when name cannot be find.
+    def __init__(self, render: Callable[[dict], list], state: dict):
+        self._render = render
+        self._state = state
+        self._logs = None
 
-    :param p: pybullet instance
-    :param NS: Dict[str,str] namespace in order to deal with obfuscated names.
+    @property
+    def state(self) -> dict:
+        return self._state
+
+    def render(self) -> list:
+        if self._logs is None:
+            self._logs = self._render(self._state)
+            self._render = None
+        return self._logs
+
+    def __getitem__(self, index):
+        return self.render()[index]
+
+    def __len__(self):
+        return len(self.render())
+
+    def __eq__(self, other):
+        return self.render() == (other.render() if isinstance(other, LazyLogs) else other)
+
+    def __repr__(self):
+        return repr(self.render())
+
+
+def contact_records(contact_points) -> np.ndarray:
+    '''
+    :param contact_points: result of p.getContactPoints()
+    :return: structured array of CONTACT_DTYPE, one record per contact point
+    '''
+    return np.array([(c[1], c[3], c[2], c[4], c[5], c[7], c[9]) for c in contact_points], dtype=CONTACT_DTYPE)
+
+
+def kinematics_records(parts: Dict[str,object]) -> np.ndarray:
+    '''
+    :param parts: Dict[str,BodyPart] parts to record, in the order of the dict
+    :return: structured array of KINEMATICS_DTYPE, one record per part
+    '''
+    records = np.zeros(len(parts), dtype=KINEMATICS_DTYPE)
+    for i, part in enumerate(parts.values()):
+        records[i] = (
+            part.bodyIndex,
+            part.bodyPartIndex,
+            part.current_position(),
+            part.current_orientation(),
+            part.get_linear_velocity(),
+            part.get_angular_velocity(),
+        )
+    return records
+
+
+def joint_state_records(robot_id: int, joint_states) -> np.ndarray:
+    '''
+    :param joint_states: result of p.getJointStates over all joints of the body, in joint index order
+    :return: structured array of JOINT_STATE_DTYPE, one record per joint
+    '''
+    return np.array(
+        [(robot_id, i, s[0], s[1], s[3]) for i, s in enumerate(joint_states)],
+        dtype=JOINT_STATE_DTYPE,
+    )
+
+
+class NameIndex:
+    '''
+    Displayed names, with the name swap (obfuscation) already applied, of bodies and of (body id, link index)
+    pairs. Built once per reset so that formatting contact and kinematics records is O(records) and needs
+    no physics-server query, except for bodies loaded after the index was built.
+    '''
+
+    def __init__(self, p, parts: Dict[str,object], NS: Dict[str,str]):
+        '''
+        :param p: pybullet instance
+        :param parts: Dict[str,BodyPart] parts whose links get a name, the first part wins for a given (body, link)
+        :param NS: Dict[str,str] namespace in order to deal with obfuscated names.
+        '''
+        self._p = p
+        self.NS = NS
+        self.bodies = {-1: self.label('World')}
+        self.links = {}
+        for part in parts.values():
+            if part.bodyIndex not in self.bodies:
+                self.bodies[part.bodyIndex] = self.label(p.getBodyInfo(part.bodyIndex)[1].decode('utf-8'))
+            key = (part.bodyIndex, part.bodyPartIndex)
+            if key not in self.links:
+                self.links[key] = self.label(part.name)
+
+    def label(self, name: str) -> str:
+        #TODO: update nameswap approach when name cannot be find.
+        if name not in self.NS:  self.NS[name] = name
+        return self.NS[name]
+
+    def body(self, body_id: int) -> str:
+        name = self.bodies.get(body_id)
+        if name is None:  # body loaded after the index was built
+            name = self.bodies[body_id] = self.label(self._p.getBodyInfo(body_id)[1].decode('utf-8'))
+        return name
+
+    def link(self, body_id: int, link_id: int) -> str:
+        name = self.links.get((body_id, link_id))
+        return name if name is not None else self.label('base')
+
+
+def joint_table(p, robot_id) -> Tuple[List[str], List[int]]:
+    '''
+    :return: the joint names and the parent link index of every joint of the body
+    '''
+    joint_infos = [p.getJointInfo(robot_id, i) for i in range(p.getNumJoints(robot_id))]
+    return [info[1].decode('utf-8') for info in joint_infos], [info[-1] for info in joint_infos]
+
+
+def _xyz_str(values) -> str:
+    return ' '.join([f"{x:.2f}" for x in values])
+
+
+def format_contacts(records: np.ndarray, names: NameIndex) -> List[str]:
+    '''
+    Render contact records as text.
+    :param records: structured array of CONTACT_DTYPE
+    :param names: NameIndex of the scene
     :return: contact_logs: List[str]
     '''
     contact_logs = []
-    contact_points = p.getContactPoints()
-    for contact in contact_points:
-        bodyA = contact[1]
-        bodyA_name = p.getBodyInfo(bodyA)[1].decode('utf-8') if bodyA >= 0 else 'World' 
-        bodyB = contact[2]
-        bodyB_name = p.getBodyInfo(bodyB)[1].decode('utf-8') if bodyB >= 0 else 'World' 
-        linkA = contact[3]
-        linkA_name = [part for part in parts.values() if part.bodyPartIndex==linkA]
-        if len(linkA_name): linkA_name = linkA_name[0].name
-        else: linkA_name = 'base'
-        #if linkA == -1: linkA_name= 'base'
-        #else: linkA_name = p.getJointInfo(bodyUniqueId=bodyA, jointIndex=linkA)[1].decode('utf-8')
-        linkB = contact[4]
-        linkB_name = [part for part in parts.values() if part.bodyPartIndex==linkB]
-        if len(linkB_name): linkB_name = linkB_name[0].name
-        else: linkB_name = 'base'
-        #if linkB == -1: linkB_name= 'base' 
-        #else: linkB_name = p.getJointInfo(bodyUniqueId=bodyB, jointIndex=linkB)[1].decode('utf-8')
-        contact_position = contact[5]
-        contact_position_str = ' '.join([f"{x:.2f}" for x in contact_position])
-        contact_normal = contact[7]
-        contact_normal_str = ' '.join([f"{x:.2f}" for x in contact_normal])
-        contact_force = contact[9]
-        contact_force_str = f"{contact_force:.2f}"
-        #TODO: update below:
-        if bodyA_name not in NS:  NS[bodyA_name] = bodyA_name
-        if bodyB_name not in NS:  NS[bodyB_name] = bodyB_name
-        if linkA_name not in NS:  NS[linkA_name] = linkA_name
-        if linkB_name not in NS:  NS[linkB_name] = linkB_name
-        contact_logs.append(f"Contact between {NS[bodyA_name]}'s link {NS[linkA_name]} and {NS[bodyB_name]}'s link {NS[linkB_name]}")
-        contact_logs.append(f"position: {contact_position_str}")
-        contact_logs.append(f"normal: {contact_normal_str}")
-        contact_logs.append(f"force: {contact_force_str}\n")
+    for bodyA, linkA, bodyB, linkB, position, normal, force in records.tolist():
+        contact_logs.append(f"Contact between {names.body(bodyA)}'s link {names.link(bodyA, linkA)} and {names.body(bodyB)}'s link {names.link(bodyB, linkB)}")
+        contact_logs.append(f"position: {_xyz_str(position)}")
+        contact_logs.append(f"normal: {_xyz_str(normal)}")
+        contact_logs.append(f"force: {force:.2f}\n")
     return contact_logs
 
-# Function to log kinematic states
-def log_kinematics(p, parts, NS, list_infos=['position', 'orientation', 'linear_velocity', 'angular_velocity']):
+
+def format_kinematics(records: np.ndarray, part_names: List[str], names: NameIndex,
+                      list_infos=['position', 'orientation', 'linear_velocity', 'angular_velocity']) -> List[str]:
+    '''
+    Render kinematics records as text.
+    :param records: structured array of KINEMATICS_DTYPE
+    :param part_names: name of the part of each record
+    :param names: NameIndex of the scene
+    '''
     kinematics_logs = []
-    for part_name, part in parts.items():
-        body_id = part.bodyIndex
-        link_id = part.bodyPartIndex
-        body_info = p.getBodyInfo(body_id)
-        body_name = body_info[1].decode('utf-8')
-        #TODO: update below:
-        if body_name not in NS:  NS[body_name] = body_name
-        if part_name not in NS:  NS[part_name] = part_name
-        #DEBUG: klog = f"{NS[body_name]}({body_id})'s part {NS[part_name]}({link_id}):\n"
-        klog = f"{NS[body_name]}'s part {NS[part_name]}:\n"
+    for part_name, (body_id, link_id, pos, orn, linear_vel, angular_vel) in zip(part_names, records.tolist()):
+        #DEBUG: klog = f"{names.body(body_id)}({body_id})'s part {names.label(part_name)}({link_id}):\n"
+        klog = f"{names.body(body_id)}'s part {names.label(part_name)}:\n"
         if 'position' in list_infos:
-          pos = part.current_position()
-          pos_str = ' '.join([f"{x:.2f}" for x in pos])
-          klog += f"Position: {pos_str}\n"
+          klog += f"Position: {_xyz_str(pos)}\n"
         if 'orientation' in list_infos:
-          orn = part.current_orientation()
-          orn_str = ' '.join([f"{x:.2f}" for x in orn])
-          klog += f"Orientation: {orn_str}\n"
-        if 'linear_velocity' in list_infos:        
-          linear_vel = part.get_linear_velocity()
-          lvel_str = ' '.join([f"{x:.2f}" for x in linear_vel])
-          klog += f"Linear Velocities: {lvel_str}\n"
+          klog += f"Orientation: {_xyz_str(orn)}\n"
+        if 'linear_velocity' in list_infos:
+          klog += f"Linear Velocities: {_xyz_str(linear_vel)}\n"
         if 'angular_velocity' in list_infos:
-          angular_vel = part.get_angular_velocity()
-          avel_str = ' '.join([f"{x:.2f}" for x in angular_vel])
-          klog += f"Angular Velocities: {avel_str}\n"        
+          klog += f"Angular Velocities: {_xyz_str(angular_vel)}\n"
           kinematics_logs.append(klog)
     return kinematics_logs
 
-# Function to log joint states
-def log_joint_states(p, robot_id):
-    printoptions = np.get_printoptions()
-    np.set_printoptions(formatter={'float_kind': lambda x: "%.3f" % x})
+
+def format_joint_states(records: np.ndarray, joint_names: List[str], joint_parents: List[int]) -> List[str]:
+    '''
+    Render joint state records of one body as text.
+    :param records: structured array of JOINT_STATE_DTYPE
+    :param joint_names, joint_parents: see joint_table
+    '''
     joint_logs = []
-    num_joints = p.getNumJoints(robot_id)
-    joint_id2name = dict([(i, p.getJointInfo(robot_id, i)[1].decode('utf-8')) for i in range(num_joints)])
-    for i in range(num_joints):
-        joint_info = p.getJointInfo(robot_id, i)
-        joint_name = joint_info[1].decode('utf-8')
-        linkParent_id = joint_info[-1]
-        linkParent_name = joint_id2name[linkParent_id] if linkParent_id >= 0 else 'World'
-        linkChild_id = i
-        linkChild_name = joint_id2name[linkChild_id]
-        joint_state = p.getJointState(robot_id, i)
-        joint_pos = joint_state[0]
-        joint_vel = joint_state[1]
-        joint_force = joint_state[3]
+    for _, joint_id, joint_pos, joint_vel, joint_force in records.tolist():
+        joint_name = joint_names[joint_id]
+        linkParent_id = joint_parents[joint_id]
+        linkParent_name = joint_names[linkParent_id] if linkParent_id >= 0 else 'World'
+        linkChild_name = joint_name
         joint_logs.append(f"Joint {joint_name}:\nBody {linkParent_name} -> Body {linkChild_name}\nPosition: {joint_pos}, Velocity: {joint_vel}, Force: {joint_force}")
-    np.set_printoptions(**printoptions) 
     return joint_logs
 
+
+def log_contacts(p, parts: Dict[str,object], NS: Dict[str,str], contact_points=None) -> List[str]:
+    '''
+    Log contacts in a string
+
+    :param p: pybullet instance
+    :param NS: Dict[str,str] namespace in order to deal with obfuscated names.
+    :param contact_points: result of p.getContactPoints() captured earlier, queried now if None.
+    :return: contact_logs: List[str]
+    '''
+    if contact_points is None:
+        contact_points = p.getContactPoints()
+    return format_contacts(contact_records(contact_points), NameIndex(p, parts, NS))
+
+# Function to log kinematic states
+def log_kinematics(p, parts, NS, list_infos=['position', 'orientation', 'linear_velocity', 'angular_velocity']):
+    return format_kinematics(kinematics_records(parts), list(parts.keys()), NameIndex(p, parts, NS), list_infos)
+
+# Function to log joint states
+def log_joint_states(p, robot_id):
+    num_joints = p.getNumJoints(robot_id)
+    # all joint states of the body in a single call
+    joint_states = p.getJointStates(robot_id, list(range(num_joints))) if num_joints > 0 else []
+    joint_names, joint_parents = joint_table(p, robot_id)
+    return format_joint_states(joint_state_records(robot_id, joint_states), joint_names, joint_parents)
@@ -0,0 +1,154 @@
+from typing import Dict, Callable
+from collections import defaultdict
+from contextlib import contextmanager
+from bisect import bisect_right
+import functools
+import time
+
+import numpy as np
+
+
+# Log-spaced histogram bin edges, from 1us to 10s.
+HISTOGRAM_EDGES = np.logspace(-6, 1, 29)
+
+
+class _PhaseStats:
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_EDGES) + 1)
+        self.api_calls = defaultdict(int)
+
+    def add(self, dt: float):
+        self.count += 1
+        self.total += dt
+        if dt < self.min: self.min = dt
+        if dt > self.max: self.max = dt
+        self.histogram[bisect_right(_EDGES, dt)] += 1
+
+    def report(self) -> dict:
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            # histogram[0] counts the durations below HISTOGRAM_EDGES[0], histogram[-1] those above HISTOGRAM_EDGES[-1]
+            'histogram': np.array(self.histogram),
+            'api_calls': dict(self.api_calls),
+        }
+
+
+_EDGES = HISTOGRAM_EDGES.tolist()
+
+
+class StepProfiler:
+    '''
+    Accumulates per-phase wall-time histograms and physics-server API call counts of a BaseBulletEnv.
+    Phases are exclusive: the time spent in a nested phase (e.g. calc_state within a step) is not counted
+    in the enclosing one, so that the remainder of _step measures the reward and contact processing.
+    Nothing of this runs unless the env was given a profiler, see BaseBulletEnv.enable_profiler.
+    '''
+
+    # robot, scene and env methods that are timed as phases of their own
+    INSTRUMENTED = {
+        'robot': ('apply_action', 'calc_state'),
+        'scene': ('global_step',),
+        'env': ('_generate_logs', '_render'),
+    }
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.phases = defaultdict(_PhaseStats)
+        self.last_step = {}
+        self._stack = []
+
+    @property
+    def current_phase(self) -> str:
+        return self._stack[-1][0] if self._stack else 'other'
+
+    def begin(self, name: str):
+        now = time.perf_counter()
+        if self._stack:
+            self._stack[-1][2] += now - self._stack[-1][1]  # pause the enclosing phase
+        self._stack.append([name, now, 0.0])
+
+    def end(self):
+        now = time.perf_counter()
+        name, start, elapsed = self._stack.pop()
+        elapsed += now - start
+        self.phases[name].add(elapsed)
+        self.last_step[name] = self.last_step.get(name, 0.0) + elapsed
+        if self._stack:
+            self._stack[-1][1] = now  # resume the enclosing phase
+
+    @contextmanager
+    def phase(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def timed(self, name: str, fn: Callable) -> Callable:
+        if getattr(fn, '_profiled_phase', None) is not None:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            self.begin(name)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.end()
+        wrapper._profiled_phase = name
+        return wrapper
+
+    def instrument(self, env):
+        '''
+        Replace the timed methods of the env, its robot and its scene by timed wrappers, on the instances only.
+        Safe to call after every reset.
+        '''
+        owners = {'robot': env.robot, 'scene': env.scene, 'env': env}
+        for owner_name, methods in self.INSTRUMENTED.items():
+            owner = owners[owner_name]
+            if owner is None:
+                continue
+            for method in methods:
+                if hasattr(owner, method):
+                    setattr(owner, method, self.timed(method, getattr(owner, method)))
+        if getattr(env.render, '_profiled_phase', None) is None:
+            env.render = env._render
+
+    def wrap_client(self, bullet_client):
+        return CountingClient(bullet_client, self)
+
+    def report(self) -> Dict[str, dict]:
+        return {name: stats.report() for name, stats in self.phases.items()}
+
+
+class CountingClient:
+    '''
+    Proxy of a BulletClient that counts the API calls made during each phase of a StepProfiler.
+    '''
+
+    def __init__(self, bullet_client, profiler: StepProfiler):
+        self._client_proxied = bullet_client
+        self._profiler = profiler
+        self._client = bullet_client._client
+
+    def __getattr__(self, name):
+        attribute = getattr(self._client_proxied, name)
+        if not callable(attribute):
+            return attribute
+        profiler = self._profiler
+
+        def counted(*args, **kwargs):
+            profiler.phases[profiler.current_phase].api_calls[name] += 1
+            return attribute(*args, **kwargs)
+        return counted
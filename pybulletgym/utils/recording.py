@@ -0,0 +1,222 @@
+import collections
+import multiprocessing as mp
+import os
+import queue
+import shutil
+import threading
+import zipfile
+
+import numpy as np
+
+
+POLICIES = ('drop', 'block')
+BACKENDS = ('thread', 'process')
+
+
+def _copy(x):
+    if isinstance(x, dict):
+        return {k: np.array(v, copy=True) for k, v in x.items()}
+    return np.array(x, copy=True)
+
+
+class _EpisodeWriter:
+    """
+    Writes the records of one episode into <directory>/episode_<index>.npz as they arrive: one array per field,
+    stacked over the recorded steps, and one array per key of dict observations. Every field is appended to a raw
+    file next to the archive, so only one record is in memory. close() streams them into the .npz and removes them.
+    """
+
+    def __init__(self, directory, index):
+        self._prefix = os.path.join(directory, f'episode_{index:06d}')
+        self.path = self._prefix + '.npz'
+        self._fields = {}  # name -> [raw file, dtype, row shape, rows]
+
+    def _append(self, name, value):
+        value = np.asarray(value)
+        if name not in self._fields:
+            self._fields[name] = [open(f'{self._prefix}.{name}.raw', 'wb'), value.dtype, value.shape, 0]
+        field = self._fields[name]
+        field[0].write(value.tobytes())  # in C order, as the header says
+        field[3] += 1
+
+    def append(self, record):
+        for name, value in record.items():
+            if isinstance(value, dict):
+                for key in value:
+                    self._append(f'{name}_{key}', value[key])
+            elif value is not None:
+                self._append(name, value)
+
+    def truncate(self):
+        '''
+        Mark the last step record truncated, the episode was cut before it terminated.
+        '''
+        if 'truncated' in self._fields:
+            raw, dtype, _, _ = self._fields['truncated']
+            raw.seek(-dtype.itemsize, os.SEEK_END)
+            raw.write(np.ones((), dtype=dtype).tobytes())
+            raw.seek(0, os.SEEK_END)
+
+    def close(self):
+        if not self._fields:
+            return
+        # written next to the archive and renamed over it, so that readers never see a partial episode
+        with zipfile.ZipFile(self.path + '.tmp', 'w', compression=zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+            for name, (raw, dtype, shape, rows) in self._fields.items():
+                raw.close()
+                with archive.open(name + '.npy', 'w', force_zip64=True) as out, open(raw.name, 'rb') as values:
+                    np.lib.format.write_array_header_1_0(out, {
+                        'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': (rows,) + shape})
+                    shutil.copyfileobj(values, out)
+                os.remove(raw.name)
+        os.replace(self.path + '.tmp', self.path)
+
+
+def _writer_loop(items, directory):
+    '''
+    Consume the items put by EpisodeRecorder until the None sentinel: ('episode', index) starts an episode and
+    closes the previous one, ('step', record) writes a record of the current episode and ('truncate', None)
+    marks its last step record truncated.
+    '''
+    episode = None
+    while True:
+        item = items.get()
+        if item is None or item[0] == 'episode':
+            if episode is not None:
+                episode.close()
+            if item is None:
+                return
+            episode = _EpisodeWriter(directory, item[1])
+        elif item[0] == 'truncate':
+            if episode is not None:
+                episode.truncate()
+        elif episode is not None:  # steps before the first reset are not part of an episode
+            episode.append(item[1])
+
+
+class EpisodeRecorder:
+    """
+    Records the rgb_array frames and the step data of a BaseBulletEnv every N steps, see BaseBulletEnv.attach_recorder.
+    The step loop only renders and copies, the records are handed through a bounded queue to a background thread
+    or process that writes them as they arrive, and packs every episode into a compressed .npz file when the next
+    one starts.
+    The first record of an episode, step 0, is its reset: it has the frame and observation but no action, reward,
+    terminated or truncated. These fields only have rows for the step records, i.e. step[1:] if step[0] == 0.
+    The recorder is called from BaseBulletEnv.step, below the TimeLimit wrapper of gym.make, which only truncates
+    the episode on its way out: the record of the last step is marked truncated when the next reset arrives
+    before the episode terminated, if that step was recorded, i.e. neither skipped by every nor dropped.
+    """
+
+    def __init__(self, directory, every=1, frames=True, queue_size=256, policy='drop', backend='thread'):
+        '''
+        :param every: record one step out of every, the first step after a reset included
+        :param frames: whether to render and record frames, or only the step data
+        :param queue_size: number of records waiting to be encoded before the policy applies
+        :param policy: when the queue is full, 'drop' the record (counted in self.dropped) or 'block' the step
+        :param backend: encode in a 'thread' or in a 'process', which does not share the GIL with the simulation
+        '''
+        if policy not in POLICIES:
+            raise ValueError(f"policy should be one of {POLICIES}, got {policy!r}")
+        if backend not in BACKENDS:
+            raise ValueError(f"backend should be one of {BACKENDS}, got {backend!r}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.every = every
+        self.frames = frames
+        self.policy = policy
+        self.dropped = 0
+        self.episodes = 0
+        self._step = 0
+        self._ended = True  # whether the current episode terminated or was truncated
+        self._last_recorded = False  # whether the last step of the current episode was recorded
+        self._markers = collections.deque()  # episode and truncate markers waiting for room in the queue
+        self.closed = False
+        if backend == 'thread':
+            self._items = queue.Queue(maxsize=queue_size)
+            self._writer = threading.Thread(target=_writer_loop, args=(self._items, directory), daemon=True)
+        else:
+            self._items = mp.Queue(maxsize=queue_size)
+            self._writer = mp.Process(target=_writer_loop, args=(self._items, directory), daemon=True)
+        self._writer.start()
+
+    def _put(self, item):
+        if self.policy == 'block':
+            self._items.put(item)
+            return
+        try:
+            self._items.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def _flush_markers(self, block=False):
+        '''
+        Queue the pending episode and truncate markers, in order.
+        :return: whether none is left, the steps of an episode cannot be queued before its marker
+        '''
+        while self._markers:
+            if block or self.policy == 'block':
+                self._items.put(self._markers[0])
+            else:
+                try:
+                    self._items.put_nowait(self._markers[0])
+                except queue.Full:
+                    return False
+            self._markers.popleft()
+        return True
+
+    def _record(self, env, obs, **transition):
+        '''
+        :param transition: action, reward, terminated and truncated of a step record, none for the reset record
+        :return: whether the record was queued
+        '''
+        # the room is checked before rendering, a dropped record costs no frame
+        if not self._flush_markers() or (self.policy == 'drop' and self._items.full()):
+            self.dropped += 1
+            return False
+        record = {
+            'step': self._step,
+            'frame': env._render('rgb_array').copy() if self.frames else None,  # the frame buffer is reused
+            'observation': _copy(obs),
+        }
+        for name, value in transition.items():
+            record[name] = None if value is None else _copy(value)
+        dropped = self.dropped
+        self._put(('step', record))
+        return self.dropped == dropped
+
+    def on_reset(self, env, obs):
+        # episode boundaries are never dropped, they would merge two episodes: while the queue is full, they wait
+        # in self._markers and the steps behind them are dropped
+        if not self._ended and self._last_recorded:
+            # reset before the episode ended, e.g. by the TimeLimit above the env: its last step was truncated
+            self._markers.append(('truncate', None))
+        self._markers.append(('episode', self.episodes))
+        self._flush_markers()
+        self.episodes += 1
+        self._step = 0
+        self._ended = False
+        self._last_recorded = False
+        self._record(env, obs)
+
+    def on_step(self, env, action, obs, reward, terminated, truncated):
+        self._step += 1
+        self._ended = terminated or truncated
+        self._last_recorded = self._step % self.every == 0 and self._record(
+            env, obs, action=action, reward=reward, terminated=terminated, truncated=truncated)
+
+    def close(self):
+        '''
+        Wait for the queued records to be encoded, the last episode included.
+        '''
+        if self.closed:
+            return
+        self._flush_markers(block=True)
+        self._items.put(None)
+        self._writer.join()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
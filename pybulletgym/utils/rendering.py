@@ -0,0 +1,119 @@
+import numpy as np
+import pybullet
+
+
+RENDERERS = {
+    'tiny': pybullet.ER_TINY_RENDERER,
+    'opengl': pybullet.ER_BULLET_HARDWARE_OPENGL,
+}
+
+# ITU-R 601 luma weights, as used by most RGB to grayscale conversions
+GRAY_WEIGHTS = (0.299, 0.587, 0.114)
+
+OPTIONS = ('width', 'height', 'fov', 'near', 'far', 'renderer', 'grayscale', 'downsample')
+
+
+class FrameRenderer:
+    """
+    Camera images of a physics client written into preallocated buffers.
+    The projection matrix is only recomputed when width, height, fov or the clipping planes change and the view
+    matrix when the camera moves. Frames are written into one (height, width, 3) uint8 buffer and, if grayscale or
+    downsample are set, converted into a second preallocated buffer of the output shape.
+
+    The arrays returned by render() are these buffers: they are overwritten by the next call, copy them if they need
+    to outlive it.
+    """
+
+    def __init__(self, width=320, height=240, fov=60, near=0.1, far=100.0, renderer=None, grayscale=False, downsample=1):
+        '''
+        :param renderer: 'tiny', 'opengl' or a pybullet ER_* constant. If None, TinyRenderer in DIRECT mode,
+        which runs on the CPU of headless machines, and the OpenGL renderer of the GUI otherwise.
+        :param grayscale: output (height, width) luma frames instead of RGB ones
+        :param downsample: keep one pixel out of downsample in both directions
+        '''
+        self.width, self.height, self.fov, self.near, self.far = width, height, fov, near, far
+        self.renderer = renderer
+        self.grayscale = grayscale
+        self.downsample = downsample
+        self._projection_key = None
+        self._view_key = None
+        self._renderers = {}  # physics client id -> renderer constant
+        self._allocate()
+
+    def configure(self, **kwargs):
+        '''
+        Change any of the constructor arguments, the buffers are reallocated.
+        '''
+        for name, value in kwargs.items():
+            if name not in OPTIONS:
+                raise TypeError(f"unknown rendering option {name!r}")
+            setattr(self, name, value)
+        self._renderers = {}
+        self._allocate()
+
+    @property
+    def output_shape(self):
+        shape = (-(-self.height // self.downsample), -(-self.width // self.downsample))
+        return shape if self.grayscale else shape + (3,)
+
+    def _allocate(self):
+        self.rgb = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        if not self.grayscale and self.downsample == 1:
+            self.frame = self.rgb
+            return
+        self.frame = np.zeros(self.output_shape, dtype=np.uint8)
+        self._gray = np.zeros(self.output_shape[:2], dtype=np.float32)
+        self._channel = np.zeros(self.output_shape[:2], dtype=np.float32)
+
+    def _renderer_for(self, bullet_client):
+        if self.renderer is not None:
+            return RENDERERS.get(self.renderer, self.renderer)
+        client_id = bullet_client._client
+        if client_id not in self._renderers:
+            gui = bullet_client.getConnectionInfo()['connectionMethod'] == pybullet.GUI
+            self._renderers[client_id] = pybullet.ER_BULLET_HARDWARE_OPENGL if gui else pybullet.ER_TINY_RENDERER
+        return self._renderers[client_id]
+
+    def projection_matrix(self, bullet_client):
+        key = (self.width, self.height, self.fov, self.near, self.far)
+        if key != self._projection_key:
+            self._projection = bullet_client.computeProjectionMatrixFOV(
+                fov=self.fov, aspect=float(self.width) / self.height, nearVal=self.near, farVal=self.far)
+            self._projection_key = key
+        return self._projection
+
+    def view_matrix(self, bullet_client, target, distance, yaw, pitch):
+        key = (tuple(target), distance, yaw, pitch)
+        if key != self._view_key:
+            self._view = bullet_client.computeViewMatrixFromYawPitchRoll(
+                cameraTargetPosition=target, distance=distance, yaw=yaw, pitch=pitch, roll=0, upAxisIndex=2)
+            self._view_key = key
+        return self._view
+
+    def render(self, bullet_client, target, distance, yaw, pitch):
+        '''
+        :param target, distance, yaw, pitch: camera looking at target from distance, see computeViewMatrixFromYawPitchRoll
+        :return: the frame buffer, of output_shape
+        '''
+        _, _, px, _, _ = bullet_client.getCameraImage(
+            width=self.width, height=self.height,
+            viewMatrix=self.view_matrix(bullet_client, target, distance, yaw, pitch),
+            projectionMatrix=self.projection_matrix(bullet_client),
+            renderer=self._renderer_for(bullet_client),
+            flags=pybullet.ER_NO_SEGMENTATION_MASK,
+        )
+        # px is a flat tuple unless pybullet was built with numpy, either way it is RGBA
+        np.copyto(self.rgb, np.reshape(px, (self.height, self.width, 4))[:, :, :3], casting='unsafe')
+        if self.frame is self.rgb:
+            return self.frame
+
+        rgb = self.rgb[::self.downsample, ::self.downsample]
+        if not self.grayscale:
+            np.copyto(self.frame, rgb)
+            return self.frame
+        np.multiply(rgb[:, :, 0], np.float32(GRAY_WEIGHTS[0]), out=self._gray)
+        for channel in (1, 2):
+            np.multiply(rgb[:, :, channel], np.float32(GRAY_WEIGHTS[channel]), out=self._channel)
+            self._gray += self._channel
+        np.copyto(self.frame, self._gray, casting='unsafe')
+        return self.frame
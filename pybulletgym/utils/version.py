@@ -0,0 +1,11 @@
+import re
+
+
+def parse_version(version):
+    '''
+    Light replacement of pkg_resources.parse_version for the release versions compared in this package,
+    as importing pkg_resources takes a significant part of the import time.
+    :return: tuple of the leading numeric components, e.g. (0, 26, 2) for '0.26.2', comparable with other tuples.
+    '''
+    match = re.match(r'\d+(\.\d+)*', str(version))
+    return tuple(int(part) for part in match.group(0).split('.')) if match else ()
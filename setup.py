@@ -33,5 +33,9 @@ setup(name='pybulletgym',
       install_requires=[
           'pybullet>=1.7.8',
       ],
-      package_data={'pybulletgym': need_files},
+      package_data={
+          'pybulletgym': need_files,
+          # converted pretrained weights, see pybulletgym/tests/roboschool/agents/weight_store.py
+          'pybulletgym.tests.roboschool.agents': ['weights/*/*.npy'],
+      },
 )